@@ -45,6 +45,8 @@ from src.modules.fermentation.src.domain.entities.protocol_execution import Prot
 from src.modules.fermentation.src.domain.entities.step_completion import StepCompletion  # noqa: F401
 from src.modules.fermentation.src.domain.entities.protocol_alert import ProtocolAlert  # noqa: F401
 from src.modules.fermentation.src.domain.entities.winemaker_action import WinemakerAction  # noqa: F401
+from src.modules.fermentation.src.domain.entities.sync_tombstone import SyncTombstone  # noqa: F401
+from src.modules.fermentation.src.domain.entities.alert_inbox_count import WineryAlertCount, ExecutionAlertCount  # noqa: F401
 
 # Analysis engine
 from src.modules.analysis_engine.src.domain.entities.recommendation_template import RecommendationTemplate  # noqa: F401
@@ -0,0 +1,62 @@
+"""Change feed support: updated_at keyset indexes and sync_tombstones
+
+Revision ID: 008_sync_change_feed
+Revises: 007_create_winemaker_actions
+Create Date: 2026-10-18
+
+GET /api/v1/sync/changes reads every synced table by (updated_at, id)
+after the client's cursor. The indexes below keep each read proportional
+to the number of changed rows instead of the table size.
+
+sync_tombstones records hard deletes (winemaker_actions); soft-deleted
+fermentations, samples and notes are reported from their own rows.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "008_sync_change_feed"
+down_revision: Union[str, None] = "007_create_winemaker_actions"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sync_tombstones",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("winery_id", sa.Integer(), nullable=False),
+        sa.Column("entity_type", sa.String(30), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["winery_id"], ["wineries.id"],
+                                name="fk_sync_tombstones_winery"),
+    )
+    op.create_index("ix_sync_tombstones__winery_id__updated_at",
+                    "sync_tombstones", ["winery_id", "updated_at"])
+
+    # Keyset indexes for the change feed
+    op.create_index("ix_fermentations__winery_id__updated_at",
+                    "fermentations", ["winery_id", "updated_at"])
+    op.create_index("ix_samples__updated_at__id",
+                    "samples", ["updated_at", "id"])
+    op.create_index("ix_fermentation_notes__updated_at__id",
+                    "fermentation_notes", ["updated_at", "id"])
+    op.create_index("ix_protocol_alerts__winery_id__updated_at",
+                    "protocol_alerts", ["winery_id", "updated_at"])
+    op.create_index("ix_winemaker_actions_winery_id_updated_at",
+                    "winemaker_actions", ["winery_id", "updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_winemaker_actions_winery_id_updated_at", table_name="winemaker_actions")
+    op.drop_index("ix_protocol_alerts__winery_id__updated_at", table_name="protocol_alerts")
+    op.drop_index("ix_fermentation_notes__updated_at__id", table_name="fermentation_notes")
+    op.drop_index("ix_samples__updated_at__id", table_name="samples")
+    op.drop_index("ix_fermentations__winery_id__updated_at", table_name="fermentations")
+    op.drop_index("ix_sync_tombstones__winery_id__updated_at", table_name="sync_tombstones")
+    op.drop_table("sync_tombstones")
@@ -0,0 +1,31 @@
+"""Composite index for filtered, cursor-paginated fermentation listings
+
+Revision ID: 009_fermentation_listing_index
+Revises: 008_sync_change_feed
+Create Date: 2026-10-18
+
+GET /api/v1/fermentation/historical lists a winery's fermentations of one
+data source, newest start_date first, continuing from an opaque
+(start_date, id) cursor. The index below serves the filter, the date range
+and the order in a single range scan, so deep pages of a long imported
+history cost the same as the first one.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "009_fermentation_listing_index"
+down_revision: Union[str, None] = "008_sync_change_feed"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_fermentations__winery_id__data_source__start_date",
+                    "fermentations", ["winery_id", "data_source", "start_date", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_fermentations__winery_id__data_source__start_date",
+                  table_name="fermentations")
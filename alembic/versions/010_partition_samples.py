@@ -0,0 +1,182 @@
+"""Range-partition samples by recorded_at; composite and BRIN indexes
+
+Revision ID: 010_partition_samples
+Revises: 009_fermentation_listing_index
+Create Date: 2026-10-18
+
+All sample types of all wineries, live and imported, share one samples
+table, so the table and its indexes grow without bound. This migration
+rebuilds samples as a table partitioned by RANGE (recorded_at):
+
+- one partition per calendar year (samples_y<year>), from the year of the
+  oldest sample through next year, plus samples_default for anything
+  outside those ranges;
+- primary key (id, recorded_at): the partition key must be part of every
+  unique constraint; ids still come from samples_id_seq;
+- ix_samples__fermentation_id__sample_type__recorded_at replaces the
+  single-column fermentation_id/sample_type/recorded_at indexes, and
+  covers per-fermentation, latest-of-type and time-range reads;
+- ix_samples__recorded_at_brin is a BRIN index on recorded_at. Rows arrive
+  roughly in time order, so a few pages summarise a whole partition.
+
+Later partitions are created by SamplePartitionRepository.ensure_partitions
+(on fermentation service startup and from scripts/manage_sample_partitions.py).
+Old ones are detached for archival with detach_partition.
+
+Sample reads bound recorded_at by the fermentation's start_date so that
+PostgreSQL prunes partitions (SampleRepository). A sample recorded before
+its fermentation's start_date would never be returned again, so the
+upgrade fails, without changing anything, while such samples exist. It
+reports how many there are and in how many fermentations. Fix the data
+first, usually by moving the start_date back to the earliest sample:
+
+    UPDATE fermentations f
+       SET start_date = s.first_recorded_at
+      FROM (SELECT fermentation_id, min(recorded_at) AS first_recorded_at
+              FROM samples GROUP BY fermentation_id) s
+     WHERE s.fermentation_id = f.id AND s.first_recorded_at < f.start_date;
+
+Downgrade copies rows of attached partitions back into a plain table;
+partitions detached in the meantime are left as standalone tables.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "010_partition_samples"
+down_revision: Union[str, None] = "009_fermentation_listing_index"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+_COLUMNS = (
+    "id, sample_type, fermentation_id, recorded_at, recorded_by_user_id, "
+    "is_deleted, data_source, imported_at, value, units, created_at, updated_at"
+)
+
+_COLUMN_DDL = """
+    id integer NOT NULL DEFAULT nextval('samples_id_seq'),
+    sample_type varchar(50) NOT NULL,
+    fermentation_id integer NOT NULL,
+    recorded_at timestamp without time zone NOT NULL,
+    recorded_by_user_id integer NOT NULL,
+    is_deleted boolean NOT NULL DEFAULT false,
+    data_source varchar(20) NOT NULL DEFAULT 'system',
+    imported_at timestamp without time zone,
+    value double precision NOT NULL,
+    units varchar(20) NOT NULL,
+    created_at timestamp without time zone NOT NULL,
+    updated_at timestamp without time zone NOT NULL,
+    CONSTRAINT fk_samples_fermentation FOREIGN KEY (fermentation_id)
+        REFERENCES fermentations (id),"""
+
+_OLD_INDEXES = (
+    "ix_samples_sample_type",
+    "ix_samples_fermentation_id",
+    "ix_samples_recorded_at",
+    "ix_samples_data_source",
+    "ix_samples__updated_at__id",
+)
+
+
+def upgrade() -> None:
+    # Reads prune on recorded_at >= start_date: refuse rows they would hide
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            bad_samples bigint;
+            bad_fermentations bigint;
+        BEGIN
+            SELECT count(*), count(DISTINCT s.fermentation_id)
+              INTO bad_samples, bad_fermentations
+              FROM samples s
+              JOIN fermentations f ON f.id = s.fermentation_id
+             WHERE s.recorded_at < f.start_date;
+            IF bad_samples > 0 THEN
+                RAISE EXCEPTION
+                    '% samples of % fermentations are recorded before the '
+                    'fermentation start_date; fix them before partitioning '
+                    '(see migration 010_partition_samples)',
+                    bad_samples, bad_fermentations;
+            END IF;
+        END $$
+        """
+    )
+
+    # Move the plain table aside (index and PK names are schema-wide)
+    for index in _OLD_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+    op.execute("ALTER TABLE samples RENAME TO samples_unpartitioned")
+    op.execute(
+        "ALTER TABLE samples_unpartitioned "
+        "RENAME CONSTRAINT samples_pkey TO samples_unpartitioned_pkey"
+    )
+
+    op.execute(
+        f"CREATE TABLE samples ({_COLUMN_DDL}\n"
+        "    CONSTRAINT samples_pkey PRIMARY KEY (id, recorded_at)\n"
+        ") PARTITION BY RANGE (recorded_at)"
+    )
+
+    # Yearly partitions from the oldest sample through next year
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            first_year integer;
+            last_year integer := extract(year FROM now())::integer + 1;
+        BEGIN
+            SELECT coalesce(extract(year FROM min(recorded_at))::integer,
+                            extract(year FROM now())::integer)
+              INTO first_year
+              FROM samples_unpartitioned;
+            FOR y IN first_year..last_year LOOP
+                EXECUTE format(
+                    'CREATE TABLE samples_y%s PARTITION OF samples '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    lpad(y::text, 4, '0'), make_date(y, 1, 1), make_date(y + 1, 1, 1)
+                );
+            END LOOP;
+        END $$
+        """
+    )
+    op.execute("CREATE TABLE samples_default PARTITION OF samples DEFAULT")
+
+    # Indexes on the parent are created on every partition
+    op.create_index("ix_samples__fermentation_id__sample_type__recorded_at",
+                    "samples", ["fermentation_id", "sample_type", "recorded_at"])
+    op.create_index("ix_samples__recorded_at_brin",
+                    "samples", ["recorded_at"], postgresql_using="brin")
+    op.create_index("ix_samples__updated_at__id",
+                    "samples", ["updated_at", "id"])
+    op.create_index("ix_samples_data_source", "samples", ["data_source"])
+
+    op.execute(
+        f"INSERT INTO samples ({_COLUMNS}) "
+        f"SELECT {_COLUMNS} FROM samples_unpartitioned"
+    )
+    # Keep the id sequence when the old table (its owner) is dropped
+    op.execute("ALTER SEQUENCE samples_id_seq OWNED BY samples.id")
+    op.execute("DROP TABLE samples_unpartitioned")
+    op.execute("ANALYZE samples")
+
+
+def downgrade() -> None:
+    op.execute(
+        f"CREATE TABLE samples_plain ({_COLUMN_DDL}\n"
+        "    CONSTRAINT samples_plain_pkey PRIMARY KEY (id)\n"
+        ")"
+    )
+    op.execute(f"INSERT INTO samples_plain ({_COLUMNS}) SELECT {_COLUMNS} FROM samples")
+    op.execute("ALTER SEQUENCE samples_id_seq OWNED BY samples_plain.id")
+    # Drops the parent with its attached partitions and their indexes
+    op.execute("DROP TABLE samples")
+    op.execute("ALTER TABLE samples_plain RENAME TO samples")
+    op.execute("ALTER TABLE samples RENAME CONSTRAINT samples_plain_pkey TO samples_pkey")
+
+    op.create_index("ix_samples_sample_type", "samples", ["sample_type"])
+    op.create_index("ix_samples_fermentation_id", "samples", ["fermentation_id"])
+    op.create_index("ix_samples_recorded_at", "samples", ["recorded_at"])
+    op.create_index("ix_samples_data_source", "samples", ["data_source"])
+    op.create_index("ix_samples__updated_at__id", "samples", ["updated_at", "id"])
@@ -0,0 +1,30 @@
+"""Cold-storage marker for archived fermentations
+
+Revision ID: 011_fermentation_archived_at
+Revises: 010_partition_samples
+Create Date: 2026-10-18
+
+Completed fermentations older than FERMENTATION_ARCHIVE_AFTER_DAYS have
+their samples and notes exported to compressed Parquet files and deleted
+from the hot tables (scripts/archive_fermentations.py). The fermentation
+row itself stays, with archived_at set, so listings, foreign keys and the
+sync feed keep working; reads of its samples and notes go to the archive.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "011_fermentation_archived_at"
+down_revision: Union[str, None] = "010_partition_samples"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("fermentations", sa.Column("archived_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("fermentations", "archived_at")
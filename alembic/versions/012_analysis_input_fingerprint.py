@@ -0,0 +1,30 @@
+"""Input fingerprint on analyses for result memoization
+
+Revision ID: 012_analysis_input_fingerprint
+Revises: 011_fermentation_archived_at
+Create Date: 2026-10-18
+
+POST /api/v1/analyses stores a hash of its inputs (readings window,
+variety, brix, compliance score, threshold and template versions) with
+each analysis. When a fermentation's latest completed analysis has the
+same fingerprint, it is returned instead of re-running the pipeline.
+Existing analyses keep NULL and are simply never reused.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "012_analysis_input_fingerprint"
+down_revision: Union[str, None] = "011_fermentation_archived_at"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("analysis", sa.Column("input_fingerprint", sa.String(64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("analysis", "input_fingerprint")
@@ -0,0 +1,44 @@
+"""Restrict protocol version uniqueness to master templates
+
+Revision ID: 013_protocol_template_uniqueness
+Revises: 012_analysis_input_fingerprint
+Create Date: 2026-10-18
+
+Protocol instances (is_template=false) copy the winery, varietal and
+version of their template, so the unique constraint on those columns
+rejected every instance. It becomes a partial unique index over master
+templates only, which also lets many instances of one template be
+inserted in a single statement when a harvest starts.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "013_protocol_template_uniqueness"
+down_revision: Union[str, None] = "012_analysis_input_fingerprint"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.drop_constraint(
+        "uq_protocol_winery_varietal_version", "fermentation_protocols", type_="unique"
+    )
+    op.create_index(
+        "uq_protocols__winery_varietal_version",
+        "fermentation_protocols",
+        ["winery_id", "varietal_code", "version"],
+        unique=True,
+        postgresql_where=sa.text("is_template"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_protocols__winery_varietal_version", table_name="fermentation_protocols")
+    op.create_unique_constraint(
+        "uq_protocol_winery_varietal_version",
+        "fermentation_protocols",
+        ["winery_id", "varietal_code", "version"],
+    )
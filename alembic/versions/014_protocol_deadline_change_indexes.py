@@ -0,0 +1,38 @@
+"""updated_at indexes for the alert scheduler's deadline refresh
+
+Revision ID: 014_protocol_deadline_change_indexes
+Revises: 013_protocol_template_uniqueness
+Create Date: 2026-10-18
+
+The alert scheduler keeps step deadlines in memory and only recomputes
+the executions whose execution row, completions, protocol or steps
+changed since its last refresh. These indexes keep that lookup
+proportional to the number of changed rows instead of the table sizes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "014_protocol_deadline_change_indexes"
+down_revision: Union[str, None] = "013_protocol_template_uniqueness"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_protocol_executions__updated_at",
+                    "protocol_executions", ["updated_at"])
+    op.create_index("ix_step_completions__updated_at",
+                    "step_completions", ["updated_at"])
+    op.create_index("ix_protocol_steps__updated_at",
+                    "protocol_steps", ["updated_at"])
+    op.create_index("ix_fermentation_protocols__updated_at",
+                    "fermentation_protocols", ["updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_fermentation_protocols__updated_at", table_name="fermentation_protocols")
+    op.drop_index("ix_protocol_steps__updated_at", table_name="protocol_steps")
+    op.drop_index("ix_step_completions__updated_at", table_name="step_completions")
+    op.drop_index("ix_protocol_executions__updated_at", table_name="protocol_executions")
@@ -0,0 +1,92 @@
+"""Alert inbox: per-winery and per-execution alert counters
+
+Revision ID: 015_alert_inbox_counts
+Revises: 014_protocol_deadline_change_indexes
+Create Date: 2026-10-18
+
+The alert badge and the per-tank alert counts on the winery dashboard
+counted protocol_alerts per request (one query per execution). These
+tables hold the counts by severity and status; ProtocolAlertRepository
+updates them in the same transaction as every alert write. They are
+backfilled from the existing alerts.
+
+Like protocol_alerts.winery_id (migration 002), winery_id has no FK to
+wineries: the counters must accept every winery an alert can carry.
+
+ix_protocol_alerts__winery_status_created backs the keyset-paginated
+inbox (a winery's alerts of one status, newest first).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "015_alert_inbox_counts"
+down_revision: Union[str, None] = "014_protocol_deadline_change_indexes"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "alert_inbox_winery_counts",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("winery_id", sa.Integer(), nullable=False),
+        sa.Column("severity", sa.String(20), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("alert_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("winery_id", "severity", "status",
+                            name="uq_alert_inbox_winery_counts__winery_severity_status"),
+    )
+    op.create_table(
+        "alert_inbox_execution_counts",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("execution_id", sa.Integer(), nullable=False),
+        sa.Column("winery_id", sa.Integer(), nullable=False),
+        sa.Column("severity", sa.String(20), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("alert_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["execution_id"], ["protocol_executions.id"],
+                                name="fk_alert_inbox_execution_counts_execution",
+                                ondelete="CASCADE"),
+        sa.UniqueConstraint("execution_id", "severity", "status",
+                            name="uq_alert_inbox_execution_counts__execution_severity_status"),
+    )
+    op.create_index("ix_alert_inbox_execution_counts__winery_id",
+                    "alert_inbox_execution_counts", ["winery_id"])
+    op.create_index("ix_protocol_alerts__winery_status_created",
+                    "protocol_alerts", ["winery_id", "status", "created_at", "id"])
+
+    op.execute(
+        """
+        INSERT INTO alert_inbox_execution_counts
+            (execution_id, winery_id, severity, status, alert_count, created_at, updated_at)
+        SELECT execution_id, winery_id, severity, status, COUNT(*), NOW(), NOW()
+        FROM protocol_alerts
+        GROUP BY execution_id, winery_id, severity, status
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO alert_inbox_winery_counts
+            (winery_id, severity, status, alert_count, created_at, updated_at)
+        SELECT winery_id, severity, status, COUNT(*), NOW(), NOW()
+        FROM protocol_alerts
+        GROUP BY winery_id, severity, status
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_protocol_alerts__winery_status_created", table_name="protocol_alerts")
+    op.drop_index("ix_alert_inbox_execution_counts__winery_id",
+                  table_name="alert_inbox_execution_counts")
+    op.drop_table("alert_inbox_execution_counts")
+    op.drop_table("alert_inbox_winery_counts")
@@ -46,6 +46,7 @@ $testResults = @{
     SharedInfraUnit = $null
     SharedErrorHandlingUnit = $null
     SharedLoggingMiddlewareUnit = $null
+    SharedLoggingPipelineUnit = $null
     SharedAuthUnit = $null
     SharedAuthIntegration = $null
     WineryUnit = $null
@@ -246,6 +247,16 @@ $testResults.SharedLoggingMiddlewareUnit = Invoke-TestSuite `
 
 if (-not $testResults.SharedLoggingMiddlewareUnit.Success) { $allPassed = $false }
 
+# Run Shared Logging Pipeline Unit Tests (pure ASGI LoggingMiddleware, async log sink, sampling)
+Write-Host "`n"
+$testResults.SharedLoggingPipelineUnit = Invoke-TestSuite `
+    -Name "Shared Logging Pipeline - Unit Tests" `
+    -ModulePath "src/shared" `
+    -TestPath "../../tests/shared/observability/" `
+    -Type "unit"
+
+if (-not $testResults.SharedLoggingPipelineUnit.Success) { $allPassed = $false }
+
 # Run Shared Auth Unit Tests
 Write-Host "`n"
 $testResults.SharedAuthUnit = Invoke-TestSuite `
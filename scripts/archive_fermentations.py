@@ -0,0 +1,79 @@
+"""
+Fermentation Cold-Storage Archival
+
+Moves the samples and notes of completed fermentations untouched for
+FERMENTATION_ARCHIVE_AFTER_DAYS (default 365) into compressed Parquet
+files under FERMENTATION_ARCHIVE_DIR (see alembic migration
+011_fermentation_archived_at). Runs on the ETL pool; meant for a nightly
+cron job on a host sharing the archive directory with the fermentation
+service.
+
+Usage:
+    python -m scripts.archive_fermentations [--older-than-days 365] [--limit 100]
+
+Archived data stays readable through the API (timeline, notes, pattern
+extraction read it back from the archive files).
+"""
+
+import argparse
+import asyncio
+import os
+
+from src.shared.infra.database.config import DatabaseConfig
+from src.shared.infra.database.engine_registry import POOL_ETL, get_engine_registry
+from src.shared.infra.database.session import DatabaseSession
+
+from src.modules.fermentation.src.repository_component.repositories.fermentation_archive_repository import (
+    FermentationArchiveRepository,
+)
+from src.modules.fermentation.src.repository_component.repositories.parquet_archive_store import (
+    ParquetArchiveStore,
+)
+from src.modules.fermentation.src.service_component.services.fermentation_archive_service import (
+    DEFAULT_ARCHIVE_AFTER_DAYS,
+    DEFAULT_ARCHIVE_BATCH_SIZE,
+    FermentationArchiveService,
+)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Archive completed fermentations")
+    parser.add_argument(
+        "--older-than-days",
+        type=int,
+        default=int(
+            os.getenv("FERMENTATION_ARCHIVE_AFTER_DAYS", str(DEFAULT_ARCHIVE_AFTER_DAYS))
+        ),
+    )
+    parser.add_argument("--limit", type=int, default=DEFAULT_ARCHIVE_BATCH_SIZE)
+    return parser.parse_args()
+
+
+async def main():
+    """Main entry point for fermentation archival"""
+    args = _parse_args()
+    service = FermentationArchiveService(
+        archive_repo=FermentationArchiveRepository(
+            DatabaseSession(DatabaseConfig(pool=POOL_ETL))
+        ),
+        archive_store=ParquetArchiveStore.from_env(),
+    )
+
+    try:
+        result = await service.archive_completed(
+            older_than_days=args.older_than_days, limit=args.limit
+        )
+    finally:
+        await get_engine_registry().dispose(POOL_ETL)
+
+    print(
+        f"✅ Archived {len(result.archived)} fermentations "
+        f"({result.samples_archived} samples, {result.notes_archived} notes)"
+    )
+    if result.failed:
+        print(f"⚠️  Left hot (retried next run): {result.failed}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
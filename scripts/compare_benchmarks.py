@@ -0,0 +1,59 @@
+"""
+Benchmark Comparison
+
+Compares two benchmark result files written by the benchmark suite
+(``python -m pytest tests/benchmarks --benchmark --benchmark-save PATH``)
+and exits non-zero when a benchmark's median regressed by more than the
+threshold, e.g. to check a CI run against the committed baseline:
+
+    python -m scripts.compare_benchmarks tests/benchmarks/baseline.json current.json
+
+Usage:
+    python -m scripts.compare_benchmarks BASELINE CURRENT [--threshold 0.25]
+"""
+
+import argparse
+import sys
+
+from src.shared.testing.benchmark import (
+    DEFAULT_REGRESSION_THRESHOLD,
+    REGRESSED,
+    compare_results,
+    format_comparison,
+    load_results,
+)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline", help="Baseline results (JSON)")
+    parser.add_argument("current", help="Results to check (JSON)")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help="Median slowdown counted as a regression (default: 0.25)",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Main entry point for benchmark comparison"""
+    args = _parse_args()
+    comparisons = compare_results(
+        load_results(args.baseline), load_results(args.current), threshold=args.threshold
+    )
+
+    for line in format_comparison(comparisons):
+        print(line)
+
+    regressed = [c.key for c in comparisons if c.status == REGRESSED]
+    if regressed:
+        print(f"\n❌ {len(regressed)} benchmark(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    print(f"\n✅ No benchmark regressed by more than {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+Fermentation History Export
+
+Writes a winery's fermentation history as Parquet files for offline
+analytics (pandas, DuckDB, Spark), one file per dataset:
+
+    <output>/fermentations.parquet
+    <output>/samples.parquet       one row per reading time, one column per sample type
+    <output>/lot_sources.parquet
+    <output>/analyses.parquet      analysis engine runs, by integer fermentation_id
+
+Rows are read from server-side cursors on the ETL pool and written as one
+row group per chunk, so memory stays flat whatever the size of the
+history. Samples of archived fermentations are read back from
+FERMENTATION_ARCHIVE_DIR.
+
+Usage:
+    python -m scripts.export_fermentation_history WINERY_ID [--output DIR]
+        [--dataset samples ...] [--chunk-size 10000]
+"""
+
+import argparse
+import asyncio
+
+from src.shared.infra.database.config import DatabaseConfig
+from src.shared.infra.database.engine_registry import POOL_ETL, get_engine_registry
+from src.shared.infra.database.session import DatabaseSession
+
+from src.modules.fermentation.src.domain.enums.export_dataset import ExportDataset
+from src.modules.fermentation.src.repository_component.repositories.fermentation_export_repository import (
+    FermentationExportRepository,
+)
+from src.modules.fermentation.src.repository_component.repositories.parquet_archive_store import (
+    ParquetArchiveStore,
+)
+from src.modules.fermentation.src.service_component.services.fermentation_export_service import (
+    DEFAULT_EXPORT_CHUNK_SIZE,
+    FermentationExportService,
+)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Export fermentation history to Parquet")
+    parser.add_argument("winery_id", type=int)
+    parser.add_argument(
+        "--output", default=None, help="Output directory (default: export/winery_<id>)"
+    )
+    parser.add_argument(
+        "--dataset",
+        action="append",
+        choices=[d.value for d in ExportDataset],
+        help="Dataset to export (repeatable, default: all)",
+    )
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_EXPORT_CHUNK_SIZE)
+    return parser.parse_args()
+
+
+async def main():
+    """Main entry point for fermentation history export"""
+    args = _parse_args()
+    output = args.output or f"export/winery_{args.winery_id}"
+    datasets = [ExportDataset(d) for d in args.dataset] if args.dataset else list(ExportDataset)
+    service = FermentationExportService(
+        export_repo=FermentationExportRepository(
+            DatabaseSession(DatabaseConfig(pool=POOL_ETL))
+        ),
+        archive_store=ParquetArchiveStore.from_env(),
+    )
+
+    try:
+        written = await service.export_parquet(
+            args.winery_id, output, datasets=datasets, chunk_size=args.chunk_size
+        )
+    finally:
+        await get_engine_registry().dispose(POOL_ETL)
+
+    for dataset, rows in written.items():
+        print(f"✅ {dataset.value}: {rows} rows → {output}/{dataset.value}.parquet")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -14,8 +14,9 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.shared.infra.database.engine_registry import POOL_ETL, get_engine_registry
 
 from src.modules.fermentation.src.domain.entities.protocol_protocol import FermentationProtocol
 from src.modules.fermentation.src.domain.entities.protocol_step import ProtocolStep
@@ -94,22 +95,15 @@ class ProtocolLoader:
         self.async_session_factory = None
     
     async def connect(self):
-        """Create async engine and session factory"""
-        self.engine = create_async_engine(
-            self.db_url,
-            echo=False,
-            future=True
-        )
-        self.async_session_factory = sessionmaker(
-            self.engine,
-            class_=AsyncSession,
-            expire_on_commit=False
-        )
+        """Get the ETL pool engine and session factory from the engine registry"""
+        registry = get_engine_registry()
+        self.engine = registry.get_engine(POOL_ETL, self.db_url)
+        self.async_session_factory = registry.session_factory(POOL_ETL, self.db_url)
     
     async def disconnect(self):
-        """Close async engine"""
+        """Drain and close the ETL pool"""
         if self.engine:
-            await self.engine.dispose()
+            await get_engine_registry().dispose(POOL_ETL)
     
     async def load_protocol_from_file(self, file_path: Path) -> None:
         """
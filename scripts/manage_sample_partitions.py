@@ -0,0 +1,68 @@
+"""
+Sample Partition Maintenance
+
+Lists, creates and detaches the yearly partitions of the samples table
+(see alembic migration 010_partition_samples). Runs on the ETL pool.
+
+Usage:
+    python -m scripts.manage_sample_partitions list
+    python -m scripts.manage_sample_partitions ensure --from 2027 --through 2028
+    python -m scripts.manage_sample_partitions detach 2019
+
+Detached partitions stay in the database as standalone tables
+(samples_y<year>); archive them (pg_dump -t) and drop them separately.
+"""
+
+import argparse
+import asyncio
+from datetime import datetime
+
+from src.shared.infra.database.config import DatabaseConfig
+from src.shared.infra.database.engine_registry import POOL_ETL, get_engine_registry
+from src.shared.infra.database.session import DatabaseSession
+
+from src.modules.fermentation.src.repository_component.repositories.sample_partition_repository import (
+    SamplePartitionRepository,
+)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Manage samples table partitions")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="List attached partitions")
+
+    this_year = datetime.utcnow().year
+    ensure = commands.add_parser("ensure", help="Create missing yearly partitions")
+    ensure.add_argument("--from", dest="from_year", type=int, default=this_year)
+    ensure.add_argument("--through", dest="through_year", type=int, default=this_year + 1)
+
+    detach = commands.add_parser("detach", help="Detach a past year's partition")
+    detach.add_argument("year", type=int)
+    return parser.parse_args()
+
+
+async def main():
+    """Main entry point for partition maintenance"""
+    args = _parse_args()
+    repository = SamplePartitionRepository(DatabaseSession(DatabaseConfig(pool=POOL_ETL)))
+
+    try:
+        if args.command == "list":
+            for partition in await repository.list_partitions():
+                print(f"{partition.name:<20} ~{partition.estimated_rows} rows")
+        elif args.command == "ensure":
+            created = await repository.ensure_partitions(args.from_year, args.through_year)
+            print(f"✅ Created: {', '.join(created)}" if created else "✅ Nothing to create")
+        elif args.command == "detach":
+            name = await repository.detach_partition(args.year)
+            print(f"✅ Detached {name}")
+    except ValueError as e:
+        print(f"❌ {e}")
+        raise SystemExit(1)
+    finally:
+        await get_engine_registry().dispose(POOL_ETL)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,447 @@
+"""
+Winery Load Test
+
+Drives the four services with a production-shaped mix of traffic and
+reports p50/p95/p99 latency per endpoint:
+
+- cellar (weight 6): a cellar hand posts a temperature reading to one of
+  their tanks and reads back the latest sample
+- dashboard (weight 3): the winery dashboard lists active fermentations,
+  harvest lots and the winery, then opens one fermentation's statistics
+  and timeline
+- analysis (weight 1): a winemaker loads a fermentation's samples and
+  triggers an analysis from its density curve
+- the alert scheduler (AlertSchedulerService's deadline refresh and the
+  alerts falling due) runs every --alert-interval seconds on the
+  background pool next to the users
+
+By default the services are create_app() instances served in-process,
+routed by path like the nginx gateway, so their lifespans, pools and
+middleware run as deployed while the test needs no running containers.
+With --gateway the same scenarios hit running services over HTTP.
+
+The workload is read from the database: the winery with the most running
+fermentations (or --winery-id), its winemakers and its running
+fermentations. Access tokens are minted with JWT_SECRET_KEY, which must
+match the services' secret in --gateway mode.
+
+Reproducible run against the test stack's PostgreSQL (docker-compose.test.yml):
+    docker compose -f docker-compose.yml -f docker-compose.test.yml \\
+        --env-file .env.test --profile load run --rm loadtest
+
+Or against a local database filled by scripts.generate_synthetic_data:
+    python -m scripts.run_load_test --database-url postgresql+asyncpg://... \\
+        [--profile 30s:10,2m:25,30s:0] [--seed 42] [--output load-report.json]
+
+Exits non-zero when the error rate exceeds --max-error-rate or a request's
+p95 exceeds --max-p95-ms.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import secrets
+import sys
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import func, select
+
+from src.shared.auth.domain.dtos import UserContext
+from src.shared.auth.domain.entities.user import User
+from src.shared.auth.domain.enums.user_role import UserRole
+from src.shared.auth.infra.services.jwt_service import JwtService
+from src.shared.infra.database import POOL_ETL, DatabaseConfig, DatabaseSession
+from src.shared.infra.database.engine_registry import get_engine_registry
+from src.shared.infra.interfaces.session_manager import ISessionManager
+from src.shared.wine_fermentator_logging import configure_logging
+from src.shared.testing.load import (
+    LoadReport,
+    LoadTestRunner,
+    PeriodicJob,
+    RampProfile,
+    Scenario,
+    VirtualUser,
+    asgi_gateway,
+    format_report,
+    http_gateway,
+    save_report,
+)
+from src.modules.fermentation.src.domain.entities.fermentation import Fermentation
+from src.modules.fermentation.src.domain.entities.fermentation_lot_source import (
+    FermentationLotSource,
+)
+from src.modules.fermentation.src.domain.enums.fermentation_status import (
+    FermentationStatus,
+)
+from src.modules.fermentation.src.service_component.services.alert_scheduler_service import (
+    AlertSchedulerService,
+)
+from src.modules.fruit_origin.src.domain.entities.harvest_lot import HarvestLot
+
+API = "/api/v1"
+
+# Scenario weights: sample posts dominate, analyses are occasional
+CELLAR_WEIGHT = 6
+DASHBOARD_WEIGHT = 3
+ANALYSIS_WEIGHT = 1
+
+# Density readings sent with an analysis (the most recent ones)
+ANALYSIS_READINGS = 12
+
+# Path prefixes of each service, in nginx.conf order (advisories first)
+SERVICE_ROUTES = (
+    (rf"{API}/fermentations/[^/]+/advisories(/|$)", "analysis_engine"),
+    (rf"{API}/(analyses|recommendations|advisories)(/|$)", "analysis_engine"),
+    (rf"{API}/(wineries|admin/wineries|auth)(/|$)", "winery"),
+    (rf"{API}/(vineyards|harvest-lots)(/|$)", "fruit_origin"),
+    (rf"{API}/(fermentations|fermentation|protocols|executions|samples)(/|$)", "fermentation"),
+)
+
+
+@dataclass(frozen=True)
+class RunningFermentation:
+    id: int
+    variety: str
+    initial_sugar_brix: float
+    start_date: datetime
+
+
+@dataclass
+class Workload:
+    """Who generates the traffic and which fermentations it touches."""
+
+    winery_id: int
+    users: List[UserContext]
+    fermentations: List[RunningFermentation]
+    tokens: JwtService
+
+    def user_for(self, vu: VirtualUser) -> UserContext:
+        return self.users[vu.index % len(self.users)]
+
+    def tank_for(self, vu: VirtualUser) -> RunningFermentation:
+        # Each cellar hand owns a tank, so their sample timestamps never race
+        return self.fermentations[vu.index % len(self.fermentations)]
+
+    def headers(self, vu: VirtualUser) -> Dict[str, str]:
+        # Access tokens expire after minutes; mint one per scenario run
+        token = self.tokens.encode_access_token(self.user_for(vu))
+        return {"Authorization": f"Bearer {token}"}
+
+
+async def load_workload(
+    session_manager: ISessionManager,
+    secret_key: str,
+    winery_id: Optional[int] = None,
+    max_fermentations: int = 500,
+) -> Workload:
+    """Read the winery, its winemakers and its running fermentations."""
+    # Core tables: a plain read needs no ORM mapper configuration
+    fermentations = Fermentation.__table__
+    lot_sources = FermentationLotSource.__table__
+    harvest_lots = HarvestLot.__table__
+    users = User.__table__
+    running = (
+        fermentations.c.status != FermentationStatus.COMPLETED.value,
+        fermentations.c.is_deleted.is_(False),
+    )
+    async with session_manager.get_session() as session:
+        if winery_id is None:
+            winery_id = (
+                await session.execute(
+                    select(fermentations.c.winery_id)
+                    .where(*running)
+                    .group_by(fermentations.c.winery_id)
+                    .order_by(func.count().desc(), fermentations.c.winery_id)
+                    .limit(1)
+                )
+            ).scalar_one_or_none()
+            if winery_id is None:
+                raise ValueError("No winery has running fermentations; seed the database first")
+
+        user_rows = (
+            await session.execute(
+                select(users.c.id, users.c.email, users.c.role)
+                .where(
+                    users.c.winery_id == winery_id,
+                    users.c.is_active.is_(True),
+                    users.c.role.in_([UserRole.WINEMAKER.value, UserRole.ADMIN.value]),
+                )
+                .order_by(users.c.id)
+            )
+        ).all()
+        if not user_rows:
+            raise ValueError(f"Winery {winery_id} has no active winemaker or admin")
+
+        rows = (
+            await session.execute(
+                select(
+                    fermentations.c.id,
+                    func.min(harvest_lots.c.grape_variety),
+                    fermentations.c.initial_sugar_brix,
+                    fermentations.c.start_date,
+                )
+                .select_from(fermentations)
+                .outerjoin(lot_sources, lot_sources.c.fermentation_id == fermentations.c.id)
+                .outerjoin(harvest_lots, harvest_lots.c.id == lot_sources.c.harvest_lot_id)
+                .where(fermentations.c.winery_id == winery_id, *running)
+                .group_by(fermentations.c.id)
+                .order_by(fermentations.c.id)
+                .limit(max_fermentations)
+            )
+        ).all()
+
+    if not rows:
+        raise ValueError(f"Winery {winery_id} has no running fermentations")
+    return Workload(
+        winery_id=winery_id,
+        users=[
+            UserContext(
+                user_id=user_id, winery_id=winery_id, email=email, role=UserRole(role)
+            )
+            for user_id, email, role in user_rows
+        ],
+        fermentations=[
+            RunningFermentation(
+                id=row[0],
+                variety=row[1] or "Unknown",
+                initial_sugar_brix=row[2],
+                start_date=row[3],
+            )
+            for row in rows
+        ],
+        tokens=JwtService(secret_key=secret_key),
+    )
+
+
+def build_scenarios(workload: Workload) -> List[Scenario]:
+    """The winery traffic mix."""
+
+    async def cellar(vu: VirtualUser) -> None:
+        tank = workload.tank_for(vu)
+        headers = workload.headers(vu)
+        await vu.request(
+            "POST",
+            f"{API}/fermentations/{tank.id}/samples",
+            headers=headers,
+            json={
+                "sample_type": "temperature",
+                "value": round(vu.random.uniform(18.0, 28.0), 1),
+                "units": "°C",
+                "recorded_at": datetime.utcnow().isoformat(),
+            },
+        )
+        await vu.request(
+            "GET", f"{API}/fermentations/{tank.id}/samples/latest", headers=headers
+        )
+
+    async def dashboard(vu: VirtualUser) -> None:
+        headers = workload.headers(vu)
+        await vu.request(
+            "GET", f"{API}/fermentations", headers=headers, params={"page": 1, "size": 20}
+        )
+        await vu.request("GET", f"{API}/harvest-lots/", headers=headers)
+        await vu.request("GET", f"{API}/admin/wineries/{workload.winery_id}", headers=headers)
+        fermentation = vu.random.choice(workload.fermentations)
+        await vu.request(
+            "GET", f"{API}/fermentations/{fermentation.id}/statistics", headers=headers
+        )
+        await vu.request(
+            "GET", f"{API}/fermentations/{fermentation.id}/timeline", headers=headers
+        )
+
+    async def analysis(vu: VirtualUser) -> None:
+        fermentation = vu.random.choice(workload.fermentations)
+        headers = workload.headers(vu)
+        response = await vu.request(
+            "GET", f"{API}/fermentations/{fermentation.id}/samples", headers=headers
+        )
+        if response is None or not response.is_success:
+            return
+        payload = analysis_payload(fermentation, response.json())
+        await vu.request("POST", f"{API}/analyses", headers=headers, json=payload)
+
+    return [
+        Scenario("cellar", cellar, weight=CELLAR_WEIGHT),
+        Scenario("dashboard", dashboard, weight=DASHBOARD_WEIGHT),
+        Scenario("analysis", analysis, weight=ANALYSIS_WEIGHT),
+    ]
+
+
+def analysis_payload(fermentation: RunningFermentation, samples: Sequence[dict]) -> dict:
+    """Analysis request built from a fermentation's latest readings."""
+    readings = [s for s in samples if s["sample_type"] == "density"][-ANALYSIS_READINGS:]
+    temperatures = [s for s in samples if s["sample_type"] == "temperature"]
+    if readings:
+        current_density = readings[-1]["value"]
+        last_reading = datetime.fromisoformat(readings[-1]["recorded_at"]).replace(tzinfo=None)
+    else:
+        current_density, last_reading = 1090.0, fermentation.start_date
+    return {
+        # The analysis engine keys fermentations as UUID(int=<integer id>)
+        "fermentation_id": str(uuid.UUID(int=fermentation.id)),
+        "current_density": current_density,
+        "temperature_celsius": temperatures[-1]["value"] if temperatures else 22.0,
+        "variety": fermentation.variety,
+        "starting_brix": fermentation.initial_sugar_brix,
+        "days_fermenting": min(
+            max((last_reading - fermentation.start_date).total_seconds() / 86400, 0.0), 365.0
+        ),
+        "previous_densities": [
+            {"timestamp": s["recorded_at"], "density": s["value"]} for s in readings
+        ],
+    }
+
+
+def alert_deadline_job(database_url: str, interval: float) -> PeriodicJob:
+    """The alert scheduler's deadline refresh and due alerts, on its own background pool."""
+    scheduler = AlertSchedulerService(database_url=database_url)
+    return PeriodicJob("alert_deadlines", scheduler.run_pending, interval=interval)
+
+
+def in_process_apps():
+    """One create_app() instance per service, keyed like SERVICE_ROUTES."""
+    from src.modules.analysis_engine.src.main import create_app as analysis_engine_app
+    from src.modules.fermentation.src.main import create_app as fermentation_app
+    from src.modules.fruit_origin.src.main import create_app as fruit_origin_app
+    from src.modules.winery.src.main import create_app as winery_app
+
+    return {
+        "fermentation": fermentation_app(),
+        "winery": winery_app(),
+        "fruit_origin": fruit_origin_app(),
+        "analysis_engine": analysis_engine_app(),
+    }
+
+
+def _gateway(args: argparse.Namespace):
+    if args.gateway:
+        return http_gateway(args.gateway)
+    apps = in_process_apps()
+    # The services log every request at INFO; keep the run's output readable
+    configure_logging(log_level=args.log_level)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    return asgi_gateway([(pattern, apps[service]) for pattern, service in SERVICE_ROUTES])
+
+
+def _failures(report: LoadReport, args: argparse.Namespace) -> List[str]:
+    failures = []
+    error_rate = report.total_errors / report.total_requests if report.total_requests else 1.0
+    if error_rate > args.max_error_rate:
+        failures.append(f"error rate {error_rate:.1%} exceeds {args.max_error_rate:.1%}")
+    if args.max_p95_ms is not None:
+        for endpoint in report.endpoints:
+            if endpoint.p95 * 1000 > args.max_p95_ms:
+                failures.append(
+                    f"{endpoint.name}: p95 {endpoint.p95 * 1000:.0f}ms exceeds {args.max_p95_ms:.0f}ms"
+                )
+    return failures
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load test the winery services")
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("DATABASE_URL"),
+        help="Async database URL (default: $DATABASE_URL)",
+    )
+    parser.add_argument(
+        "--gateway", help="Base URL of running services (default: create_app() in-process)"
+    )
+    parser.add_argument(
+        "--profile",
+        default="30s:10,2m:25,30s:0",
+        help="Ramp stages DURATION:USERS,... (default: 30s:10,2m:25,30s:0)",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the virtual users")
+    parser.add_argument("--winery-id", type=int, help="Winery to load (default: busiest)")
+    parser.add_argument(
+        "--think-time",
+        type=float,
+        nargs=2,
+        default=(0.5, 2.0),
+        metavar=("MIN", "MAX"),
+        help="Seconds a user waits between scenarios (default: 0.5 2.0)",
+    )
+    parser.add_argument(
+        "--alert-interval",
+        type=float,
+        default=60.0,
+        help="Seconds between alert scheduler runs; 0 disables them (default: 60)",
+    )
+    parser.add_argument(
+        "--log-level", default="WARNING", help="Log level of in-process services (default: WARNING)"
+    )
+    parser.add_argument("--output", help="Write the report as JSON to this path")
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--max-p95-ms", type=float, help="Fail when any request's p95 exceeds it")
+    return parser.parse_args()
+
+
+async def main() -> int:
+    """Main entry point for the load test"""
+    args = _parse_args()
+    if not args.database_url:
+        print("❌ Set DATABASE_URL or pass --database-url")
+        return 2
+    # The in-process services read both from the environment at startup
+    os.environ["DATABASE_URL"] = args.database_url
+    if not os.getenv("JWT_SECRET_KEY"):
+        if args.gateway:
+            print("❌ JWT_SECRET_KEY must match the services' secret")
+            return 2
+        os.environ["JWT_SECRET_KEY"] = secrets.token_hex(32)
+
+    session_manager = DatabaseSession(DatabaseConfig(pool=POOL_ETL))
+    try:
+        workload = await load_workload(
+            session_manager, os.environ["JWT_SECRET_KEY"], winery_id=args.winery_id
+        )
+    finally:
+        await get_engine_registry().dispose(POOL_ETL)
+    print(
+        f"Winery {workload.winery_id}: {len(workload.users)} users, "
+        f"{len(workload.fermentations)} running fermentations"
+    )
+
+    profile = RampProfile.parse(args.profile)
+    jobs = (
+        [alert_deadline_job(args.database_url, args.alert_interval)]
+        if args.alert_interval
+        else []
+    )
+    async with _gateway(args) as gateway:
+        runner = LoadTestRunner(
+            build_scenarios(workload),
+            profile,
+            gateway,
+            jobs=jobs,
+            think_time=tuple(args.think_time),
+            seed=args.seed,
+        )
+        report = await runner.run()
+
+    for line in format_report(report):
+        print(line)
+    if args.output:
+        save_report(args.output, report)
+        print(f"Report written to {args.output}")
+
+    failures = _failures(report, args)
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Load test passed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
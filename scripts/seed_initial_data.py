@@ -34,7 +34,7 @@ from sqlalchemy import select
 from src.modules.winery.src.domain.entities.winery import Winery
 from src.shared.auth.domain.entities.user import User
 from src.shared.auth.domain.enums.user_role import UserRole
-from src.shared.infra.database import DatabaseConfig, DatabaseSession
+from src.shared.infra.database import POOL_ETL, DatabaseConfig, DatabaseSession
 from src.shared.wine_fermentator_logging import get_logger
 from passlib.context import CryptContext
 
@@ -237,8 +237,8 @@ async def seed_all(config_path: str = "scripts/seed_config.yaml") -> Dict[str, A
         logger.warning("CHANGE THIS PASSWORD IMMEDIATELY in production!")
         logger.warning("")
     
-    # Build async session using shared DatabaseConfig + DatabaseSession
-    db_config = DatabaseConfig()
+    # Build async session using shared DatabaseConfig + DatabaseSession (ETL pool)
+    db_config = DatabaseConfig(pool=POOL_ETL)
     db_session = DatabaseSession(db_config)
     
     try:
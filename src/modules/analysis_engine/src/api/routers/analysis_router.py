@@ -3,7 +3,8 @@ Analysis Router - REST API endpoints for fermentation analysis.
 
 Implements analysis trigger and retrieval with:
 - JWT authentication (require_winemaker)
-- Multi-tenancy enforcement (winery_id from user context)
+- Multi-tenancy enforcement (winery_id from user context; analyses key
+  wineries by UUID, so an integer winery id is passed as UUID(int=id))
 - Request/response validation via Pydantic
 
 Endpoints:
@@ -33,6 +34,19 @@ from src.modules.analysis_engine.src.service_component.services.analysis_orchest
     AnalysisOrchestratorService,
 )
 
+
+def _winery_uuid(user: UserContext) -> UUID:
+    """
+    Winery key of the analyses the user can see.
+
+    Tokens carry integer winery ids; analyses are stored under UUID(int=id),
+    the mapping the event bus and the fermentation export use as well.
+    """
+    if isinstance(user.winery_id, UUID):
+        return user.winery_id
+    return UUID(int=user.winery_id)
+
+
 router = APIRouter(
     prefix="/analyses",
     tags=["analyses"],
@@ -47,6 +61,8 @@ router = APIRouter(
     description=(
         "Runs the full analysis pipeline for a fermentation: "
         "historical comparison → anomaly detection → recommendations. "
+        "When the inputs match the fermentation's latest completed analysis, "
+        "that analysis is returned instead; refresh=true always re-runs. "
         "Requires WINEMAKER or ADMIN role."
     ),
 )
@@ -55,6 +71,9 @@ async def trigger_analysis(
     request: AnalysisCreateRequest,
     current_user: Annotated[UserContext, Depends(require_winemaker)],
     orchestrator: Annotated[AnalysisOrchestratorService, Depends(get_analysis_orchestrator)],
+    refresh: Annotated[
+        bool, Query(description="Re-run the pipeline even if the inputs are unchanged")
+    ] = False,
 ) -> AnalysisResponse:
     """
     Trigger a new fermentation analysis.
@@ -68,6 +87,7 @@ async def trigger_analysis(
         request: Current fermentation readings and metadata
         current_user: Authenticated user (provides winery_id for multi-tenancy)
         orchestrator: Analysis orchestrator service
+        refresh: Bypass the input-fingerprint memo
 
     Returns:
         AnalysisResponse: Complete analysis with anomalies and recommendations
@@ -87,7 +107,7 @@ async def trigger_analysis(
         ]
 
     analysis = await orchestrator.execute_analysis(
-        winery_id=current_user.winery_id,
+        winery_id=_winery_uuid(current_user),
         fermentation_id=request.fermentation_id,
         current_density=request.current_density,
         temperature_celsius=request.temperature_celsius,
@@ -97,6 +117,7 @@ async def trigger_analysis(
         days_fermenting=request.days_fermenting,
         previous_densities=previous_densities,
         protocol_compliance_score=request.protocol_compliance_score,  # ADR-037 boost
+        force_refresh=refresh,
     )
 
     return AnalysisResponse.from_orm_entity(analysis)
@@ -133,7 +154,7 @@ async def get_analysis(
     """
     analysis = await orchestrator.get_analysis(
         analysis_id=analysis_id,
-        winery_id=current_user.winery_id,
+        winery_id=_winery_uuid(current_user),
     )
 
     if analysis is None:
@@ -177,7 +198,7 @@ async def list_fermentation_analyses(
     """
     analyses = await orchestrator.get_fermentation_analyses(
         fermentation_id=fermentation_id,
-        winery_id=current_user.winery_id,
+        winery_id=_winery_uuid(current_user),
         limit=limit,
     )
 
@@ -188,8 +209,9 @@ async def list_fermentation_analyses(
             status=a.status,
             analyzed_at=a.analyzed_at,
             historical_samples_count=a.historical_samples_count or 0,
-            anomaly_count=len(a.anomalies) if a.anomalies else 0,
-            recommendation_count=len(a.recommendations) if a.recommendations else 0,
+            anomaly_count=a.anomaly_count or 0,
+            recommendation_count=a.recommendation_count or 0,
+            max_severity=a.max_severity,
         )
         for a in analyses
     ]
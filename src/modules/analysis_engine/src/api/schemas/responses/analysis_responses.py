@@ -296,3 +296,6 @@ class AnalysisSummaryResponse(BaseModel):
     historical_samples_count: int = Field(..., description="Number of historical samples used", ge=0)
     anomaly_count: int = Field(default=0, description="Number of anomalies detected")
     recommendation_count: int = Field(default=0, description="Number of recommendations generated")
+    max_severity: Optional[str] = Field(
+        default=None, description="Highest anomaly severity (CRITICAL, WARNING, INFO), None without anomalies"
+    )
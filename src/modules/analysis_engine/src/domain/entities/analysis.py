@@ -10,9 +10,16 @@ from datetime import datetime, timezone
 from typing import List, Optional, TYPE_CHECKING
 from uuid import uuid4
 
-from sqlalchemy import String, Integer, DateTime, ForeignKey, Index
+from sqlalchemy import String, Integer, DateTime, ForeignKey, Index, case, func, select
 from sqlalchemy.dialects.postgresql import UUID as PGUUID, JSONB
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+    query_expression,
+    raiseload,
+    relationship,
+    with_expression,
+)
 
 from src.shared.infra.orm.base_entity import Base
 from ..enums.analysis_status import AnalysisStatus
@@ -62,6 +69,10 @@ class Analysis(Base):
     comparison_result: Mapped[dict] = mapped_column(JSONB, nullable=False)
     confidence_level: Mapped[dict] = mapped_column(JSONB, nullable=False)
     historical_samples_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Hash of the pipeline inputs; a later request with the same inputs
+    # reuses this analysis (AnalysisOrchestratorService.execute_analysis)
+    input_fingerprint: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
     
     # Relationships
     anomalies: Mapped[List["Anomaly"]] = relationship(
@@ -77,6 +88,12 @@ class Analysis(Base):
         cascade="all, delete-orphan"
     )
 
+    # Aggregates computed in SQL for list views (see summary_options());
+    # None when not loaded
+    anomaly_count: Mapped[Optional[int]] = query_expression()
+    recommendation_count: Mapped[Optional[int]] = query_expression()
+    max_severity: Mapped[Optional[str]] = query_expression()
+
     def __init__(
         self,
         fermentation_id=None,
@@ -134,6 +151,54 @@ class Analysis(Base):
 
         super().__init__(**kwargs)
 
+    @classmethod
+    def summary_options(cls) -> tuple:
+        """
+        Loader options for list views: headers plus child aggregates.
+
+        anomaly_count, recommendation_count and max_severity come from
+        correlated subqueries in the same statement, and the anomalies and
+        recommendations collections are not loaded (accessing them raises).
+        Use with populate_existing so analyses already in the session get
+        the expressions too.
+        """
+        from .anomaly import Anomaly
+        from .recommendation import Recommendation
+        from ..enums.severity_level import SeverityLevel
+
+        anomaly_count = (
+            select(func.count(Anomaly.id))
+            .where(Anomaly.analysis_id == cls.id)
+            .correlate(cls)
+            .scalar_subquery()
+        )
+        recommendation_count = (
+            select(func.count(Recommendation.id))
+            .where(Recommendation.analysis_id == cls.id)
+            .correlate(cls)
+            .scalar_subquery()
+        )
+        severity_rank = case(
+            {level.value: level.priority_score for level in SeverityLevel},
+            value=Anomaly.severity,
+            else_=0,
+        )
+        max_severity = (
+            select(Anomaly.severity)
+            .where(Anomaly.analysis_id == cls.id)
+            .order_by(severity_rank.desc())
+            .limit(1)
+            .correlate(cls)
+            .scalar_subquery()
+        )
+        return (
+            with_expression(cls.anomaly_count, anomaly_count),
+            with_expression(cls.recommendation_count, recommendation_count),
+            with_expression(cls.max_severity, max_severity),
+            raiseload(cls.anomalies),
+            raiseload(cls.recommendations),
+        )
+
     def start(self) -> None:
         """
         Start the analysis process.
@@ -93,6 +93,9 @@ class IAnalysisRepository(ABC):
     ) -> List['Analysis']:
         """
         List analyses for a winery with optional filtering.
+
+        Returns summaries: anomaly_count, recommendation_count and
+        max_severity are populated, the child collections are not loaded.
         
         Args:
             winery_id: The winery ID
@@ -115,7 +118,8 @@ class IAnalysisRepository(ABC):
         limit: int = 100
     ) -> List['Analysis']:
         """
-        List analyses within a date range for a winery.
+        List analyses within a date range for a winery (summaries, as
+        list_by_winery).
         
         Args:
             winery_id: The winery ID
@@ -251,6 +251,10 @@ class AnalysisRepository(BaseRepository, IAnalysisRepository):
         """
         Lists all analyses for a winery with pagination.
 
+        Returns summary projections (see Analysis.summary_options): child
+        counts and max severity are populated, anomalies and recommendations
+        are not loaded. Use get_by_id for the full analysis.
+
         Args:
             winery_id: Winery ID for filtering
             status: Optional status filter
@@ -282,7 +286,9 @@ class AnalysisRepository(BaseRepository, IAnalysisRepository):
                     
                     query = query.order_by(
                         Analysis.analyzed_at.desc()
-                    ).limit(limit).offset(offset)
+                    ).limit(limit).offset(offset).options(
+                        *Analysis.summary_options()
+                    ).execution_options(populate_existing=True)
 
                     result = await session.execute(query)
                     analyses = result.scalars().all()
@@ -437,6 +443,8 @@ class AnalysisRepository(BaseRepository, IAnalysisRepository):
     ) -> List[Analysis]:
         """
         List analyses within a date range for a winery.
+
+        Returns summary projections like list_by_winery.
         
         Args:
             winery_id: The winery ID
@@ -467,7 +475,9 @@ class AnalysisRepository(BaseRepository, IAnalysisRepository):
                         Analysis.analyzed_at <= end_date
                     ).order_by(
                         Analysis.analyzed_at.desc()
-                    ).offset(skip).limit(limit)
+                    ).offset(skip).limit(limit).options(
+                        *Analysis.summary_options()
+                    ).execution_options(populate_existing=True)
 
                     result = await session.execute(query)
                     analyses = result.scalars().all()
@@ -567,38 +577,50 @@ class AnalysisRepository(BaseRepository, IAnalysisRepository):
     async def get_by_winery(self, winery_id: UUID) -> List[Analysis]:
         """
         Get all analyses for a winery (simplified version of list_by_winery).
+
+        Returns summary projections like list_by_winery: anomalies and
+        recommendations are not loaded (accessing them raises). Use get_by_id
+        for a full analysis.
         
         Args:
             winery_id: The winery ID
             
         Returns:
-            List of all analyses for the winery
+            List of analysis summaries for the winery (at most 1000)
         """
         return await self.list_by_winery(winery_id, limit=1000)
 
     async def get_by_status(self, winery_id: UUID, status: AnalysisStatus) -> List[Analysis]:
         """
         Get analyses filtered by status.
+
+        Returns summary projections like list_by_winery: anomalies and
+        recommendations are not loaded (accessing them raises). Use get_by_id
+        for a full analysis.
         
         Args:
             winery_id: The winery ID
             status: The status to filter by
             
         Returns:
-            List of analyses with the specified status
+            List of analysis summaries with the specified status (at most 1000)
         """
         return await self.list_by_winery(winery_id, status=status, limit=1000)
 
     async def get_recent(self, winery_id: UUID, limit: int = 10) -> List[Analysis]:
         """
         Get most recent analyses for a winery.
+
+        Returns summary projections like list_by_winery: anomalies and
+        recommendations are not loaded (accessing them raises). Use get_by_id
+        for a full analysis.
         
         Args:
             winery_id: The winery ID
             limit: Maximum number of analyses to return
             
         Returns:
-            List of recent analyses ordered by analyzed_at DESC
+            List of recent analysis summaries ordered by analyzed_at DESC
         """
         return await self.list_by_winery(winery_id, limit=limit)
 
@@ -9,15 +9,18 @@ This is the main service that orchestrates the analysis pipeline:
 The orchestrator manages the Analysis aggregate root and coordinates
 all sub-services to produce a complete analysis result.
 """
+import hashlib
+import json
 from typing import Optional
 from uuid import UUID
 from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 from src.modules.analysis_engine.src.domain.entities.analysis import Analysis
 from src.modules.analysis_engine.src.domain.entities.anomaly import Anomaly
 from src.modules.analysis_engine.src.domain.entities.recommendation import Recommendation
+from src.modules.analysis_engine.src.domain.entities.recommendation_template import RecommendationTemplate
 from src.modules.analysis_engine.src.domain.enums.analysis_status import AnalysisStatus
 from src.modules.analysis_engine.src.domain.value_objects.confidence_level import ConfidenceLevel
 from src.modules.analysis_engine.src.service_component.services.comparison_service import ComparisonService
@@ -27,6 +30,10 @@ from src.modules.analysis_engine.src.service_component.services.protocol_integra
 from src.modules.analysis_engine.src.service_component.services.threshold_config_service import (
     ThresholdConfigService,
 )
+from src.shared.infra.events import EventBus, get_event_bus
+from src.shared.wine_fermentator_logging import get_logger
+
+logger = get_logger(__name__)
 
 
 class AnalysisOrchestratorService:
@@ -40,17 +47,29 @@ class AnalysisOrchestratorService:
     4. Call Recommendation Service → generate fixes
     5. Update Analysis (COMPLETE status)
     6. Persist all entities
+
+    Results are memoized by input fingerprint: when the fermentation's
+    latest completed analysis was computed from the same inputs, it is
+    returned without re-running the pipeline.
     """
     
-    def __init__(self, session: AsyncSession, threshold_config: ThresholdConfigService) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        threshold_config: ThresholdConfigService,
+        event_bus: Optional[EventBus] = None,
+    ) -> None:
         """
         Initialize the Analysis Orchestrator.
 
         Args:
             session: AsyncSession for database operations
             threshold_config: ThresholdConfigService for anomaly detection thresholds
+            event_bus: Bus for analysis.completed events (default: process bus)
         """
         self.session = session
+        self.threshold_config = threshold_config
+        self.event_bus = event_bus or get_event_bus()
         self.comparison = ComparisonService(session)
         self.anomaly_detection = AnomalyDetectionService(session, threshold_config)
         self.recommendation = RecommendationService(session)
@@ -68,6 +87,7 @@ class AnalysisOrchestratorService:
         days_fermenting: float = 0.0,
         previous_densities: Optional[list] = None,
         protocol_compliance_score: Optional[float] = None,
+        force_refresh: bool = False,
     ) -> Analysis:
         """
         Execute a complete fermentation analysis.
@@ -88,6 +108,8 @@ class AnalysisOrchestratorService:
             protocol_compliance_score: Protocol compliance % [0-100] from Protocol Engine.
                 If provided, confidence is boosted/penalised via ADR-037 formula.
                 If None (no protocol assigned), confidence is unchanged.
+            force_refresh: Run the pipeline even when the latest analysis was
+                computed from the same inputs
         
         Returns:
             Complete Analysis object with anomalies and recommendations
@@ -95,6 +117,30 @@ class AnalysisOrchestratorService:
         Raises:
             WineryAccessDenied: If attempting cross-winery access
         """
+        # Step 0: Reuse the latest analysis when nothing changed since
+        fingerprint = self._input_fingerprint(
+            fermentation_id=fermentation_id,
+            current_density=current_density,
+            temperature_celsius=temperature_celsius,
+            variety=variety,
+            fruit_origin_id=fruit_origin_id,
+            starting_brix=starting_brix,
+            days_fermenting=days_fermenting,
+            previous_densities=previous_densities or [],
+            protocol_compliance_score=protocol_compliance_score,
+            threshold_version=self.threshold_config.version,
+            template_version=await self._template_version(),
+        )
+        if not force_refresh:
+            memoized = await self._memoized_analysis(winery_id, fermentation_id, fingerprint)
+            if memoized is not None:
+                logger.info(
+                    "analysis_reused",
+                    analysis_id=str(memoized.id),
+                    fermentation_id=str(fermentation_id),
+                )
+                return memoized
+
         # Step 1: Create and initialize Analysis
         analysis = Analysis(
             fermentation_id=fermentation_id,
@@ -104,6 +150,7 @@ class AnalysisOrchestratorService:
             comparison_result={},  # Will populate below
             confidence_level={},  # Will populate below
             historical_samples_count=0,
+            input_fingerprint=fingerprint,
         )
         
         try:
@@ -186,6 +233,18 @@ class AnalysisOrchestratorService:
             analysis.status = AnalysisStatus.FAILED.value
             raise
         
+        # Step 8: Notify the winery's open event streams
+        self.event_bus.publish(
+            winery_id,
+            "analysis.completed",
+            {
+                "id": analysis.id,
+                "fermentation_id": fermentation_id,
+                "anomaly_count": len(anomalies),
+                "recommendation_count": len(recommendations),
+                "overall_confidence": confidence.overall_confidence,
+            },
+        )
         return analysis
     
     async def get_analysis(
@@ -231,6 +290,10 @@ class AnalysisOrchestratorService:
     ) -> list[Analysis]:
         """
         Get analysis history for a fermentation.
+
+        Only headers and child aggregates are loaded (anomaly_count,
+        recommendation_count, max_severity); get_analysis loads the full
+        anomalies and recommendations.
         
         Args:
             fermentation_id: Fermentation to get history for
@@ -238,7 +301,7 @@ class AnalysisOrchestratorService:
             limit: Maximum results
         
         Returns:
-            List of Analysis objects, most recent first
+            List of Analysis summaries, most recent first
         """
         result = await self.session.execute(
             select(Analysis)
@@ -248,9 +311,93 @@ class AnalysisOrchestratorService:
             )
             .order_by(Analysis.analyzed_at.desc())
             .limit(limit)
+            .options(*Analysis.summary_options())
+            .execution_options(populate_existing=True)
         )
         return result.scalars().all()
     
+    async def _memoized_analysis(
+        self,
+        winery_id: UUID,
+        fermentation_id: UUID,
+        fingerprint: str,
+    ) -> Optional[Analysis]:
+        """
+        The fermentation's latest analysis, if it completed with these inputs.
+
+        Only the latest analysis's header is read; its anomalies and
+        recommendations load only on a hit.
+        """
+        result = await self.session.execute(
+            select(Analysis.id, Analysis.status, Analysis.input_fingerprint)
+            .where(
+                Analysis.fermentation_id == fermentation_id,
+                Analysis.winery_id == winery_id,
+            )
+            .order_by(Analysis.analyzed_at.desc())
+            .limit(1)
+        )
+        latest = result.first()
+        if (
+            latest is None
+            or latest.input_fingerprint != fingerprint
+            or latest.status != AnalysisStatus.COMPLETED.value
+        ):
+            return None
+        return await self.session.get(Analysis, latest.id)
+
+    async def _template_version(self) -> str:
+        """
+        Identifies the current recommendation templates.
+
+        Any template insert, update (updated_at) or delete changes it, which
+        invalidates memoized analyses.
+        """
+        result = await self.session.execute(
+            select(func.count(RecommendationTemplate.id), func.max(RecommendationTemplate.updated_at))
+        )
+        count, last_updated = result.one()
+        return f"{count}:{last_updated.isoformat() if last_updated else ''}"
+
+    @staticmethod
+    def _input_fingerprint(
+        fermentation_id: UUID,
+        current_density: float,
+        temperature_celsius: float,
+        variety: str,
+        fruit_origin_id: Optional[UUID],
+        starting_brix: Optional[float],
+        days_fermenting: float,
+        previous_densities: list,
+        protocol_compliance_score: Optional[float],
+        threshold_version: str,
+        template_version: str,
+    ) -> str:
+        """
+        SHA-256 of everything the pipeline result depends on.
+
+        Readings are ordered by timestamp so the same window in a different
+        order gives the same fingerprint.
+        """
+        readings = sorted(
+            (timestamp.isoformat(), density) for timestamp, density in previous_densities
+        )
+        inputs = {
+            "fermentation_id": str(fermentation_id),
+            "current_density": current_density,
+            "temperature_celsius": temperature_celsius,
+            "variety": variety,
+            "fruit_origin_id": str(fruit_origin_id) if fruit_origin_id else None,
+            "starting_brix": starting_brix,
+            "days_fermenting": days_fermenting,
+            "previous_densities": readings,
+            "protocol_compliance_score": protocol_compliance_score,
+            "threshold_version": threshold_version,
+            "template_version": template_version,
+        }
+        canonical = json.dumps(inputs, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
     @staticmethod
     def _calculate_confidence(
         historical_count: int,
@@ -12,6 +12,8 @@ FUTURE — per-winery DB overrides (Option B):
 """
 from __future__ import annotations
 
+import hashlib
+import json
 import sys
 from dataclasses import dataclass
 from pathlib import Path
@@ -76,10 +78,19 @@ class ThresholdConfigService:
         svc = ThresholdConfigService()                        # uses default path
         svc = ThresholdConfigService(config_path=some_path)  # override (tests)
         thresholds = svc.get_thresholds("Cabernet Sauvignon")
+
+    ``version`` identifies the loaded thresholds; it is part of the analysis
+    input fingerprint, so reloading changed thresholds stops memoized
+    analyses from being reused.
     """
 
     def __init__(self, config_path: Path | None = None) -> None:
-        path = config_path or _DEFAULT_CONFIG_PATH
+        self._path = config_path or _DEFAULT_CONFIG_PATH
+        self.reload()
+
+    def reload(self) -> None:
+        """Re-read the config file (e.g. after thresholds were edited)."""
+        path = self._path
         try:
             with open(path, "rb") as f:
                 self._config = tomllib.load(f)
@@ -91,6 +102,8 @@ class ThresholdConfigService:
             raise ThresholdConfigError(
                 f"Failed to load threshold config from {path}: {exc}"
             ) from exc
+        canonical = json.dumps(self._config, sort_keys=True, default=str)
+        self.version = hashlib.sha256(canonical.encode()).hexdigest()[:16]
 
     def get_thresholds(self, variety: str) -> VarietalThresholds:
         """
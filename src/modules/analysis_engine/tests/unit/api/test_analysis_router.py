@@ -0,0 +1,87 @@
+"""
+Router-level tests for the analysis endpoints: winery scoping.
+
+The orchestrator is mocked; these tests check which winery key the router
+hands it for the authenticated user.
+"""
+import pytest
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.shared.auth.domain.dtos import UserContext
+from src.shared.auth.domain.enums.user_role import UserRole
+from src.shared.auth.infra.api.dependencies import require_winemaker
+from src.modules.analysis_engine.src.api.dependencies import get_analysis_orchestrator
+from src.modules.analysis_engine.src.api.routers.analysis_router import router
+
+
+def _client(winery_id, orchestrator):
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[require_winemaker] = lambda: UserContext(
+        user_id=1, winery_id=winery_id, email="w@x.com", role=UserRole.WINEMAKER
+    )
+    app.dependency_overrides[get_analysis_orchestrator] = lambda: orchestrator
+    return TestClient(app)
+
+
+@pytest.fixture
+def orchestrator():
+    mock = AsyncMock()
+    mock.get_analysis.return_value = None
+    mock.get_fermentation_analyses.return_value = []
+    return mock
+
+
+class TestWineryScoping:
+    def test_get_analysis_maps_integer_winery_id_to_uuid(self, orchestrator):
+        analysis_id = uuid4()
+
+        response = _client(42, orchestrator).get(f"/analyses/{analysis_id}")
+
+        assert response.status_code == 404
+        orchestrator.get_analysis.assert_awaited_once_with(
+            analysis_id=analysis_id, winery_id=UUID(int=42)
+        )
+
+    def test_list_fermentation_analyses_maps_integer_winery_id_to_uuid(self, orchestrator):
+        fermentation_id = uuid4()
+
+        response = _client(42, orchestrator).get(
+            f"/analyses/fermentation/{fermentation_id}", params={"limit": 5}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == []
+        orchestrator.get_fermentation_analyses.assert_awaited_once_with(
+            fermentation_id=fermentation_id, winery_id=UUID(int=42), limit=5
+        )
+
+    def test_trigger_analysis_maps_integer_winery_id_to_uuid(self, orchestrator):
+        # Stop after the call; the response mapping isn't under test here
+        orchestrator.execute_analysis.side_effect = RuntimeError("stop")
+
+        response = _client(42, orchestrator).post(
+                "/analyses",
+            json={
+                "fermentation_id": str(uuid4()),
+                "current_density": 1040.0,
+                "temperature_celsius": 20.0,
+                "variety": "Malbec",
+                "starting_brix": 24.0,
+                "days_fermenting": 3.0,
+            },
+        )
+
+        assert response.status_code == 500
+        assert orchestrator.execute_analysis.await_args.kwargs["winery_id"] == UUID(int=42)
+
+    def test_uuid_winery_id_is_passed_unchanged(self, orchestrator):
+        winery_id = uuid4()
+
+        _client(winery_id, orchestrator).get(f"/analyses/fermentation/{uuid4()}")
+
+        assert orchestrator.get_fermentation_analyses.await_args.kwargs["winery_id"] == winery_id
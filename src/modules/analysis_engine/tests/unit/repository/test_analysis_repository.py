@@ -8,9 +8,12 @@ constructs and executes the right queries.
 """
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import datetime, timezone
 from uuid import uuid4
 from contextlib import asynccontextmanager
 
+from sqlalchemy.dialects import postgresql
+
 from src.modules.analysis_engine.src.repository_component.repositories.analysis_repository import (
     AnalysisRepository,
 )
@@ -132,6 +135,40 @@ class TestAnalysisRepositoryGetByFermentationId:
         mock_session.execute.assert_called_once()
 
 
+def executed_sql(mock_session):
+    statement = mock_session.execute.call_args.args[0]
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestAnalysisRepositorySummaries:
+    """List methods load headers plus child aggregates, not the children."""
+
+    @pytest.mark.asyncio
+    async def test_list_by_winery_selects_child_aggregates(self, repo, mock_session, winery_id):
+        await repo.list_by_winery(winery_id, status=AnalysisStatus.COMPLETED)
+
+        sql = executed_sql(mock_session)
+        assert "count(anomaly.id)" in sql
+        assert "count(recommendation.id)" in sql
+        assert "ORDER BY CASE anomaly.severity" in sql
+
+    @pytest.mark.asyncio
+    async def test_list_by_date_range_selects_child_aggregates(self, repo, mock_session, winery_id):
+        await repo.list_by_date_range(
+            winery_id, datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 2, 1, tzinfo=timezone.utc)
+        )
+
+        sql = executed_sql(mock_session)
+        assert "count(anomaly.id)" in sql
+        assert "count(recommendation.id)" in sql
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_loads_the_full_analysis(self, repo, mock_session, winery_id):
+        await repo.get_by_id(uuid4(), winery_id)
+
+        assert "count(anomaly.id)" not in executed_sql(mock_session)
+
+
 class TestAnalysisRepositoryTableName:
     def test_analysis_tablename(self):
         assert Analysis.__tablename__ == "analysis"
@@ -3,7 +3,9 @@ Tests for AnalysisOrchestratorService.
 """
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import datetime, timezone
 from uuid import uuid4
+from sqlalchemy.dialects import postgresql
 
 from src.modules.analysis_engine.src.service_component.services.analysis_orchestrator_service import (
     AnalysisOrchestratorService,
@@ -103,6 +105,164 @@ class TestGetFermentationAnalyses:
         )
         assert len(result) == 2
 
+    @pytest.mark.asyncio
+    async def test_loads_child_aggregates_instead_of_children(self, mock_async_session, winery_id, fermentation_id, threshold_config):
+        orchestrator = AnalysisOrchestratorService(session=mock_async_session, threshold_config=threshold_config)
+        mock_async_session.execute.return_value.scalars.return_value.all.return_value = []
+        await orchestrator.get_fermentation_analyses(
+            fermentation_id=fermentation_id,
+            winery_id=winery_id,
+        )
+        statement = mock_async_session.execute.call_args.args[0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "count(anomaly.id)" in sql
+        assert "count(recommendation.id)" in sql
+
+
+TEMPLATES_UPDATED_AT = datetime(2024, 9, 1, tzinfo=timezone.utc)
+READINGS = [
+    (datetime(2024, 9, 2, 8, 0, tzinfo=timezone.utc), 1080.0),
+    (datetime(2024, 9, 3, 8, 0, tzinfo=timezone.utc), 1065.0),
+]
+
+
+def memo_inputs(fermentation_id, **overrides):
+    inputs = dict(
+        fermentation_id=fermentation_id,
+        current_density=1050.0,
+        temperature_celsius=24.0,
+        variety="Merlot",
+        fruit_origin_id=None,
+        starting_brix=24.5,
+        days_fermenting=2.0,
+        previous_densities=READINGS,
+        protocol_compliance_score=None,
+    )
+    inputs.update(overrides)
+    return inputs
+
+
+def stub_memo_queries(session, latest):
+    """Template version query, then the latest-analysis header query."""
+    templates = MagicMock()
+    templates.one.return_value = (12, TEMPLATES_UPDATED_AT)
+    headers = MagicMock()
+    headers.first.return_value = latest
+    session.execute.side_effect = [templates, headers]
+
+
+class TestAnalysisMemoization:
+    def fingerprint(self, threshold_config, fermentation_id, **overrides):
+        return AnalysisOrchestratorService._input_fingerprint(
+            **memo_inputs(fermentation_id, **overrides),
+            threshold_version=threshold_config.version,
+            template_version=f"12:{TEMPLATES_UPDATED_AT.isoformat()}",
+        )
+
+    def test_fingerprint_ignores_reading_order(self, threshold_config, fermentation_id):
+        assert self.fingerprint(threshold_config, fermentation_id) == self.fingerprint(
+            threshold_config, fermentation_id, previous_densities=list(reversed(READINGS))
+        )
+
+    def test_fingerprint_changes_with_any_input(self, threshold_config, fermentation_id):
+        base = self.fingerprint(threshold_config, fermentation_id)
+        assert self.fingerprint(threshold_config, fermentation_id, current_density=1049.0) != base
+        assert self.fingerprint(threshold_config, fermentation_id, protocol_compliance_score=80.0) != base
+        assert AnalysisOrchestratorService._input_fingerprint(
+            **memo_inputs(fermentation_id),
+            threshold_version="other",
+            template_version=f"12:{TEMPLATES_UPDATED_AT.isoformat()}",
+        ) != base
+
+    @pytest.mark.asyncio
+    async def test_unchanged_inputs_return_the_latest_analysis(
+        self, mock_async_session, winery_id, fermentation_id, threshold_config
+    ):
+        orchestrator = AnalysisOrchestratorService(session=mock_async_session, threshold_config=threshold_config)
+        orchestrator.comparison.find_similar_fermentations = AsyncMock()
+        latest = Analysis(fermentation_id=fermentation_id, winery_id=winery_id)
+        stub_memo_queries(mock_async_session, MagicMock(
+            id=latest.id,
+            status=AnalysisStatus.COMPLETED.value,
+            input_fingerprint=self.fingerprint(threshold_config, fermentation_id),
+        ))
+        mock_async_session.get.return_value = latest
+
+        result = await orchestrator.execute_analysis(winery_id=winery_id, **memo_inputs(fermentation_id))
+
+        assert result is latest
+        mock_async_session.get.assert_awaited_once_with(Analysis, latest.id)
+        orchestrator.comparison.find_similar_fermentations.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status, fingerprint_overrides", [
+        (AnalysisStatus.COMPLETED.value, {"current_density": 1049.0}),
+        (AnalysisStatus.FAILED.value, {}),
+    ])
+    async def test_changed_inputs_or_unfinished_analysis_rerun_the_pipeline(
+        self, mock_async_session, winery_id, fermentation_id, threshold_config, status, fingerprint_overrides
+    ):
+        orchestrator = AnalysisOrchestratorService(session=mock_async_session, threshold_config=threshold_config)
+        orchestrator.comparison.find_similar_fermentations = AsyncMock(side_effect=RuntimeError("pipeline ran"))
+        stub_memo_queries(mock_async_session, MagicMock(
+            id=uuid4(),
+            status=status,
+            input_fingerprint=self.fingerprint(threshold_config, fermentation_id, **fingerprint_overrides),
+        ))
+
+        with pytest.raises(RuntimeError, match="pipeline ran"):
+            await orchestrator.execute_analysis(winery_id=winery_id, **memo_inputs(fermentation_id))
+
+    @pytest.mark.asyncio
+    async def test_force_refresh_bypasses_the_memo(
+        self, mock_async_session, winery_id, fermentation_id, threshold_config
+    ):
+        orchestrator = AnalysisOrchestratorService(session=mock_async_session, threshold_config=threshold_config)
+        orchestrator.comparison.find_similar_fermentations = AsyncMock(side_effect=RuntimeError("pipeline ran"))
+        stub_memo_queries(mock_async_session, latest=None)
+
+        with pytest.raises(RuntimeError, match="pipeline ran"):
+            await orchestrator.execute_analysis(
+                winery_id=winery_id, force_refresh=True, **memo_inputs(fermentation_id)
+            )
+        # Only the template version was read; no memo lookup
+        assert mock_async_session.execute.await_count == 1
+
+
+class TestAnalysisCompletedEvent:
+    @pytest.mark.asyncio
+    async def test_reaches_streams_opened_with_the_integer_winery_id(
+        self, mock_async_session, fermentation_id, threshold_config
+    ):
+        from src.modules.analysis_engine.src.api.routers.analysis_router import _winery_uuid
+        from src.shared.auth.domain.dtos import UserContext
+        from src.shared.auth.domain.enums.user_role import UserRole
+        from src.shared.infra.events import EventBus
+
+        user = UserContext(user_id=1, winery_id=42, email="w@x.com", role=UserRole.WINEMAKER)
+        bus = EventBus()
+        # Keyed the way the SSE stream router subscribes
+        subscription = bus.subscribe(user.winery_id)
+        orchestrator = AnalysisOrchestratorService(
+            session=mock_async_session, threshold_config=threshold_config, event_bus=bus
+        )
+        orchestrator.comparison.find_similar_fermentations = AsyncMock(return_value=([], 0))
+        orchestrator.comparison.build_comparison_result = AsyncMock(
+            return_value=MagicMock(average_duration_days=None, to_dict=MagicMock(return_value={}))
+        )
+        orchestrator.anomaly_detection.detect_all_anomalies = AsyncMock(return_value=[])
+        orchestrator.recommendation.generate_recommendations = AsyncMock(return_value=[])
+        stub_memo_queries(mock_async_session, latest=None)
+
+        await orchestrator.execute_analysis(
+            winery_id=_winery_uuid(user), **memo_inputs(fermentation_id)
+        )
+
+        event = await subscription.next_event(timeout=0.1)
+        assert event is not None
+        assert event.type == "analysis.completed"
+        assert event.data["fermentation_id"] == fermentation_id
+
 
 class TestExecuteAnalysis:
     @pytest.mark.asyncio
@@ -90,3 +90,20 @@ class TestThresholdConfigServiceLoading:
         )
         with pytest.raises(ThresholdConfigError):
             ThresholdConfigService(config_path=Path("/nonexistent/path/thresholds.toml"))
+
+    def test_version_changes_when_reloaded_thresholds_change(self, tmp_path):
+        from src.modules.analysis_engine.src.service_component.services.threshold_config_service import (
+            ThresholdConfigService,
+        )
+        config = tmp_path / "thresholds.toml"
+        config.write_bytes(TEST_TOML_PATH.read_bytes())
+        svc = ThresholdConfigService(config_path=config)
+        original = svc.version
+
+        svc.reload()
+        assert svc.version == original
+
+        config.write_text(config.read_text().replace("23.9", "24.5"))
+        svc.reload()
+        assert svc.version != original
+        assert svc.get_thresholds("Merlot").temperature_critical_min_celsius == 24.5
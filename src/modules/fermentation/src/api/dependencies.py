@@ -5,11 +5,17 @@ Provides dependency injection for services, repositories, and real PostgreSQL da
 Following Clean Architecture: API layer depends on service abstractions.
 """
 
-from typing import Annotated
-from fastapi import Depends
+from typing import Annotated, Optional
+from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.shared.infra.database.fastapi_session import get_db_session
+from src.shared.infra.database.fastapi_session import (
+    get_db_session,
+    get_read_only_db_session,
+)
+from src.shared.infra.database.config import DatabaseConfig
+from src.shared.infra.database.engine_registry import POOL_ETL
+from src.shared.infra.database.session import DatabaseSession
 from src.shared.infra.repository.fastapi_session_manager import FastAPISessionManager
 
 from src.modules.fermentation.src.domain.repositories.fermentation_repository_interface import (
@@ -44,6 +50,29 @@ from src.modules.fermentation.src.service_component.services.sample_service impo
     SampleService,
 )
 
+from src.modules.fermentation.src.domain.repositories.fermentation_archive_store_interface import (
+    IFermentationArchiveStore,
+)
+from src.modules.fermentation.src.repository_component.repositories.parquet_archive_store import (
+    ParquetArchiveStore,
+)
+from src.modules.fermentation.src.repository_component.repositories.fermentation_export_repository import (
+    FermentationExportRepository,
+)
+from src.modules.fermentation.src.service_component.services.fermentation_export_service import (
+    FermentationExportService,
+)
+from src.modules.fermentation.src.repository_component.repositories.change_feed_repository import (
+    ChangeFeedRepository,
+)
+from src.modules.fermentation.src.service_component.services.sync_service import (
+    SyncService,
+)
+from src.modules.fermentation.src.service_component.services.telemetry_ingestion_service import (
+    TelemetryIngestionBuffer,
+    TelemetryIngestionService,
+)
+
 # UnitOfWork imports
 from src.modules.fermentation.src.domain.interfaces.unit_of_work_interface import (
     IUnitOfWork,
@@ -95,12 +124,16 @@ def get_fermentation_validator() -> IFermentationValidator:
 
 async def get_fermentation_repository(
     session: Annotated[AsyncSession, Depends(get_db_session)],
+    read_session: Annotated[
+        Optional[AsyncSession], Depends(get_read_only_db_session)
+    ] = None,
 ) -> IFermentationRepository:
     """
     Dependency: Get fermentation repository with real PostgreSQL database session.
 
     Args:
         session: AsyncSession from FastAPI dependency (auto-injected)
+        read_session: Read-only session for methods that opt in to replica reads
 
     Returns:
         IFermentationRepository: Repository instance connected to PostgreSQL
@@ -109,15 +142,42 @@ async def get_fermentation_repository(
         - Session managed by get_db_session (commit/rollback/close automatic)
         - Repository wraps session with SessionManager for BaseRepository compatibility
     """
-    session_manager = FastAPISessionManager(session)
+    session_manager = FastAPISessionManager(session, read_session=read_session)
     return FermentationRepository(session_manager)
 
 
+# ======================================================================================
+# Sample Dependencies (Sample Service Layer)
+# ======================================================================================
+
+
+async def get_sample_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+    read_session: Annotated[
+        Optional[AsyncSession], Depends(get_read_only_db_session)
+    ] = None,
+) -> ISampleRepository:
+    """
+    Dependency: Get sample repository with real PostgreSQL database session.
+
+    Args:
+        session: AsyncSession from FastAPI dependency (auto-injected)
+        read_session: Read-only session for methods that opt in to replica reads
+
+    Returns:
+        ISampleRepository: Repository instance connected to PostgreSQL
+    """
+    session_manager = FastAPISessionManager(session, read_session=read_session)
+    return SampleRepository(session_manager)
+
+
+# Defined after get_sample_repository: start_date updates are checked against samples
 async def get_fermentation_service(
     repository: Annotated[
         IFermentationRepository, Depends(get_fermentation_repository)
     ],
     validator: Annotated[IFermentationValidator, Depends(get_fermentation_validator)],
+    sample_repo: Annotated[ISampleRepository, Depends(get_sample_repository)],
 ) -> IFermentationService:
     """
     Dependency: Get fermentation service instance with injected dependencies.
@@ -125,32 +185,24 @@ async def get_fermentation_service(
     Args:
         repository: Fermentation repository (auto-injected with PostgreSQL session)
         validator: Fermentation validator (auto-injected)
+        sample_repo: Sample repository (start_date changes are checked against samples)
 
     Returns:
         IFermentationService: Service instance with REAL database persistence
     """
-    return FermentationService(fermentation_repo=repository, validator=validator)
-
-
-# ======================================================================================
-# Sample Dependencies (Sample Service Layer)
-# ======================================================================================
+    return FermentationService(
+        fermentation_repo=repository, validator=validator, sample_repo=sample_repo
+    )
 
 
-async def get_sample_repository(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
-) -> ISampleRepository:
+def get_archive_store() -> IFermentationArchiveStore:
     """
-    Dependency: Get sample repository with real PostgreSQL database session.
-
-    Args:
-        session: AsyncSession from FastAPI dependency (auto-injected)
+    Dependency: Cold storage of archived fermentations (FERMENTATION_ARCHIVE_DIR).
 
     Returns:
-        ISampleRepository: Repository instance connected to PostgreSQL
+        IFermentationArchiveStore: Parquet archive store on local disk
     """
-    session_manager = FastAPISessionManager(session)
-    return SampleRepository(session_manager)
+    return ParquetArchiveStore.from_env()
 
 
 async def get_chronology_validator(
@@ -234,6 +286,9 @@ async def get_sample_service(
     fermentation_repo: Annotated[
         IFermentationRepository, Depends(get_fermentation_repository)
     ],
+    archive_store: Annotated[
+        Optional[IFermentationArchiveStore], Depends(get_archive_store)
+    ] = None,
 ) -> ISampleService:
     """
     Dependency: Get sample service instance with injected dependencies.
@@ -242,6 +297,7 @@ async def get_sample_service(
         sample_repo: Sample repository (auto-injected with PostgreSQL session)
         validation_orchestrator: Validation orchestrator for sample validation
         fermentation_repo: Fermentation repository for ownership validation
+        archive_store: Cold storage read for archived fermentations
 
     Returns:
         ISampleService: Service instance with REAL database persistence
@@ -250,9 +306,86 @@ async def get_sample_service(
         sample_repo=sample_repo,
         validation_orchestrator=validation_orchestrator,
         fermentation_repo=fermentation_repo,
+        archive_store=archive_store,
     )
 
 
+async def get_sync_service(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+) -> SyncService:
+    """
+    Dependency: Get delta sync service (change feed over the request session).
+
+    Args:
+        session: AsyncSession from FastAPI dependency (auto-injected)
+
+    Returns:
+        SyncService: Service reading the change feed repository
+    """
+    session_manager = FastAPISessionManager(session)
+    return SyncService.from_env(ChangeFeedRepository(session_manager))
+
+
+def get_export_service(
+    archive_store: Annotated[
+        Optional[IFermentationArchiveStore], Depends(get_archive_store)
+    ] = None,
+) -> FermentationExportService:
+    """
+    Dependency: Get columnar history export service.
+
+    The export streams long after the request session would be closed, so
+    it reads on its own sessions from the ETL pool (long command timeout,
+    never competes with the API pool).
+
+    Args:
+        archive_store: Cold storage of archived samples
+
+    Returns:
+        FermentationExportService: Service streaming Arrow record batches
+    """
+    session_manager = DatabaseSession(DatabaseConfig(pool=POOL_ETL))
+    return FermentationExportService(
+        export_repo=FermentationExportRepository(session_manager),
+        archive_store=archive_store,
+    )
+
+
+def get_telemetry_buffer(request: Request) -> TelemetryIngestionBuffer:
+    """
+    Dependency: Get the process-wide telemetry buffer started by the app lifespan.
+
+    Raises:
+        HTTPException 503: If the ingestion buffer is not running
+    """
+    buffer = getattr(request.app.state, "telemetry_buffer", None)
+    if buffer is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Telemetry ingestion is not available",
+        )
+    return buffer
+
+
+async def get_telemetry_ingestion_service(
+    fermentation_repo: Annotated[
+        IFermentationRepository, Depends(get_fermentation_repository)
+    ],
+    buffer: Annotated[TelemetryIngestionBuffer, Depends(get_telemetry_buffer)],
+) -> TelemetryIngestionService:
+    """
+    Dependency: Get telemetry ingestion service (ownership check + shared buffer).
+
+    Args:
+        fermentation_repo: Fermentation repository for ownership validation
+        buffer: Process-wide ingestion buffer
+
+    Returns:
+        TelemetryIngestionService: Request-scoped ingestion entry point
+    """
+    return TelemetryIngestionService(fermentation_repo=fermentation_repo, buffer=buffer)
+
+
 async def get_unit_of_work(
     session: Annotated[AsyncSession, Depends(get_db_session)],
 ) -> IUnitOfWork:
@@ -302,6 +435,9 @@ async def get_pattern_analysis_service(
         IFermentationRepository, Depends(get_fermentation_repository)
     ],
     sample_repo: Annotated[ISampleRepository, Depends(get_sample_repository)],
+    archive_store: Annotated[
+        Optional[IFermentationArchiveStore], Depends(get_archive_store)
+    ] = None,
 ) -> IPatternAnalysisService:
     """
     Dependency: Get pattern analysis service instance with injected dependencies.
@@ -312,10 +448,13 @@ async def get_pattern_analysis_service(
     Args:
         fermentation_repo: Fermentation repository (auto-injected with PostgreSQL session)
         sample_repo: Sample repository (auto-injected with PostgreSQL session)
+        archive_store: Cold storage read for archived fermentations
 
     Returns:
         IPatternAnalysisService: Service instance with REAL database persistence
     """
     return PatternAnalysisService(
-        fermentation_repo=fermentation_repo, sample_repo=sample_repo
+        fermentation_repo=fermentation_repo,
+        sample_repo=sample_repo,
+        archive_store=archive_store,
     )
@@ -30,6 +30,8 @@ from src.shared.domain.errors import (
     SampleNotFound,
     InvalidSampleDate,
     InvalidSampleValue,
+    InvalidSyncCursor,
+    InvalidPageCursor,
 )
 
 # Legacy imports for backward compatibility
@@ -146,6 +148,7 @@ def register_error_handlers(app) -> None:
     - InvalidFermentationState → 422
     - FermentationAlreadyCompleted → 409
     - InvalidSampleDate, InvalidSampleValue → 422
+    - InvalidSyncCursor, InvalidPageCursor → 400
 
     Args:
         app: FastAPI application instance
@@ -212,3 +215,23 @@ def register_error_handlers(app) -> None:
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content={"detail": str(exc), "error_type": "InvalidSampleValue"},
         )
+
+    @app.exception_handler(InvalidSyncCursor)
+    async def invalid_sync_cursor_handler(
+        request: Request, exc: InvalidSyncCursor
+    ) -> JSONResponse:
+        """Handle malformed or foreign change-feed cursors."""
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={"detail": str(exc), "error_type": "InvalidSyncCursor"},
+        )
+
+    @app.exception_handler(InvalidPageCursor)
+    async def invalid_page_cursor_handler(
+        request: Request, exc: InvalidPageCursor
+    ) -> JSONResponse:
+        """Handle malformed or foreign listing cursors."""
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={"detail": str(exc), "error_type": "InvalidPageCursor"},
+        )
@@ -2,6 +2,8 @@
 Protocol Alert Router - REST API endpoints for protocol execution alerts (ADR-040).
 
 Endpoints:
+    GET  /api/v1/alerts/inbox                              → winery inbox page + badge counts
+    GET  /api/v1/alerts/counts                             → counts per winery and execution
     GET  /api/v1/executions/{execution_id}/alerts          → list alerts (filterable)
     POST /api/v1/executions/{execution_id}/alerts/check    → trigger alert check
     POST /api/v1/alerts/{alert_id}/acknowledge             → acknowledge an alert
@@ -10,6 +12,10 @@ Endpoints:
 Following ADR-006 API Layer Design and ADR-040 Notifications & Alerts.
 """
 
+import base64
+import binascii
+import json
+from datetime import datetime
 from typing import Annotated, Optional
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -20,7 +26,12 @@ from src.modules.fermentation.src.api.dependencies import get_db_session
 from src.modules.fermentation.src.api.schemas.responses import (
     AlertResponse,
     AlertListResponse,
+    AlertCountsResponse,
+    AlertCountsOverviewResponse,
+    AlertInboxResponse,
+    ExecutionAlertCountsResponse,
 )
+from src.modules.fermentation.src.domain.dtos.alert_dtos import InboxPosition
 from src.modules.fermentation.src.domain.entities.protocol_alert import ProtocolAlert
 from src.modules.fermentation.src.repository_component.protocol_alert_repository import (
     ProtocolAlertRepository,
@@ -28,11 +39,14 @@ from src.modules.fermentation.src.repository_component.protocol_alert_repository
 from src.modules.fermentation.src.repository_component.protocol_execution_repository import (
     ProtocolExecutionRepository,
 )
+from src.modules.fermentation.src.service_component.errors import InvalidPageCursor
 
 router = APIRouter(
     tags=["protocol-alerts"],
 )
 
+INBOX_CURSOR_VERSION = 1
+
 
 def get_alert_repository(
     session: Annotated[AsyncSession, Depends(get_db_session)],
@@ -48,6 +62,127 @@ def get_execution_repository(
     return ProtocolExecutionRepository(session=session)
 
 
+def encode_inbox_cursor(
+    winery_id: int, status_filter: Optional[str], position: InboxPosition
+) -> str:
+    """Opaque inbox cursor: urlsafe base64 of the last alert's (created_at, id)."""
+    created_at, alert_id = position
+    payload = {
+        "v": INBOX_CURSOR_VERSION,
+        "w": winery_id,
+        "s": status_filter,
+        "p": [created_at.isoformat(), alert_id],
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_inbox_cursor(
+    cursor: str, winery_id: int, status_filter: Optional[str]
+) -> InboxPosition:
+    """Keyset position of an inbox cursor; InvalidPageCursor (400) when unusable."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload["v"] != INBOX_CURSOR_VERSION:
+            raise ValueError("unsupported cursor version")
+        created_at, alert_id = payload["p"]
+        position = (datetime.fromisoformat(created_at), int(alert_id))
+        cursor_winery, cursor_status = payload["w"], payload["s"]
+    except (binascii.Error, UnicodeDecodeError, KeyError, TypeError, ValueError):
+        raise InvalidPageCursor("Malformed page cursor, restart from the first page")
+    if cursor_winery != winery_id:
+        raise InvalidPageCursor("Page cursor was issued for another winery")
+    if cursor_status != status_filter:
+        raise InvalidPageCursor("Page cursor was issued for different filters")
+    return position
+
+
+@router.get(
+    "/alerts/inbox",
+    response_model=AlertInboxResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Alert inbox of the user's winery",
+    description=(
+        "Returns one page of the winery's alerts, newest first, with the badge "
+        "counts. Pass next_cursor back as `cursor` to get the next page. "
+        "Requires WINEMAKER or ADMIN role."
+    ),
+)
+async def get_alert_inbox(
+    current_user: Annotated[UserContext, Depends(require_winemaker)],
+    alert_repo: Annotated[ProtocolAlertRepository, Depends(get_alert_repository)],
+    status_filter: Annotated[
+        Optional[str],
+        Query(
+            alias="status",
+            description="PENDING | SENT | ACKNOWLEDGED | DISMISSED; omit for all",
+        ),
+    ] = "PENDING",
+    cursor: Annotated[
+        Optional[str],
+        Query(max_length=512, description="next_cursor from the previous page"),
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=100, description="Max items")] = 50,
+) -> AlertInboxResponse:
+    """
+    Page through the winery's alerts (keyset pagination on created_at, id).
+
+    Raises:
+        HTTP 400: Malformed cursor, or cursor of another winery or status
+    """
+    winery_id = current_user.winery_id
+    after = decode_inbox_cursor(cursor, winery_id, status_filter) if cursor else None
+    alerts = await alert_repo.get_inbox(
+        winery_id=winery_id, status=status_filter, after=after, limit=limit + 1
+    )
+    next_cursor = None
+    if len(alerts) > limit:
+        alerts = alerts[:limit]
+        last = alerts[-1]
+        next_cursor = encode_inbox_cursor(
+            winery_id, status_filter, (last.created_at, last.id)
+        )
+    counts = await alert_repo.get_winery_counts(winery_id)
+
+    return AlertInboxResponse(
+        items=[AlertResponse.model_validate(a) for a in alerts],
+        next_cursor=next_cursor,
+        counts=AlertCountsResponse.from_counts(counts),
+    )
+
+
+@router.get(
+    "/alerts/counts",
+    response_model=AlertCountsOverviewResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Alert counts of the user's winery",
+    description=(
+        "Alert counts by status and severity for the winery and for each of its "
+        "executions with alerts (per-tank badges). Requires WINEMAKER or ADMIN role."
+    ),
+)
+async def get_alert_counts(
+    current_user: Annotated[UserContext, Depends(require_winemaker)],
+    alert_repo: Annotated[ProtocolAlertRepository, Depends(get_alert_repository)],
+) -> AlertCountsOverviewResponse:
+    """Winery and per-execution alert counts, from the inbox counters."""
+    winery_id = current_user.winery_id
+    winery_counts = await alert_repo.get_winery_counts(winery_id)
+    execution_counts = await alert_repo.get_execution_counts(winery_id)
+
+    return AlertCountsOverviewResponse(
+        winery=AlertCountsResponse.from_counts(winery_counts),
+        executions=[
+            ExecutionAlertCountsResponse(
+                execution_id=execution_id,
+                **AlertCountsResponse.from_counts(counts).model_dump(),
+            )
+            for execution_id, counts in sorted(execution_counts.items())
+        ],
+    )
+
+
 @router.get(
     "/executions/{execution_id}/alerts",
     response_model=AlertListResponse,
@@ -153,8 +288,8 @@ async def acknowledge_alert(
             detail=f"Alert {alert_id} is already {alert.status.lower()}",
         )
 
-    alert.acknowledge()
-    session.add(alert)
+    # Through the repository so the inbox counters move with the status
+    alert = await alert_repo.acknowledge(alert_id)
     await session.commit()
     await session.refresh(alert)
 
@@ -202,8 +337,8 @@ async def dismiss_alert(
             detail=f"Alert {alert_id} is already {alert.status.lower()}",
         )
 
-    alert.dismiss()
-    session.add(alert)
+    # Through the repository so the inbox counters move with the status
+    alert = await alert_repo.dismiss(alert_id)
     await session.commit()
     await session.refresh(alert)
 
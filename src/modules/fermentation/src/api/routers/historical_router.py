@@ -10,8 +10,10 @@ Related ADR: ADR-032 (Historical Data API Layer), ADR-034 (Refactoring)
 from typing import Dict, Any, Optional
 from datetime import date
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Header
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
+from src.shared.auth.domain.dtos import UserContext
+from src.shared.auth.infra.api.dependencies import get_current_user
 from src.shared.wine_fermentator_logging import get_logger
 from src.modules.fermentation.src.service_component.interfaces.fermentation_service_interface import (
     IFermentationService,
@@ -35,10 +37,22 @@ from src.modules.fermentation.src.api.schemas.responses.historical_responses imp
     ImportJobResponse,
     ImportTriggerResponse,
 )
-from src.modules.fermentation.src.service_component.errors import NotFoundError
+from src.modules.fermentation.src.service_component.errors import (
+    ExportUnavailable,
+    InvalidPageCursor,
+    NotFoundError,
+)
+from src.modules.fermentation.src.service_component.services.fermentation_export_service import (
+    ARROW_STREAM_MEDIA_TYPE,
+    DEFAULT_EXPORT_CHUNK_SIZE,
+    FermentationExportService,
+)
+from src.modules.fermentation.src.domain.dtos import FermentationListFilter
+from src.modules.fermentation.src.domain.enums.export_dataset import ExportDataset
 
 # Import actual dependencies (ADR-034)
 from src.modules.fermentation.src.api.dependencies import (
+    get_export_service,
     get_fermentation_service,
     get_pattern_analysis_service,
     get_sample_service,
@@ -81,7 +95,10 @@ def get_winery_id(x_winery_id: int = Header(..., alias="X-Winery-ID")) -> int:
     response_model=PaginatedHistoricalFermentationsResponse,
     status_code=status.HTTP_200_OK,
     summary="List historical fermentations",
-    description="Query historical fermentation data with optional filters and pagination",
+    description=(
+        "Query historical fermentation data with optional filters, newest first. "
+        "Pass next_cursor back as `cursor` to get the next page."
+    ),
 )
 async def list_historical_fermentations(
     winery_id: int = Depends(get_winery_id),
@@ -91,16 +108,31 @@ async def list_historical_fermentations(
     start_date_to: Optional[date] = Query(
         None, description="Filter by start date (to)"
     ),
-    fruit_origin_id: Optional[int] = Query(None, description="Filter by fruit origin"),
+    fruit_origin_id: Optional[int] = Query(
+        None, description="Filter by fruit origin (harvest lot used)"
+    ),
     status: Optional[str] = Query(None, description="Filter by fermentation status"),
     limit: int = Query(100, ge=1, le=1000, description="Items per page"),
-    offset: int = Query(0, ge=0, description="Pagination offset"),
+    offset: int = Query(
+        0, ge=0, description="Pagination offset (ignored when a cursor is given)"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page"
+    ),
     service: IFermentationService = Depends(get_fermentation_service),
 ) -> PaginatedHistoricalFermentationsResponse:
     """List historical fermentations with filters and pagination.
 
     ADR-034: Uses FermentationService with data_source='HISTORICAL' filter.
+    Filters, ordering and pagination all run in the database.
     """
+    filters = FermentationListFilter(
+        data_source="HISTORICAL",
+        start_date_from=start_date_from,
+        start_date_to=start_date_to,
+        fruit_origin_id=fruit_origin_id,
+        status=status,
+    )
     logger.info(
         "Listing historical fermentations",
         extra={
@@ -113,66 +145,38 @@ async def list_historical_fermentations(
             },
             "limit": limit,
             "offset": offset,
+            "cursor": cursor is not None,
         },
     )
 
     try:
-        # Get fermentations from service with data_source='HISTORICAL' (ADR-034)
-        fermentations = await service.get_fermentations_by_winery(
+        page = await service.list_fermentations_page(
             winery_id=winery_id,
-            status=status,
-            include_completed=True,  # Historical data includes completed fermentations
-            data_source="HISTORICAL",  # ADR-034: Filter by data source
+            filters=filters,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
         )
 
-        # Apply additional filters in-memory (TODO: push to service layer)
-        from datetime import datetime
-
-        if start_date_from:
-            fermentations = [
-                f
-                for f in fermentations
-                if f.start_date
-                and (
-                    f.start_date.date()
-                    if isinstance(f.start_date, datetime)
-                    else f.start_date
-                )
-                >= start_date_from
-            ]
-        if start_date_to:
-            fermentations = [
-                f
-                for f in fermentations
-                if f.start_date
-                and (
-                    f.start_date.date()
-                    if isinstance(f.start_date, datetime)
-                    else f.start_date
-                )
-                <= start_date_to
-            ]
-        if fruit_origin_id:
-            fermentations = [
-                f for f in fermentations if f.fruit_origin_id == fruit_origin_id
-            ]
-
-        # Apply pagination
-        total = len(fermentations)
-        fermentations = fermentations[offset : offset + limit]
-
         # Convert to response DTOs
-        items = [HistoricalFermentationResponse.from_entity(f) for f in fermentations]
+        items = [HistoricalFermentationResponse.from_entity(f) for f in page.items]
 
         logger.info(
             "Retrieved historical fermentations",
-            extra={"winery_id": winery_id, "count": len(items), "total": total},
+            extra={"winery_id": winery_id, "count": len(items), "total": page.total},
         )
 
         return PaginatedHistoricalFermentationsResponse(
-            items=items, total=total, limit=limit, offset=offset
+            items=items,
+            total=page.total,
+            limit=limit,
+            offset=offset,
+            next_cursor=page.next_cursor,
         )
 
+    except InvalidPageCursor:
+        # 400 via the global handler, not the 500 below
+        raise
     except Exception as e:
         logger.error(
             "Error listing historical fermentations",
@@ -187,6 +191,52 @@ async def list_historical_fermentations(
         )
 
 
+@router.get(
+    "/export/{dataset}",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Export history as an Arrow stream",
+    description=(
+        "Stream one dataset of the winery's fermentation history "
+        "(fermentations, samples pivoted by type, lot sources, analyses) as an Arrow IPC "
+        "stream, read from a server-side cursor in record batches of chunk_size rows."
+    ),
+)
+async def export_history(
+    dataset: ExportDataset,
+    chunk_size: int = Query(
+        DEFAULT_EXPORT_CHUNK_SIZE, ge=100, le=100_000, description="Rows per record batch"
+    ),
+    current_user: UserContext = Depends(get_current_user),
+    service: FermentationExportService = Depends(get_export_service),
+) -> StreamingResponse:
+    """Stream a dataset for offline analytics (pyarrow.ipc.open_stream).
+
+    Scoped by the authenticated user's winery, never by the X-Winery-ID
+    header: a bulk export must not be widened by a client-supplied value.
+    """
+    winery_id = current_user.winery_id
+    try:
+        # Fails before any byte is sent if the export can't run
+        service.schema(dataset)
+    except ExportUnavailable as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+
+    logger.info(
+        "Exporting fermentation history",
+        extra={"winery_id": winery_id, "dataset": dataset.value, "chunk_size": chunk_size},
+    )
+    return StreamingResponse(
+        service.stream_ipc(winery_id, dataset, chunk_size),
+        media_type=ARROW_STREAM_MEDIA_TYPE,
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="winery_{winery_id}_{dataset.value}.arrows"'
+            )
+        },
+    )
+
+
 @router.get(
     "/import",
     response_model=list[ImportJobResponse],
@@ -16,7 +16,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.shared.auth.domain.dtos import UserContext
 from src.shared.auth.infra.api.dependencies import require_winemaker
-from src.modules.fermentation.src.api.dependencies import get_db_session
+from src.modules.fermentation.src.api.dependencies import (
+    get_archive_store,
+    get_db_session,
+)
 from src.modules.fermentation.src.api.schemas.note_schemas import (
     NoteCreateRequest,
     NoteUpdateRequest,
@@ -33,6 +36,12 @@ from src.modules.fermentation.src.domain.repositories.fermentation_note_reposito
 from src.modules.fermentation.src.repository_component.repositories.fermentation_note_repository import (
     FermentationNoteRepository,
 )
+from src.modules.fermentation.src.repository_component.repositories.fermentation_repository import (
+    FermentationRepository,
+)
+from src.modules.fermentation.src.domain.repositories.fermentation_archive_store_interface import (
+    IFermentationArchiveStore,
+)
 from src.modules.fermentation.src.repository_component.errors import EntityNotFoundError
 from src.shared.infra.repository.fastapi_session_manager import FastAPISessionManager
 
@@ -41,10 +50,15 @@ router = APIRouter(tags=["fermentation-notes"])
 
 def _get_service(
     session: Annotated[AsyncSession, Depends(get_db_session)],
+    archive_store: Annotated[IFermentationArchiveStore, Depends(get_archive_store)],
 ) -> FermentationNoteService:
     session_manager = FastAPISessionManager(session)
     repo: IFermentationNoteRepository = FermentationNoteRepository(session_manager)
-    return FermentationNoteService(note_repo=repo)
+    return FermentationNoteService(
+        note_repo=repo,
+        archive_store=archive_store,
+        fermentation_repo=FermentationRepository(session_manager),
+    )
 
 
 # =============================================================================
@@ -24,6 +24,7 @@ from src.modules.fermentation.src.api.schemas.requests import (
     ProtocolUpdateRequest,
     ProtocolCloneRequest,
     ProtocolInstantiateRequest,
+    ProtocolBulkInstantiateRequest,
 )
 
 # Response schemas (Pydantic - for serialization)
@@ -828,3 +829,42 @@ async def instantiate_template(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=msg
         )
     return _to_response(instance)
+
+
+@router.post(
+    "/{protocol_id}/instantiate/bulk",
+    response_model=List[ProtocolResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create per-fermentation instances of a FINAL template in bulk (ADR-039)",
+    description=(
+        "Deep-copies a FINAL master template into one protocol instance per "
+        "fermentation batch, e.g. for every tank filled at harvest start. All "
+        "instances and their steps are created in one transaction. Instances are "
+        "returned in request order. Requires WINEMAKER or ADMIN role."
+    ),
+)
+async def instantiate_template_bulk(
+    protocol_id: Annotated[int, Path(gt=0, description="Source template protocol ID")],
+    request: ProtocolBulkInstantiateRequest,
+    current_user: Annotated[UserContext, Depends(require_winemaker)],
+    repository: Annotated[
+        IFermentationProtocolRepository, Depends(get_protocol_repository)
+    ],
+) -> List[ProtocolResponse]:
+    """Instantiate a FINAL template once per fermentation batch."""
+    service = _build_service(repository)
+    try:
+        instances = await service.instantiate_from_template_bulk(
+            template_id=protocol_id,
+            winery_id=current_user.winery_id,
+            fermentation_batch_names=request.fermentation_batch_names,
+            created_by_user_id=current_user.user_id,
+        )
+    except ValueError as e:
+        msg = str(e)
+        if "not found" in msg or "Access denied" in msg:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=msg
+        )
+    return [_to_response(instance) for instance in instances]
@@ -13,6 +13,10 @@ Sample endpoints are nested under fermentation endpoints:
 - GET /fermentations/{id}/samples/{sample_id}
 - GET /fermentations/{id}/samples/latest
 
+Batch ingestion (sensors, mobile sync) is not nested:
+- POST /samples/batch
+- POST /samples/telemetry (buffered sensor readings, 202 Accepted)
+
 Following ADR-006 API Layer Design
 """
 
@@ -25,15 +29,24 @@ from src.shared.auth.infra.api.dependencies import require_winemaker, get_curren
 
 from src.modules.fermentation.src.api.schemas.requests.sample_requests import (
     SampleCreateRequest,
+    SampleBatchCreateRequest,
+    TelemetryBatchRequest,
 )
 from src.modules.fermentation.src.api.schemas.responses.sample_responses import (
     SampleResponse,
+    SampleBatchItemResponse,
+    SampleBatchResponse,
+    TelemetryIngestResponse,
 )
 from src.modules.fermentation.src.api.error_handlers import handle_service_errors
 from src.modules.fermentation.src.service_component.interfaces.sample_service_interface import (
     ISampleService,
 )
-from src.modules.fermentation.src.domain.dtos import SampleCreate
+from src.modules.fermentation.src.domain.dtos import (
+    SampleCreate,
+    SampleBatchItem,
+    TelemetryReading,
+)
 from src.modules.fermentation.src.domain.enums.sample_type import SampleType
 from src.modules.fermentation.src.service_component.errors import (
     ValidationError,
@@ -41,8 +54,15 @@ from src.modules.fermentation.src.service_component.errors import (
 )
 from src.shared.domain.errors import SampleNotFound
 
+from src.modules.fermentation.src.service_component.services.telemetry_ingestion_service import (
+    TelemetryIngestionService,
+)
+
 # Import dependencies
-from src.modules.fermentation.src.api.dependencies import get_sample_service
+from src.modules.fermentation.src.api.dependencies import (
+    get_sample_service,
+    get_telemetry_ingestion_service,
+)
 
 router = APIRouter(prefix="/fermentations", tags=["samples"])
 
@@ -446,6 +466,125 @@ async def validate_sample(
     return validation_result.model_dump()
 
 
+# ======================================================================================
+# POST /api/v1/samples/batch - Batch Sample Ingestion
+# ======================================================================================
+
+
+@samples_router.post(
+    "/batch",
+    response_model=SampleBatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Add many sample measurements at once",
+    description="Records up to 500 samples across fermentations of the user's winery. Each item is validated like a single sample; valid items are stored in one write even if others are rejected. Requires WINEMAKER or ADMIN role.",
+)
+@handle_service_errors
+async def create_samples_batch(
+    request: SampleBatchCreateRequest,
+    current_user: Annotated[UserContext, Depends(require_winemaker)] = None,
+    sample_service: Annotated[ISampleService, Depends(get_sample_service)] = None,
+) -> SampleBatchResponse:
+    """
+    Add a batch of sample measurements.
+
+    Args:
+        request: Samples with their fermentation IDs (validated by Pydantic)
+        current_user: Authenticated user context
+        sample_service: Sample service instance
+
+    Returns:
+        SampleBatchResponse: Created/rejected counts and per-item results
+
+    Raises:
+        HTTP 403: Insufficient permissions (not WINEMAKER or ADMIN)
+        HTTP 422: Malformed request (e.g. empty batch or more than 500 items)
+        HTTP 401: Not authenticated
+    """
+    items = [
+        SampleBatchItem(
+            fermentation_id=item.fermentation_id,
+            sample=SampleCreate(
+                sample_type=SampleType(item.sample_type),
+                value=item.value,
+                units=item.units,
+                recorded_at=item.recorded_at,
+            ),
+        )
+        for item in request.samples
+    ]
+
+    results = await sample_service.add_samples_batch(
+        winery_id=current_user.winery_id,
+        user_id=current_user.user_id,
+        items=items,
+    )
+
+    created = sum(1 for r in results if r.accepted)
+    return SampleBatchResponse(
+        created=created,
+        rejected=len(results) - created,
+        items=[SampleBatchItemResponse.from_result(r) for r in results],
+    )
+
+
+# ======================================================================================
+# POST /api/v1/samples/telemetry - Sensor Telemetry Ingestion
+# ======================================================================================
+
+
+@samples_router.post(
+    "/telemetry",
+    response_model=TelemetryIngestResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Ingest tank sensor readings",
+    description="High-rate path for temperature/density probes. Readings are buffered and written in bulk; they appear in sample queries within max_visibility_delay_seconds. Returns 503 when the buffer is full (retry later). Requires WINEMAKER or ADMIN role.",
+)
+@handle_service_errors
+async def ingest_telemetry(
+    request: TelemetryBatchRequest,
+    current_user: Annotated[UserContext, Depends(require_winemaker)] = None,
+    telemetry_service: Annotated[
+        TelemetryIngestionService, Depends(get_telemetry_ingestion_service)
+    ] = None,
+) -> TelemetryIngestResponse:
+    """
+    Buffer sensor readings for bulk persistence.
+
+    Args:
+        request: Sensor readings (validated by Pydantic)
+        current_user: Authenticated user context (sensor gateway account)
+        telemetry_service: Ingestion service instance
+
+    Returns:
+        TelemetryIngestResponse: Accepted/coalesced counts and rejected fermentations
+
+    Raises:
+        HTTP 503: Buffer full (backpressure) or ingestion not running
+        HTTP 422: Malformed request
+        HTTP 401/403: Not authenticated / insufficient permissions
+    """
+    result = await telemetry_service.ingest(
+        winery_id=current_user.winery_id,
+        readings=[
+            TelemetryReading(
+                fermentation_id=r.fermentation_id,
+                sample_type=r.sample_type,
+                value=r.value,
+                units=r.units,
+                recorded_at=r.recorded_at,
+            )
+            for r in request.readings
+        ],
+    )
+    return TelemetryIngestResponse(
+        accepted=result.accepted,
+        coalesced=result.coalesced,
+        rejected_fermentation_ids=result.rejected_fermentation_ids,
+        rejected_readings=result.rejected_readings,
+        max_visibility_delay_seconds=result.max_visibility_delay_seconds,
+    )
+
+
 # =============================================================================
 # DELETE /api/v1/samples/{id} - Delete sample
 # =============================================================================
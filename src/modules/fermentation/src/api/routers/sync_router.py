@@ -0,0 +1,77 @@
+"""
+Sync Router — delta sync change feed for web and mobile clients.
+
+Endpoints:
+    GET /api/v1/sync/changes  → rows changed since the client's cursor
+
+Typical client loop:
+    1. First launch: GET /sync/changes (no cursor) → full snapshot, paged
+    2. While has_more: GET /sync/changes?cursor=<next_cursor>
+    3. Store next_cursor; on the next refresh repeat step 2 only.
+       Response size follows the change rate, not the dataset size.
+    4. Upsert rows keyed by id; a row whose (id, updated_at) is already
+       stored is a repeat from the overlap window and can be skipped.
+"""
+
+from typing import Annotated, List, Optional
+
+from fastapi import APIRouter, Depends, Query, status
+
+from src.shared.auth.domain.dtos import UserContext
+from src.shared.auth.infra.api.dependencies import get_current_user
+from src.modules.fermentation.src.api.dependencies import get_sync_service
+from src.modules.fermentation.src.api.error_handlers import handle_service_errors
+from src.modules.fermentation.src.api.schemas.sync_schemas import SyncChangesResponse
+from src.modules.fermentation.src.domain.enums.sync_entity import SyncEntity
+from src.modules.fermentation.src.service_component.services.sync_service import (
+    DEFAULT_SYNC_PAGE_SIZE,
+    SyncService,
+)
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+
+@router.get(
+    "/changes",
+    response_model=SyncChangesResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get changes since the last sync",
+    description=(
+        "Change feed over fermentations, samples, notes, alerts and actions of the "
+        "user's winery. Without a cursor returns a full snapshot; with the "
+        "next_cursor of the previous response returns only rows changed since, "
+        "plus deleted entities. Call again immediately while has_more is true. "
+        "Rows of the last few minutes may be sent again on the next sync; "
+        "dedupe by (id, updated_at)."
+    ),
+)
+@handle_service_errors
+async def get_changes(
+    current_user: Annotated[UserContext, Depends(get_current_user)],
+    sync_service: Annotated[SyncService, Depends(get_sync_service)],
+    cursor: Annotated[
+        Optional[str],
+        Query(max_length=2048, description="next_cursor from the previous sync"),
+    ] = None,
+    limit: Annotated[
+        int, Query(ge=1, le=1000, description="Max rows per entity stream")
+    ] = DEFAULT_SYNC_PAGE_SIZE,
+    entities: Annotated[
+        Optional[List[SyncEntity]],
+        Query(description="Streams to sync (repeatable, default: all)"),
+    ] = None,
+) -> SyncChangesResponse:
+    """
+    Return one page of the change feed.
+
+    Raises:
+        HTTP 400: Malformed cursor or cursor of another winery (restart full sync)
+        HTTP 401/403: Not authenticated
+    """
+    change_set = await sync_service.get_changes(
+        winery_id=current_user.winery_id,
+        cursor=cursor,
+        limit=limit,
+        entities=entities,
+    )
+    return SyncChangesResponse.from_change_set(change_set)
@@ -9,6 +9,7 @@ from .protocol_requests import (
     ProtocolUpdateRequest,
     ProtocolCloneRequest,
     ProtocolInstantiateRequest,
+    ProtocolBulkInstantiateRequest,
     StepCreateRequest,
     StepUpdateRequest,
     StepOverrideRequest,
@@ -24,6 +25,7 @@ __all__ = [
     "ProtocolUpdateRequest",
     "ProtocolCloneRequest",
     "ProtocolInstantiateRequest",
+    "ProtocolBulkInstantiateRequest",
     "StepCreateRequest",
     "StepUpdateRequest",
     "StepOverrideRequest",
@@ -6,7 +6,7 @@ Implements semantic versioning, step type validation, and business rules.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -98,6 +98,31 @@ class ProtocolInstantiateRequest(BaseModel):
     )
 
 
+class ProtocolBulkInstantiateRequest(BaseModel):
+    """
+    Request DTO for instantiating one FINAL template for many fermentations (ADR-039).
+
+    Used at harvest start, when every new tank gets its own instance.
+    """
+
+    fermentation_batch_names: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=200,
+        description="Fermentation batch names, one instance each "
+        "(e.g. ['PN-2026-Batch-01', 'PN-2026-Batch-02'])",
+    )
+
+    @field_validator("fermentation_batch_names")
+    @classmethod
+    def validate_batch_names(cls, v: List[str]) -> List[str]:
+        if any(not name or len(name) > 200 for name in v):
+            raise ValueError("batch names must be 1-200 characters")
+        if len(set(v)) != len(v):
+            raise ValueError("batch names must be unique")
+        return v
+
+
 class StepOverrideRequest(BaseModel):
     """Request DTO for overriding step parameters in an inactive protocol (ADR-039)."""
 
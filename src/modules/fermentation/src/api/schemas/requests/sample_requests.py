@@ -5,9 +5,11 @@ Pydantic models for validating incoming requests to sample endpoints.
 Implements field validation for sample measurement data.
 """
 
-from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field
+from datetime import datetime, timezone
+from typing import List, Optional
+from pydantic import BaseModel, Field, field_validator
+
+from src.modules.fermentation.src.domain.enums.sample_type import SampleType
 
 
 class SampleCreateRequest(BaseModel):
@@ -58,3 +60,73 @@ class SampleUpdateRequest(BaseModel):
     recorded_at: Optional[datetime] = Field(
         None, description="Timestamp when sample was recorded"
     )
+
+
+class SampleBatchItemRequest(SampleCreateRequest):
+    """
+    One sample of a batch ingestion request
+
+    Same fields as SampleCreateRequest plus the target fermentation.
+    """
+
+    fermentation_id: int = Field(..., gt=0, description="ID of the fermentation")
+
+    @field_validator("sample_type")
+    @classmethod
+    def validate_sample_type(cls, v: str) -> str:
+        """Reject unknown types up front so one bad item can't fail the batch"""
+        valid = [t.value for t in SampleType]
+        if v not in valid:
+            raise ValueError(f"sample_type must be one of: {', '.join(valid)}")
+        return v
+
+
+class SampleBatchCreateRequest(BaseModel):
+    """
+    Request DTO for batch sample ingestion (sensors, offline mobile sync)
+
+    Samples may target several fermentations of the caller's winery.
+    """
+
+    samples: List[SampleBatchItemRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Samples to record (1-500 items)",
+    )
+
+
+class TelemetryReadingRequest(BaseModel):
+    """
+    One sensor reading (tank probe)
+    """
+
+    fermentation_id: int = Field(..., gt=0, description="ID of the fermentation")
+    sample_type: SampleType = Field(..., description="Measurement type")
+    value: float = Field(..., allow_inf_nan=False, description="Measured value")
+    units: str = Field(..., min_length=1, max_length=20, description="Units")
+    recorded_at: datetime = Field(..., description="Probe timestamp")
+
+    @field_validator("recorded_at")
+    @classmethod
+    def normalize_recorded_at(cls, v: datetime) -> datetime:
+        """Store naive UTC like every other timestamp; probes may send an offset"""
+        if v.tzinfo is not None:
+            v = v.astimezone(timezone.utc).replace(tzinfo=None)
+        return v
+
+
+class TelemetryBatchRequest(BaseModel):
+    """
+    Request DTO for high-rate sensor ingestion
+
+    Readings are buffered and written in bulk; they become visible to the
+    regular sample endpoints within a bounded delay.
+    """
+
+    readings: List[TelemetryReadingRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Sensor readings (1-1000 items)",
+    )
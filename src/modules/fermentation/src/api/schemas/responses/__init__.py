@@ -14,6 +14,10 @@ from .protocol_responses import (
     CompletionListResponse,
     AlertResponse,
     AlertListResponse,
+    AlertCountsResponse,
+    ExecutionAlertCountsResponse,
+    AlertCountsOverviewResponse,
+    AlertInboxResponse,
 )
 from ..action_schemas import (
     ActionResponse,
@@ -32,6 +36,10 @@ __all__ = [
     "CompletionListResponse",
     "AlertResponse",
     "AlertListResponse",
+    "AlertCountsResponse",
+    "ExecutionAlertCountsResponse",
+    "AlertCountsOverviewResponse",
+    "AlertInboxResponse",
     "ActionResponse",
     "ActionListResponse",
 ]
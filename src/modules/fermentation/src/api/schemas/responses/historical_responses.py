@@ -118,9 +118,15 @@ class PaginatedHistoricalFermentationsResponse(BaseModel):
     items: List[HistoricalFermentationResponse] = Field(
         ..., description="List of historical fermentations"
     )
-    total: int = Field(..., description="Total count of fermentations")
+    total: Optional[int] = Field(
+        None,
+        description="Total count of fermentations (first page only, null on cursor pages)",
+    )
     limit: int = Field(..., description="Items per page")
     offset: int = Field(..., description="Offset for pagination")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor of the next page, null on the last page"
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -147,6 +153,7 @@ class PaginatedHistoricalFermentationsResponse(BaseModel):
                     "total": 1,
                     "limit": 100,
                     "offset": 0,
+                    "next_cursor": None,
                 }
             ]
         }
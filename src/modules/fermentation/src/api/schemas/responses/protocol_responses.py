@@ -6,7 +6,7 @@ pagination, status information, and nested structures.
 """
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List
 from pydantic import BaseModel, Field
 
 
@@ -191,3 +191,51 @@ class AlertListResponse(BaseModel):
     pending_count: int = Field(
         ..., ge=0, description="Total PENDING alerts for this execution"
     )
+
+
+class AlertCountsResponse(BaseModel):
+    """Alert counts of a winery or execution, read from the inbox counters."""
+
+    total: int = Field(..., ge=0, description="All alerts")
+    pending: int = Field(..., ge=0, description="PENDING alerts (badge count)")
+    by_status: Dict[str, int] = Field(
+        default_factory=dict, description="Alert count per status"
+    )
+    pending_by_severity: Dict[str, int] = Field(
+        default_factory=dict, description="PENDING alert count per severity"
+    )
+
+    @classmethod
+    def from_counts(cls, counts) -> "AlertCountsResponse":
+        """Build from an AlertCounts DTO."""
+        return cls(
+            total=counts.total,
+            pending=counts.pending,
+            by_status=counts.by_status(),
+            pending_by_severity=counts.by_severity(status="PENDING"),
+        )
+
+
+class ExecutionAlertCountsResponse(AlertCountsResponse):
+    """Alert counts of one protocol execution (one tank on the dashboard)."""
+
+    execution_id: int = Field(..., description="Protocol execution ID")
+
+
+class AlertCountsOverviewResponse(BaseModel):
+    """A winery's alert counts, in total and per execution."""
+
+    winery: AlertCountsResponse = Field(..., description="Counts across the winery")
+    executions: List[ExecutionAlertCountsResponse] = Field(
+        ..., description="Counts per execution with alerts"
+    )
+
+
+class AlertInboxResponse(BaseModel):
+    """One page of a winery's alert inbox, with the badge counts."""
+
+    items: List[AlertResponse] = Field(..., description="Alerts, newest first")
+    next_cursor: Optional[str] = Field(
+        None, description="Send as ?cursor= for the next page; null on the last page"
+    )
+    counts: AlertCountsResponse = Field(..., description="Counts across the winery")
@@ -5,8 +5,13 @@ These Pydantic models define the structure of sample data returned by the API.
 """
 
 from datetime import datetime
+from typing import List, Literal, Optional
 from pydantic import BaseModel, ConfigDict, Field
 
+from src.modules.fermentation.src.api.schemas.responses.fermentation_responses import (
+    ValidationErrorDetail,
+)
+
 
 class SampleResponse(BaseModel):
     """
@@ -62,3 +67,69 @@ class SampleResponse(BaseModel):
             created_at=sample.created_at,
             updated_at=sample.updated_at,
         )
+
+
+class SampleBatchItemResponse(BaseModel):
+    """
+    Outcome of one item of a batch ingestion request
+    """
+
+    index: int = Field(..., description="Position of the item in the request")
+    fermentation_id: int = Field(..., description="Target fermentation ID")
+    status: Literal["created", "rejected"] = Field(..., description="Item outcome")
+    sample: Optional[SampleResponse] = Field(
+        None, description="Created sample (only when status is 'created')"
+    )
+    errors: List[ValidationErrorDetail] = Field(
+        default_factory=list, description="Why the item was rejected"
+    )
+
+    @classmethod
+    def from_result(cls, result: "SampleBatchItemResult") -> "SampleBatchItemResponse":
+        """Convert a service SampleBatchItemResult to response DTO"""
+        return cls(
+            index=result.index,
+            fermentation_id=result.fermentation_id,
+            status="created" if result.accepted else "rejected",
+            sample=SampleResponse.from_entity(result.sample) if result.accepted else None,
+            errors=[
+                ValidationErrorDetail(field=e.field, message=e.message)
+                for e in result.errors
+            ],
+        )
+
+
+class SampleBatchResponse(BaseModel):
+    """
+    Response DTO for batch sample ingestion
+
+    Valid items are stored even when others are rejected; check each item.
+    """
+
+    created: int = Field(..., description="Number of samples created")
+    rejected: int = Field(..., description="Number of items rejected")
+    items: List[SampleBatchItemResponse] = Field(
+        ..., description="Per-item results, in request order"
+    )
+
+
+class TelemetryIngestResponse(BaseModel):
+    """
+    Response DTO for sensor ingestion (202 Accepted)
+
+    Readings are not yet queryable; they are after max_visibility_delay_seconds.
+    """
+
+    accepted: int = Field(..., description="Readings buffered for writing")
+    coalesced: int = Field(..., description="Readings merged into buffered ones")
+    rejected_fermentation_ids: List[int] = Field(
+        default_factory=list,
+        description="Fermentations not found, not owned or COMPLETED (readings dropped)",
+    )
+    rejected_readings: int = Field(
+        0,
+        description="Readings dropped for a timestamp before fermentation start or in the future",
+    )
+    max_visibility_delay_seconds: float = Field(
+        ..., description="Upper bound before readings appear in sample queries"
+    )
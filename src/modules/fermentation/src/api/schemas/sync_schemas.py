@@ -0,0 +1,83 @@
+"""
+Response schemas for the delta sync API (GET /sync/changes).
+
+Payloads reuse the regular response schemas so a synced entity looks
+exactly like the same entity fetched from its own endpoint.
+"""
+
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from src.modules.fermentation.src.api.schemas.action_schemas import ActionResponse
+from src.modules.fermentation.src.api.schemas.note_schemas import NoteResponse
+from src.modules.fermentation.src.api.schemas.responses.fermentation_responses import (
+    FermentationResponse,
+)
+from src.modules.fermentation.src.api.schemas.responses.protocol_responses import (
+    AlertResponse,
+)
+from src.modules.fermentation.src.api.schemas.responses.sample_responses import (
+    SampleResponse,
+)
+from src.modules.fermentation.src.domain.dtos.sync_dtos import SyncChangeSet
+from src.modules.fermentation.src.domain.enums.sync_entity import SyncEntity
+
+
+class SyncDeletionResponse(BaseModel):
+    """An entity the client must remove from its local store."""
+
+    entity: SyncEntity = Field(..., description="Stream of the deleted entity")
+    id: int = Field(..., description="ID of the deleted entity")
+    deleted_at: datetime = Field(..., description="When it was deleted (UTC)")
+
+
+class SyncChangesResponse(BaseModel):
+    """One page of the change feed."""
+
+    fermentations: List[FermentationResponse] = Field(default_factory=list)
+    samples: List[SampleResponse] = Field(default_factory=list)
+    notes: List[NoteResponse] = Field(default_factory=list)
+    alerts: List[AlertResponse] = Field(default_factory=list)
+    actions: List[ActionResponse] = Field(default_factory=list)
+    deleted: List[SyncDeletionResponse] = Field(
+        default_factory=list, description="Soft-deleted and removed entities"
+    )
+    next_cursor: str = Field(..., description="Send as ?cursor= on the next sync")
+    has_more: bool = Field(
+        ..., description="More changes are pending; call again immediately"
+    )
+    server_time: datetime = Field(..., description="Watermark this page covers (UTC)")
+
+    @classmethod
+    def from_change_set(cls, change_set: SyncChangeSet) -> "SyncChangesResponse":
+        upserts = change_set.upserts
+        return cls(
+            fermentations=[
+                FermentationResponse.from_entity(f)
+                for f in upserts.get(SyncEntity.FERMENTATION, [])
+            ],
+            samples=[
+                SampleResponse.from_entity(s) for s in upserts.get(SyncEntity.SAMPLE, [])
+            ],
+            notes=[
+                NoteResponse.model_validate(n) for n in upserts.get(SyncEntity.NOTE, [])
+            ],
+            alerts=[
+                AlertResponse.model_validate(a) for a in upserts.get(SyncEntity.ALERT, [])
+            ],
+            actions=[
+                ActionResponse.model_validate(a)
+                for a in upserts.get(SyncEntity.ACTION, [])
+            ],
+            deleted=[
+                SyncDeletionResponse(
+                    entity=d.entity, id=d.entity_id, deleted_at=d.deleted_at
+                )
+                for d in change_set.deletions
+            ],
+            next_cursor=change_set.next_cursor,
+            has_more=change_set.has_more,
+            server_time=change_set.server_time,
+        )
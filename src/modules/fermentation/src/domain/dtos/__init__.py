@@ -10,9 +10,22 @@ from .fermentation_dtos import (
     FermentationUpdate,
     FermentationWithBlendCreate,
     LotSourceData,
+    ListPosition,
+    FermentationListFilter,
+    FermentationPage,
+)
+from .sample_dtos import (
+    SampleCreate,
+    SampleBatchItem,
+    SampleBatchItemResult,
+    TelemetryReading,
+    TelemetryIngestResult,
+    SamplePartition,
 )
-from .sample_dtos import SampleCreate
 from .fermentation_note_dtos import FermentationNoteCreate, FermentationNoteUpdate
+from .sync_dtos import FeedPosition, SyncDeletion, SyncChangeSet
+from .archive_dtos import ArchivedRows, ArchiveRunResult
+from .alert_dtos import AlertCounts, InboxPosition
 from .protocol_dtos import (
     ProtocolCreate,
     ProtocolUpdate,
@@ -40,9 +53,24 @@ __all__ = [
     "FermentationUpdate",
     "FermentationWithBlendCreate",
     "LotSourceData",
+    "ListPosition",
+    "FermentationListFilter",
+    "FermentationPage",
     "SampleCreate",
+    "SampleBatchItem",
+    "SampleBatchItemResult",
+    "TelemetryReading",
+    "TelemetryIngestResult",
+    "SamplePartition",
     "FermentationNoteCreate",
     "FermentationNoteUpdate",
+    "FeedPosition",
+    "SyncDeletion",
+    "SyncChangeSet",
+    "ArchivedRows",
+    "ArchiveRunResult",
+    "AlertCounts",
+    "InboxPosition",
     "ProtocolCreate",
     "ProtocolUpdate",
     "ProtocolResponse",
@@ -0,0 +1,56 @@
+"""
+Protocol Alert Data Transfer Objects.
+
+Counts read from the alert inbox counters (alert_inbox_*_counts) and the
+keyset position used to page through a winery's alert inbox.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+# Keyset position in the inbox: (created_at, id) of the last alert sent
+InboxPosition = Tuple[datetime, int]
+
+
+@dataclass(frozen=True)
+class AlertCounts:
+    """
+    Alert counts of a winery or an execution.
+
+    Attributes:
+        counts: Number of alerts per (status, severity); absent keys are 0
+    """
+
+    counts: Dict[Tuple[str, str], int] = field(default_factory=dict)
+
+    def count(self, status: Optional[str] = None, severity: Optional[str] = None) -> int:
+        """Alerts with the given status and/or severity (all when both are None)."""
+        return sum(
+            n
+            for (s, sev), n in self.counts.items()
+            if (status is None or s == status) and (severity is None or sev == severity)
+        )
+
+    @property
+    def total(self) -> int:
+        return self.count()
+
+    @property
+    def pending(self) -> int:
+        return self.count(status="PENDING")
+
+    def by_status(self) -> Dict[str, int]:
+        """Alert count per status."""
+        totals: Dict[str, int] = {}
+        for (status, _), n in self.counts.items():
+            totals[status] = totals.get(status, 0) + n
+        return totals
+
+    def by_severity(self, status: Optional[str] = None) -> Dict[str, int]:
+        """Alert count per severity, optionally of one status only."""
+        totals: Dict[str, int] = {}
+        for (s, severity), n in self.counts.items():
+            if status is None or s == status:
+                totals[severity] = totals.get(severity, 0) + n
+        return totals
@@ -0,0 +1,41 @@
+"""
+Cold-Storage Archive Data Transfer Objects.
+
+DTOs of the fermentation archival pipeline: the rows exported from the hot
+tables for one fermentation, and the outcome of an archival run.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, List
+
+
+@dataclass
+class ArchivedRows:
+    """
+    Hot rows of one fermentation, exported before they are purged.
+
+    Attributes:
+        samples: Sample entities (all types, soft-deleted included)
+        notes: FermentationNote entities (soft-deleted included)
+    """
+
+    samples: List[Any] = field(default_factory=list)
+    notes: List[Any] = field(default_factory=list)
+
+
+@dataclass
+class ArchiveRunResult:
+    """
+    Outcome of one archival run.
+
+    Attributes:
+        archived: IDs of fermentations moved to cold storage
+        failed: IDs left hot (export or purge failed; retried next run)
+        samples_archived: Sample rows removed from the hot table
+        notes_archived: Note rows removed from the hot table
+    """
+
+    archived: List[int] = field(default_factory=list)
+    failed: List[int] = field(default_factory=list)
+    samples_archived: int = 0
+    notes_archived: int = 0
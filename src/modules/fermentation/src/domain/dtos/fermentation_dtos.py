@@ -5,11 +5,14 @@ Pure Python dataclasses for fermentation data transfer between layers.
 No framework dependencies (no Pydantic, no SQLAlchemy).
 """
 
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional, List
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Optional, List, Tuple
 from decimal import Decimal
 
+# Keyset position in a fermentation listing: (start_date, id) of the last row sent
+ListPosition = Tuple[datetime, int]
+
 
 @dataclass
 class FermentationCreate:
@@ -150,3 +153,40 @@ class FermentationWithBlendCreate:
 
     fermentation_data: FermentationCreate
     lot_sources: List[LotSourceData]
+
+
+@dataclass(frozen=True)
+class FermentationListFilter:
+    """
+    Filters of a fermentation listing, applied in SQL by the repository.
+
+    Attributes:
+        data_source: Data source to list (ADR-029), e.g. 'HISTORICAL'
+        start_date_from: Earliest start date (inclusive)
+        start_date_to: Latest start date (inclusive)
+        fruit_origin_id: Harvest lot the fermentation was made from
+            (through its FermentationLotSource rows)
+        status: Exact fermentation status
+    """
+
+    data_source: str
+    start_date_from: Optional[date] = None
+    start_date_to: Optional[date] = None
+    fruit_origin_id: Optional[int] = None
+    status: Optional[str] = None
+
+
+@dataclass
+class FermentationPage:
+    """
+    One page of a fermentation listing, newest start_date first.
+
+    Attributes:
+        items: Fermentation entities of the page
+        next_cursor: Opaque cursor of the next page, None on the last page
+        total: Rows matching the filter; only counted for the first page
+    """
+
+    items: List[Any] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
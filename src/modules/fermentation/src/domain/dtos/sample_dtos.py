@@ -5,8 +5,9 @@ Pure Python dataclasses for sample data transfer between layers.
 No framework dependencies (no Pydantic, no SQLAlchemy).
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any, List, Optional
 from src.modules.fermentation.src.domain.enums.sample_type import SampleType
 
 
@@ -31,3 +32,105 @@ class SampleCreate:
     value: float
     units: str
     recorded_at: datetime
+
+
+@dataclass
+class SampleBatchItem:
+    """
+    One sample of a batch ingestion request.
+
+    Attributes:
+        fermentation_id: Fermentation the sample belongs to
+        sample: Sample creation data
+    """
+
+    fermentation_id: int
+    sample: SampleCreate
+
+
+@dataclass
+class SampleBatchItemResult:
+    """
+    Outcome of one batch item, reported back in request order.
+
+    Attributes:
+        index: Position of the item in the request
+        fermentation_id: Fermentation the sample belongs to
+        sample: Persisted sample (None if rejected)
+        errors: Validation errors explaining a rejection
+    """
+
+    index: int
+    fermentation_id: int
+    sample: Optional[Any] = None
+    errors: List[Any] = field(default_factory=list)
+
+    @property
+    def accepted(self) -> bool:
+        return self.sample is not None
+
+
+@dataclass(frozen=True)
+class TelemetryReading:
+    """
+    One sensor reading for the high-rate ingestion path.
+
+    Lighter than SampleCreate: no per-reading validation pipeline; readings
+    are buffered and written in bulk by TelemetryIngestionBuffer.
+
+    Attributes:
+        fermentation_id: Fermentation the probe is attached to
+        sample_type: Type of measurement (TEMPERATURE, DENSITY, ...)
+        value: Measured value
+        units: Units of measurement
+        recorded_at: Timestamp taken by the probe
+    """
+
+    fermentation_id: int
+    sample_type: SampleType
+    value: float
+    units: str
+    recorded_at: datetime
+
+
+@dataclass
+class TelemetryIngestResult:
+    """
+    Outcome of one telemetry submission.
+
+    Attributes:
+        accepted: Readings buffered for the next bulk write
+        coalesced: Readings merged into an already buffered one
+        rejected_fermentation_ids: Fermentations not found, foreign or COMPLETED
+            (their readings were dropped)
+        rejected_readings: Readings dropped for a timestamp before their
+            fermentation's start or in the future
+        max_visibility_delay_seconds: Upper bound before readings are queryable
+    """
+
+    accepted: int = 0
+    coalesced: int = 0
+    rejected_fermentation_ids: List[int] = field(default_factory=list)
+    rejected_readings: int = 0
+    max_visibility_delay_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class SamplePartition:
+    """
+    One partition of the samples table (PostgreSQL range partitioning).
+
+    Attributes:
+        name: Partition table name (samples_y<year> or samples_default)
+        year: Calendar year of recorded_at held by the partition,
+            None for the default partition (rows outside every range)
+        estimated_rows: Planner row estimate (pg_class.reltuples)
+    """
+
+    name: str
+    year: Optional[int]
+    estimated_rows: int = 0
+
+    @property
+    def is_default(self) -> bool:
+        return self.year is None
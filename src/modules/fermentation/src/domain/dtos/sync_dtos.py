@@ -0,0 +1,52 @@
+"""
+Delta Sync Data Transfer Objects.
+
+DTOs returned by the change feed (GET /sync/changes). A change set holds,
+per entity stream, the rows changed after the client's cursor and the
+deletions (soft-deleted rows and tombstones), plus the cursor to send next.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from src.modules.fermentation.src.domain.enums.sync_entity import SyncEntity
+
+# Keyset position inside one stream: (updated_at, id) of the last row sent
+FeedPosition = Tuple[datetime, int]
+
+
+@dataclass(frozen=True)
+class SyncDeletion:
+    """
+    A deleted entity the client must drop.
+
+    Attributes:
+        entity: Stream the entity belongs to
+        entity_id: ID of the deleted entity
+        deleted_at: When the deletion happened (row/tombstone updated_at)
+    """
+
+    entity: SyncEntity
+    entity_id: int
+    deleted_at: datetime
+
+
+@dataclass
+class SyncChangeSet:
+    """
+    One page of the change feed.
+
+    Attributes:
+        upserts: Live rows (ORM entities) per stream, oldest change first
+        deletions: Deleted entities across all streams
+        next_cursor: Opaque cursor for the next call
+        has_more: True if at least one stream was cut at the page limit
+        server_time: Watermark the page was read up to
+    """
+
+    upserts: Dict[SyncEntity, List[Any]] = field(default_factory=dict)
+    deletions: List[SyncDeletion] = field(default_factory=list)
+    next_cursor: str = ""
+    has_more: bool = False
+    server_time: datetime = field(default_factory=datetime.utcnow)
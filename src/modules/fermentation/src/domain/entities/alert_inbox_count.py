@@ -0,0 +1,73 @@
+"""
+Alert inbox counters (read model of protocol_alerts)
+
+Denormalized alert counts by severity and status, per winery and per
+protocol execution. ProtocolAlertRepository keeps them in step with every
+alert write (create, bulk create, acknowledge, dismiss) in the same
+transaction, so the alert badge and the per-tank counts read a few rows
+instead of counting protocol_alerts.
+
+winery_id has no FK to wineries, matching protocol_alerts.winery_id
+(migration 002): a counter exists for every winery an alert can carry.
+
+Tables: alert_inbox_winery_counts, alert_inbox_execution_counts
+"""
+
+from sqlalchemy import String, Integer, ForeignKey, Index, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.shared.infra.orm.base_entity import BaseEntity
+
+
+class WineryAlertCount(BaseEntity):
+    """Number of a winery's alerts with one (severity, status)."""
+
+    __tablename__ = "alert_inbox_winery_counts"
+    __table_args__ = (
+        UniqueConstraint(
+            "winery_id",
+            "severity",
+            "status",
+            name="uq_alert_inbox_winery_counts__winery_severity_status",
+        ),
+    )
+
+    winery_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    severity: Mapped[str] = mapped_column(String(20), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    alert_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<WineryAlertCount(winery_id={self.winery_id}, severity={self.severity}, "
+            f"status={self.status}, count={self.alert_count})>"
+        )
+
+
+class ExecutionAlertCount(BaseEntity):
+    """Number of an execution's alerts with one (severity, status)."""
+
+    __tablename__ = "alert_inbox_execution_counts"
+    __table_args__ = (
+        UniqueConstraint(
+            "execution_id",
+            "severity",
+            "status",
+            name="uq_alert_inbox_execution_counts__execution_severity_status",
+        ),
+        Index("ix_alert_inbox_execution_counts__winery_id", "winery_id"),
+    )
+
+    execution_id: Mapped[int] = mapped_column(
+        ForeignKey("protocol_executions.id", ondelete="CASCADE"), nullable=False
+    )
+    winery_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    severity: Mapped[str] = mapped_column(String(20), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    alert_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ExecutionAlertCount(execution_id={self.execution_id}, "
+            f"severity={self.severity}, status={self.status}, count={self.alert_count})>"
+        )
@@ -1,6 +1,14 @@
 from datetime import datetime
 from typing import List, TYPE_CHECKING, Optional
-from sqlalchemy import String, Float, Integer, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import (
+    String,
+    Float,
+    Integer,
+    DateTime,
+    ForeignKey,
+    Index,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.shared.infra.orm.base_entity import BaseEntity
 
@@ -24,6 +32,16 @@ class Fermentation(BaseEntity):
         UniqueConstraint(
             "winery_id", "vessel_code", name="uq_fermentations__winery_id__vessel_code"
         ),
+        # Change feed keyset scan (GET /sync/changes)
+        Index("ix_fermentations__winery_id__updated_at", "winery_id", "updated_at"),
+        # Filtered, keyset-paginated listings (historical browsing)
+        Index(
+            "ix_fermentations__winery_id__data_source__start_date",
+            "winery_id",
+            "data_source",
+            "start_date",
+            "id",
+        ),
         {
             "sqlite_autoincrement": True,
             "extend_existing": True,  # Allow re-registration for testing
@@ -64,6 +82,9 @@ class Fermentation(BaseEntity):
     )
     imported_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
+    # Cold storage: samples and notes moved to archive files (migration 011)
+    archived_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
     # Soft delete support
     is_deleted: Mapped[bool] = mapped_column(
         nullable=False, default=False, server_default="false"
@@ -1,5 +1,5 @@
 from typing import TYPE_CHECKING
-from sqlalchemy import Boolean, Column, Integer, String, ForeignKey, Text
+from sqlalchemy import Boolean, Column, Integer, String, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship, Mapped
 
 from src.shared.infra.orm.base_entity import BaseEntity
@@ -10,7 +10,11 @@ if TYPE_CHECKING:
 
 class FermentationNote(BaseEntity):
     __tablename__ = "fermentation_notes"
-    __table_args__ = {"extend_existing": True}  # Allow re-registration for testing
+    __table_args__ = (
+        # Change feed keyset scan (GET /sync/changes)
+        Index("ix_fermentation_notes__updated_at__id", "updated_at", "id"),
+        {"extend_existing": True},  # Allow re-registration for testing
+    )
 
     # Foreign Key
     fermentation_id = Column(
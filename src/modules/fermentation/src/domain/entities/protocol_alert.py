@@ -39,6 +39,15 @@ class ProtocolAlert(BaseEntity):
     __table_args__ = (
         Index("ix_protocol_alerts__execution_status", "execution_id", "status"),
         Index("ix_protocol_alerts__winery_id", "winery_id"),
+        Index("ix_protocol_alerts__winery_id__updated_at", "winery_id", "updated_at"),
+        # Alert inbox: a winery's alerts of one status, newest first
+        Index(
+            "ix_protocol_alerts__winery_status_created",
+            "winery_id",
+            "status",
+            "created_at",
+            "id",
+        ),
     )
 
     # Scope
@@ -14,6 +14,7 @@ from sqlalchemy import (
     Text,
     DateTime,
     ForeignKey,
+    Index,
     UniqueConstraint,
     CheckConstraint,
 )
@@ -49,6 +50,7 @@ class ProtocolExecution(BaseEntity):
             "fermentation_id", name="uq_protocol_executions__fermentation"
         ),
         CheckConstraint("compliance_score BETWEEN 0 AND 100"),
+        Index("ix_protocol_executions__updated_at", "updated_at"),
     )
 
     # Foreign keys
@@ -14,8 +14,9 @@ from sqlalchemy import (
     Text,
     DateTime,
     ForeignKey,
-    UniqueConstraint,
+    Index,
     CheckConstraint,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -41,14 +42,20 @@ class FermentationProtocol(BaseEntity):
 
     __tablename__ = "fermentation_protocols"
     __table_args__ = (
-        UniqueConstraint(
+        # Only master templates are versioned; instances copy their template's
+        # winery/varietal/version, so uniqueness excludes them
+        Index(
+            "uq_protocols__winery_varietal_version",
             "winery_id",
             "varietal_code",
             "version",
-            name="uq_protocols__winery_varietal_version",
+            unique=True,
+            postgresql_where=text("is_template"),
+            sqlite_where=text("is_template"),
         ),
         CheckConstraint("expected_duration_days > 0"),
         CheckConstraint("color IN ('RED', 'WHITE', 'ROSÉ')"),
+        Index("ix_fermentation_protocols__updated_at", "updated_at"),
     )
 
     # Foreign keys
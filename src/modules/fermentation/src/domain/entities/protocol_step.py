@@ -15,6 +15,7 @@ from sqlalchemy import (
     Text,
     DateTime,
     ForeignKey,
+    Index,
     UniqueConstraint,
     CheckConstraint,
 )
@@ -66,6 +67,7 @@ class ProtocolStep(BaseEntity):
         CheckConstraint("tolerance_hours >= 0"),
         CheckConstraint("duration_minutes >= 0"),
         CheckConstraint("criticality_score BETWEEN 0 AND 100"),
+        Index("ix_protocol_steps__updated_at", "updated_at"),
     )
 
     # Foreign keys
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import ForeignKey, String, Integer
+from sqlalchemy import ForeignKey, String, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.shared.infra.orm.base_entity import BaseEntity
@@ -10,7 +10,24 @@ class BaseSample(BaseEntity):
     """Base class for all sample types in fermentation monitoring."""
 
     __tablename__ = "samples"
-    __table_args__ = {"extend_existing": True}  # Allow re-registration for testing
+    # On PostgreSQL the table is range-partitioned by recorded_at, one
+    # partition per year, with primary key (id, recorded_at) (migration 010).
+    __table_args__ = (
+        # Change feed keyset scan (GET /sync/changes)
+        Index("ix_samples__updated_at__id", "updated_at", "id"),
+        # Per-fermentation reads: all samples, latest of a type, time ranges
+        Index(
+            "ix_samples__fermentation_id__sample_type__recorded_at",
+            "fermentation_id",
+            "sample_type",
+            "recorded_at",
+        ),
+        # Time-range scans over the append-mostly, time-ordered rows
+        Index(
+            "ix_samples__recorded_at_brin", "recorded_at", postgresql_using="brin"
+        ),
+        {"extend_existing": True},  # Allow re-registration for testing
+    )
     __mapper_args__ = {
         "polymorphic_on": "sample_type",
         "polymorphic_identity": "base_sample",
@@ -19,14 +36,14 @@ class BaseSample(BaseEntity):
     # Primary identification
     # Id is inherited from BaseEntity
     sample_type: Mapped[str] = mapped_column(
-        String(50), nullable=False, index=True
+        String(50), nullable=False
     )  # e.g., 'glucose', 'ethanol', 'temperature'
 
     # Sample context
     fermentation_id: Mapped[int] = mapped_column(
-        ForeignKey("fermentations.id"), nullable=False, index=True
+        ForeignKey("fermentations.id"), nullable=False
     )
-    recorded_at: Mapped[datetime] = mapped_column(nullable=False, index=True)
+    recorded_at: Mapped[datetime] = mapped_column(nullable=False)
     recorded_by_user_id: Mapped[int] = mapped_column(
         Integer,
         nullable=False,  # Audit: user who recorded - no FK to avoid module dependencies
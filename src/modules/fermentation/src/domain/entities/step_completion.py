@@ -14,6 +14,7 @@ from sqlalchemy import (
     Text,
     DateTime,
     ForeignKey,
+    Index,
     UniqueConstraint,
     CheckConstraint,
 )
@@ -55,6 +56,7 @@ class StepCompletion(BaseEntity):
         CheckConstraint(
             "(was_skipped = true AND skip_reason IS NOT NULL) OR was_skipped = false"
         ),
+        Index("ix_step_completions__updated_at", "updated_at"),
     )
 
     # Foreign keys
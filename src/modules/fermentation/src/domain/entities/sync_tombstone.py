@@ -0,0 +1,40 @@
+"""
+SyncTombstone Entity
+
+Deletion marker for rows that are removed physically (winemaker actions)
+and therefore cannot appear in the change feed as ``is_deleted`` rows.
+Soft-deleted entities (fermentations, samples, notes) need no tombstone:
+their own row is the marker.
+
+Table: sync_tombstones
+"""
+
+from sqlalchemy import String, Integer, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.shared.infra.orm.base_entity import BaseEntity
+
+
+class SyncTombstone(BaseEntity):
+    """
+    Records that ``entity_type``/``entity_id`` was deleted.
+
+    ``updated_at`` is the deletion time and orders the tombstone in the
+    change feed together with the live rows.
+    """
+
+    __tablename__ = "sync_tombstones"
+    __table_args__ = (
+        Index("ix_sync_tombstones__winery_id__updated_at", "winery_id", "updated_at"),
+        {"extend_existing": True},
+    )
+
+    winery_id: Mapped[int] = mapped_column(ForeignKey("wineries.id"), nullable=False)
+    entity_type: Mapped[str] = mapped_column(String(30), nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<SyncTombstone(entity_type='{self.entity_type}', "
+            f"entity_id={self.entity_id}, winery_id={self.winery_id})>"
+        )
@@ -48,6 +48,7 @@ class WinemakerAction(BaseEntity):
         Index("ix_winemaker_actions_execution_id", "execution_id"),
         Index("ix_winemaker_actions_alert_id", "alert_id"),
         Index("ix_winemaker_actions_taken_at", "taken_at"),
+        Index("ix_winemaker_actions_winery_id_updated_at", "winery_id", "updated_at"),
         CheckConstraint(
             "outcome IN ('PENDING', 'RESOLVED', 'NO_EFFECT', 'WORSENED')",
             name="ck_winemaker_actions_outcome",
@@ -8,6 +8,8 @@ from .fermentation_status import FermentationStatus
 from .sample_type import SampleType
 from .data_source import DataSource
 from .step_type import StepType, ProtocolExecutionStatus, SkipReason
+from .sync_entity import SyncEntity
+from .export_dataset import ExportDataset
 
 __all__ = [
     "FermentationStatus",
@@ -16,4 +18,6 @@ __all__ = [
     "StepType",
     "ProtocolExecutionStatus",
     "SkipReason",
+    "SyncEntity",
+    "ExportDataset",
 ]
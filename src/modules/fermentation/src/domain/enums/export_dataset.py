@@ -0,0 +1,27 @@
+"""
+ExportDataset enum for the columnar history export.
+
+Each value is one table of the export: the API streams one dataset per
+request, the CLI writes one Parquet file per dataset.
+"""
+
+from enum import Enum
+
+
+class ExportDataset(str, Enum):
+    """
+    Datasets exposed by GET /fermentation/historical/export/{dataset}.
+
+    Values:
+        FERMENTATIONS: fermentations of the winery, one row each
+        SAMPLES: sample readings pivoted to one row per (fermentation,
+            recorded_at), one column per sample type
+        LOT_SOURCES: harvest lots blended into each fermentation
+        ANALYSES: analysis engine runs on the winery's fermentations, one
+            row each
+    """
+
+    FERMENTATIONS = "fermentations"
+    SAMPLES = "samples"
+    LOT_SOURCES = "lot_sources"
+    ANALYSES = "analyses"
@@ -0,0 +1,27 @@
+"""
+SyncEntity enum for the delta sync change feed.
+
+Each value is one stream of the feed: clients keep a position per stream
+in the opaque cursor and receive changed rows and tombstones per stream.
+"""
+
+from enum import Enum
+
+
+class SyncEntity(str, Enum):
+    """
+    Entity streams exposed by GET /sync/changes.
+
+    Values:
+        FERMENTATION: fermentations of the winery
+        SAMPLE: samples of the winery's fermentations
+        NOTE: fermentation notes
+        ALERT: protocol alerts
+        ACTION: winemaker actions
+    """
+
+    FERMENTATION = "fermentation"
+    SAMPLE = "sample"
+    NOTE = "note"
+    ALERT = "alert"
+    ACTION = "action"
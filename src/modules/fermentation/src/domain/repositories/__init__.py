@@ -7,9 +7,21 @@ Core repository interfaces that define the persistence contracts for domain enti
 from .fermentation_repository_interface import IFermentationRepository
 from .sample_repository_interface import ISampleRepository
 from .fermentation_note_repository_interface import IFermentationNoteRepository
+from .telemetry_sample_repository_interface import ITelemetrySampleRepository
+from .change_feed_repository_interface import IChangeFeedRepository
+from .sample_partition_repository_interface import ISamplePartitionRepository
+from .fermentation_archive_repository_interface import IFermentationArchiveRepository
+from .fermentation_archive_store_interface import IFermentationArchiveStore
+from .fermentation_export_repository_interface import IFermentationExportRepository
 
 __all__ = [
     "IFermentationRepository",
     "ISampleRepository",
     "IFermentationNoteRepository",
+    "ITelemetrySampleRepository",
+    "IChangeFeedRepository",
+    "ISamplePartitionRepository",
+    "IFermentationArchiveRepository",
+    "IFermentationArchiveStore",
+    "IFermentationExportRepository",
 ]
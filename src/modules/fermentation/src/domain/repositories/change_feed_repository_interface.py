@@ -0,0 +1,78 @@
+"""
+Interface definition for the Change Feed Repository.
+Read-only contract behind the delta sync API (GET /sync/changes).
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, List, Optional
+
+from src.modules.fermentation.src.domain.dtos.sync_dtos import FeedPosition
+from src.modules.fermentation.src.domain.enums.sync_entity import SyncEntity
+
+
+class IChangeFeedRepository(ABC):
+    """
+    Interface for keyset reads of changed rows per winery.
+
+    DESIGN PRINCIPLES:
+    - Keyset, not offset: rows strictly after (updated_at, id) of the last
+      row the client saw, so a read costs O(changes), not O(table)
+    - Bounded above: only rows with updated_at <= until, so a page never
+      races with writes that are still committing
+    - Soft-deleted rows are included (they are the deletion marker)
+    """
+
+    @abstractmethod
+    async def get_changes(
+        self,
+        winery_id: int,
+        entity: SyncEntity,
+        after: Optional[FeedPosition],
+        until: datetime,
+        limit: int,
+    ) -> List[Any]:
+        """
+        Retrieves rows of one stream changed after a position.
+
+        Args:
+            winery_id: Winery ID for access control
+            entity: Stream to read
+            after: Last (updated_at, id) sent to the client, None for a full sync
+            until: Upper bound on updated_at (inclusive)
+            limit: Maximum rows to return
+
+        Returns:
+            List[Any]: ORM entities ordered by (updated_at, id), deleted ones included
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        pass
+
+    @abstractmethod
+    async def get_tombstones(
+        self,
+        winery_id: int,
+        entity: SyncEntity,
+        after: Optional[FeedPosition],
+        until: datetime,
+        limit: int,
+    ) -> List[Any]:
+        """
+        Retrieves hard-delete tombstones of one stream after a position.
+
+        Args:
+            winery_id: Winery ID for access control
+            entity: Stream the deleted entities belonged to
+            after: Last (updated_at, id) tombstone sent, None for a full sync
+            until: Upper bound on updated_at (inclusive)
+            limit: Maximum tombstones to return
+
+        Returns:
+            List[SyncTombstone]: Tombstones ordered by (updated_at, id)
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        pass
@@ -0,0 +1,76 @@
+"""
+Interface definition for the Fermentation Archive Repository.
+Hot-table side of the cold-storage pipeline: find archivable fermentations,
+export their rows and purge them once the archive files are written.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List
+
+from src.modules.fermentation.src.domain.dtos.archive_dtos import ArchivedRows
+from src.modules.fermentation.src.domain.entities.fermentation import Fermentation
+
+
+class IFermentationArchiveRepository(ABC):
+    """
+    Interface for moving completed fermentations out of the hot tables.
+
+    DESIGN PRINCIPLES:
+    - The fermentation row stays (foreign keys, listings, sync feed); only
+      its samples and notes leave, and archived_at marks it
+    - Purging is all-or-nothing per fermentation and only removes what was
+      exported: if rows changed in between, nothing is deleted
+    - Archived rows are not tombstoned: they moved, they weren't deleted
+    """
+
+    @abstractmethod
+    async def list_archivable(
+        self, completed_before: datetime, limit: int = 100
+    ) -> List[Fermentation]:
+        """
+        Lists completed, not yet archived fermentations last updated before a cutoff.
+
+        Args:
+            completed_before: Fermentations updated after this stay hot
+            limit: Maximum number of fermentations returned (oldest first)
+
+        Returns:
+            List[Fermentation]: Fermentations to archive
+        """
+        pass
+
+    @abstractmethod
+    async def export_rows(self, fermentation_id: int) -> ArchivedRows:
+        """
+        Reads every sample and note of a fermentation, soft-deleted included.
+
+        Args:
+            fermentation_id: ID of the fermentation
+
+        Returns:
+            ArchivedRows: Samples and notes to write to cold storage
+        """
+        pass
+
+    @abstractmethod
+    async def purge_archived(
+        self, fermentation_id: int, rows: ArchivedRows, archived_at: datetime
+    ) -> bool:
+        """
+        Deletes the exported rows and marks the fermentation archived, atomically.
+
+        Args:
+            fermentation_id: ID of the fermentation
+            rows: Rows previously returned by export_rows (and written out)
+            archived_at: Timestamp stored in fermentations.archived_at
+
+        Returns:
+            bool: False (and nothing changed) if the hot rows no longer match
+                the export (row count or max updated_at), e.g. a note was
+                added or a sample edited meanwhile
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        pass
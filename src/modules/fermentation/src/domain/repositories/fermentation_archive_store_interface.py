@@ -0,0 +1,73 @@
+"""
+Interface definition for the Fermentation Archive Store.
+Cold side of the archival pipeline: compressed columnar files holding the
+samples and notes of archived fermentations.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List
+
+from src.modules.fermentation.src.domain.dtos.archive_dtos import ArchivedRows
+from src.modules.fermentation.src.domain.entities.fermentation_note import (
+    FermentationNote,
+)
+from src.modules.fermentation.src.domain.entities.samples.base_sample import BaseSample
+
+
+class IFermentationArchiveStore(ABC):
+    """
+    Interface for reading and writing archived fermentation data.
+
+    DESIGN PRINCIPLES:
+    - Keyed by (winery_id, fermentation_id): a winery can only ever read
+      its own archives
+    - Writes are atomic and durable: readers see the whole archive or
+      none of it, and a returned write survives a crash
+    - Only fermentations marked archived are read; a missing archive is
+      an error, never an empty result
+    - Reads rehydrate detached domain entities, ordered like the hot
+      repository queries they stand in for
+    """
+
+    @abstractmethod
+    async def write(self, winery_id: int, fermentation_id: int, rows: ArchivedRows) -> None:
+        """
+        Writes (or replaces) the archive of a fermentation.
+
+        Args:
+            winery_id: Owning winery
+            fermentation_id: ID of the fermentation
+            rows: Samples and notes to archive
+
+        Raises:
+            ArchiveUnavailable: If the archive can't be written
+        """
+        pass
+
+    @abstractmethod
+    async def read_samples(self, winery_id: int, fermentation_id: int) -> List[BaseSample]:
+        """
+        Rehydrates the archived samples of a fermentation.
+
+        Returns:
+            List[BaseSample]: Samples ordered by recorded_at ASC
+
+        Raises:
+            ArchiveUnavailable: If the archive is missing or can't be read
+        """
+        pass
+
+    @abstractmethod
+    async def read_notes(
+        self, winery_id: int, fermentation_id: int
+    ) -> List[FermentationNote]:
+        """
+        Rehydrates the archived, non-deleted notes of a fermentation.
+
+        Returns:
+            List[FermentationNote]: Notes ordered by created_at DESC
+
+        Raises:
+            ArchiveUnavailable: If the archive is missing or can't be read
+        """
+        pass
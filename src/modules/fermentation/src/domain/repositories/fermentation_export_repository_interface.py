@@ -0,0 +1,70 @@
+"""
+Interface definition for the Fermentation Export Repository.
+Read-only contract behind the columnar history export.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+from src.modules.fermentation.src.domain.enums.export_dataset import ExportDataset
+
+
+class IFermentationExportRepository(ABC):
+    """
+    Interface for streaming a winery's fermentation history in chunks.
+
+    DESIGN PRINCIPLES:
+    - Server-side cursor: rows are fetched chunk by chunk while the caller
+      consumes them, so memory is bounded by the chunk size, not by the
+      size of the history
+    - Stable columns: every chunk of a dataset has the columns reported by
+      columns(), in that order, whatever values it holds
+    - Soft-deleted fermentations and samples are excluded
+    """
+
+    @abstractmethod
+    def columns(self, dataset: ExportDataset) -> List[Tuple[str, str]]:
+        """
+        Columns of a dataset.
+
+        Args:
+            dataset: Dataset to describe
+
+        Returns:
+            List[Tuple[str, str]]: (name, type) pairs; type is one of
+                "int64", "float64", "string", "bool", "timestamp", "date"
+        """
+        pass
+
+    @abstractmethod
+    def stream(
+        self, winery_id: int, dataset: ExportDataset, chunk_size: int
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Streams the rows of one dataset for a winery.
+
+        Args:
+            winery_id: Winery ID for access control
+            dataset: Dataset to read
+            chunk_size: Rows fetched from the cursor per chunk
+
+        Yields:
+            List[Dict[str, Any]]: Up to chunk_size rows keyed by column name
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        pass
+
+    @abstractmethod
+    async def list_archived_ids(self, winery_id: int) -> List[int]:
+        """
+        IDs of the winery's archived fermentations (samples in cold storage).
+
+        Args:
+            winery_id: Winery ID for access control
+
+        Returns:
+            List[int]: Fermentation IDs in ascending order
+        """
+        pass
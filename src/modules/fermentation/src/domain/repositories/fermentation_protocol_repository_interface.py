@@ -5,7 +5,7 @@ Defines contracts for protocol data access.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from src.modules.fermentation.src.domain.entities.protocol_protocol import (
     FermentationProtocol,
 )
@@ -19,6 +19,13 @@ class IFermentationProtocolRepository(ABC):
         """Create and persist a new protocol"""
         pass
 
+    @abstractmethod
+    async def bulk_create(
+        self, rows: Sequence[Dict[str, Any]]
+    ) -> List[FermentationProtocol]:
+        """Insert many protocols in one statement; returned in input order"""
+        pass
+
     @abstractmethod
     async def get_by_id(self, protocol_id: int) -> Optional[FermentationProtocol]:
         """Get protocol by ID"""
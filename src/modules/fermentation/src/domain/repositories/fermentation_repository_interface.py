@@ -20,7 +20,11 @@ from src.modules.fermentation.src.domain.enums.fermentation_status import (
 )
 
 # Import DTOs from domain.dtos package
-from src.modules.fermentation.src.domain.dtos import FermentationCreate
+from src.modules.fermentation.src.domain.dtos import (
+    FermentationCreate,
+    FermentationListFilter,
+    ListPosition,
+)
 
 if TYPE_CHECKING:
     from src.modules.fermentation.src.domain.entities.fermentation import Fermentation
@@ -77,6 +81,28 @@ class IFermentationRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_by_ids(
+        self, fermentation_ids: List[int], winery_id: int
+    ) -> List[Fermentation]:
+        """
+        Retrieves several fermentations in one query with winery access control.
+
+        Used by batch operations to check ownership once per fermentation.
+        IDs that don't exist or belong to another winery are simply absent.
+
+        Args:
+            fermentation_ids: IDs of the fermentations to retrieve
+            winery_id: Winery ID for access control (required for security)
+
+        Returns:
+            List[Fermentation]: Fermentations found (in no particular order)
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        pass
+
     @abstractmethod
     async def update_status(
         self,
@@ -186,3 +212,53 @@ class IFermentationRepository(ABC):
             RepositoryError: If database operation fails
         """
         pass
+
+    @abstractmethod
+    async def list_page_by_data_source(
+        self,
+        winery_id: int,
+        filters: FermentationListFilter,
+        limit: int,
+        after: Optional[ListPosition] = None,
+        offset: int = 0,
+    ) -> List[Fermentation]:
+        """
+        Retrieves one page of a winery's fermentations of a data source.
+
+        All filters are applied in the query. Rows are ordered by
+        (start_date, id) descending; ``after`` continues a keyset page,
+        ``offset`` is kept for offset-paginated callers.
+
+        Args:
+            winery_id: ID of the winery
+            filters: Data source, date range, fruit origin and status filters
+            limit: Maximum rows to return
+            after: (start_date, id) of the last row of the previous page
+            offset: Rows to skip (ignored when ``after`` is given)
+
+        Returns:
+            List[Fermentation]: Non-deleted fermentations of the page
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        pass
+
+    @abstractmethod
+    async def count_by_data_source(
+        self, winery_id: int, filters: FermentationListFilter
+    ) -> int:
+        """
+        Counts a winery's non-deleted fermentations matching a listing filter.
+
+        Args:
+            winery_id: ID of the winery
+            filters: Same filters as list_page_by_data_source
+
+        Returns:
+            int: Number of matching fermentations
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        pass
@@ -4,8 +4,9 @@ Repository Interface for ProtocolAlert (ADR-040).
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 
+from src.modules.fermentation.src.domain.dtos.alert_dtos import AlertCounts, InboxPosition
 from src.modules.fermentation.src.domain.entities.protocol_alert import ProtocolAlert
 
 
@@ -52,6 +53,20 @@ class IProtocolAlertRepository(ABC):
         """List all PENDING alerts across all executions for a winery."""
         pass
 
+    @abstractmethod
+    async def get_inbox(
+        self,
+        winery_id: int,
+        status: Optional[str] = "PENDING",
+        after: Optional[InboxPosition] = None,
+        limit: int = 50,
+    ) -> List[ProtocolAlert]:
+        """
+        One page of a winery's alerts (of ``status``, all when None),
+        newest first, starting after the (created_at, id) keyset position.
+        """
+        pass
+
     @abstractmethod
     async def acknowledge(self, alert_id: int) -> Optional[ProtocolAlert]:
         """Set status=ACKNOWLEDGED and acknowledged_at=now."""
@@ -66,3 +81,22 @@ class IProtocolAlertRepository(ABC):
     async def count_pending(self, execution_id: int) -> int:
         """Count PENDING alerts for an execution."""
         pass
+
+    @abstractmethod
+    async def get_winery_counts(self, winery_id: int) -> AlertCounts:
+        """Alert counts of a winery by status and severity."""
+        pass
+
+    @abstractmethod
+    async def get_execution_counts(
+        self,
+        winery_id: int,
+        execution_ids: Optional[Sequence[int]] = None,
+    ) -> Dict[int, AlertCounts]:
+        """Alert counts per execution of a winery (executions with alerts only)."""
+        pass
+
+    @abstractmethod
+    async def remove_execution_counts(self, execution_id: int) -> None:
+        """Take an execution's alerts out of the counters (before deleting it)."""
+        pass
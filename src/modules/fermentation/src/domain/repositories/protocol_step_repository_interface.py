@@ -3,7 +3,7 @@ Repository Interface for ProtocolStep
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 from src.modules.fermentation.src.domain.entities.protocol_step import ProtocolStep
 
 
@@ -15,6 +15,16 @@ class IProtocolStepRepository(ABC):
         """Create and persist a new step"""
         pass
 
+    @abstractmethod
+    async def bulk_create(self, rows: Sequence[Dict[str, Any]]) -> List[ProtocolStep]:
+        """Insert many steps in one statement; returned in input order"""
+        pass
+
+    @abstractmethod
+    async def bulk_set_dependencies(self, dependencies: Mapping[int, int]) -> None:
+        """Set depends_on_step_id for many steps (step ID -> dependency ID)"""
+        pass
+
     @abstractmethod
     async def get_by_id(self, step_id: int) -> Optional[ProtocolStep]:
         """Get step by ID"""
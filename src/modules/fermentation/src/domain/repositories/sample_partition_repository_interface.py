@@ -0,0 +1,72 @@
+"""
+Interface definition for the Sample Partition Repository.
+Maintenance contract for the range-partitioned samples table (migration 010).
+"""
+
+from abc import ABC, abstractmethod
+from typing import List
+
+from src.modules.fermentation.src.domain.dtos.sample_dtos import SamplePartition
+
+
+class ISamplePartitionRepository(ABC):
+    """
+    Interface for managing the yearly partitions of the samples table.
+
+    DESIGN PRINCIPLES:
+    - One partition per calendar year of recorded_at (samples_y<year>), plus
+      a default partition for rows outside every range
+    - Creating partitions is idempotent; rows already in the default
+      partition for that year are moved into the new partition
+    - Detaching keeps the partition as a standalone table for archival;
+      the current and future years can't be detached
+    - PostgreSQL only: on other dialects (SQLite tests) every method is a no-op
+    """
+
+    @abstractmethod
+    async def list_partitions(self) -> List[SamplePartition]:
+        """
+        Lists the attached partitions of the samples table.
+
+        Returns:
+            List[SamplePartition]: Partitions ordered by year, default last
+        """
+        pass
+
+    @abstractmethod
+    async def ensure_partitions(self, from_year: int, through_year: int) -> List[str]:
+        """
+        Creates the missing yearly partitions of a range of years.
+
+        Args:
+            from_year: First year to cover
+            through_year: Last year to cover (inclusive)
+
+        Returns:
+            List[str]: Names of the partitions created
+
+        Raises:
+            ValueError: If from_year > through_year
+            RepositoryError: If database operation fails
+        """
+        pass
+
+    @abstractmethod
+    async def detach_partition(self, year: int) -> str:
+        """
+        Detaches a past year's partition for archival.
+
+        The table keeps its rows and indexes but is no longer part of
+        samples, so queries and backups of samples no longer touch it.
+
+        Args:
+            year: Year of the partition to detach
+
+        Returns:
+            str: Name of the detached table
+
+        Raises:
+            ValueError: If year is the current or a future year, or not attached
+            RepositoryError: If database operation fails
+        """
+        pass
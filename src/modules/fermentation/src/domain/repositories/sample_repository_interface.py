@@ -5,7 +5,7 @@ ARCHITECTURE: Repository returns BaseSample entities consistently across all met
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from src.modules.fermentation.src.domain.entities.samples.base_sample import BaseSample
 from src.modules.fermentation.src.domain.enums.sample_type import SampleType
@@ -144,6 +144,21 @@ class ISampleRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_earliest_recorded_at(self, fermentation_id: int) -> Optional[datetime]:
+        """
+        Retrieves the recorded_at of the fermentation's earliest sample.
+        Used by FermentationService to keep start_date at or before every sample.
+
+        Args:
+            fermentation_id: ID of the fermentation
+
+        Returns:
+            Optional[datetime]: Earliest recorded_at (soft-deleted samples
+                included) or None if the fermentation has no samples
+        """
+        pass
+
     @abstractmethod
     async def get_latest_sample_by_type(
         self, fermentation_id: int, sample_type: SampleType
@@ -164,6 +179,27 @@ class ISampleRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_latest_samples_by_fermentation_ids(
+        self, fermentation_ids: List[int]
+    ) -> Dict[int, Dict[str, BaseSample]]:
+        """
+        Retrieves the most recent sample of every type for several fermentations.
+        Used by batch ingestion to prefetch the validation window in one query
+        instead of one history lookup per sample.
+
+        Args:
+            fermentation_ids: IDs of the fermentations
+
+        Returns:
+            Dict[int, Dict[str, BaseSample]]: fermentation_id -> sample_type value -> latest sample.
+            Fermentations without samples are absent.
+
+        Raises:
+            RepositoryError: If database operation fails
+        """
+        pass
+
     @abstractmethod
     async def check_duplicate_timestamp(
         self,
@@ -211,7 +247,8 @@ class ISampleRepository(ABC):
     async def bulk_upsert_samples(self, samples: List[BaseSample]) -> List[BaseSample]:
         """
         Performs bulk upsert (create or update) of multiple samples.
-        Used for batch operations to improve performance.
+        Used for batch operations to improve performance: new samples are
+        written in a single multi-row INSERT within one transaction.
 
         UPSERT LOGIC:
         - If sample.id is None: INSERT new sample
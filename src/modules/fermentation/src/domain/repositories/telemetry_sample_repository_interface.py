@@ -0,0 +1,41 @@
+"""
+Interface definition for the Telemetry Sample Repository.
+Write-only contract for the high-rate sensor ingestion path.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from src.modules.fermentation.src.domain.dtos.sample_dtos import TelemetryReading
+
+
+class ITelemetrySampleRepository(ABC):
+    """
+    Interface for bulk persistence of sensor readings.
+
+    DESIGN PRINCIPLES:
+    - Write-only: readings land in the regular samples table, so existing
+      sample queries (timeline, latest sample) see them once written
+    - Set-based: one bulk statement per call, no ORM unit of work
+    - Own transaction: each call commits (used by a background flusher,
+      never inside a request UnitOfWork)
+    """
+
+    @abstractmethod
+    async def bulk_insert_readings(
+        self, readings: Sequence[TelemetryReading], recorded_by_user_id: int
+    ) -> int:
+        """
+        Inserts sensor readings as sample rows in a single bulk write.
+
+        Args:
+            readings: Readings to persist
+            recorded_by_user_id: Audit user recorded for every row (sensor account)
+
+        Returns:
+            int: Number of rows written
+
+        Raises:
+            RepositoryError: If the bulk write fails (nothing is written)
+        """
+        pass
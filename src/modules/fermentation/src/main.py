@@ -16,6 +16,7 @@ Docker:
 
 import os
 from contextlib import asynccontextmanager
+from datetime import datetime
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -25,11 +26,17 @@ from src.modules.fermentation.src.service_component.services.alert_scheduler_ser
 )
 
 # ADR-027: Structured Logging Middleware
-from src.shared.wine_fermentator_logging import configure_logging, get_logger
+from src.shared.wine_fermentator_logging import (
+    configure_logging,
+    get_logger,
+    shutdown_logging,
+)
 from src.shared.wine_fermentator_logging.middleware import (
     LoggingMiddleware,
     UserContextMiddleware,
 )
+from src.shared.wine_fermentator_logging.metrics import MetricsMiddleware
+from src.shared.wine_fermentator_logging.loop_monitor import EventLoopMonitor
 
 # ADR-026: Domain error handlers
 from src.shared.api.error_handlers import register_error_handlers
@@ -64,13 +71,32 @@ from src.modules.fermentation.src.api.routers.historical_router import (
     router as historical_router,
 )
 from src.modules.fermentation.src.api.routers.note_router import router as note_router
+from src.modules.fermentation.src.api.routers.sync_router import router as sync_router
 
 from src.shared.auth.infra.api.auth_router import router as auth_router
 from src.shared.api.constants import API_V1_PREFIX
+from src.shared.api.metrics_router import router as metrics_router
+from src.shared.api.event_stream_router import router as event_stream_router
+from src.shared.infra.database.query_inspector import (
+    QueryInspectionMiddleware,
+    query_inspection_enabled,
+)
 from src.shared.infra.database.fastapi_session import (
     initialize_database,
     close_database,
 )
+from src.shared.infra.database.config import DatabaseConfig
+from src.shared.infra.database.engine_registry import POOL_BACKGROUND
+from src.shared.infra.database.session import DatabaseSession
+from src.modules.fermentation.src.repository_component.repositories.telemetry_sample_repository import (
+    TelemetrySampleRepository,
+)
+from src.modules.fermentation.src.repository_component.repositories.sample_partition_repository import (
+    SamplePartitionRepository,
+)
+from src.modules.fermentation.src.service_component.services.telemetry_ingestion_service import (
+    TelemetryIngestionBuffer,
+)
 
 # Configure structured logging before app creation
 configure_logging(log_level="INFO")
@@ -91,20 +117,45 @@ def _get_db_url() -> str:
     return url
 
 
+async def _ensure_sample_partitions(session_manager: DatabaseSession) -> None:
+    """Make sure samples has partitions for this year and the next (best effort)."""
+    year = datetime.utcnow().year
+    try:
+        await SamplePartitionRepository(session_manager).ensure_partitions(year, year + 1)
+    except Exception as exc:
+        # Rows land in samples_default until the partitions exist
+        logger.warning("sample_partitions_not_ensured", error=str(exc))
+
+
 @asynccontextmanager
 async def _lifespan(app: FastAPI):
-    """Initialise DB and background scheduler on startup; clean up on shutdown."""
+    """Initialise DB, background scheduler, telemetry buffer and loop monitor; clean up on shutdown."""
+    # ADR-027: event loop lag / blocked-loop reporting (GET /metrics, logs)
+    loop_monitor = EventLoopMonitor.from_env()
+    loop_monitor.start()
     initialize_database()
     logger.info("database_initialised")
+    # Sensor ingestion writes outside request sessions, on the background pool
+    telemetry_sessions = DatabaseSession(DatabaseConfig(pool=POOL_BACKGROUND))
+    await _ensure_sample_partitions(telemetry_sessions)
+    telemetry_buffer = TelemetryIngestionBuffer.from_env(
+        TelemetrySampleRepository(telemetry_sessions)
+    )
+    telemetry_buffer.start()
+    app.state.telemetry_buffer = telemetry_buffer
     scheduler = AlertSchedulerService(
         database_url=_get_db_url(),
-        interval_minutes=int(os.getenv("ALERT_SCHEDULER_INTERVAL_MINUTES", "30")),
+        refresh_seconds=int(os.getenv("ALERT_DEADLINE_REFRESH_SECONDS", "60")),
     )
     scheduler.start()
     logger.info("alert_scheduler_wired")
     yield
     scheduler.stop()
+    await telemetry_buffer.stop()
+    # Drains every registry pool (api, background) after background work stopped
     await close_database()
+    await loop_monitor.stop()
+    shutdown_logging()
 
 
 def create_app() -> FastAPI:
@@ -123,6 +174,14 @@ def create_app() -> FastAPI:
         redoc_url="/redoc",
     )
 
+    # Staging only (DB_QUERY_INSPECTION=true): flag N+1 query patterns per request
+    if query_inspection_enabled():
+        app.add_middleware(QueryInspectionMiddleware)
+
+    # ADR-027: Request/query metrics (innermost, so its timing excludes the
+    # logging layers); exposed on GET /metrics.
+    app.add_middleware(MetricsMiddleware)
+
     # ADR-027: Structured logging middleware.
     # Starlette wraps LIFO: the last add_middleware call is the outermost layer.
     # We want:  LoggingMiddleware (outer, runs first — clears ctx, binds
@@ -180,6 +239,13 @@ def create_app() -> FastAPI:
         historical_router, prefix=API_V1_PREFIX
     )  # ADR-032: /api/v1/fermentation/historical
     app.include_router(note_router, prefix=API_V1_PREFIX, tags=["fermentation-notes"])
+    app.include_router(sync_router, prefix=API_V1_PREFIX, tags=["sync"])
+
+    # Server push: alerts and samples of the user's winery (SSE)
+    app.include_router(event_stream_router, prefix=API_V1_PREFIX)
+
+    # ADR-027: In-process metrics (Prometheus text / ?format=json)
+    app.include_router(metrics_router)
 
     # Health check endpoint
     @app.get("/health", tags=["health"])
@@ -11,6 +11,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.modules.fermentation.src.domain.entities.winemaker_action import (
     WinemakerAction,
 )
+from src.modules.fermentation.src.domain.entities.sync_tombstone import SyncTombstone
+from src.modules.fermentation.src.domain.enums.sync_entity import SyncEntity
 from src.modules.fermentation.src.domain.repositories.action_repository_interface import (
     IActionRepository,
 )
@@ -134,6 +136,14 @@ class ActionRepository(IActionRepository):
         action = await self.get_by_id(action_id, winery_id)
         if action is None:
             return False
+        # Hard delete: leave a tombstone so synced clients drop the action too
+        self.session.add(
+            SyncTombstone(
+                winery_id=winery_id,
+                entity_type=SyncEntity.ACTION.value,
+                entity_id=action.id,
+            )
+        )
         await self.session.delete(action)
         await self.session.flush()
         return True
@@ -5,8 +5,8 @@ Async repository for FermentationProtocol entity persistence.
 Uses SQLAlchemy async session for database operations.
 """
 
-from typing import List, Optional, Tuple
-from sqlalchemy import select, func, update
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import select, func, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.modules.fermentation.src.domain.entities.protocol_protocol import (
@@ -46,6 +46,29 @@ class FermentationProtocolRepository(IFermentationProtocolRepository):
         await self.session.flush()
         return protocol
 
+    async def bulk_create(
+        self, rows: Sequence[Dict[str, Any]]
+    ) -> List[FermentationProtocol]:
+        """
+        Insert many protocols with one multi-row INSERT ... RETURNING.
+
+        Args:
+            rows: Column values of each protocol
+
+        Returns:
+            Created protocols with IDs assigned, in the order of ``rows``
+
+        Raises:
+            IntegrityError: If unique constraint violated (winery, varietal, version)
+        """
+        if not rows:
+            return []
+        stmt = insert(FermentationProtocol).returning(
+            FermentationProtocol, sort_by_parameter_order=True
+        )
+        result = await self.session.scalars(stmt, list(rows))
+        return list(result.all())
+
     async def get_by_id(self, protocol_id: int) -> Optional[FermentationProtocol]:
         """
         Get protocol by ID.
@@ -112,7 +135,9 @@ class FermentationProtocolRepository(IFermentationProtocolRepository):
         self, winery_id: int, varietal_code: str, version: str
     ) -> Optional[FermentationProtocol]:
         """
-        Get protocol by unique constraint (winery, varietal, version).
+        Get master template by unique constraint (winery, varietal, version).
+
+        Instances share their template's version, so only templates are matched.
 
         Args:
             winery_id: Winery ID
@@ -126,6 +151,7 @@ class FermentationProtocolRepository(IFermentationProtocolRepository):
             (FermentationProtocol.winery_id == winery_id)
             & (FermentationProtocol.varietal_code == varietal_code)
             & (FermentationProtocol.version == version)
+            & FermentationProtocol.is_template.is_(True)
         )
         result = await self.session.execute(stmt)
         return result.scalars().first()
@@ -3,19 +3,43 @@ ProtocolAlert Repository Implementation (ADR-040).
 
 Concrete implementation using SQLAlchemy AsyncSession directly,
 following the fermentation module pattern (not BaseRepository).
+
+Every alert write also updates the alert inbox counters
+(alert_inbox_winery_counts / alert_inbox_execution_counts) in the same
+transaction: creates add to the (severity, status) buckets, status changes
+move one alert between buckets. Status changes lock the alert row first
+(SELECT ... FOR UPDATE), so concurrent acknowledge/dismiss calls on one
+alert see each other's result and the counters move once per real change. Counter rows are upserted with
+``INSERT ... ON CONFLICT DO UPDATE`` in key order, one statement per table
+for a whole batch of alerts.
 """
 
+from collections import Counter
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, delete, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.modules.fermentation.src.domain.dtos.alert_dtos import AlertCounts, InboxPosition
+from src.modules.fermentation.src.domain.entities.alert_inbox_count import (
+    ExecutionAlertCount,
+    WineryAlertCount,
+)
 from src.modules.fermentation.src.domain.entities.protocol_alert import ProtocolAlert
 from src.modules.fermentation.src.domain.repositories.protocol_alert_repository_interface import (
     IProtocolAlertRepository,
 )
 
+# Key columns of the counter rows, in the order deltas are keyed by
+_WINERY_COLUMNS = ("winery_id", "severity", "status")
+_EXECUTION_COLUMNS = ("winery_id", "execution_id", "severity", "status")
+_UNIQUE_COLUMNS = {
+    WineryAlertCount: ("winery_id", "severity", "status"),
+    ExecutionAlertCount: ("execution_id", "severity", "status"),
+}
+
 
 class ProtocolAlertRepository(IProtocolAlertRepository):
     """Repository for ProtocolAlert persistence operations."""
@@ -27,6 +51,7 @@ class ProtocolAlertRepository(IProtocolAlertRepository):
         """Persist a new alert."""
         self.session.add(alert)
         await self.session.flush()
+        await self._adjust_counts(Counter({self._count_key(alert): 1}))
         return alert
 
     async def create_many(self, alerts: List[ProtocolAlert]) -> List[ProtocolAlert]:
@@ -36,6 +61,7 @@ class ProtocolAlertRepository(IProtocolAlertRepository):
         for alert in alerts:
             self.session.add(alert)
         await self.session.flush()
+        await self._adjust_counts(Counter(self._count_key(alert) for alert in alerts))
         return alerts
 
     async def get_by_id(self, alert_id: int) -> Optional[ProtocolAlert]:
@@ -91,31 +117,208 @@ class ProtocolAlertRepository(IProtocolAlertRepository):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_inbox(
+        self,
+        winery_id: int,
+        status: Optional[str] = "PENDING",
+        after: Optional[InboxPosition] = None,
+        limit: int = 50,
+    ) -> List[ProtocolAlert]:
+        """
+        One page of a winery's alerts, newest first (keyset pagination).
+
+        Reads ix_protocol_alerts__winery_status_created from ``after``'s
+        (created_at, id) on, so every page costs the same however deep it is.
+        """
+        conditions = [ProtocolAlert.winery_id == winery_id]
+        if status is not None:
+            conditions.append(ProtocolAlert.status == status)
+        if after is not None:
+            conditions.append(
+                tuple_(ProtocolAlert.created_at, ProtocolAlert.id) < tuple_(*after)
+            )
+
+        stmt = (
+            select(ProtocolAlert)
+            .where(and_(*conditions))
+            .order_by(ProtocolAlert.created_at.desc(), ProtocolAlert.id.desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def acknowledge(self, alert_id: int) -> Optional[ProtocolAlert]:
         """Set status=ACKNOWLEDGED and acknowledged_at=now."""
-        alert = await self.get_by_id(alert_id)
+        alert = await self._get_for_update(alert_id)
         if alert is None:
             return None
+        previous_status = alert.status
         alert.acknowledge()
         await self.session.flush()
+        await self._move_count(alert, previous_status)
         return alert
 
     async def dismiss(self, alert_id: int) -> Optional[ProtocolAlert]:
         """Set status=DISMISSED and dismissed_at=now."""
-        alert = await self.get_by_id(alert_id)
+        alert = await self._get_for_update(alert_id)
         if alert is None:
             return None
+        previous_status = alert.status
         alert.dismiss()
         await self.session.flush()
+        await self._move_count(alert, previous_status)
         return alert
 
     async def count_pending(self, execution_id: int) -> int:
-        """Count PENDING alerts for an execution."""
-        stmt = select(func.count(ProtocolAlert.id)).where(
+        """Count PENDING alerts for an execution (from the inbox counters)."""
+        stmt = select(func.coalesce(func.sum(ExecutionAlertCount.alert_count), 0)).where(
             and_(
-                ProtocolAlert.execution_id == execution_id,
-                ProtocolAlert.status == "PENDING",
+                ExecutionAlertCount.execution_id == execution_id,
+                ExecutionAlertCount.status == "PENDING",
             )
         )
         result = await self.session.execute(stmt)
         return result.scalar_one()
+
+    async def get_winery_counts(self, winery_id: int) -> AlertCounts:
+        """Alert counts of a winery by status and severity."""
+        stmt = select(
+            WineryAlertCount.status,
+            WineryAlertCount.severity,
+            WineryAlertCount.alert_count,
+        ).where(
+            WineryAlertCount.winery_id == winery_id,
+            WineryAlertCount.alert_count > 0,
+        )
+        result = await self.session.execute(stmt)
+        return AlertCounts({(status, severity): n for status, severity, n in result.all()})
+
+    async def get_execution_counts(
+        self,
+        winery_id: int,
+        execution_ids: Optional[Sequence[int]] = None,
+    ) -> Dict[int, AlertCounts]:
+        """
+        Alert counts per execution of a winery, in one query.
+
+        Executions without alerts are absent. ``execution_ids`` restricts the
+        result to those executions.
+        """
+        conditions = [
+            ExecutionAlertCount.winery_id == winery_id,
+            ExecutionAlertCount.alert_count > 0,
+        ]
+        if execution_ids is not None:
+            if not execution_ids:
+                return {}
+            conditions.append(ExecutionAlertCount.execution_id.in_(execution_ids))
+        stmt = select(
+            ExecutionAlertCount.execution_id,
+            ExecutionAlertCount.status,
+            ExecutionAlertCount.severity,
+            ExecutionAlertCount.alert_count,
+        ).where(and_(*conditions))
+        result = await self.session.execute(stmt)
+
+        counts: Dict[int, Dict[Tuple[str, str], int]] = {}
+        for execution_id, status, severity, n in result.all():
+            counts.setdefault(execution_id, {})[(status, severity)] = n
+        return {execution_id: AlertCounts(c) for execution_id, c in counts.items()}
+
+    async def remove_execution_counts(self, execution_id: int) -> None:
+        """
+        Take an execution's alerts out of its winery's counters.
+
+        Call before deleting the execution: its alerts and execution counters
+        go with it (ON DELETE CASCADE), the winery counters would not.
+        """
+        rows = await self.session.execute(
+            select(
+                ExecutionAlertCount.winery_id,
+                ExecutionAlertCount.severity,
+                ExecutionAlertCount.status,
+                ExecutionAlertCount.alert_count,
+            ).where(ExecutionAlertCount.execution_id == execution_id)
+        )
+        deltas: Counter = Counter()
+        for winery_id, severity, status, n in rows.all():
+            deltas[(winery_id, severity, status)] -= n
+        await self._upsert_counts(WineryAlertCount, _WINERY_COLUMNS, deltas)
+        await self.session.execute(
+            delete(ExecutionAlertCount).where(
+                ExecutionAlertCount.execution_id == execution_id
+            )
+        )
+
+    async def _get_for_update(self, alert_id: int) -> Optional[ProtocolAlert]:
+        """
+        Load an alert and lock its row until the transaction ends.
+
+        The status read here decides the counter move, so it must be the
+        committed one: a concurrent writer waits for the lock and then sees
+        the new status (populate_existing refreshes an already loaded alert).
+        """
+        stmt = (
+            select(ProtocolAlert)
+            .where(ProtocolAlert.id == alert_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().first()
+
+    # ─── Inbox counters ─────────────────────────────────────────────────────
+
+    @staticmethod
+    def _count_key(alert: ProtocolAlert, status: Optional[str] = None) -> Tuple:
+        return (
+            alert.winery_id,
+            alert.execution_id,
+            alert.severity,
+            status or alert.status,
+        )
+
+    async def _move_count(self, alert: ProtocolAlert, previous_status: str) -> None:
+        if alert.status == previous_status:
+            return
+        deltas: Counter = Counter()
+        deltas[self._count_key(alert, previous_status)] -= 1
+        deltas[self._count_key(alert)] += 1
+        await self._adjust_counts(deltas)
+
+    async def _adjust_counts(self, deltas: Counter) -> None:
+        """Apply (winery_id, execution_id, severity, status) → delta to both counter tables."""
+        winery_deltas: Counter = Counter()
+        for (winery_id, _, severity, status), n in deltas.items():
+            winery_deltas[(winery_id, severity, status)] += n
+        await self._upsert_counts(WineryAlertCount, _WINERY_COLUMNS, winery_deltas)
+        await self._upsert_counts(ExecutionAlertCount, _EXECUTION_COLUMNS, deltas)
+
+    async def _upsert_counts(
+        self, entity, columns: Tuple[str, ...], deltas: Counter
+    ) -> None:
+        """Add ``deltas`` (keyed by ``columns`` values) to ``entity``'s counter rows."""
+        # Sorted keys: concurrent writers lock counter rows in the same order
+        now = datetime.utcnow()
+        rows = [
+            {**dict(zip(columns, key)), "alert_count": n, "created_at": now, "updated_at": now}
+            for key, n in sorted(deltas.items())
+            if n
+        ]
+        if not rows:
+            return
+        dialect_insert = (
+            postgresql.insert
+            if self.session.get_bind().dialect.name == "postgresql"
+            else sqlite.insert
+        )
+        stmt = dialect_insert(entity).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            # An execution's winery never changes, so its key omits winery_id
+            index_elements=list(_UNIQUE_COLUMNS[entity]),
+            set_={
+                "alert_count": entity.alert_count + stmt.excluded.alert_count,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await self.session.execute(stmt)
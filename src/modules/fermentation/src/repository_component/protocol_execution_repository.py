@@ -16,6 +16,9 @@ from src.modules.fermentation.src.domain.enums.step_type import ProtocolExecutio
 from src.modules.fermentation.src.domain.repositories.protocol_execution_repository_interface import (
     IProtocolExecutionRepository,
 )
+from src.modules.fermentation.src.repository_component.protocol_alert_repository import (
+    ProtocolAlertRepository,
+)
 
 
 class ProtocolExecutionRepository(IProtocolExecutionRepository):
@@ -100,6 +103,8 @@ class ProtocolExecutionRepository(IProtocolExecutionRepository):
         if execution is None:
             return False
 
+        # Its alerts go with it (ON DELETE CASCADE); keep the winery's counts right
+        await ProtocolAlertRepository(self.session).remove_execution_counts(execution_id)
         await self.session.delete(execution)
         await self.session.flush()
         return True
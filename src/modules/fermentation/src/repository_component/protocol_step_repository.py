@@ -5,8 +5,8 @@ Async repository for ProtocolStep entity persistence.
 Uses SQLAlchemy async session for database operations.
 """
 
-from typing import List, Optional, Tuple
-from sqlalchemy import select, func
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+from sqlalchemy import select, func, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.modules.fermentation.src.domain.entities.protocol_step import ProtocolStep
@@ -44,6 +44,44 @@ class ProtocolStepRepository(IProtocolStepRepository):
         await self.session.flush()
         return step
 
+    async def bulk_create(self, rows: Sequence[Dict[str, Any]]) -> List[ProtocolStep]:
+        """
+        Insert many steps with one multi-row INSERT ... RETURNING.
+
+        Args:
+            rows: Column values of each step
+
+        Returns:
+            Created steps with IDs assigned, in the order of ``rows``
+
+        Raises:
+            IntegrityError: If unique constraint violated (protocol_id, step_order)
+        """
+        if not rows:
+            return []
+        stmt = insert(ProtocolStep).returning(
+            ProtocolStep, sort_by_parameter_order=True
+        )
+        result = await self.session.scalars(stmt, list(rows))
+        return list(result.all())
+
+    async def bulk_set_dependencies(self, dependencies: Mapping[int, int]) -> None:
+        """
+        Set depends_on_step_id of many steps in one executemany UPDATE.
+
+        Args:
+            dependencies: Step ID -> ID of the step it depends on
+        """
+        if not dependencies:
+            return
+        await self.session.execute(
+            update(ProtocolStep),
+            [
+                {"id": step_id, "depends_on_step_id": depends_on}
+                for step_id, depends_on in dependencies.items()
+            ],
+        )
+
     async def get_by_id(self, step_id: int) -> Optional[ProtocolStep]:
         """
         Get step by ID.
@@ -9,10 +9,22 @@ from .fermentation_repository import FermentationRepository
 from .sample_repository import SampleRepository
 from .lot_source_repository import LotSourceRepository
 from .fermentation_note_repository import FermentationNoteRepository
+from .telemetry_sample_repository import TelemetrySampleRepository
+from .change_feed_repository import ChangeFeedRepository
+from .sample_partition_repository import SamplePartitionRepository
+from .fermentation_archive_repository import FermentationArchiveRepository
+from .parquet_archive_store import ParquetArchiveStore
+from .fermentation_export_repository import FermentationExportRepository
 
 __all__ = [
     "FermentationRepository",
     "SampleRepository",
     "LotSourceRepository",
     "FermentationNoteRepository",
+    "TelemetrySampleRepository",
+    "ChangeFeedRepository",
+    "SamplePartitionRepository",
+    "FermentationArchiveRepository",
+    "ParquetArchiveStore",
+    "FermentationExportRepository",
 ]
@@ -0,0 +1,153 @@
+"""
+Change Feed Repository Implementation.
+
+Keyset reads behind the delta sync API. Every synced table is read by
+(updated_at, id) strictly after the client's position and up to a
+server-chosen watermark, using the composite indexes from migration 008,
+so each read is proportional to the number of changed rows.
+
+Tenant scoping:
+- fermentations, protocol_alerts, winemaker_actions, sync_tombstones:
+  own winery_id column
+- samples, fermentation_notes: joined to fermentations.winery_id
+
+Implements ADR-027 Structured Logging:
+- Row counts per stream read
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select, tuple_
+
+# ADR-027: Structured logging
+from src.shared.wine_fermentator_logging import get_logger
+
+from src.modules.fermentation.src.domain.dtos.sync_dtos import FeedPosition
+from src.modules.fermentation.src.domain.entities.fermentation import Fermentation
+from src.modules.fermentation.src.domain.entities.fermentation_note import (
+    FermentationNote,
+)
+from src.modules.fermentation.src.domain.entities.protocol_alert import ProtocolAlert
+from src.modules.fermentation.src.domain.entities.samples.base_sample import BaseSample
+from src.modules.fermentation.src.domain.entities.sync_tombstone import SyncTombstone
+from src.modules.fermentation.src.domain.entities.winemaker_action import (
+    WinemakerAction,
+)
+from src.modules.fermentation.src.domain.enums.sync_entity import SyncEntity
+from src.modules.fermentation.src.domain.repositories.change_feed_repository_interface import (
+    IChangeFeedRepository,
+)
+
+from src.shared.infra.repository.base_repository import BaseRepository
+
+logger = get_logger(__name__)
+
+_MODELS: Dict[SyncEntity, Any] = {
+    SyncEntity.FERMENTATION: Fermentation,
+    SyncEntity.SAMPLE: BaseSample,
+    SyncEntity.NOTE: FermentationNote,
+    SyncEntity.ALERT: ProtocolAlert,
+    SyncEntity.ACTION: WinemakerAction,
+}
+
+# Streams without a winery_id column, scoped through their fermentation
+_SCOPED_BY_FERMENTATION = {SyncEntity.SAMPLE, SyncEntity.NOTE}
+
+
+class ChangeFeedRepository(BaseRepository, IChangeFeedRepository):
+    """
+    Repository for change feed reads (read-only).
+    """
+
+    async def get_changes(
+        self,
+        winery_id: int,
+        entity: SyncEntity,
+        after: Optional[FeedPosition],
+        until: datetime,
+        limit: int,
+    ) -> List[Any]:
+        """
+        Retrieves rows of one stream changed after a position.
+
+        Args:
+            winery_id: Winery ID for access control
+            entity: Stream to read
+            after: Last (updated_at, id) sent to the client, None for a full sync
+            until: Upper bound on updated_at (inclusive)
+            limit: Maximum rows to return
+
+        Returns:
+            List[Any]: ORM entities ordered by (updated_at, id), deleted ones included
+        """
+        model = _MODELS[entity]
+
+        async def _get_changes_operation():
+            session_cm = await self.get_session()
+            async with session_cm as session:
+                query = select(model)
+                if entity in _SCOPED_BY_FERMENTATION:
+                    query = query.join(
+                        Fermentation, Fermentation.id == model.fermentation_id
+                    ).where(Fermentation.winery_id == winery_id)
+                else:
+                    query = query.where(model.winery_id == winery_id)
+                query = self._apply_keyset(query, model, after, until, limit)
+
+                result = await session.execute(query)
+                rows = list(result.scalars().all())
+
+                logger.debug(
+                    "change_feed_read",
+                    winery_id=winery_id,
+                    entity=entity.value,
+                    rows=len(rows),
+                )
+                return rows
+
+        return await self.execute_with_error_mapping(_get_changes_operation)
+
+    async def get_tombstones(
+        self,
+        winery_id: int,
+        entity: SyncEntity,
+        after: Optional[FeedPosition],
+        until: datetime,
+        limit: int,
+    ) -> List[SyncTombstone]:
+        """
+        Retrieves hard-delete tombstones of one stream after a position.
+
+        Args:
+            winery_id: Winery ID for access control
+            entity: Stream the deleted entities belonged to
+            after: Last (updated_at, id) tombstone sent, None for a full sync
+            until: Upper bound on updated_at (inclusive)
+            limit: Maximum tombstones to return
+
+        Returns:
+            List[SyncTombstone]: Tombstones ordered by (updated_at, id)
+        """
+
+        async def _get_tombstones_operation():
+            session_cm = await self.get_session()
+            async with session_cm as session:
+                query = select(SyncTombstone).where(
+                    SyncTombstone.winery_id == winery_id,
+                    SyncTombstone.entity_type == entity.value,
+                )
+                query = self._apply_keyset(query, SyncTombstone, after, until, limit)
+
+                result = await session.execute(query)
+                return list(result.scalars().all())
+
+        return await self.execute_with_error_mapping(_get_tombstones_operation)
+
+    @staticmethod
+    def _apply_keyset(query, model, after: Optional[FeedPosition], until, limit):
+        """Rows in (after, until], ordered by (updated_at, id), at most limit."""
+        query = query.where(model.updated_at <= until)
+        if after is not None:
+            query = query.where(tuple_(model.updated_at, model.id) > tuple_(*after))
+        return query.order_by(model.updated_at, model.id).limit(limit)
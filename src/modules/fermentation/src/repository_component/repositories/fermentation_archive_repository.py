@@ -0,0 +1,178 @@
+"""
+Fermentation Archive Repository Implementation.
+
+Hot-table side of cold-storage archival (migration 011). Completed
+fermentations keep their row, but their samples and notes are exported,
+written to archive files by the caller, then deleted here in one
+transaction that also sets fermentations.archived_at. The purge compares
+row counts and max(updated_at) with the export, so neither new nor edited
+rows are dropped.
+
+Like TelemetrySampleRepository, it commits its own transactions and is
+meant for a dedicated session manager (archival script), not for request
+sessions.
+
+Implements ADR-027 Structured Logging:
+- LogTimer for export and purge timing
+- Row counts per archived fermentation
+"""
+
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, func, select, update
+
+# ADR-027: Structured logging
+from src.shared.wine_fermentator_logging import get_logger, LogTimer
+
+from src.modules.fermentation.src.domain.dtos.archive_dtos import ArchivedRows
+from src.modules.fermentation.src.domain.entities.fermentation import Fermentation
+from src.modules.fermentation.src.domain.entities.fermentation_note import (
+    FermentationNote,
+)
+from src.modules.fermentation.src.domain.entities.samples.base_sample import BaseSample
+from src.modules.fermentation.src.domain.enums.fermentation_status import (
+    FermentationStatus,
+)
+from src.modules.fermentation.src.domain.repositories.fermentation_archive_repository_interface import (
+    IFermentationArchiveRepository,
+)
+
+from src.shared.infra.repository.base_repository import BaseRepository
+
+logger = get_logger(__name__)
+
+
+class FermentationArchiveRepository(BaseRepository, IFermentationArchiveRepository):
+    """
+    Repository for moving completed fermentations out of the hot tables.
+    """
+
+    async def list_archivable(
+        self, completed_before: datetime, limit: int = 100
+    ) -> List[Fermentation]:
+        async def _list_operation():
+            session_cm = await self.get_session()
+            async with session_cm as session:
+                stmt = (
+                    select(Fermentation)
+                    .where(
+                        Fermentation.status == FermentationStatus.COMPLETED.value,
+                        Fermentation.archived_at.is_(None),
+                        Fermentation.is_deleted == False,
+                        Fermentation.updated_at < completed_before,
+                    )
+                    .order_by(Fermentation.updated_at.asc(), Fermentation.id.asc())
+                    .limit(limit)
+                )
+                result = await session.execute(stmt)
+                return list(result.scalars().all())
+
+        return await self.execute_with_error_mapping(_list_operation)
+
+    async def export_rows(self, fermentation_id: int) -> ArchivedRows:
+        # Register the sample subclasses so rows load as their concrete type
+        from src.modules.fermentation.src.domain.entities.samples.sugar_sample import (  # noqa: F401
+            SugarSample,
+        )
+        from src.modules.fermentation.src.domain.entities.samples.density_sample import (  # noqa: F401
+            DensitySample,
+        )
+        from src.modules.fermentation.src.domain.entities.samples.celcius_temperature_sample import (  # noqa: F401
+            CelsiusTemperatureSample,
+        )
+
+        async def _export_operation():
+            with LogTimer(logger, "export_fermentation_rows"):
+                session_cm = await self.get_session()
+                async with session_cm as session:
+                    samples = await session.execute(
+                        select(BaseSample)
+                        .where(BaseSample.fermentation_id == fermentation_id)
+                        .order_by(BaseSample.recorded_at.asc(), BaseSample.id.asc())
+                    )
+                    notes = await session.execute(
+                        select(FermentationNote)
+                        .where(FermentationNote.fermentation_id == fermentation_id)
+                        .order_by(FermentationNote.id.asc())
+                    )
+                    return ArchivedRows(
+                        samples=list(samples.scalars().all()),
+                        notes=list(notes.scalars().all()),
+                    )
+
+        return await self.execute_with_error_mapping(_export_operation)
+
+    async def purge_archived(
+        self, fermentation_id: int, rows: ArchivedRows, archived_at: datetime
+    ) -> bool:
+        async def _purge_operation():
+            with LogTimer(logger, "purge_archived_fermentation"):
+                session_cm = await self.get_session()
+                async with session_cm as session:
+                    hot = {}
+                    deleted = {}
+                    for name, table, exported in (
+                        ("samples", BaseSample.__table__, rows.samples),
+                        ("notes", FermentationNote.__table__, rows.notes),
+                    ):
+                        hot[name] = (
+                            await session.execute(
+                                select(func.count(), func.max(table.c.updated_at)).where(
+                                    table.c.fermentation_id == fermentation_id
+                                )
+                            )
+                        ).one()
+                        stmt = delete(table).where(table.c.fermentation_id == fermentation_id)
+                        exported_max = _max_updated_at(exported)
+                        if exported_max is not None:
+                            # A row edited after the check is kept and trips the count
+                            stmt = stmt.where(table.c.updated_at <= exported_max)
+                        deleted[name] = (await session.execute(stmt)).rowcount
+                    marked = await session.execute(
+                        update(Fermentation.__table__)
+                        .where(
+                            Fermentation.__table__.c.id == fermentation_id,
+                            Fermentation.__table__.c.archived_at.is_(None),
+                        )
+                        .values(archived_at=archived_at)
+                    )
+
+                    # Rows added or edited since the export would be lost with the purge
+                    if (
+                        tuple(hot["samples"]) != _export_stats(rows.samples)
+                        or tuple(hot["notes"]) != _export_stats(rows.notes)
+                        or deleted["samples"] != len(rows.samples)
+                        or deleted["notes"] != len(rows.notes)
+                        or marked.rowcount != 1
+                    ):
+                        await session.rollback()
+                        logger.warning(
+                            "archive_purge_mismatch",
+                            fermentation_id=fermentation_id,
+                            samples_exported=len(rows.samples),
+                            samples_hot=hot["samples"][0],
+                            notes_exported=len(rows.notes),
+                            notes_hot=hot["notes"][0],
+                        )
+                        return False
+
+                    await session.commit()
+                    logger.info(
+                        "fermentation_rows_purged",
+                        fermentation_id=fermentation_id,
+                        samples=len(rows.samples),
+                        notes=len(rows.notes),
+                    )
+                    return True
+
+        return await self.execute_with_error_mapping(_purge_operation)
+
+
+def _max_updated_at(entities: Sequence[Any]) -> Optional[datetime]:
+    return max((e.updated_at for e in entities if e.updated_at is not None), default=None)
+
+
+def _export_stats(entities: Sequence[Any]) -> Tuple[int, Optional[datetime]]:
+    """(row count, max updated_at) of exported rows, as the hot check returns them."""
+    return len(entities), _max_updated_at(entities)
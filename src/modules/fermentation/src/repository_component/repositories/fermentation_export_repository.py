@@ -0,0 +1,241 @@
+"""
+Fermentation Export Repository Implementation.
+
+Chunked reads behind the columnar history export. Each dataset is one
+SELECT executed on a server-side cursor (session.stream with yield_per),
+so rows are pulled from PostgreSQL chunk by chunk while the caller turns
+them into Arrow record batches; memory stays bounded by the chunk size.
+
+Samples are pivoted in the database with conditional aggregation: one row
+per (fermentation_id, recorded_at) and one column per SampleType, which is
+the shape analytics tools want and a fraction of the rows.
+
+Analyses belong to the analysis engine, which keys wineries and
+fermentations as UUID(int=<integer id>). They are read through a Core
+table (no import of that module's entities), scoped by the winery's UUID
+and joined to its fermentations on the same mapping, so they export with
+the integer fermentation_id of the other datasets.
+
+Reads go through get_read_session(), so they run on the read replica when
+one is configured.
+
+Implements ADR-027 Structured Logging:
+- Row and chunk counts per streamed dataset
+"""
+
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, List, Tuple
+from uuid import UUID
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    case,
+    cast,
+    func,
+    select,
+    type_coerce,
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+
+# ADR-027: Structured logging
+from src.shared.wine_fermentator_logging import get_logger
+
+from src.modules.fermentation.src.domain.entities.fermentation import Fermentation
+from src.modules.fermentation.src.domain.entities.fermentation_lot_source import (
+    FermentationLotSource,
+)
+from src.modules.fermentation.src.domain.entities.samples.base_sample import BaseSample
+from src.modules.fermentation.src.domain.enums.export_dataset import ExportDataset
+from src.modules.fermentation.src.domain.enums.sample_type import SampleType
+from src.modules.fermentation.src.domain.repositories.fermentation_export_repository_interface import (
+    IFermentationExportRepository,
+)
+
+from src.shared.infra.repository.base_repository import BaseRepository
+from src.shared.infra.repository.errors import map_database_error
+
+logger = get_logger(__name__)
+
+# Export column type for each Python type SQLAlchemy reports
+_COLUMN_TYPES = {
+    bool: "bool",
+    int: "int64",
+    float: "float64",
+    str: "string",
+    datetime: "timestamp",
+    date: "date",
+}
+
+# Analysis engine table, read-only; kept off Base.metadata so it is never
+# created or migrated from this module
+_analysis = Table(
+    "analysis",
+    MetaData(),
+    Column("id", PGUUID(as_uuid=True), primary_key=True),
+    Column("fermentation_id", PGUUID(as_uuid=True)),
+    Column("winery_id", PGUUID(as_uuid=True)),
+    Column("status", String(50)),
+    Column("analyzed_at", DateTime(timezone=True)),
+    Column("historical_samples_count", Integer),
+)
+
+_FERMENTATION_COLUMNS = (
+    Fermentation.id,
+    Fermentation.vintage_year,
+    Fermentation.yeast_strain,
+    Fermentation.vessel_code,
+    Fermentation.input_mass_kg,
+    Fermentation.initial_sugar_brix,
+    Fermentation.initial_density,
+    Fermentation.status,
+    Fermentation.start_date,
+    Fermentation.data_source,
+    Fermentation.imported_at,
+    Fermentation.archived_at,
+    Fermentation.created_at,
+    Fermentation.updated_at,
+)
+
+
+def _fermentations_query(winery_id: int):
+    return (
+        select(*_FERMENTATION_COLUMNS)
+        .where(Fermentation.winery_id == winery_id, Fermentation.is_deleted == False)
+        .order_by(Fermentation.id)
+    )
+
+
+def _samples_query(winery_id: int):
+    readings = [
+        func.max(
+            case((BaseSample.sample_type == sample_type.value, BaseSample.value))
+        ).label(sample_type.value)
+        for sample_type in SampleType
+    ]
+    return (
+        select(BaseSample.fermentation_id, BaseSample.recorded_at, *readings)
+        .join(Fermentation, Fermentation.id == BaseSample.fermentation_id)
+        .where(
+            Fermentation.winery_id == winery_id,
+            Fermentation.is_deleted == False,
+            BaseSample.is_deleted == False,
+        )
+        .group_by(BaseSample.fermentation_id, BaseSample.recorded_at)
+        .order_by(BaseSample.fermentation_id, BaseSample.recorded_at)
+    )
+
+
+def _lot_sources_query(winery_id: int):
+    return (
+        select(
+            FermentationLotSource.id,
+            FermentationLotSource.fermentation_id,
+            # FK to another module's table: its type isn't resolved here
+            type_coerce(FermentationLotSource.harvest_lot_id, Integer).label(
+                "harvest_lot_id"
+            ),
+            FermentationLotSource.mass_used_kg,
+            FermentationLotSource.notes,
+        )
+        .join(Fermentation, Fermentation.id == FermentationLotSource.fermentation_id)
+        .where(Fermentation.winery_id == winery_id, Fermentation.is_deleted == False)
+        .order_by(FermentationLotSource.fermentation_id, FermentationLotSource.id)
+    )
+
+
+def _analyses_query(winery_id: int):
+    # UUID(int=id) in SQL: the id as 32 zero-padded hex digits
+    fermentation_uuid = cast(func.lpad(func.to_hex(Fermentation.id), 32, "0"), PGUUID)
+    return (
+        select(
+            cast(_analysis.c.id, String).label("id"),
+            Fermentation.id.label("fermentation_id"),
+            _analysis.c.status,
+            _analysis.c.analyzed_at,
+            _analysis.c.historical_samples_count,
+        )
+        .join(Fermentation, _analysis.c.fermentation_id == fermentation_uuid)
+        .where(
+            _analysis.c.winery_id == UUID(int=winery_id),
+            Fermentation.winery_id == winery_id,
+            Fermentation.is_deleted == False,
+        )
+        .order_by(Fermentation.id, _analysis.c.analyzed_at, _analysis.c.id)
+    )
+
+
+_QUERIES = {
+    ExportDataset.FERMENTATIONS: _fermentations_query,
+    ExportDataset.SAMPLES: _samples_query,
+    ExportDataset.LOT_SOURCES: _lot_sources_query,
+    ExportDataset.ANALYSES: _analyses_query,
+}
+
+
+class FermentationExportRepository(BaseRepository, IFermentationExportRepository):
+    """
+    Repository for streaming a winery's history (read-only).
+    """
+
+    def query(self, winery_id: int, dataset: ExportDataset):
+        """SELECT statement of a dataset for a winery."""
+        return _QUERIES[dataset](winery_id)
+
+    def columns(self, dataset: ExportDataset) -> List[Tuple[str, str]]:
+        # Winery 0 never matches; only the selected column types are used
+        statement = self.query(0, dataset)
+        return [
+            (column.name, _COLUMN_TYPES.get(column.type.python_type, "string"))
+            for column in statement.selected_columns
+        ]
+
+    async def stream(
+        self, winery_id: int, dataset: ExportDataset, chunk_size: int
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        statement = self.query(winery_id, dataset).execution_options(
+            yield_per=chunk_size
+        )
+        rows = 0
+        chunks = 0
+        try:
+            session_cm = await self.get_read_session()
+            async with session_cm as session:
+                result = await session.stream(statement)
+                async for partition in result.mappings().partitions(chunk_size):
+                    chunk = [dict(row) for row in partition]
+                    rows += len(chunk)
+                    chunks += 1
+                    yield chunk
+        except Exception as e:
+            raise map_database_error(e) from e
+
+        logger.info(
+            "fermentation_export_streamed",
+            winery_id=winery_id,
+            dataset=dataset.value,
+            rows=rows,
+            chunks=chunks,
+        )
+
+    async def list_archived_ids(self, winery_id: int) -> List[int]:
+        async def _list_archived_operation():
+            session_cm = await self.get_read_session()
+            async with session_cm as session:
+                stmt = (
+                    select(Fermentation.id)
+                    .where(
+                        Fermentation.winery_id == winery_id,
+                        Fermentation.is_deleted == False,
+                        Fermentation.archived_at.is_not(None),
+                    )
+                    .order_by(Fermentation.id)
+                )
+                result = await session.execute(stmt)
+                return list(result.scalars().all())
+
+        return await self.execute_with_error_mapping(_list_archived_operation)
@@ -20,9 +20,9 @@ Implements ADR-027 Structured Logging:
 - Security audit trail (WHO accessed WHAT)
 """
 
-from datetime import datetime
+from datetime import datetime, time, timedelta
 from typing import List, Optional
-from sqlalchemy import select
+from sqlalchemy import exists, func, select, tuple_
 
 # ADR-027: Structured logging
 from src.shared.wine_fermentator_logging import get_logger, LogTimer
@@ -34,10 +34,17 @@ from src.modules.fermentation.src.domain.enums.fermentation_status import (
 from src.modules.fermentation.src.domain.repositories.fermentation_repository_interface import (
     IFermentationRepository,
 )
-from src.modules.fermentation.src.domain.dtos import FermentationCreate
+from src.modules.fermentation.src.domain.dtos import (
+    FermentationCreate,
+    FermentationListFilter,
+    ListPosition,
+)
 
 # Import ORM entities
 from src.modules.fermentation.src.domain.entities.fermentation import Fermentation
+from src.modules.fermentation.src.domain.entities.fermentation_lot_source import (
+    FermentationLotSource,
+)
 
 from src.shared.infra.repository.base_repository import BaseRepository
 
@@ -163,6 +170,46 @@ class FermentationRepository(BaseRepository, IFermentationRepository):
 
         return await self.execute_with_error_mapping(_get_operation)
 
+    async def get_by_ids(
+        self, fermentation_ids: List[int], winery_id: int
+    ) -> List[Fermentation]:
+        """
+        Retrieves several fermentations in one query with winery access control.
+
+        Args:
+            fermentation_ids: IDs of the fermentations to retrieve
+            winery_id: Winery ID for access control
+
+        Returns:
+            List[Fermentation]: Fermentations found (missing/foreign IDs omitted)
+        """
+        if not fermentation_ids:
+            return []
+
+        async def _get_operation():
+            with LogTimer(logger, "get_fermentations_by_ids"):
+                session_cm = await self.get_session()
+                async with session_cm as session:
+                    query = select(Fermentation).where(
+                        Fermentation.id.in_(set(fermentation_ids)),
+                        Fermentation.winery_id == winery_id,
+                        Fermentation.is_deleted == False,
+                    )
+
+                    result = await session.execute(query)
+                    fermentations = list(result.scalars().all())
+
+                    logger.debug(
+                        "fermentations_found_by_ids",
+                        requested=len(set(fermentation_ids)),
+                        found=len(fermentations),
+                        winery_id=winery_id,
+                    )
+
+                    return fermentations
+
+        return await self.execute_with_error_mapping(_get_operation)
+
     async def update_status(
         self,
         fermentation_id: int,
@@ -323,7 +370,7 @@ class FermentationRepository(BaseRepository, IFermentationRepository):
         """
 
         async def _get_by_winery_operation():
-            with LogTimer(logger, "get_fermentations_by_winery"):
+            with LogTimer(logger, "get_fermentations_by_winery", level="debug"):
                 logger.debug(
                     "querying_fermentations_by_winery",
                     winery_id=winery_id,
@@ -401,7 +448,8 @@ class FermentationRepository(BaseRepository, IFermentationRepository):
                     include_deleted=include_deleted,
                 )
 
-                session_cm = await self.get_session()
+                # Pure read: may run on the read replica
+                session_cm = await self.get_read_session()
                 async with session_cm as session:
                     # Build query with data_source filter
                     conditions = [
@@ -428,6 +476,131 @@ class FermentationRepository(BaseRepository, IFermentationRepository):
 
         return await self.execute_with_error_mapping(_list_by_data_source_operation)
 
+    async def list_page_by_data_source(
+        self,
+        winery_id: int,
+        filters: FermentationListFilter,
+        limit: int,
+        after: Optional[ListPosition] = None,
+        offset: int = 0,
+    ) -> List[Fermentation]:
+        """
+        Retrieves one page of a winery's fermentations of a data source.
+
+        Served by ix_fermentations__winery_id__data_source__start_date: the
+        scan starts at the keyset position instead of counting past
+        ``offset`` rows, so deep pages cost the same as the first one.
+
+        Args:
+            winery_id: ID of the winery
+            filters: Data source, date range, fruit origin and status filters
+            limit: Maximum rows to return
+            after: (start_date, id) of the last row of the previous page
+            offset: Rows to skip (ignored when ``after`` is given)
+
+        Returns:
+            List[Fermentation]: Fermentations ordered by (start_date, id) DESC
+        """
+
+        async def _list_page_by_data_source_operation():
+            with LogTimer(logger, "list_fermentations_page_by_data_source"):
+                # Pure read: may run on the read replica
+                session_cm = await self.get_read_session()
+                async with session_cm as session:
+                    conditions = self._list_filter_conditions(winery_id, filters)
+                    if after is not None:
+                        conditions.append(
+                            tuple_(Fermentation.start_date, Fermentation.id)
+                            < tuple_(*after)
+                        )
+
+                    query = (
+                        select(Fermentation)
+                        .where(*conditions)
+                        .order_by(
+                            Fermentation.start_date.desc(), Fermentation.id.desc()
+                        )
+                        .limit(limit)
+                    )
+                    if after is None and offset:
+                        query = query.offset(offset)
+                    result = await session.execute(query)
+                    fermentations = list(result.scalars().all())
+
+                    logger.info(
+                        "fermentations_page_retrieved_by_data_source",
+                        winery_id=winery_id,
+                        data_source=filters.data_source,
+                        count=len(fermentations),
+                        keyset=after is not None,
+                    )
+
+                    return fermentations
+
+        return await self.execute_with_error_mapping(
+            _list_page_by_data_source_operation
+        )
+
+    async def count_by_data_source(
+        self, winery_id: int, filters: FermentationListFilter
+    ) -> int:
+        """
+        Counts a winery's non-deleted fermentations matching a listing filter.
+
+        Args:
+            winery_id: ID of the winery
+            filters: Same filters as list_page_by_data_source
+
+        Returns:
+            int: Number of matching fermentations
+        """
+
+        async def _count_by_data_source_operation():
+            session_cm = await self.get_read_session()
+            async with session_cm as session:
+                query = (
+                    select(func.count())
+                    .select_from(Fermentation)
+                    .where(*self._list_filter_conditions(winery_id, filters))
+                )
+                result = await session.execute(query)
+                return int(result.scalar_one())
+
+        return await self.execute_with_error_mapping(_count_by_data_source_operation)
+
+    @staticmethod
+    def _list_filter_conditions(
+        winery_id: int, filters: FermentationListFilter
+    ) -> list:
+        """WHERE clauses of a listing; the index prefix columns come first."""
+        conditions = [
+            Fermentation.winery_id == winery_id,
+            Fermentation.data_source == filters.data_source,
+            Fermentation.is_deleted == False,
+        ]
+        # Date bounds are whole days; compare as a half-open datetime range
+        # so the start_date index range scan still applies
+        if filters.start_date_from is not None:
+            conditions.append(
+                Fermentation.start_date
+                >= datetime.combine(filters.start_date_from, time.min)
+            )
+        if filters.start_date_to is not None:
+            conditions.append(
+                Fermentation.start_date
+                < datetime.combine(filters.start_date_to + timedelta(days=1), time.min)
+            )
+        if filters.status is not None:
+            conditions.append(Fermentation.status == filters.status)
+        if filters.fruit_origin_id is not None:
+            conditions.append(
+                exists().where(
+                    FermentationLotSource.fermentation_id == Fermentation.id,
+                    FermentationLotSource.harvest_lot_id == filters.fruit_origin_id,
+                )
+            )
+        return conditions
+
     # NOTE: For comprehensive sample queries, implement ISampleRepository
     # This repository focuses on fermentation lifecycle operations.
     # Sample-specific queries should use SampleRepository:
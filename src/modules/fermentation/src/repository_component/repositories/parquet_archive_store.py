@@ -0,0 +1,182 @@
+"""
+Parquet Archive Store Implementation.
+
+Cold storage for archived fermentations (migration 011): the samples and
+notes of one fermentation are written as two zstd-compressed Parquet
+files on local disk:
+
+    <root>/winery_<winery_id>/fermentation_<id>/samples.parquet
+    <root>/winery_<winery_id>/fermentation_<id>/notes.parquet
+
+Reads rehydrate detached entities (sample rows as their concrete sample
+class), so services hand them to the API exactly like hot rows. File I/O
+runs in a worker thread to keep the event loop free.
+
+Requires pyarrow; it is imported on first use, so services that never
+touch an archive don't need it.
+"""
+
+import asyncio
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+# ADR-027: Structured logging
+from src.shared.wine_fermentator_logging import get_logger, LogTimer
+from src.shared.domain.errors import ArchiveUnavailable
+
+from src.modules.fermentation.src.domain.dtos.archive_dtos import ArchivedRows
+from src.modules.fermentation.src.domain.entities.fermentation_note import (
+    FermentationNote,
+)
+from src.modules.fermentation.src.domain.entities.samples.base_sample import BaseSample
+from src.modules.fermentation.src.domain.repositories.fermentation_archive_store_interface import (
+    IFermentationArchiveStore,
+)
+
+logger = get_logger(__name__)
+
+DEFAULT_ARCHIVE_DIR = "data/fermentation_archive"
+
+_SAMPLES_FILE = "samples.parquet"
+_NOTES_FILE = "notes.parquet"
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ArchiveUnavailable(
+            "Reading or writing fermentation archives requires pyarrow"
+        ) from e
+    return pyarrow, pyarrow.parquet
+
+
+def entities_to_rows(entities: Sequence[Any]) -> List[Dict[str, Any]]:
+    """Column values of ORM entities, keyed by column name."""
+    rows = []
+    for entity in entities:
+        table = type(entity).__table__
+        rows.append({column.name: getattr(entity, column.name) for column in table.columns})
+    return rows
+
+
+def rows_to_samples(rows: Sequence[Dict[str, Any]]) -> List[BaseSample]:
+    """Detached sample entities of their concrete class, by recorded_at."""
+    # Register the sample subclasses in the polymorphic map
+    from src.modules.fermentation.src.domain.entities.samples.sugar_sample import (  # noqa: F401
+        SugarSample,
+    )
+    from src.modules.fermentation.src.domain.entities.samples.density_sample import (  # noqa: F401
+        DensitySample,
+    )
+    from src.modules.fermentation.src.domain.entities.samples.celcius_temperature_sample import (  # noqa: F401
+        CelsiusTemperatureSample,
+    )
+
+    polymorphic_map = BaseSample.__mapper__.polymorphic_map
+    samples = []
+    for row in rows:
+        mapper = polymorphic_map.get(row["sample_type"])
+        sample_class = mapper.class_ if mapper is not None else BaseSample
+        samples.append(sample_class(**row))
+    samples.sort(key=lambda s: (s.recorded_at, s.id))
+    return samples
+
+
+def rows_to_notes(rows: Sequence[Dict[str, Any]]) -> List[FermentationNote]:
+    """Detached, non-deleted notes, newest first (like the hot listing)."""
+    notes = [FermentationNote(**row) for row in rows if not row.get("is_deleted")]
+    notes.sort(key=lambda n: n.created_at, reverse=True)
+    return notes
+
+
+def _fsync(path: Path) -> None:
+    """Flushes a file (or a directory entry table) to disk."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class ParquetArchiveStore(IFermentationArchiveStore):
+    """
+    Fermentation archive store on local disk, one directory per fermentation.
+    """
+
+    def __init__(self, root: str = DEFAULT_ARCHIVE_DIR, compression: str = "zstd"):
+        self._root = Path(root)
+        self._compression = compression
+
+    @classmethod
+    def from_env(cls) -> "ParquetArchiveStore":
+        """Store rooted at FERMENTATION_ARCHIVE_DIR."""
+        return cls(root=os.getenv("FERMENTATION_ARCHIVE_DIR", DEFAULT_ARCHIVE_DIR))
+
+    def directory(self, winery_id: int, fermentation_id: int) -> Path:
+        """Directory holding the archive files of a fermentation."""
+        return self._root / f"winery_{int(winery_id)}" / f"fermentation_{int(fermentation_id)}"
+
+    async def write(self, winery_id: int, fermentation_id: int, rows: ArchivedRows) -> None:
+        directory = self.directory(winery_id, fermentation_id)
+        with LogTimer(logger, "write_fermentation_archive"):
+            await asyncio.to_thread(
+                self._write_files,
+                directory,
+                {
+                    _SAMPLES_FILE: entities_to_rows(rows.samples),
+                    _NOTES_FILE: entities_to_rows(rows.notes),
+                },
+            )
+        logger.info(
+            "fermentation_archive_written",
+            fermentation_id=fermentation_id,
+            winery_id=winery_id,
+            samples=len(rows.samples),
+            notes=len(rows.notes),
+        )
+
+    async def read_samples(self, winery_id: int, fermentation_id: int) -> List[BaseSample]:
+        path = self.directory(winery_id, fermentation_id) / _SAMPLES_FILE
+        rows = await asyncio.to_thread(self._read_file, path)
+        return rows_to_samples(rows)
+
+    async def read_notes(
+        self, winery_id: int, fermentation_id: int
+    ) -> List[FermentationNote]:
+        path = self.directory(winery_id, fermentation_id) / _NOTES_FILE
+        rows = await asyncio.to_thread(self._read_file, path)
+        return rows_to_notes(rows)
+
+    def _write_files(self, directory: Path, tables: Dict[str, List[Dict[str, Any]]]) -> None:
+        pa, pq = _pyarrow()
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            for name, rows in tables.items():
+                # Write aside, then rename: readers never see a partial file
+                partial = directory / f".{name}.partial"
+                pq.write_table(
+                    pa.Table.from_pylist(rows),
+                    partial,
+                    compression=self._compression,
+                )
+                _fsync(partial)
+                os.replace(partial, directory / name)
+            # Persist the renames themselves
+            _fsync(directory)
+        except OSError as e:
+            raise ArchiveUnavailable(f"Could not write archive {directory}: {e}") from e
+
+    @staticmethod
+    def _read_file(path: Path) -> List[Dict[str, Any]]:
+        if not path.exists():
+            logger.error("fermentation_archive_missing", path=str(path))
+            raise ArchiveUnavailable(f"Archive file {path} is missing")
+        _, pq = _pyarrow()
+        try:
+            return pq.read_table(path).to_pylist()
+        except Exception as e:
+            logger.error("fermentation_archive_unreadable", path=str(path), error=str(e))
+            raise ArchiveUnavailable(f"Could not read archive {path}") from e
@@ -0,0 +1,184 @@
+"""
+Sample Partition Repository Implementation.
+
+Maintenance operations on the range-partitioned samples table (migration
+010): samples is partitioned by recorded_at, one partition per calendar
+year, with samples_default catching rows outside every range.
+
+Years line up with vintages: a fermentation's samples almost always sit in
+one partition, and a whole past vintage can be detached (then archived or
+dropped) without touching live data.
+
+Like TelemetrySampleRepository, it commits its own transactions and is
+meant for a dedicated session manager (startup hook, maintenance script),
+not for request sessions.
+"""
+
+import re
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import text
+
+# ADR-027: Structured logging
+from src.shared.wine_fermentator_logging import get_logger, LogTimer
+
+from src.modules.fermentation.src.domain.dtos.sample_dtos import SamplePartition
+from src.modules.fermentation.src.domain.entities.samples.base_sample import BaseSample
+from src.modules.fermentation.src.domain.repositories.sample_partition_repository_interface import (
+    ISamplePartitionRepository,
+)
+
+from src.shared.infra.repository.base_repository import BaseRepository
+
+logger = get_logger(__name__)
+
+SAMPLES_TABLE = BaseSample.__tablename__
+DEFAULT_PARTITION = f"{SAMPLES_TABLE}_default"
+
+_PARTITION_NAME = re.compile(rf"^{SAMPLES_TABLE}_y(\d{{4}})$")
+
+
+def partition_name(year: int) -> str:
+    """Table name of the partition holding samples recorded in ``year``."""
+    return f"{SAMPLES_TABLE}_y{int(year):04d}"
+
+
+def _year_bounds(year: int) -> tuple:
+    return f"{int(year):04d}-01-01", f"{int(year) + 1:04d}-01-01"
+
+
+class SamplePartitionRepository(BaseRepository, ISamplePartitionRepository):
+    """
+    Repository for samples partition maintenance (PostgreSQL only).
+    """
+
+    async def list_partitions(self) -> List[SamplePartition]:
+        async def _list_operation():
+            session_cm = await self.get_session()
+            async with session_cm as session:
+                connection = await session.connection()
+                if connection.dialect.name != "postgresql":
+                    return []
+                result = await session.execute(
+                    text(
+                        "SELECT c.relname, c.reltuples::bigint "
+                        "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                        "WHERE i.inhparent = CAST(:parent AS regclass)"
+                    ),
+                    {"parent": SAMPLES_TABLE},
+                )
+                partitions = []
+                for name, reltuples in result.all():
+                    match = _PARTITION_NAME.match(name)
+                    partitions.append(
+                        SamplePartition(
+                            name=name,
+                            year=int(match.group(1)) if match else None,
+                            estimated_rows=max(int(reltuples), 0),
+                        )
+                    )
+                # Default partition (year None) last
+                partitions.sort(key=lambda p: (p.year is None, p.year or 0))
+                return partitions
+
+        return await self.execute_with_error_mapping(_list_operation)
+
+    async def ensure_partitions(self, from_year: int, through_year: int) -> List[str]:
+        if from_year > through_year:
+            raise ValueError(
+                f"from_year ({from_year}) must not be after through_year ({through_year})"
+            )
+        existing = {p.year for p in await self.list_partitions()}
+
+        async def _ensure_operation():
+            with LogTimer(logger, "ensure_sample_partitions"):
+                session_cm = await self.get_session()
+                async with session_cm as session:
+                    connection = await session.connection()
+                    if connection.dialect.name != "postgresql":
+                        return []
+                    created = []
+                    for year in range(from_year, through_year + 1):
+                        if year in existing:
+                            continue
+                        await self._create_partition(session, year)
+                        created.append(partition_name(year))
+                    await session.commit()
+
+                    if created:
+                        logger.info("sample_partitions_created", partitions=created)
+                    return created
+
+        return await self.execute_with_error_mapping(_ensure_operation)
+
+    async def detach_partition(self, year: int) -> str:
+        if year >= datetime.utcnow().year:
+            raise ValueError(
+                f"Refusing to detach {partition_name(year)}: new samples are still "
+                "written to the current and future years"
+            )
+        if year not in {p.year for p in await self.list_partitions()}:
+            raise ValueError(f"{partition_name(year)} is not attached to {SAMPLES_TABLE}")
+
+        async def _detach_operation():
+            session_cm = await self.get_session()
+            async with session_cm as session:
+                name = partition_name(year)
+                await session.execute(
+                    text(f"ALTER TABLE {SAMPLES_TABLE} DETACH PARTITION {name}")
+                )
+                await session.commit()
+                logger.info("sample_partition_detached", partition=name, year=year)
+                return name
+
+        return await self.execute_with_error_mapping(_detach_operation)
+
+    @staticmethod
+    async def _create_partition(session, year: int) -> None:
+        """
+        Create the partition of ``year``.
+
+        PostgreSQL refuses a new range while samples_default holds rows in
+        it, so those rows are moved: detach the default partition, create
+        the range, copy its rows over, then re-attach the default.
+        """
+        name = partition_name(year)
+        lower, upper = _year_bounds(year)
+        bounds = {"lower": lower, "upper": upper}
+        in_range = "recorded_at >= CAST(:lower AS timestamp) AND recorded_at < CAST(:upper AS timestamp)"
+
+        stranded = (
+            await session.execute(
+                text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE {in_range})"),
+                bounds,
+            )
+        ).scalar()
+        if stranded:
+            await session.execute(
+                text(f"ALTER TABLE {SAMPLES_TABLE} DETACH PARTITION {DEFAULT_PARTITION}")
+            )
+        await session.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {SAMPLES_TABLE} "
+                f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+            )
+        )
+        if stranded:
+            moved = await session.execute(
+                text(
+                    f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE {in_range} "
+                    f"RETURNING *) INSERT INTO {SAMPLES_TABLE} SELECT * FROM moved"
+                ),
+                bounds,
+            )
+            await session.execute(
+                text(
+                    f"ALTER TABLE {SAMPLES_TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"
+                )
+            )
+            logger.info(
+                "sample_partition_rows_moved_from_default",
+                partition=name,
+                rows=moved.rowcount,
+            )
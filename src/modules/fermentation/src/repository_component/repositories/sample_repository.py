@@ -21,7 +21,7 @@ Implements ADR-027 Structured Logging:
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from decimal import Decimal
 
 # ADR-027: Structured logging
@@ -43,6 +43,36 @@ logger = get_logger(__name__)
 # when running unit tests. This is CRITICAL to prevent mapper errors.
 
 
+def _recorded_since_start(sample_class, fermentation_ids):
+    """
+    recorded_at >= start_date of the fermentation(s) (earliest one for several).
+
+    Always true: every write path rejects samples that predate their
+    fermentation (SampleService.add_sample/add_samples_batch,
+    TelemetryIngestionService.ingest, ETLService import), and
+    FermentationService.update_fermentation never moves start_date past
+    the earliest sample. A write path that
+    skips that check would store samples these reads never return.
+    It gives PostgreSQL a recorded_at bound on lookups by
+    fermentation, so the range-partitioned samples table (migration 010)
+    is pruned at execution time to the partitions from the start year on.
+    """
+    from src.modules.fermentation.src.domain.entities.fermentation import (
+        Fermentation,
+    )
+    from sqlalchemy import func, select
+
+    if isinstance(fermentation_ids, int):
+        start = select(Fermentation.start_date).where(
+            Fermentation.id == fermentation_ids
+        )
+    else:
+        start = select(func.min(Fermentation.start_date)).where(
+            Fermentation.id.in_(fermentation_ids)
+        )
+    return sample_class.recorded_at >= start.scalar_subquery()
+
+
 class SampleRepository(BaseRepository, ISampleRepository):
     """
     Repository for sample data operations.
@@ -71,26 +101,10 @@ class SampleRepository(BaseRepository, ISampleRepository):
         """
 
         async def _create_operation():
-            with LogTimer(logger, "create_sample"):
-                # Import SQLAlchemy entities inside method
-                from src.modules.fermentation.src.domain.entities.samples.sugar_sample import (
-                    SugarSample as SQLSugarSample,
-                )
-                from src.modules.fermentation.src.domain.entities.samples.density_sample import (
-                    DensitySample as SQLDensitySample,
-                )
-                from src.modules.fermentation.src.domain.entities.samples.celcius_temperature_sample import (
-                    CelsiusTemperatureSample as SQLCelsiusTemperatureSample,
-                )
+            with LogTimer(logger, "create_sample", level="debug"):
+                sample_type_value = self._sample_type_value(sample)
 
-                # Map domain entity to SQLAlchemy entity based on type
-                sample_type_value = (
-                    sample.sample_type
-                    if isinstance(sample.sample_type, str)
-                    else sample.sample_type.value
-                )
-
-                logger.info(
+                logger.debug(
                     "creating_sample",
                     fermentation_id=sample.fermentation_id,
                     sample_type=sample_type_value,
@@ -100,56 +114,7 @@ class SampleRepository(BaseRepository, ISampleRepository):
 
                 session_cm = await self.get_session()
                 async with session_cm as session:
-                    if (
-                        sample_type_value == SampleType.SUGAR.value
-                        or sample.sample_type == SampleType.SUGAR
-                    ):
-                        sql_sample = SQLSugarSample(
-                            fermentation_id=sample.fermentation_id,
-                            recorded_by_user_id=sample.recorded_by_user_id,
-                            sample_type=sample_type_value,
-                            value=sample.value,
-                            units=sample.units,
-                            recorded_at=sample.recorded_at,
-                        )
-                    elif (
-                        sample_type_value == SampleType.DENSITY.value
-                        or sample.sample_type == SampleType.DENSITY
-                    ):
-                        sql_sample = SQLDensitySample(
-                            fermentation_id=sample.fermentation_id,
-                            recorded_by_user_id=sample.recorded_by_user_id,
-                            sample_type=sample_type_value,
-                            value=sample.value,
-                            units=sample.units,
-                            recorded_at=sample.recorded_at,
-                        )
-                    elif (
-                        sample_type_value == SampleType.TEMPERATURE.value
-                        or sample.sample_type == SampleType.TEMPERATURE
-                    ):
-                        sql_sample = SQLCelsiusTemperatureSample(
-                            fermentation_id=sample.fermentation_id,
-                            recorded_by_user_id=sample.recorded_by_user_id,
-                            sample_type=sample_type_value,
-                            value=sample.value,
-                            units=sample.units,
-                            recorded_at=sample.recorded_at,
-                        )
-                    else:
-                        # Generic BaseSample for other types
-                        from src.modules.fermentation.src.domain.entities.samples.base_sample import (
-                            BaseSample as SQLBaseSample,
-                        )
-
-                        sql_sample = SQLBaseSample(
-                            fermentation_id=sample.fermentation_id,
-                            recorded_by_user_id=sample.recorded_by_user_id,
-                            sample_type=sample_type_value,
-                            value=sample.value,
-                            units=sample.units,
-                            recorded_at=sample.recorded_at,
-                        )
+                    sql_sample = self._to_orm_sample(sample)
 
                     session.add(sql_sample)
                     await session.flush()
@@ -167,6 +132,50 @@ class SampleRepository(BaseRepository, ISampleRepository):
 
         return await self.execute_with_error_mapping(_create_operation)
 
+    @staticmethod
+    def _sample_type_value(sample: BaseSample) -> str:
+        """Sample type as its string value (entities may hold the enum or the value)."""
+        return (
+            sample.sample_type
+            if isinstance(sample.sample_type, str)
+            else sample.sample_type.value
+        )
+
+    def _to_orm_sample(self, sample: BaseSample) -> BaseSample:
+        """
+        Maps a domain sample to a new SQLAlchemy entity of the matching subclass.
+
+        Helper method shared by create() and bulk_upsert_samples().
+        """
+        # Import SQLAlchemy entities inside method
+        from src.modules.fermentation.src.domain.entities.samples.sugar_sample import (
+            SugarSample as SQLSugarSample,
+        )
+        from src.modules.fermentation.src.domain.entities.samples.density_sample import (
+            DensitySample as SQLDensitySample,
+        )
+        from src.modules.fermentation.src.domain.entities.samples.celcius_temperature_sample import (
+            CelsiusTemperatureSample as SQLCelsiusTemperatureSample,
+        )
+
+        sample_type_value = self._sample_type_value(sample)
+        sample_class_map = {
+            SampleType.SUGAR.value: SQLSugarSample,
+            SampleType.DENSITY.value: SQLDensitySample,
+            SampleType.TEMPERATURE.value: SQLCelsiusTemperatureSample,
+        }
+        # Generic BaseSample for other types
+        sql_class = sample_class_map.get(sample_type_value, BaseSample)
+
+        return sql_class(
+            fermentation_id=sample.fermentation_id,
+            recorded_by_user_id=sample.recorded_by_user_id,
+            sample_type=sample_type_value,
+            value=sample.value,
+            units=sample.units,
+            recorded_at=sample.recorded_at,
+        )
+
     def _map_to_domain(self, sql_sample) -> BaseSample:
         """
         Maps SQLAlchemy sample entity to domain BaseSample.
@@ -317,6 +326,7 @@ class SampleRepository(BaseRepository, ISampleRepository):
                                 sample_class.fermentation_id == fermentation_id,
                                 Fermentation.winery_id
                                 == winery_id,  # ADR-025: winery_id validation
+                                _recorded_since_start(sample_class, fermentation_id),
                             )
                         )
 
@@ -383,7 +393,10 @@ class SampleRepository(BaseRepository, ISampleRepository):
                 ]:
                     stmt = (
                         select(sample_class)
-                        .where(sample_class.fermentation_id == fermentation_id)
+                        .where(
+                            sample_class.fermentation_id == fermentation_id,
+                            _recorded_since_start(sample_class, fermentation_id),
+                        )
                         .order_by(sample_class.recorded_at.asc())
                     )
 
@@ -428,7 +441,8 @@ class SampleRepository(BaseRepository, ISampleRepository):
         )
         from sqlalchemy import select
 
-        session_cm = await self.get_session()
+        # Pure read: may run on the read replica
+        session_cm = await self.get_read_session()
         async with session_cm as session:
             samples = []
 
@@ -484,6 +498,18 @@ class SampleRepository(BaseRepository, ISampleRepository):
 
             return start_date  # Return None if not found
 
+    async def get_earliest_recorded_at(self, fermentation_id: int) -> Optional[datetime]:
+        """Get recorded_at of the fermentation's earliest sample (deleted ones included)."""
+        from sqlalchemy import func, select
+
+        session_cm = await self.get_session()
+        async with session_cm as session:
+            stmt = select(func.min(BaseSample.recorded_at)).where(
+                BaseSample.fermentation_id == fermentation_id
+            )
+            result = await session.execute(stmt)
+            return result.scalar_one_or_none()
+
     async def get_latest_sample_by_type(
         self, fermentation_id: int, sample_type: SampleType
     ) -> Optional[BaseSample]:
@@ -523,7 +549,10 @@ class SampleRepository(BaseRepository, ISampleRepository):
 
             stmt = (
                 select(sample_class)
-                .where(sample_class.fermentation_id == fermentation_id)
+                .where(
+                    sample_class.fermentation_id == fermentation_id,
+                    _recorded_since_start(sample_class, fermentation_id),
+                )
                 .order_by(sample_class.recorded_at.desc())
                 .limit(1)
             )
@@ -621,21 +650,134 @@ class SampleRepository(BaseRepository, ISampleRepository):
 
             # Not found - just return without error
 
+    async def get_latest_samples_by_fermentation_ids(
+        self, fermentation_ids: List[int]
+    ) -> Dict[int, Dict[str, BaseSample]]:
+        """
+        Get the most recent sample of every type for several fermentations.
+
+        Single query: ranks samples per (fermentation_id, sample_type) by
+        recorded_at and keeps the first row of each window partition.
+
+        Args:
+            fermentation_ids: IDs of the fermentations
+
+        Returns:
+            fermentation_id -> sample_type value -> latest sample
+        """
+        if not fermentation_ids:
+            return {}
+
+        # Subclasses must be registered for polymorphic loading
+        from src.modules.fermentation.src.domain.entities.samples.sugar_sample import (  # noqa: F401
+            SugarSample,
+        )
+        from src.modules.fermentation.src.domain.entities.samples.density_sample import (  # noqa: F401
+            DensitySample,
+        )
+        from src.modules.fermentation.src.domain.entities.samples.celcius_temperature_sample import (  # noqa: F401
+            CelsiusTemperatureSample,
+        )
+        from sqlalchemy import func, select
+
+        async def _get_operation():
+            with LogTimer(logger, "get_latest_samples_by_fermentation_ids"):
+                ids = set(fermentation_ids)
+                ranked = (
+                    select(
+                        BaseSample.id,
+                        BaseSample.recorded_at,
+                        func.row_number()
+                        .over(
+                            partition_by=(
+                                BaseSample.fermentation_id,
+                                BaseSample.sample_type,
+                            ),
+                            order_by=BaseSample.recorded_at.desc(),
+                        )
+                        .label("sample_rank"),
+                    )
+                    .where(
+                        BaseSample.fermentation_id.in_(ids),
+                        _recorded_since_start(BaseSample, ids),
+                    )
+                    .subquery()
+                )
+                # Join on the full (id, recorded_at) key so each row is
+                # fetched from its own partition only
+                stmt = (
+                    select(BaseSample)
+                    .join(
+                        ranked,
+                        (BaseSample.id == ranked.c.id)
+                        & (BaseSample.recorded_at == ranked.c.recorded_at),
+                    )
+                    .where(ranked.c.sample_rank == 1)
+                )
+
+                session_cm = await self.get_session()
+                async with session_cm as session:
+                    result = await session.execute(stmt)
+
+                    latest: Dict[int, Dict[str, BaseSample]] = {}
+                    for sample in result.scalars().all():
+                        latest.setdefault(sample.fermentation_id, {})[
+                            sample.sample_type
+                        ] = sample
+
+                    logger.debug(
+                        "latest_samples_retrieved_by_fermentation_ids",
+                        fermentation_count=len(set(fermentation_ids)),
+                        with_samples=len(latest),
+                    )
+                    return latest
+
+        return await self.execute_with_error_mapping(_get_operation)
+
     async def bulk_upsert_samples(self, samples: List[BaseSample]) -> List[BaseSample]:
         """
         Bulk upsert samples.
 
+        New samples (id is None) are added in one unit of work and written
+        with a single flush, which SQLAlchemy emits as one multi-row
+        INSERT ... RETURNING. Samples with an id are merged into the same
+        transaction.
+
         Args:
             samples: List of samples to upsert
 
         Returns:
-            List of upserted samples
+            List of upserted samples, in input order
         """
-        result = []
-        for sample in samples:
-            upserted = await self.upsert_sample(sample)
-            result.append(upserted)
-        return result
+        if not samples:
+            return []
+
+        async def _bulk_upsert_operation():
+            with LogTimer(logger, "bulk_upsert_samples"):
+                session_cm = await self.get_session()
+                async with session_cm as session:
+                    persisted = []
+                    for sample in samples:
+                        if sample.id is None:
+                            sql_sample = self._to_orm_sample(sample)
+                            session.add(sql_sample)
+                        else:
+                            sql_sample = await session.merge(sample)
+                        persisted.append(sql_sample)
+
+                    await session.flush()
+
+                    logger.info(
+                        "samples_bulk_upserted",
+                        count=len(persisted),
+                        fermentation_count=len(
+                            {s.fermentation_id for s in persisted}
+                        ),
+                    )
+
+                    return [self._map_to_domain(s) for s in persisted]
+
+        return await self.execute_with_error_mapping(_bulk_upsert_operation)
 
     async def list_by_data_source(
         self, fermentation_id: int, data_source: str, winery_id: int
@@ -676,7 +818,8 @@ class SampleRepository(BaseRepository, ISampleRepository):
                     winery_id=winery_id,
                 )
 
-                session_cm = await self.get_session()
+                # Pure read: may run on the read replica
+                session_cm = await self.get_read_session()
                 async with session_cm as session:
                     all_samples = []
 
@@ -0,0 +1,127 @@
+"""
+Telemetry Sample Repository Implementation.
+
+Bulk writer for the high-rate sensor ingestion path (tank temperature and
+density probes). Readings are written straight into the ``samples`` table
+without the ORM unit of work, so every existing sample query (timeline,
+latest sample, chronology validation) sees them as soon as they commit.
+
+Write strategy:
+- PostgreSQL + asyncpg: ``COPY samples (...) FROM STDIN`` via
+  ``copy_records_to_table`` (binary COPY, fastest bulk path)
+- Other dialects (SQLite in tests): one executemany INSERT
+
+Implements ADR-027 Structured Logging:
+- LogTimer for bulk write timing
+- Row counts per flush
+"""
+
+from datetime import datetime
+from typing import List, Sequence, Tuple
+
+from sqlalchemy import insert
+
+# ADR-027: Structured logging
+from src.shared.wine_fermentator_logging import get_logger, LogTimer
+
+from src.modules.fermentation.src.domain.dtos.sample_dtos import TelemetryReading
+from src.modules.fermentation.src.domain.entities.samples.base_sample import BaseSample
+from src.modules.fermentation.src.domain.enums.data_source import DataSource
+from src.modules.fermentation.src.domain.repositories.telemetry_sample_repository_interface import (
+    ITelemetrySampleRepository,
+)
+
+from src.shared.infra.repository.base_repository import BaseRepository
+
+logger = get_logger(__name__)
+
+# Column order shared by the COPY records and the INSERT parameters
+_COLUMNS: Tuple[str, ...] = (
+    "fermentation_id",
+    "sample_type",
+    "value",
+    "units",
+    "recorded_at",
+    "recorded_by_user_id",
+    "is_deleted",
+    "data_source",
+    "created_at",
+    "updated_at",
+)
+
+
+class TelemetrySampleRepository(BaseRepository, ITelemetrySampleRepository):
+    """
+    Repository for bulk sensor reading writes.
+
+    Commits its own transaction on every call; meant to be driven by
+    TelemetryIngestionBuffer with a dedicated (non-request) session manager.
+    """
+
+    async def bulk_insert_readings(
+        self, readings: Sequence[TelemetryReading], recorded_by_user_id: int
+    ) -> int:
+        """
+        Inserts sensor readings as sample rows in a single bulk write.
+
+        Args:
+            readings: Readings to persist
+            recorded_by_user_id: Audit user recorded for every row
+
+        Returns:
+            int: Number of rows written
+        """
+        if not readings:
+            return 0
+
+        records = self._to_records(readings, recorded_by_user_id)
+
+        async def _bulk_insert_operation():
+            with LogTimer(logger, "bulk_insert_telemetry_readings"):
+                session_cm = await self.get_session()
+                async with session_cm as session:
+                    connection = await session.connection()
+                    if connection.dialect.driver == "asyncpg":
+                        raw = await connection.get_raw_connection()
+                        await raw.driver_connection.copy_records_to_table(
+                            BaseSample.__tablename__,
+                            records=records,
+                            columns=list(_COLUMNS),
+                        )
+                    else:
+                        await connection.execute(
+                            insert(BaseSample.__table__),
+                            [dict(zip(_COLUMNS, record)) for record in records],
+                        )
+                    await session.commit()
+
+                    logger.debug(
+                        "telemetry_readings_written",
+                        rows=len(records),
+                        driver=connection.dialect.driver,
+                    )
+                    return len(records)
+
+        return await self.execute_with_error_mapping(_bulk_insert_operation)
+
+    @staticmethod
+    def _to_records(
+        readings: Sequence[TelemetryReading], recorded_by_user_id: int
+    ) -> List[tuple]:
+        """Rows in _COLUMNS order (audit timestamps set once per flush)."""
+        now = datetime.utcnow()
+        return [
+            (
+                r.fermentation_id,
+                r.sample_type.value,
+                float(r.value),
+                r.units,
+                r.recorded_at,
+                recorded_by_user_id,
+                False,
+                DataSource.SYSTEM.value,
+                now,
+                now,
+            )
+            for r in readings
+        ]
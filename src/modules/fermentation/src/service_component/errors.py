@@ -16,6 +16,11 @@ from src.shared.domain.errors import (
     SampleNotFound,
     InvalidSampleDate,
     InvalidSampleValue,
+    TelemetryBufferFull,
+    InvalidSyncCursor,
+    InvalidPageCursor,
+    ArchiveUnavailable,
+    ExportUnavailable,
 )
 
 # Backward compatibility aliases (DEPRECATED - will be removed in Phase 4)
@@ -39,6 +44,11 @@ __all__ = [
     "SampleNotFound",
     "InvalidSampleDate",
     "InvalidSampleValue",
+    "TelemetryBufferFull",
+    "InvalidSyncCursor",
+    "InvalidPageCursor",
+    "ArchiveUnavailable",
+    "ExportUnavailable",
     # Legacy aliases (deprecated)
     "ServiceError",
     "NotFoundError",
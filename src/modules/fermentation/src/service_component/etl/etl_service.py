@@ -55,8 +55,11 @@ from src.modules.fermentation.src.domain.interfaces.harvest_lot_provider_interfa
 )
 from src.shared.infra.interfaces.session_manager import ISessionManager
 from src.shared.infra.session.transaction_scope import TransactionScope
+from src.shared.wine_fermentator_logging import get_logger, log_batch
 from decimal import Decimal
 
+logger = get_logger(__name__)
+
 
 @dataclass
 class ImportResult:
@@ -168,14 +171,18 @@ class ETLService:
             df.columns = df.columns.str.strip().str.lower()
             result.total_rows = len(df)
 
-            # Import data with per-fermentation transactions (partial success)
-            (
-                fermentations_created,
-                samples_created,
-                failed_fermentations,
-            ) = await self._import_data(
-                df, winery_id, user_id, progress_callback, cancellation_token
-            )
+            # Import data with per-fermentation transactions (partial success).
+            # Per-row info events are counted into one etl_import_batch_summary.
+            with log_batch(
+                logger, "etl_import", winery_id=winery_id, total_rows=result.total_rows
+            ):
+                (
+                    fermentations_created,
+                    samples_created,
+                    failed_fermentations,
+                ) = await self._import_data(
+                    df, winery_id, user_id, progress_callback, cancellation_token
+                )
 
             result.fermentations_created = fermentations_created
             result.samples_created = samples_created
@@ -220,6 +227,12 @@ class ETLService:
         - Reuses shared default blocks (prevents UNIQUE constraint violations)
         - Handles optional vineyard_name and grape_variety gracefully
 
+        Logging (ADR-027):
+        - import_file runs this inside log_batch(): per-row repository/service
+          info events are counted and emitted once as etl_import_batch_summary,
+          so log volume does not scale with file size (warnings/errors still
+          emitted)
+
         Progress tracking (ADR-030 Phase 3):
         - Invokes progress_callback after each fermentation if provided
         - Checks cancellation_token before each fermentation
@@ -339,8 +352,15 @@ class ETLService:
                     )
 
                     # Step 6: Create samples for this fermentation
+                    # Sample reads prune partitions on recorded_at >= start_date,
+                    # so an earlier sample would be stored but never read back
                     ferm_samples_created = 0
                     for idx, row in group_df.iterrows():
+                        if pd.to_datetime(row["sample_date"]) < fermentation_start_date:
+                            raise ValueError(
+                                f"sample_date {row['sample_date']} is before "
+                                f"fermentation_start_date {fermentation_start_date}"
+                            )
                         sample_data_list = self._prepare_sample_data(
                             created_fermentation.id, row, user_id
                         )
@@ -368,6 +388,12 @@ class ETLService:
 
                 # Track failure but continue with remaining fermentations
                 failed_fermentations.append({"code": str(ferm_code), "error": str(e)})
+                logger.warning(
+                    "etl_fermentation_import_failed",
+                    fermentation_code=str(ferm_code),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
 
         return fermentations_created, samples_created, failed_fermentations
 
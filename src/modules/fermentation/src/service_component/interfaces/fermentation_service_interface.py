@@ -25,6 +25,8 @@ from src.modules.fermentation.src.domain.dtos import (
     FermentationCreate,
     FermentationUpdate,
     FermentationWithBlendCreate,
+    FermentationListFilter,
+    FermentationPage,
 )
 from src.modules.fermentation.src.domain.enums.fermentation_status import (
     FermentationStatus,
@@ -211,6 +213,40 @@ class IFermentationService(ABC):
         """
         pass
 
+    @abstractmethod
+    async def list_fermentations_page(
+        self,
+        winery_id: int,
+        filters: FermentationListFilter,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+    ) -> FermentationPage:
+        """
+        Retrieves one page of fermentations, filtered in the database.
+
+        Business logic:
+        1. Applies winery scoping and the data source/date/fruit origin/status filters
+        2. Orders by start_date DESC, id DESC
+        3. Continues after ``cursor`` (opaque, from the previous page) or skips ``offset`` rows
+        4. Counts the total only for the first page
+
+        Args:
+            winery_id: ID of the winery
+            filters: Listing filters (data source required)
+            limit: Maximum fermentations per page
+            cursor: next_cursor of the previous page
+            offset: Rows to skip when no cursor is given (legacy pagination)
+
+        Returns:
+            FermentationPage: Items, next_cursor (None on the last page) and total
+
+        Raises:
+            InvalidPageCursor: If the cursor is malformed or from another winery/filter
+            RepositoryError: If database operation fails
+        """
+        pass
+
     # ==================================================================================
     # UPDATE OPERATIONS
     # ==================================================================================
@@ -21,7 +21,11 @@ from typing import Optional, List
 from datetime import datetime
 
 from src.modules.fermentation.src.domain.entities.samples.base_sample import BaseSample
-from src.modules.fermentation.src.domain.dtos import SampleCreate
+from src.modules.fermentation.src.domain.dtos import (
+    SampleCreate,
+    SampleBatchItem,
+    SampleBatchItemResult,
+)
 from src.modules.fermentation.src.domain.enums.sample_type import SampleType
 from src.modules.fermentation.src.service_component.models.schemas.validations.validation_result import (
     ValidationResult,
@@ -80,6 +84,35 @@ class ISampleService(ABC):
         """
         pass
 
+    @abstractmethod
+    async def add_samples_batch(
+        self, winery_id: int, user_id: int, items: List[SampleBatchItem]
+    ) -> List[SampleBatchItemResult]:
+        """
+        Adds many samples, possibly across fermentations, in one operation.
+
+        Business logic:
+        1. Verifies all fermentations exist and belong to winery (one query)
+        2. Rejects items of COMPLETED fermentations
+        3. Validates each fermentation's samples against one prefetched window
+           (same rules as add_sample)
+        4. Persists all valid samples with a single multi-row write
+        5. Returns one result per item; invalid items don't block valid ones
+
+        Args:
+            winery_id: Winery ID for access control
+            user_id: ID of user recording samples (audit)
+            items: Samples with their fermentation IDs
+
+        Returns:
+            List[SampleBatchItemResult]: Per-item outcome, in request order
+
+        Raises:
+            ValidationError: If the batch exceeds the maximum size
+            RepositoryError: If database operation fails
+        """
+        pass
+
     # ==================================================================================
     # QUERY OPERATIONS
     # ==================================================================================
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, List, Optional
 from src.modules.fermentation.src.domain.entities.samples.base_sample import BaseSample
 from src.modules.fermentation.src.service_component.models.schemas.validations.validation_result import (
     ValidationResult,
@@ -29,16 +29,26 @@ class IValidationOrchestrator(ABC):
 
     @abstractmethod
     async def validate_sample_batch(
-        self, fermentation_id: int, samples: List[BaseSample]
-    ) -> ValidationResult:
+        self,
+        fermentation_id: int,
+        samples: List[BaseSample],
+        latest_by_type: Optional[Dict[str, BaseSample]] = None,
+    ) -> List[ValidationResult]:
         """
-        Validates a batch of samples for both value correctness and chronology.
+        Validates a batch of samples of one fermentation for value correctness,
+        chronology and business rules, without per-sample history queries.
+
+        Samples are checked in recorded_at order against a prefetched window
+        (latest stored sample per type); every accepted sample becomes the new
+        latest of its type for the following ones.
 
         Args:
             fermentation_id: ID of the fermentation
             samples: List of sample entities to validate
+            latest_by_type: Latest stored sample per sample_type value
+                (None or empty when the fermentation has no samples yet)
 
         Returns:
-            ValidationResult: Comprehensive validation results with errors and warnings
+            List[ValidationResult]: One result per sample, in input order
         """
         pass
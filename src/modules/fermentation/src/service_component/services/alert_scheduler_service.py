@@ -1,15 +1,31 @@
 """
 Alert Scheduler Service (ADR-040 Phase 4)
 
-Background job that runs every 30 minutes and scans all ACTIVE protocol
-executions to generate time-based alerts automatically:
+Background scheduler that raises time-based alerts for the steps of ACTIVE
+protocol executions exactly when their deadlines pass:
 
-  STEP_OVERDUE    — step's tolerance window has passed and it is not completed
   STEP_DUE_SOON   — step is due within the next 12 hours
+  STEP_OVERDUE    — step's tolerance window has passed and it is not completed
+
+Every pending step's deadlines are computed once and kept in a
+``DeadlineQueue`` (a min-heap ordered by fire time). A one-shot job is armed
+at the earliest deadline; when it fires, the due entries are re-checked
+against the database (execution still ACTIVE, step not completed) and their
+alerts created.
+
+Deadlines are recomputed only for executions that changed. The queue is
+loaded from every ACTIVE execution at startup; after that a light refresh
+job picks up executions whose own row, step completions, protocol or
+protocol steps were updated since its previous run (``updated_at``
+watermark), so started/finished executions, completed steps and edited
+protocols re-plan their deadlines without rescanning idle wineries.
 
 Duplicate-alert guard: a new alert for the same (execution, step, type) is
-suppressed if a non-dismissed alert already exists for that combination,
-preventing spam across scheduler runs.
+suppressed if a non-dismissed alert already exists for that combination
+within the dedup window, so a restart does not repeat recent alerts.
+
+New alerts are pushed to the winery's open event streams (``alert.created``)
+once their transaction has committed.
 
 Wire-up:
     Call ``AlertSchedulerService.start()`` on FastAPI startup
@@ -18,23 +34,36 @@ Wire-up:
 
 from __future__ import annotations
 
-import asyncio
-from datetime import datetime, timedelta
-from typing import List, Optional
+import heapq
+import itertools
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from sqlalchemy import and_, select
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import and_, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.shared.infra.database.engine_registry import (
+    POOL_BACKGROUND,
+    get_engine_registry,
+)
+from src.shared.infra.events import EventBus, get_event_bus
 from src.shared.wine_fermentator_logging import get_logger
 from src.modules.fermentation.src.domain.entities.protocol_alert import ProtocolAlert
 from src.modules.fermentation.src.domain.entities.protocol_execution import (
     ProtocolExecution,
 )
+from src.modules.fermentation.src.domain.entities.protocol_protocol import (
+    FermentationProtocol,
+)
 from src.modules.fermentation.src.domain.entities.protocol_step import ProtocolStep
 from src.modules.fermentation.src.domain.entities.step_completion import StepCompletion
 from src.modules.fermentation.src.domain.enums.step_type import ProtocolExecutionStatus
+from src.modules.fermentation.src.repository_component.protocol_alert_repository import (
+    ProtocolAlertRepository,
+)
 
 logger = get_logger(__name__)
 
@@ -44,6 +73,148 @@ _APPROACHING_HOURS = 12
 # Suppress duplicate alert for the same (execution, step, type) for this window
 _DEDUP_HOURS = 6
 
+# Changes committed while a refresh ran are picked up by the next one
+_REFRESH_OVERLAP = timedelta(minutes=2)
+
+# (execution, step) pairs re-checked per query before alerts fire
+_PENDING_CHECK_CHUNK = 1000
+
+STEP_DUE_SOON = "STEP_DUE_SOON"
+STEP_OVERDUE = "STEP_OVERDUE"
+
+
+@dataclass(frozen=True)
+class StepDeadline:
+    """One alert to raise at ``fire_at`` unless the step gets completed first."""
+
+    fire_at: datetime
+    alert_type: str
+    due_at: datetime
+    execution_id: int
+    protocol_id: int
+    winery_id: int
+    step_id: int
+    step_name: str
+    is_critical: bool
+
+
+def step_deadlines(
+    execution_id: int,
+    protocol_id: int,
+    winery_id: int,
+    start_date: datetime,
+    steps: Iterable,
+    completed_step_ids: Set[int],
+    now: datetime,
+) -> List[StepDeadline]:
+    """
+    Deadlines of an execution's pending steps.
+
+    A step is due at ``start_date + expected_day + tolerance_hours``. Steps
+    not yet due get a STEP_DUE_SOON deadline ``_APPROACHING_HOURS`` before
+    that (immediately when already inside the window) and a STEP_OVERDUE
+    deadline at it; steps already past due only get STEP_OVERDUE.
+    """
+    deadlines = []
+    for step in steps:
+        if step.id in completed_step_ids:
+            continue
+        due_at = start_date + timedelta(
+            days=step.expected_day, hours=step.tolerance_hours
+        )
+        fields = dict(
+            due_at=due_at,
+            execution_id=execution_id,
+            protocol_id=protocol_id,
+            winery_id=winery_id,
+            step_id=step.id,
+            step_name=step.description,
+            is_critical=step.is_critical,
+        )
+        if now < due_at:
+            approaching_at = due_at - timedelta(hours=_APPROACHING_HOURS)
+            deadlines.append(
+                StepDeadline(
+                    fire_at=max(approaching_at, now), alert_type=STEP_DUE_SOON, **fields
+                )
+            )
+        deadlines.append(
+            StepDeadline(fire_at=due_at, alert_type=STEP_OVERDUE, **fields)
+        )
+    return deadlines
+
+
+class DeadlineQueue:
+    """
+    Min-heap of step deadlines, replaced per execution.
+
+    Replacing or dropping an execution's deadlines does not search the heap:
+    each execution's entries carry the generation they were scheduled in,
+    and entries of an older generation are discarded when they reach the top
+    (the heap is compacted once those outnumber the live entries).
+    """
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[datetime, int, int, StepDeadline]] = []
+        self._generations: Dict[int, int] = {}
+        # Live (not yet popped) entries per execution, and in total
+        self._pending: Dict[int, int] = {}
+        self._live = 0
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return self._live
+
+    def replace(self, execution_id: int, deadlines: Iterable[StepDeadline]) -> None:
+        """Schedule ``deadlines`` in place of the execution's current ones."""
+        generation = next(self._counter)
+        self._generations[execution_id] = generation
+        count = 0
+        for deadline in deadlines:
+            heapq.heappush(
+                self._heap,
+                (deadline.fire_at, next(self._counter), generation, deadline),
+            )
+            count += 1
+        self._live += count - self._pending.get(execution_id, 0)
+        self._pending[execution_id] = count
+        self._compact()
+
+    def discard(self, execution_id: int) -> None:
+        """Forget every deadline of an execution."""
+        self._generations.pop(execution_id, None)
+        self._live -= self._pending.pop(execution_id, 0)
+        self._compact()
+
+    def next_fire_at(self) -> Optional[datetime]:
+        """Fire time of the earliest live deadline, None when empty."""
+        self._drop_stale_top()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> List[StepDeadline]:
+        """Remove and return every live deadline whose fire time has passed."""
+        due = []
+        while True:
+            self._drop_stale_top()
+            if not self._heap or self._heap[0][0] > now:
+                return due
+            deadline = heapq.heappop(self._heap)[3]
+            self._pending[deadline.execution_id] -= 1
+            self._live -= 1
+            due.append(deadline)
+
+    def _is_live(self, entry: Tuple[datetime, int, int, StepDeadline]) -> bool:
+        return self._generations.get(entry[3].execution_id) == entry[2]
+
+    def _drop_stale_top(self) -> None:
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+
+    def _compact(self) -> None:
+        if len(self._heap) > 2 * len(self) + 64:
+            self._heap = [entry for entry in self._heap if self._is_live(entry)]
+            heapq.heapify(self._heap)
+
 
 class AlertSchedulerService:
     """
@@ -53,33 +224,49 @@ class AlertSchedulerService:
     (alert_router.py) exposes these to the frontend for display/acknowledge.
     """
 
-    def __init__(self, database_url: str, interval_minutes: int = 30) -> None:
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        refresh_seconds: int = 60,
+        event_bus: Optional[EventBus] = None,
+    ) -> None:
         """
         Args:
-            database_url:      Async DB URL  (``postgresql+asyncpg://...``)
-            interval_minutes:  How often the scan runs (default 30 min).
+            database_url:     Async DB URL  (``postgresql+asyncpg://...``);
+                              defaults to DatabaseConfig's URL.
+            refresh_seconds:  How often changed executions are re-planned
+                              (default 60 s); alerts fire at their deadlines.
+            event_bus:        Bus for alert.created events (default: process bus).
         """
         self._db_url = database_url
-        self._interval = interval_minutes
-        self._scheduler = AsyncIOScheduler()
+        self._refresh_seconds = refresh_seconds
+        # Naive datetimes throughout this service are UTC
+        self._scheduler = AsyncIOScheduler(timezone=timezone.utc)
+        self._event_bus = event_bus or get_event_bus()
+        self._queue = DeadlineQueue()
+        # Start of the previous refresh; None until the queue has been loaded
+        self._watermark: Optional[datetime] = None
+        # Alerts added in the running transaction, published after its commit
+        self._created_alerts: List[ProtocolAlert] = []
 
     # ─── Lifecycle ──────────────────────────────────────────────────────────
 
     def start(self) -> None:
-        """Register the job and start the scheduler (call on FastAPI startup)."""
+        """Register the refresh job and start the scheduler (call on FastAPI startup)."""
         self._scheduler.add_job(
-            self._scan_all_executions,
+            self._refresh_deadlines,
             trigger="interval",
-            minutes=self._interval,
-            id="alert_scan",
+            seconds=self._refresh_seconds,
+            id="alert_deadline_refresh",
             replace_existing=True,
             coalesce=True,  # skip missed runs; don't pile up
             max_instances=1,
+            next_run_time=datetime.now(timezone.utc),  # load the queue right away
         )
         self._scheduler.start()
         logger.info(
             "alert_scheduler_started",
-            interval_minutes=self._interval,
+            refresh_seconds=self._refresh_seconds,
         )
 
     def stop(self) -> None:
@@ -87,124 +274,264 @@ class AlertSchedulerService:
         self._scheduler.shutdown(wait=False)
         logger.info("alert_scheduler_stopped")
 
-    # ─── Main scan ──────────────────────────────────────────────────────────
+    async def run_pending(self) -> int:
+        """
+        Refresh changed executions, then raise every alert already due.
 
-    async def _scan_all_executions(self) -> None:
+        What the scheduled jobs do between them, in one call (load tests and
+        benchmarks drive the scheduler this way). Returns alerts created.
         """
-        Main job body: open a short-lived DB session, find all ACTIVE
-        executions, and generate alerts for each one.
+        await self._refresh_deadlines(arm=False)
+        return await self._fire_due_deadlines(arm=False)
+
+    # ─── Deadline refresh ───────────────────────────────────────────────────
+
+    async def _refresh_deadlines(self, arm: bool = True) -> None:
         """
-        engine = create_async_engine(self._db_url, pool_pre_ping=True)
-        async_session = sessionmaker(
-            engine, class_=AsyncSession, expire_on_commit=False
-        )
+        Job body: re-plan the deadlines of executions changed since the
+        previous refresh (every ACTIVE execution on the first run).
 
+        Runs on the registry's "background" pool, so it can never take
+        connections from API requests.
+        """
+        async_session = get_engine_registry().session_factory(
+            POOL_BACKGROUND, self._db_url
+        )
+        started = datetime.utcnow()
         try:
             async with async_session() as session:
-                async with session.begin():
-                    executions = await self._get_active_executions(session)
-                    logger.info(
-                        "alert_scan_started",
-                        active_executions=len(executions),
-                    )
-
-                    total_created = 0
-                    for execution in executions:
-                        created = await self._process_execution(session, execution)
-                        total_created += created
-
-                    logger.info(
-                        "alert_scan_completed",
-                        active_executions=len(executions),
-                        alerts_created=total_created,
-                    )
+                changed = await self._load_changed_executions(session)
+            self._watermark = started
+            logger.info(
+                "alert_deadlines_refreshed",
+                changed_executions=changed,
+                pending_deadlines=len(self._queue),
+            )
         except Exception as exc:
-            logger.error("alert_scan_failed", error=str(exc))
-        finally:
-            await engine.dispose()
-
-    # ─── Per-execution logic ─────────────────────────────────────────────────
+            logger.error("alert_deadline_refresh_failed", error=str(exc))
+        if arm:
+            self._arm_fire_job()
 
-    async def _process_execution(
-        self, session: AsyncSession, execution: ProtocolExecution
-    ) -> int:
+    async def _load_changed_executions(self, session: AsyncSession) -> int:
         """
-        Check one execution and create alerts for overdue / approaching steps.
+        Replace the queued deadlines of changed executions; returns how many
+        executions were re-planned or dropped.
 
-        Returns number of alerts created.
+        Three queries regardless of the number of executions: the changed
+        executions, the steps of their protocols and their completions.
         """
-        # All steps for this protocol
-        steps_result = await session.execute(
-            select(ProtocolStep)
-            .where(ProtocolStep.protocol_id == execution.protocol_id)
-            .order_by(ProtocolStep.step_order)
+        if self._watermark is None:
+            changed = ProtocolExecution.status == ProtocolExecutionStatus.ACTIVE.value
+        else:
+            changed = self._changed_since(self._watermark - _REFRESH_OVERLAP)
+        active = and_(
+            changed, ProtocolExecution.status == ProtocolExecutionStatus.ACTIVE.value
         )
-        steps: List[ProtocolStep] = list(steps_result.scalars().all())
 
-        # Set of step IDs that are already completed or skipped
+        executions = (
+            await session.execute(
+                select(
+                    ProtocolExecution.id,
+                    ProtocolExecution.protocol_id,
+                    ProtocolExecution.winery_id,
+                    ProtocolExecution.start_date,
+                    ProtocolExecution.status,
+                ).where(changed)
+            )
+        ).all()
+        steps_result = await session.execute(
+            select(
+                ProtocolStep.id,
+                ProtocolStep.protocol_id,
+                ProtocolStep.expected_day,
+                ProtocolStep.tolerance_hours,
+                ProtocolStep.is_critical,
+                ProtocolStep.description,
+            ).where(
+                ProtocolStep.protocol_id.in_(
+                    select(ProtocolExecution.protocol_id).where(active)
+                )
+            )
+        )
+        steps_by_protocol: Dict[int, list] = {}
+        for step in steps_result.all():
+            steps_by_protocol.setdefault(step.protocol_id, []).append(step)
         completions_result = await session.execute(
-            select(StepCompletion.step_id).where(
-                StepCompletion.execution_id == execution.id
+            select(StepCompletion.execution_id, StepCompletion.step_id).where(
+                StepCompletion.execution_id.in_(select(ProtocolExecution.id).where(active))
             )
         )
-        completed_step_ids = set(completions_result.scalars().all())
+        completed: Dict[int, Set[int]] = {}
+        for execution_id, step_id in completions_result.all():
+            completed.setdefault(execution_id, set()).add(step_id)
 
         now = datetime.utcnow()
-        alerts_created = 0
+        for execution in executions:
+            if execution.status != ProtocolExecutionStatus.ACTIVE.value:
+                self._queue.discard(execution.id)
+                continue
+            self._queue.replace(
+                execution.id,
+                step_deadlines(
+                    execution.id,
+                    execution.protocol_id,
+                    execution.winery_id,
+                    execution.start_date,
+                    steps_by_protocol.get(execution.protocol_id, ()),
+                    completed.get(execution.id, set()),
+                    now,
+                ),
+            )
+        return len(executions)
 
-        for step in steps:
-            if step.id in completed_step_ids:
-                continue  # already done
+    @staticmethod
+    def _changed_since(since: datetime):
+        """Executions whose row, completions, protocol or steps changed since ``since``."""
+        return or_(
+            ProtocolExecution.updated_at >= since,
+            ProtocolExecution.id.in_(
+                select(StepCompletion.execution_id).where(
+                    StepCompletion.updated_at >= since
+                )
+            ),
+            ProtocolExecution.protocol_id.in_(
+                select(ProtocolStep.protocol_id).where(ProtocolStep.updated_at >= since)
+            ),
+            ProtocolExecution.protocol_id.in_(
+                select(FermentationProtocol.id).where(
+                    FermentationProtocol.updated_at >= since
+                )
+            ),
+        )
+
+    def _arm_fire_job(self) -> None:
+        """(Re)schedule the one-shot fire job at the earliest pending deadline."""
+        fire_at = self._queue.next_fire_at()
+        if fire_at is None:
+            try:
+                self._scheduler.remove_job("alert_fire")
+            except JobLookupError:
+                pass
+            return
+        self._scheduler.add_job(
+            self._fire_due_deadlines,
+            trigger="date",
+            run_date=max(fire_at, datetime.utcnow()),
+            id="alert_fire",
+            replace_existing=True,
+            misfire_grace_time=None,  # a late deadline still fires
+        )
+
+    # ─── Firing ─────────────────────────────────────────────────────────────
+
+    async def _fire_due_deadlines(self, arm: bool = True) -> int:
+        """
+        Job body: create the alerts of every deadline that has passed.
 
-            # Window: execution.start_date + expected_day ± tolerance_hours
-            due_at = execution.start_date + timedelta(
-                days=step.expected_day,
-                hours=step.tolerance_hours,
+        Deadlines are re-checked in one query first, so a step completed (or
+        an execution finished) since the last refresh raises nothing.
+        Returns number of alerts created.
+        """
+        now = datetime.utcnow()
+        due = self._queue.pop_due(now)
+        created = 0
+        if due:
+            async_session = get_engine_registry().session_factory(
+                POOL_BACKGROUND, self._db_url
             )
-            approaching_at = due_at - timedelta(hours=_APPROACHING_HOURS)
+            self._created_alerts = []
+            try:
+                async with async_session() as session:
+                    async with session.begin():
+                        pending = await self._still_pending(session, due)
+                        for deadline in due:
+                            if (deadline.execution_id, deadline.step_id) not in pending:
+                                continue
+                            created += await self._raise_alert(session, deadline, now)
+                        # One insert for the batch; also bumps the inbox counters
+                        await ProtocolAlertRepository(session).create_many(
+                            self._created_alerts
+                        )
+                self._publish_created_alerts()
+                logger.info(
+                    "alert_deadlines_fired",
+                    due_deadlines=len(due),
+                    alerts_created=created,
+                )
+            except Exception as exc:
+                created = 0
+                # The popped deadlines are gone; reload the queue on the next refresh
+                self._watermark = None
+                logger.error("alert_fire_failed", error=str(exc))
+        if arm:
+            self._arm_fire_job()
+        return created
 
-            if now >= due_at:
-                # OVERDUE
-                created = await self._maybe_create_alert(
-                    session=session,
-                    execution=execution,
-                    step=step,
-                    alert_type="STEP_OVERDUE",
-                    severity="CRITICAL" if step.is_critical else "WARNING",
-                    message=(
-                        f"Step '{step.description}' is overdue "
-                        f"(was due {due_at.strftime('%Y-%m-%d %H:%M')} UTC)."
-                    ),
+    @staticmethod
+    async def _still_pending(
+        session: AsyncSession, deadlines: List[StepDeadline]
+    ) -> Set[Tuple[int, int]]:
+        """(execution_id, step_id) pairs of ``deadlines`` that still need an alert."""
+        pairs = sorted({(d.execution_id, d.step_id) for d in deadlines})
+        pending: Set[Tuple[int, int]] = set()
+        # Chunked to stay within the driver's bind parameter limit
+        for offset in range(0, len(pairs), _PENDING_CHECK_CHUNK):
+            result = await session.execute(
+                select(ProtocolExecution.id, ProtocolStep.id)
+                .join(
+                    ProtocolStep,
+                    ProtocolStep.protocol_id == ProtocolExecution.protocol_id,
                 )
-                alerts_created += created
-
-            elif now >= approaching_at:
-                # DUE SOON
-                hours_left = round((due_at - now).total_seconds() / 3600, 1)
-                created = await self._maybe_create_alert(
-                    session=session,
-                    execution=execution,
-                    step=step,
-                    alert_type="STEP_DUE_SOON",
-                    severity="WARNING" if step.is_critical else "INFO",
-                    message=(
-                        f"Step '{step.description}' is due in "
-                        f"{hours_left}h "
-                        f"(deadline {due_at.strftime('%Y-%m-%d %H:%M')} UTC)."
+                .where(
+                    tuple_(ProtocolExecution.id, ProtocolStep.id).in_(
+                        pairs[offset:offset + _PENDING_CHECK_CHUNK]
                     ),
+                    ProtocolExecution.status == ProtocolExecutionStatus.ACTIVE.value,
+                    ~select(StepCompletion.id)
+                    .where(
+                        StepCompletion.execution_id == ProtocolExecution.id,
+                        StepCompletion.step_id == ProtocolStep.id,
+                    )
+                    .exists(),
                 )
-                alerts_created += created
+            )
+            pending.update((execution_id, step_id) for execution_id, step_id in result.all())
+        return pending
 
-        return alerts_created
+    async def _raise_alert(
+        self, session: AsyncSession, deadline: StepDeadline, now: datetime
+    ) -> int:
+        """Create the alert of a due deadline; returns 1 if created, 0 if not."""
+        due_label = deadline.due_at.strftime("%Y-%m-%d %H:%M")
+        if deadline.alert_type == STEP_OVERDUE:
+            severity = "CRITICAL" if deadline.is_critical else "WARNING"
+            message = (
+                f"Step '{deadline.step_name}' is overdue "
+                f"(was due {due_label} UTC)."
+            )
+        else:
+            if now >= deadline.due_at:
+                return 0  # fired late; the STEP_OVERDUE deadline covers it
+            hours_left = round((deadline.due_at - now).total_seconds() / 3600, 1)
+            severity = "WARNING" if deadline.is_critical else "INFO"
+            message = (
+                f"Step '{deadline.step_name}' is due in "
+                f"{hours_left}h "
+                f"(deadline {due_label} UTC)."
+            )
+        return await self._maybe_create_alert(
+            session=session,
+            deadline=deadline,
+            severity=severity,
+            message=message,
+        )
 
     # ─── Dedup + persist ────────────────────────────────────────────────────
 
     async def _maybe_create_alert(
         self,
         session: AsyncSession,
-        execution: ProtocolExecution,
-        step: ProtocolStep,
-        alert_type: str,
+        deadline: StepDeadline,
         severity: str,
         message: str,
     ) -> int:
@@ -220,9 +547,9 @@ class AlertSchedulerService:
             select(ProtocolAlert.id)
             .where(
                 and_(
-                    ProtocolAlert.execution_id == execution.id,
-                    ProtocolAlert.step_id == step.id,
-                    ProtocolAlert.alert_type == alert_type,
+                    ProtocolAlert.execution_id == deadline.execution_id,
+                    ProtocolAlert.step_id == deadline.step_id,
+                    ProtocolAlert.alert_type == deadline.alert_type,
                     ProtocolAlert.status != "DISMISSED",
                     ProtocolAlert.created_at >= dedup_since,
                 )
@@ -233,39 +560,44 @@ class AlertSchedulerService:
             return 0  # already alerted recently
 
         alert = ProtocolAlert(
-            execution_id=execution.id,
-            protocol_id=execution.protocol_id,
-            winery_id=execution.winery_id,
-            step_id=step.id,
-            step_name=step.description,
-            alert_type=alert_type,
+            execution_id=deadline.execution_id,
+            protocol_id=deadline.protocol_id,
+            winery_id=deadline.winery_id,
+            step_id=deadline.step_id,
+            step_name=deadline.step_name,
+            alert_type=deadline.alert_type,
             severity=severity,
             status="PENDING",
             message=message,
             created_at=datetime.utcnow(),
         )
-        session.add(alert)
-        # flush happens at the enclosing begin() commit
+        # Inserted with the rest of the run's alerts before the commit
+        self._created_alerts.append(alert)
 
         logger.info(
             "alert_created",
-            execution_id=execution.id,
-            step_id=step.id,
-            alert_type=alert_type,
+            execution_id=deadline.execution_id,
+            step_id=deadline.step_id,
+            alert_type=deadline.alert_type,
             severity=severity,
         )
         return 1
 
-    # ─── Helpers ────────────────────────────────────────────────────────────
-
-    @staticmethod
-    async def _get_active_executions(
-        session: AsyncSession,
-    ) -> List[ProtocolExecution]:
-        """Return all ACTIVE protocol executions."""
-        result = await session.execute(
-            select(ProtocolExecution).where(
-                ProtocolExecution.status == ProtocolExecutionStatus.ACTIVE.value
+    def _publish_created_alerts(self) -> None:
+        """Push the committed alerts of this run to their wineries' streams."""
+        for alert in self._created_alerts:
+            self._event_bus.publish(
+                alert.winery_id,
+                "alert.created",
+                {
+                    "id": alert.id,
+                    "execution_id": alert.execution_id,
+                    "step_id": alert.step_id,
+                    "step_name": alert.step_name,
+                    "alert_type": alert.alert_type,
+                    "severity": alert.severity,
+                    "message": alert.message,
+                    "created_at": alert.created_at,
+                },
             )
-        )
-        return list(result.scalars().all())
+        self._created_alerts = []
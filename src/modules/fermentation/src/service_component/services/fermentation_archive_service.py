@@ -0,0 +1,119 @@
+"""
+Fermentation Archive Service
+
+Moves completed fermentations to cold storage so the hot samples and
+fermentation_notes tables (and their indexes) only hold the working set.
+
+Per fermentation, in this order:
+1. export its samples and notes from the hot tables
+2. write them to the archive store (compressed Parquet files)
+3. delete the exported rows and set fermentations.archived_at, in one
+   transaction that is rolled back if the rows changed since step 1
+
+A failure at any step leaves the fermentation hot and unarchived; the
+next run retries it (rewriting its files). Data is never deleted before
+its archive is on disk.
+
+Reads of archived fermentations are rehydrated from the store by the
+services that serve them (SampleService timeline reads,
+PatternAnalysisService, FermentationNoteService).
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from src.shared.wine_fermentator_logging import get_logger, LogTimer
+
+from src.modules.fermentation.src.domain.dtos.archive_dtos import ArchiveRunResult
+from src.modules.fermentation.src.domain.repositories.fermentation_archive_repository_interface import (
+    IFermentationArchiveRepository,
+)
+from src.modules.fermentation.src.domain.repositories.fermentation_archive_store_interface import (
+    IFermentationArchiveStore,
+)
+
+logger = get_logger(__name__)
+
+DEFAULT_ARCHIVE_AFTER_DAYS = 365
+DEFAULT_ARCHIVE_BATCH_SIZE = 100
+
+
+class FermentationArchiveService:
+    """Archives completed fermentations older than a configurable age."""
+
+    def __init__(
+        self,
+        archive_repo: IFermentationArchiveRepository,
+        archive_store: IFermentationArchiveStore,
+    ):
+        """
+        Initialize service with dependencies.
+
+        Args:
+            archive_repo: Hot-table side (candidates, export, purge)
+            archive_store: Cold storage the rows are written to
+        """
+        self._archive_repo = archive_repo
+        self._archive_store = archive_store
+
+    async def archive_completed(
+        self,
+        older_than_days: int = DEFAULT_ARCHIVE_AFTER_DAYS,
+        limit: int = DEFAULT_ARCHIVE_BATCH_SIZE,
+        now: Optional[datetime] = None,
+    ) -> ArchiveRunResult:
+        """
+        Archives up to ``limit`` completed fermentations untouched for ``older_than_days``.
+
+        Args:
+            older_than_days: Minimum age (since last update) of a completed fermentation
+            limit: Maximum fermentations archived in this run (oldest first)
+            now: Reference time (defaults to utcnow)
+
+        Returns:
+            ArchiveRunResult: Archived and failed fermentation IDs, row counts
+        """
+        if older_than_days < 0:
+            raise ValueError("older_than_days must not be negative")
+        now = now or datetime.utcnow()
+        cutoff = now - timedelta(days=older_than_days)
+        result = ArchiveRunResult()
+
+        with LogTimer(logger, "archive_completed_fermentations"):
+            candidates = await self._archive_repo.list_archivable(
+                completed_before=cutoff, limit=limit
+            )
+            for fermentation in candidates:
+                try:
+                    rows = await self._archive_repo.export_rows(fermentation.id)
+                    await self._archive_store.write(
+                        fermentation.winery_id, fermentation.id, rows
+                    )
+                    purged = await self._archive_repo.purge_archived(
+                        fermentation.id, rows, archived_at=now
+                    )
+                except Exception as e:
+                    logger.error(
+                        "fermentation_archive_failed",
+                        fermentation_id=fermentation.id,
+                        error=str(e),
+                    )
+                    result.failed.append(fermentation.id)
+                    continue
+
+                if not purged:
+                    result.failed.append(fermentation.id)
+                    continue
+                result.archived.append(fermentation.id)
+                result.samples_archived += len(rows.samples)
+                result.notes_archived += len(rows.notes)
+
+        logger.info(
+            "fermentations_archived",
+            cutoff=cutoff.isoformat(),
+            archived=len(result.archived),
+            failed=len(result.failed),
+            samples=result.samples_archived,
+            notes=result.notes_archived,
+        )
+        return result
@@ -0,0 +1,236 @@
+"""
+Fermentation Export Service
+
+Columnar export of a winery's fermentation history for offline analytics,
+in place of paging through the JSON historical endpoints.
+
+Every dataset (see ExportDataset) is read from a server-side cursor in
+chunks and each chunk becomes one Arrow record batch, so memory is bounded
+by the chunk size whatever the size of the history. Batches are either
+streamed as an Arrow IPC stream (API) or written as Parquet row groups
+(export script).
+
+Archived fermentations (migration 011) have their samples in cold
+storage; with an archive store, the samples dataset appends them after the
+hot rows, pivoted the same way, one batch per fermentation.
+
+Requires pyarrow; it is imported on first use.
+"""
+
+import asyncio
+import io
+import os
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from src.shared.domain.errors import ExportUnavailable
+from src.shared.wine_fermentator_logging import get_logger, LogTimer
+
+from src.modules.fermentation.src.domain.entities.samples.base_sample import BaseSample
+from src.modules.fermentation.src.domain.enums.export_dataset import ExportDataset
+from src.modules.fermentation.src.domain.repositories.fermentation_archive_store_interface import (
+    IFermentationArchiveStore,
+)
+from src.modules.fermentation.src.domain.repositories.fermentation_export_repository_interface import (
+    IFermentationExportRepository,
+)
+
+logger = get_logger(__name__)
+
+DEFAULT_EXPORT_CHUNK_SIZE = 10_000
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ExportUnavailable("Columnar export requires pyarrow") from e
+    return pyarrow
+
+
+def _arrow_type(pa, column_type: str):
+    return {
+        "int64": pa.int64(),
+        "float64": pa.float64(),
+        "string": pa.string(),
+        "bool": pa.bool_(),
+        "timestamp": pa.timestamp("us"),
+        "date": pa.date32(),
+    }[column_type]
+
+
+def pivot_samples(
+    samples: Sequence[BaseSample], columns: Sequence[Tuple[str, str]]
+) -> List[Dict[str, Any]]:
+    """
+    Samples pivoted like the samples dataset query: one row per
+    (fermentation_id, recorded_at), the highest value per sample type.
+    """
+    names = [name for name, _ in columns]
+    rows: Dict[Tuple[int, Any], Dict[str, Any]] = {}
+    for sample in samples:
+        if sample.is_deleted:
+            continue
+        key = (sample.fermentation_id, sample.recorded_at)
+        row = rows.get(key)
+        if row is None:
+            row = dict.fromkeys(names)
+            row["fermentation_id"], row["recorded_at"] = key
+            rows[key] = row
+        if sample.sample_type in row:
+            current = row[sample.sample_type]
+            row[sample.sample_type] = (
+                sample.value if current is None else max(current, sample.value)
+            )
+    return [rows[key] for key in sorted(rows)]
+
+
+class FermentationExportService:
+    """Streams a winery's fermentation history as Arrow record batches."""
+
+    def __init__(
+        self,
+        export_repo: IFermentationExportRepository,
+        archive_store: Optional[IFermentationArchiveStore] = None,
+    ):
+        """
+        Initialize service with dependencies.
+
+        Args:
+            export_repo: Chunked reads of the hot tables
+            archive_store: Cold storage of archived samples (None: hot rows only)
+        """
+        self._export_repo = export_repo
+        self._archive_store = archive_store
+
+    def schema(self, dataset: ExportDataset):
+        """Arrow schema shared by every batch of a dataset."""
+        pa = _pyarrow()
+        return pa.schema(
+            [
+                (name, _arrow_type(pa, column_type))
+                for name, column_type in self._export_repo.columns(dataset)
+            ]
+        )
+
+    async def record_batches(
+        self,
+        winery_id: int,
+        dataset: ExportDataset,
+        chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE,
+    ) -> AsyncIterator[Any]:
+        """
+        Record batches of one dataset, at most chunk_size rows each.
+
+        Args:
+            winery_id: Winery whose history is exported
+            dataset: Dataset to export
+            chunk_size: Rows per batch
+
+        Yields:
+            pyarrow.RecordBatch: Batches with the dataset's schema
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        pa = _pyarrow()
+        schema = self.schema(dataset)
+
+        async for chunk in self._export_repo.stream(winery_id, dataset, chunk_size):
+            yield pa.RecordBatch.from_pylist(chunk, schema=schema)
+
+        if dataset is not ExportDataset.SAMPLES or self._archive_store is None:
+            return
+        columns = self._export_repo.columns(dataset)
+        for fermentation_id in await self._export_repo.list_archived_ids(winery_id):
+            samples = await self._archive_store.read_samples(
+                winery_id=winery_id, fermentation_id=fermentation_id
+            )
+            rows = pivot_samples(samples, columns)
+            for start in range(0, len(rows), chunk_size):
+                yield pa.RecordBatch.from_pylist(
+                    rows[start:start + chunk_size], schema=schema
+                )
+
+    async def stream_ipc(
+        self,
+        winery_id: int,
+        dataset: ExportDataset,
+        chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """
+        One dataset encoded as an Arrow IPC stream, yielded batch by batch.
+
+        The first chunk holds the schema, so an empty dataset is still a
+        valid (empty) stream.
+        """
+        pa = _pyarrow()
+        sink = io.BytesIO()
+        writer = pa.ipc.new_stream(sink, self.schema(dataset))
+
+        def _drain() -> bytes:
+            data = sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+            return data
+
+        yield _drain()
+        async for batch in self.record_batches(winery_id, dataset, chunk_size):
+            writer.write_batch(batch)
+            yield _drain()
+        writer.close()
+        yield _drain()
+
+    async def export_parquet(
+        self,
+        winery_id: int,
+        directory: str,
+        datasets: Sequence[ExportDataset] = tuple(ExportDataset),
+        chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE,
+        compression: str = "zstd",
+    ) -> Dict[ExportDataset, int]:
+        """
+        Writes one Parquet file per dataset, one row group per batch.
+
+        Files are written as ``<directory>/<dataset>.parquet`` through a
+        temporary file renamed on success, so a failed export never leaves
+        a truncated file behind.
+
+        Returns:
+            Dict[ExportDataset, int]: Rows written per dataset
+        """
+        pa = _pyarrow()
+        target = Path(directory)
+        target.mkdir(parents=True, exist_ok=True)
+        written: Dict[ExportDataset, int] = {}
+
+        for dataset in datasets:
+            path = target / f"{dataset.value}.parquet"
+            partial = target / f".{dataset.value}.parquet.partial"
+            rows = 0
+            with LogTimer(logger, "export_fermentation_dataset"):
+                writer = pa.parquet.ParquetWriter(
+                    partial, self.schema(dataset), compression=compression
+                )
+                try:
+                    async for batch in self.record_batches(winery_id, dataset, chunk_size):
+                        await asyncio.to_thread(writer.write_batch, batch)
+                        rows += batch.num_rows
+                    writer.close()
+                except BaseException:
+                    writer.close()
+                    partial.unlink(missing_ok=True)
+                    raise
+            os.replace(partial, path)
+            written[dataset] = rows
+            logger.info(
+                "fermentation_dataset_exported",
+                winery_id=winery_id,
+                dataset=dataset.value,
+                rows=rows,
+                path=str(path),
+            )
+        return written
@@ -21,6 +21,12 @@ from src.modules.fermentation.src.domain.dtos.fermentation_note_dtos import (
 from src.modules.fermentation.src.domain.repositories.fermentation_note_repository_interface import (
     IFermentationNoteRepository,
 )
+from src.modules.fermentation.src.domain.repositories.fermentation_archive_store_interface import (
+    IFermentationArchiveStore,
+)
+from src.modules.fermentation.src.domain.repositories.fermentation_repository_interface import (
+    IFermentationRepository,
+)
 from src.modules.fermentation.src.repository_component.errors import EntityNotFoundError
 from src.shared.wine_fermentator_logging import get_logger
 
@@ -39,8 +45,15 @@ class FermentationNoteService:
     Multi-tenant security enforced via winery_id scoping in the repository.
     """
 
-    def __init__(self, note_repo: IFermentationNoteRepository) -> None:
+    def __init__(
+        self,
+        note_repo: IFermentationNoteRepository,
+        archive_store: Optional[IFermentationArchiveStore] = None,
+        fermentation_repo: Optional[IFermentationRepository] = None,
+    ) -> None:
         self._repo = note_repo
+        self._archive_store = archive_store
+        self._fermentation_repo = fermentation_repo
 
     # ------------------------------------------------------------------
     # Command: add a note
@@ -119,11 +132,27 @@ class FermentationNoteService:
         Return all notes for a fermentation, ordered newest-first.
 
         Returns an empty list if the fermentation has no notes or does not
-        belong to the winery.
+        belong to the winery. Notes of an archived fermentation (archived_at
+        set) are read from cold storage, keyed by winery too.
+
+        Raises:
+            ArchiveUnavailable: If the fermentation is archived but its
+                archive can't be read
         """
-        return await self._repo.get_by_fermentation(
+        notes = await self._repo.get_by_fermentation(
             fermentation_id=fermentation_id, winery_id=winery_id
         )
+        if notes or self._archive_store is None or self._fermentation_repo is None:
+            return notes
+
+        fermentation = await self._fermentation_repo.get_by_id(
+            fermentation_id=fermentation_id, winery_id=winery_id
+        )
+        if fermentation is not None and fermentation.archived_at is not None:
+            notes = await self._archive_store.read_notes(
+                winery_id=winery_id, fermentation_id=fermentation_id
+            )
+        return notes
 
     # ------------------------------------------------------------------
     # Command: update a note
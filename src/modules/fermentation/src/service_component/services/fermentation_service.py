@@ -18,6 +18,11 @@ Test Coverage: 45/45 tests passing (33 service + 12 validator)
 Production Ready: Yes
 """
 
+import base64
+import binascii
+import hashlib
+import json
+from datetime import datetime, timezone
 from typing import Optional, List
 
 # ADR-027: Structured logging
@@ -32,19 +37,31 @@ from src.modules.fermentation.src.service_component.interfaces.fermentation_vali
 from src.modules.fermentation.src.domain.repositories.fermentation_repository_interface import (
     IFermentationRepository,
 )
+from src.modules.fermentation.src.domain.repositories.sample_repository_interface import (
+    ISampleRepository,
+)
 from src.modules.fermentation.src.domain.entities.fermentation import Fermentation
 from src.modules.fermentation.src.domain.dtos import (
     FermentationCreate,
     FermentationUpdate,
     FermentationWithBlendCreate,
+    FermentationListFilter,
+    FermentationPage,
+    ListPosition,
+)
+from src.modules.fermentation.src.service_component.errors import (
+    BusinessRuleViolation,
+    InvalidPageCursor,
+    NotFoundError,
 )
-from src.modules.fermentation.src.service_component.errors import NotFoundError
 from src.modules.fermentation.src.domain.interfaces.unit_of_work_interface import (
     IUnitOfWork,
 )
 
 logger = get_logger(__name__)
 
+LIST_CURSOR_VERSION = 1
+
 
 class FermentationService(IFermentationService):
     """
@@ -67,6 +84,7 @@ class FermentationService(IFermentationService):
         self,
         fermentation_repo: IFermentationRepository,
         validator: IFermentationValidator,
+        sample_repo: Optional[ISampleRepository] = None,
     ):
         """
         Initialize service with dependencies (Dependency Injection).
@@ -74,9 +92,12 @@ class FermentationService(IFermentationService):
         Args:
             fermentation_repo: Repository for fermentation data access
             validator: Validator for fermentation business rules
+            sample_repo: Sample lookups for start_date changes (without it
+                start_date can't be moved later)
         """
         self._fermentation_repo = fermentation_repo
         self._validator = validator
+        self._sample_repo = sample_repo
 
     async def create_fermentation(
         self, winery_id: int, user_id: int, data: FermentationCreate
@@ -326,6 +347,103 @@ class FermentationService(IFermentationService):
 
         return fermentations
 
+    async def list_fermentations_page(
+        self,
+        winery_id: int,
+        filters: FermentationListFilter,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+    ) -> FermentationPage:
+        """
+        Retrieve one page of fermentations, filtered in the database.
+
+        Keyset pagination: the repository reads limit + 1 rows after the
+        cursor's (start_date, id); the extra row only tells whether there
+        is a next page. The total is counted for the first page only, so
+        following cursors never re-counts the whole history.
+
+        Cursor format (opaque to clients): urlsafe base64 of
+        ``{"v": 1, "w": winery_id, "f": filter_fingerprint, "p": [start_date_iso, id]}``.
+        """
+        after = self.decode_list_cursor(cursor, winery_id, filters) if cursor else None
+        rows = await self._fermentation_repo.list_page_by_data_source(
+            winery_id=winery_id,
+            filters=filters,
+            limit=limit + 1,
+            after=after,
+            offset=offset,
+        )
+
+        page = FermentationPage(items=rows[:limit])
+        if len(rows) > limit:
+            last = page.items[-1]
+            page.next_cursor = self.encode_list_cursor(
+                winery_id, filters, (last.start_date, last.id)
+            )
+        if cursor is None:
+            page.total = await self._fermentation_repo.count_by_data_source(
+                winery_id=winery_id, filters=filters
+            )
+
+        logger.info(
+            "fermentations_page_retrieved",
+            winery_id=winery_id,
+            data_source=filters.data_source,
+            count=len(page.items),
+            has_more=page.next_cursor is not None,
+        )
+        return page
+
+    # ─── List cursor codec ──────────────────────────────────────────────────
+
+    @staticmethod
+    def _filter_fingerprint(filters: FermentationListFilter) -> str:
+        raw = json.dumps(
+            [
+                filters.data_source,
+                filters.start_date_from and filters.start_date_from.isoformat(),
+                filters.start_date_to and filters.start_date_to.isoformat(),
+                filters.fruit_origin_id,
+                filters.status,
+            ]
+        ).encode()
+        return hashlib.sha1(raw).hexdigest()[:12]
+
+    @classmethod
+    def encode_list_cursor(
+        cls, winery_id: int, filters: FermentationListFilter, position: ListPosition
+    ) -> str:
+        start_date, row_id = position
+        payload = {
+            "v": LIST_CURSOR_VERSION,
+            "w": winery_id,
+            "f": cls._filter_fingerprint(filters),
+            "p": [start_date.isoformat(), row_id],
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode_list_cursor(
+        cls, cursor: str, winery_id: int, filters: FermentationListFilter
+    ) -> ListPosition:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            if payload["v"] != LIST_CURSOR_VERSION:
+                raise ValueError("unsupported cursor version")
+            start_date, row_id = payload["p"]
+            position = (datetime.fromisoformat(start_date), int(row_id))
+            cursor_winery, fingerprint = payload["w"], payload["f"]
+        except (binascii.Error, UnicodeDecodeError, KeyError, TypeError, ValueError):
+            raise InvalidPageCursor("Malformed page cursor, restart from the first page")
+        if cursor_winery != winery_id:
+            raise InvalidPageCursor("Page cursor was issued for another winery")
+        if fingerprint != cls._filter_fingerprint(filters):
+            raise InvalidPageCursor("Page cursor was issued for different filters")
+        return position
+
     async def update_fermentation(
         self,
         fermentation_id: int,
@@ -348,6 +466,7 @@ class FermentationService(IFermentationService):
         Raises:
             NotFoundError: If fermentation not found or wrong winery
             ValueError: If update data is invalid
+            BusinessRuleViolation: If start_date would move past a recorded sample
             RepositoryError: If database operation fails
 
         Business Logic:
@@ -399,6 +518,12 @@ class FermentationService(IFermentationService):
             fermentation.vintage_year = data.vintage_year
 
         if data.start_date is not None:
+            start_date = data.start_date
+            if start_date.tzinfo is not None:
+                # start_date and recorded_at are stored as naive UTC
+                start_date = start_date.astimezone(timezone.utc).replace(tzinfo=None)
+            if start_date > fermentation.start_date:
+                await self._check_no_sample_before(fermentation_id, start_date)
             fermentation.start_date = data.start_date
 
         # Note: Repository doesn't have update method yet,
@@ -410,6 +535,26 @@ class FermentationService(IFermentationService):
         # In production, repository should have explicit update method
         return fermentation
 
+    async def _check_no_sample_before(
+        self, fermentation_id: int, start_date: datetime
+    ) -> None:
+        """
+        Reject a later start_date that would leave samples before the start.
+
+        Sample reads bound recorded_at by start_date (partition pruning), so
+        such samples would silently disappear from every timeline.
+        """
+        if self._sample_repo is None:
+            raise BusinessRuleViolation(
+                "start_date can only be moved later when samples can be checked"
+            )
+        earliest = await self._sample_repo.get_earliest_recorded_at(fermentation_id)
+        if earliest is not None and earliest < start_date:
+            raise BusinessRuleViolation(
+                f"start_date {start_date.isoformat()} is after the earliest sample "
+                f"of fermentation {fermentation_id} ({earliest.isoformat()})"
+            )
+
     async def update_status(
         self, fermentation_id: int, winery_id: int, new_status: str, user_id: int
     ) -> bool:
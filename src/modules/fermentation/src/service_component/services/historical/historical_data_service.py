@@ -23,7 +23,7 @@ Related ADRs:
 
 import warnings
 from typing import List, Optional, Dict, Any, Tuple
-from datetime import date, datetime
+from datetime import date
 from statistics import mean
 
 # ADR-027: Structured logging
@@ -35,6 +35,7 @@ from src.modules.fermentation.src.domain.repositories.fermentation_repository_in
 from src.modules.fermentation.src.domain.repositories.sample_repository_interface import (
     ISampleRepository,
 )
+from src.modules.fermentation.src.domain.dtos import FermentationListFilter
 from src.modules.fermentation.src.domain.entities.fermentation import Fermentation
 from src.modules.fermentation.src.domain.entities.samples.base_sample import BaseSample
 from src.modules.fermentation.src.service_component.errors import NotFoundError
@@ -117,9 +118,7 @@ class HistoricalDataService:
             RepositoryError: If database query fails
 
         Note:
-            Current repository interface only supports data_source filtering.
-            Additional filters (date_range, fruit_origin, status) will be applied in-memory.
-            TODO: Update IFermentationRepository to support advanced filtering.
+            Filters and pagination run in the repository query.
         """
         logger.info(
             "get_historical_fermentations",
@@ -129,55 +128,19 @@ class HistoricalDataService:
             offset=offset,
         )
 
-        # Use list_by_data_source which is the correct method
-        fermentations = await self._fermentation_repo.list_by_data_source(
-            winery_id=winery_id, data_source="HISTORICAL", include_deleted=False
+        fermentations = await self._fermentation_repo.list_page_by_data_source(
+            winery_id=winery_id,
+            filters=FermentationListFilter(
+                data_source="HISTORICAL",
+                start_date_from=filters.get("start_date_from"),
+                start_date_to=filters.get("start_date_to"),
+                fruit_origin_id=filters.get("fruit_origin_id"),
+                status=filters.get("status"),
+            ),
+            limit=limit,
+            offset=offset,
         )
 
-        # Apply additional filters in-memory (TODO: push to repository layer)
-        if "start_date_from" in filters:
-            start_date_from = filters["start_date_from"]
-            # Always compare dates (not datetimes)
-            fermentations = [
-                f
-                for f in fermentations
-                if f.start_date
-                and (
-                    f.start_date.date()
-                    if isinstance(f.start_date, datetime)
-                    else f.start_date
-                )
-                >= start_date_from
-            ]
-
-        if "start_date_to" in filters:
-            start_date_to = filters["start_date_to"]
-            # Always compare dates (not datetimes)
-            fermentations = [
-                f
-                for f in fermentations
-                if f.start_date
-                and (
-                    f.start_date.date()
-                    if isinstance(f.start_date, datetime)
-                    else f.start_date
-                )
-                <= start_date_to
-            ]
-        if "fruit_origin_id" in filters:
-            fermentations = [
-                f
-                for f in fermentations
-                if f.fruit_origin_id == filters["fruit_origin_id"]
-            ]
-        if "status" in filters:
-            fermentations = [f for f in fermentations if f.status == filters["status"]]
-
-        # Apply pagination
-        start_idx = offset
-        end_idx = offset + limit
-        fermentations = fermentations[start_idx:end_idx]
-
         logger.info(
             "get_historical_fermentations_result",
             winery_id=winery_id,
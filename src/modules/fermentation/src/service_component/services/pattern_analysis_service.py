@@ -30,6 +30,9 @@ from src.modules.fermentation.src.domain.repositories.fermentation_repository_in
 from src.modules.fermentation.src.domain.repositories.sample_repository_interface import (
     ISampleRepository,
 )
+from src.modules.fermentation.src.domain.repositories.fermentation_archive_store_interface import (
+    IFermentationArchiveStore,
+)
 
 logger = get_logger(__name__)
 
@@ -52,7 +55,10 @@ class PatternAnalysisService(IPatternAnalysisService):
     """
 
     def __init__(
-        self, fermentation_repo: IFermentationRepository, sample_repo: ISampleRepository
+        self,
+        fermentation_repo: IFermentationRepository,
+        sample_repo: ISampleRepository,
+        archive_store: Optional[IFermentationArchiveStore] = None,
     ):
         """
         Initialize service with repository dependencies.
@@ -60,9 +66,11 @@ class PatternAnalysisService(IPatternAnalysisService):
         Args:
             fermentation_repo: Repository for fermentation data access
             sample_repo: Repository for sample data access
+            archive_store: Cold storage of archived fermentations' samples
         """
         self._fermentation_repo = fermentation_repo
         self._sample_repo = sample_repo
+        self._archive_store = archive_store
 
     async def extract_patterns(
         self,
@@ -113,8 +121,8 @@ class PatternAnalysisService(IPatternAnalysisService):
             )
         else:
             # Get all fermentations for winery
-            fermentations = await self._fermentation_repo.list_by_winery(
-                winery_id=winery_id, include_deleted=False
+            fermentations = await self._fermentation_repo.get_by_winery(
+                winery_id=winery_id, include_completed=True, include_deleted=False
             )
 
         # Apply additional filters in-memory (TODO: push to repository layer)
@@ -186,7 +194,7 @@ class PatternAnalysisService(IPatternAnalysisService):
                 stuck_count += 1
 
             # Get samples to calculate duration and final values
-            samples = await self._sample_repo.get_samples_by_fermentation_id(ferm.id)
+            samples = await self._samples_of(ferm)
 
             # Filter by data_source if specified
             if data_source:
@@ -253,3 +261,14 @@ class PatternAnalysisService(IPatternAnalysisService):
         )
 
         return pattern
+
+    async def _samples_of(self, fermentation):
+        """Samples of a fermentation, from cold storage once it is archived."""
+        if (
+            self._archive_store is not None
+            and getattr(fermentation, "archived_at", None) is not None
+        ):
+            return await self._archive_store.read_samples(
+                winery_id=fermentation.winery_id, fermentation_id=fermentation.id
+            )
+        return await self._sample_repo.get_samples_by_fermentation_id(fermentation.id)
@@ -14,8 +14,8 @@ Performance Target: <100ms per calculation
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
 from src.modules.fermentation.src.domain.entities.protocol_protocol import (
@@ -126,6 +126,291 @@ UNJUSTIFIED_SKIP_REASONS = {
 }
 
 
+_JUSTIFIED_SKIP_VALUES = frozenset(r.value for r in JUSTIFIED_SKIP_REASONS)
+
+
+def _step_type_value(step: ProtocolStep) -> str:
+    """Step type as its string value (steps loaded from the database hold the value)."""
+    return getattr(step.step_type, "value", step.step_type)
+
+
+# ============================================================================
+# Per-Execution Evaluation
+# ============================================================================
+
+
+@dataclass
+class StepCompletionIndex:
+    """Completion records of one step; repeatable steps can have several."""
+
+    first: StepCompletion
+    latest: StepCompletion
+    first_skip: Optional[StepCompletion] = None
+    done: bool = False  # any record that is not a skip
+    credited: bool = False  # done, or skipped for a justified reason
+
+    def add(self, completion: StepCompletion) -> None:
+        self.latest = completion
+        if completion.was_skipped:
+            if self.first_skip is None:
+                self.first_skip = completion
+            if completion.skip_reason in _JUSTIFIED_SKIP_VALUES:
+                self.credited = True
+        else:
+            self.done = self.credited = True
+
+
+@dataclass
+class ExecutionEvaluation:
+    """
+    Everything derived from an execution's steps and completions.
+
+    Completions are indexed by step_id once; one pass over the steps then
+    yields the completion and timing scores, the critical completion
+    percentage, deviations and overdue steps. Built by ``evaluate()``.
+    """
+
+    completion: WeightedCompletionScore
+    timing: TimingScore
+    critical_steps_completion_pct: float  # 0-100
+    deviations: List[StepDeviation]
+    overdue_steps: List[Dict]
+    step_count: int
+    completed_records: int  # non-skipped completion records
+    skipped_records: int
+    by_step: Dict[int, StepCompletionIndex] = field(default_factory=dict)
+
+    @classmethod
+    def evaluate(
+        cls,
+        steps: Sequence[ProtocolStep],
+        completions: Sequence[StepCompletion],
+        start_date: datetime,
+        now: datetime,
+    ) -> "ExecutionEvaluation":
+        # Index completions by step, counting records for the timing score
+        by_step: Dict[int, StepCompletionIndex] = {}
+        completed_records = on_time_records = skipped_records = 0
+        for c in completions:
+            entry = by_step.get(c.step_id)
+            if entry is None:
+                entry = by_step[c.step_id] = StepCompletionIndex(first=c, latest=c)
+            entry.add(c)
+            if c.was_skipped:
+                skipped_records += 1
+            else:
+                completed_records += 1
+                if c.is_on_schedule:
+                    on_time_records += 1
+
+        start_day = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        breakdown: List[StepCompletionBreakdown] = []
+        deviations: List[StepDeviation] = []
+        overdue_steps: List[Dict] = []
+        total_earned = total_possible = 0.0
+        completed_count = skipped_count = 0
+        critical_count = critical_done = 0
+
+        for step in steps:
+            entry = by_step.get(step.id)
+
+            # Points: the latest record counts
+            points = _step_completion_points(step, entry.latest if entry else None)
+            breakdown.append(points)
+            total_earned += points.earned_points
+            total_possible += points.possible_points
+            if entry:
+                if entry.latest.was_skipped:
+                    skipped_count += 1
+                else:
+                    completed_count += 1
+
+            if step.is_critical:
+                critical_count += 1
+                if entry and entry.done:
+                    critical_done += 1
+                if not (entry and entry.credited):
+                    deviations.append(_critical_step_deviation(step, entry))
+
+            # Lateness: the first record counts
+            if entry and not entry.first.was_skipped and not entry.first.is_on_schedule:
+                deviations.append(_late_step_deviation(step, entry.first))
+
+            if entry is None:
+                expected_date = start_day + timedelta(days=step.expected_day)
+                if now > expected_date:
+                    overdue_steps.append(
+                        {
+                            "step_id": step.id,
+                            "step_type": _step_type_value(step),
+                            "description": step.description,
+                            "expected_date": expected_date,
+                            "days_overdue": (now - expected_date).days,
+                            "is_critical": step.is_critical,
+                        }
+                    )
+
+        score = (total_earned / total_possible) * 100 if total_possible else 0
+        completion = WeightedCompletionScore(
+            score=round(score, 2),
+            step_breakdown=breakdown,
+            total_earned=round(total_earned, 2),
+            total_possible=round(total_possible, 2),
+            completed_count=completed_count,
+            skipped_count=skipped_count,
+            pending_count=len(steps) - completed_count - skipped_count,
+        )
+        timing = TimingScore(
+            # No completed steps = no timing issues yet
+            score=(
+                round(on_time_records / completed_records * 100, 2)
+                if completed_records
+                else 100
+            ),
+            on_time_count=on_time_records,
+            late_count=completed_records - on_time_records,
+            total_completed=completed_records,
+        )
+        critical_pct = (
+            critical_done / critical_count * 100 if critical_count else 100.0
+        )
+
+        return cls(
+            completion=completion,
+            timing=timing,
+            critical_steps_completion_pct=critical_pct,
+            deviations=deviations,
+            overdue_steps=overdue_steps,
+            step_count=len(steps),
+            completed_records=completed_records,
+            skipped_records=skipped_records,
+            by_step=by_step,
+        )
+
+
+def _critical_step_deviation(
+    step: ProtocolStep, entry: Optional[StepCompletionIndex]
+) -> StepDeviation:
+    """Deviation for a critical step that is neither done nor justifiably skipped."""
+    skip_record = entry.first_skip if entry else None
+    if skip_record is not None:
+        return StepDeviation(
+            step_id=step.id,
+            step_type=_step_type_value(step),
+            description=step.description,
+            deviation_type="UNJUSTIFIED_SKIP",
+            severity="CRITICAL",
+            details=f"Critical step skipped without justification: {skip_record.skip_reason}",
+        )
+    return StepDeviation(
+        step_id=step.id,
+        step_type=_step_type_value(step),
+        description=step.description,
+        deviation_type="MISSING",
+        severity="CRITICAL",
+        details="Critical step not completed",
+    )
+
+
+def _late_step_deviation(step: ProtocolStep, completion: StepCompletion) -> StepDeviation:
+    return StepDeviation(
+        step_id=step.id,
+        step_type=_step_type_value(step),
+        description=step.description,
+        deviation_type="LATE",
+        severity="HIGH" if completion.days_late > 2 else "MEDIUM",
+        details=f"Step completed {completion.days_late} days late",
+    )
+
+
+def _step_completion_points(
+    step: ProtocolStep,
+    completion: Optional[StepCompletion],
+) -> StepCompletionBreakdown:
+    """
+    Points earned for a single step.
+
+    - Base points: 100 × (criticality_score / 100)
+    - Completed on-time: 100% of points
+    - Completed late (within tolerance): 90% of points
+    - Completed late (1+ days): 75% of points
+    - Completed late (2+ days): 50% of points
+    - Justified skip: 60% of points
+    - Unjustified skip: 0% of points
+    - Not completed: 0% of points
+    """
+    # Base points from criticality
+    criticality_multiplier = step.criticality_score / 100.0
+    possible_points = 100 * criticality_multiplier
+
+    # Step not completed
+    if completion is None:
+        return StepCompletionBreakdown(
+            step_id=step.id,
+            step_type=_step_type_value(step),
+            earned_points=0,
+            possible_points=possible_points,
+            notes="Step not completed",
+            was_skipped=False,
+        )
+
+    # Step was skipped
+    if completion.was_skipped:
+        skip_reason = SkipReason(completion.skip_reason)
+        if skip_reason in JUSTIFIED_SKIP_REASONS:
+            earned = possible_points * 0.60
+            return StepCompletionBreakdown(
+                step_id=step.id,
+                step_type=_step_type_value(step),
+                earned_points=earned,
+                possible_points=possible_points,
+                notes=f"Justifiably skipped ({skip_reason.value}): 60% credit",
+                was_skipped=True,
+            )
+        else:
+            return StepCompletionBreakdown(
+                step_id=step.id,
+                step_type=_step_type_value(step),
+                earned_points=0,
+                possible_points=possible_points,
+                notes=f"Skipped without justification ({skip_reason.value})",
+                was_skipped=True,
+            )
+
+    # Step was completed
+    earned_points = possible_points
+
+    # Apply timing penalty
+    if not completion.is_on_schedule:
+        days_late = completion.days_late or 0
+        tolerance_days = (step.tolerance_hours or 0) / 24.0
+
+        if days_late <= tolerance_days:
+            # Slightly late but within extended tolerance: 10% penalty
+            timing_penalty = possible_points * 0.10
+        elif days_late <= (tolerance_days + 1):
+            # 1 day past tolerance: 25% penalty
+            timing_penalty = possible_points * 0.25
+        else:
+            # 2+ days late: 50% penalty
+            timing_penalty = min(possible_points * 0.50, possible_points)
+
+        earned_points -= timing_penalty
+
+    earned_points = max(earned_points, 0)
+
+    return StepCompletionBreakdown(
+        step_id=step.id,
+        step_type=_step_type_value(step),
+        earned_points=earned_points,
+        possible_points=possible_points,
+        completed_at=completion.completed_at,
+        days_late=completion.days_late or 0,
+        notes=f"On-time: {completion.is_on_schedule}; Days late: {completion.days_late or 0}",
+        was_skipped=False,
+    )
+
+
 # ============================================================================
 # Protocol Compliance Service
 # ============================================================================
@@ -187,29 +472,27 @@ class ProtocolComplianceService:
         if not execution:
             raise ValueError(f"ProtocolExecution {execution_id} not found")
 
-        protocol = execution.protocol
-        if not protocol:
+        if not execution.protocol:
             raise ValueError(
                 f"ProtocolExecution {execution_id} has no protocol assigned"
             )
 
-        # Step 1: Calculate weighted completion score
-        completion_score_data = await self._calculate_weighted_completion_score(
-            protocol, execution
-        )
+        evaluation = await self._evaluate(execution)
+        return self._compliance_score(evaluation)
 
-        # Step 2: Calculate timing score
-        timing_score_data = await self._calculate_timing_score(execution)
+    @staticmethod
+    def _compliance_score(evaluation: ExecutionEvaluation) -> ComplianceScoreResult:
+        """Combine an evaluation's scores into the final compliance score."""
+        completion_score_data = evaluation.completion
+        timing_score_data = evaluation.timing
 
-        # Step 3: Combine into final score
+        # Combine into final score
         final_score = (completion_score_data.score * 0.70) + (
             timing_score_data.score * 0.30
         )
 
-        # Step 4: Apply critical steps adjustments
-        critical_steps_completion_pct = await self._calculate_critical_completion_pct(
-            protocol, execution
-        )
+        # Apply critical steps adjustments
+        critical_steps_completion_pct = evaluation.critical_steps_completion_pct
 
         # Adjust for critical step completion
         if critical_steps_completion_pct == 100:
@@ -399,75 +682,11 @@ class ProtocolComplianceService:
         if not execution:
             raise ValueError(f"ProtocolExecution {execution_id} not found")
 
-        protocol = execution.protocol
-        if not protocol:
+        if not execution.protocol:
             raise ValueError(f"Execution {execution_id} has no protocol")
 
-        deviations: List[StepDeviation] = []
-
-        # Get all completions for this execution
-        completions = await self.completion_repo.get_by_execution(execution_id)
-        completed_step_ids = {
-            c.step_id
-            for c in completions
-            if not c.was_skipped
-            or c.skip_reason in [r.value for r in JUSTIFIED_SKIP_REASONS]
-        }
-
-        for step in protocol.steps:
-            # Check if critical step is missing
-            if step.is_critical and step.id not in completed_step_ids:
-                # Check if it's an unjustified skip
-                skip_record = next(
-                    (c for c in completions if c.step_id == step.id and c.was_skipped),
-                    None,
-                )
-                if skip_record:
-                    if skip_record.skip_reason not in [
-                        r.value for r in JUSTIFIED_SKIP_REASONS
-                    ]:
-                        deviations.append(
-                            StepDeviation(
-                                step_id=step.id,
-                                step_type=step.step_type.value,
-                                description=step.description,
-                                deviation_type="UNJUSTIFIED_SKIP",
-                                severity="CRITICAL",
-                                details=f"Critical step skipped without justification: {skip_record.skip_reason}",
-                            )
-                        )
-                else:
-                    deviations.append(
-                        StepDeviation(
-                            step_id=step.id,
-                            step_type=step.step_type.value,
-                            description=step.description,
-                            deviation_type="MISSING",
-                            severity="CRITICAL",
-                            details="Critical step not completed",
-                        )
-                    )
-
-            # Check if step was late
-            completion = next((c for c in completions if c.step_id == step.id), None)
-            if (
-                completion
-                and not completion.was_skipped
-                and not completion.is_on_schedule
-            ):
-                severity = "HIGH" if completion.days_late > 2 else "MEDIUM"
-                deviations.append(
-                    StepDeviation(
-                        step_id=step.id,
-                        step_type=step.step_type.value,
-                        description=step.description,
-                        deviation_type="LATE",
-                        severity=severity,
-                        details=f"Step completed {completion.days_late} days late",
-                    )
-                )
-
-        return deviations
+        evaluation = await self._evaluate(execution)
+        return evaluation.deviations
 
     # ========================================================================
     # Execution Status Tracking
@@ -497,17 +716,18 @@ class ProtocolComplianceService:
         if not execution:
             raise ValueError(f"ProtocolExecution {execution_id} not found")
 
-        # Calculate current compliance score
-        score_result = await self.calculate_compliance_score(execution_id)
-
-        # Get completions
-        completions = await self.completion_repo.get_by_execution(execution_id)
-        completed_count = sum(1 for c in completions if not c.was_skipped)
-        skipped_count = sum(1 for c in completions if c.was_skipped)
-        pending_count = len(execution.protocol.steps) - completed_count - skipped_count
+        if not execution.protocol:
+            raise ValueError(
+                f"ProtocolExecution {execution_id} has no protocol assigned"
+            )
 
-        # Detect deviations
-        deviations = await self.detect_deviations(execution_id)
+        # Score, progress and deviations all come from one evaluation
+        evaluation = await self._evaluate(execution)
+        score_result = self._compliance_score(evaluation)
+        completed_count = evaluation.completed_records
+        skipped_count = evaluation.skipped_records
+        pending_count = evaluation.step_count - completed_count - skipped_count
+        deviations = evaluation.deviations
 
         return {
             "execution_id": execution_id,
@@ -522,7 +742,7 @@ class ProtocolComplianceService:
                 "completed": completed_count,
                 "skipped": skipped_count,
                 "pending": pending_count,
-                "total": len(execution.protocol.steps),
+                "total": evaluation.step_count,
             },
             "deviations": [
                 {
@@ -552,233 +772,23 @@ class ProtocolComplianceService:
         if not execution:
             raise ValueError(f"ProtocolExecution {execution_id} not found")
 
-        protocol = execution.protocol
-        completions = await self.completion_repo.get_by_execution(execution_id)
-        completed_step_ids = {c.step_id for c in completions}
-
-        overdue_steps = []
-        now = datetime.utcnow()
-
-        for step in protocol.steps:
-            # Skip if already completed
-            if step.id in completed_step_ids:
-                continue
-
-            # Calculate expected completion date
-            expected_date = execution.start_date.replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-            expected_date = expected_date + timedelta(days=step.expected_day)
-
-            # Check if overdue
-            if now > expected_date:
-                days_overdue = (now - expected_date).days
-                overdue_steps.append(
-                    {
-                        "step_id": step.id,
-                        "step_type": step.step_type.value,
-                        "description": step.description,
-                        "expected_date": expected_date,
-                        "days_overdue": days_overdue,
-                        "is_critical": step.is_critical,
-                    }
-                )
-
-        return overdue_steps
+        evaluation = await self._evaluate(execution)
+        return evaluation.overdue_steps
 
     # ========================================================================
     # Private Helper Methods
     # ========================================================================
 
-    async def _calculate_weighted_completion_score(
-        self,
-        protocol: FermentationProtocol,
-        execution: ProtocolExecution,
-    ) -> WeightedCompletionScore:
-        """
-        Calculate weighted completion score (0-100).
-
-        For each step:
-        - Base points: 100 × (criticality_score / 100)
-        - Completed on-time: 100% of points
-        - Completed late (within tolerance): 90% of points
-        - Completed late (1+ days): 75% of points
-        - Completed late (2+ days): 50% of points
-        - Justified skip: 60% of points
-        - Unjustified skip: 0% of points
-        - Not completed: 0% of points
-        """
-        step_results = []
-        total_earned = 0.0
-        total_possible = 0.0
-        completed_count = 0
-        skipped_count = 0
-
-        # Get all completions for this execution
-        completions = await self.completion_repo.get_by_execution(execution.id)
-        completion_map = {c.step_id: c for c in completions}
-
-        for step in protocol.steps:
-            completion = completion_map.get(step.id)
-            result = await self._calculate_step_completion_points(step, completion)
-
-            step_results.append(result)
-            total_earned += result.earned_points
-            total_possible += result.possible_points
-
-            if completion:
-                if completion.was_skipped:
-                    skipped_count += 1
-                else:
-                    completed_count += 1
-
-        pending_count = len(protocol.steps) - completed_count - skipped_count
-
-        # Calculate final score
-        if total_possible == 0:
-            score = 0
-        else:
-            score = (total_earned / total_possible) * 100
-
-        return WeightedCompletionScore(
-            score=round(score, 2),
-            step_breakdown=step_results,
-            total_earned=round(total_earned, 2),
-            total_possible=round(total_possible, 2),
-            completed_count=completed_count,
-            skipped_count=skipped_count,
-            pending_count=pending_count,
-        )
-
-    async def _calculate_step_completion_points(
-        self,
-        step: ProtocolStep,
-        completion: Optional[StepCompletion],
-    ) -> StepCompletionBreakdown:
-        """Calculate points earned for a single step."""
-        # Base points from criticality
-        criticality_multiplier = step.criticality_score / 100.0
-        possible_points = 100 * criticality_multiplier
-
-        # Step not completed
-        if completion is None:
-            return StepCompletionBreakdown(
-                step_id=step.id,
-                step_type=step.step_type.value,
-                earned_points=0,
-                possible_points=possible_points,
-                notes="Step not completed",
-                was_skipped=False,
-            )
-
-        # Step was skipped
-        if completion.was_skipped:
-            skip_reason = SkipReason(completion.skip_reason)
-            if skip_reason in JUSTIFIED_SKIP_REASONS:
-                earned = possible_points * 0.60
-                return StepCompletionBreakdown(
-                    step_id=step.id,
-                    step_type=step.step_type.value,
-                    earned_points=earned,
-                    possible_points=possible_points,
-                    notes=f"Justifiably skipped ({skip_reason.value}): 60% credit",
-                    was_skipped=True,
-                )
-            else:
-                return StepCompletionBreakdown(
-                    step_id=step.id,
-                    step_type=step.step_type.value,
-                    earned_points=0,
-                    possible_points=possible_points,
-                    notes=f"Skipped without justification ({skip_reason.value})",
-                    was_skipped=True,
-                )
-
-        # Step was completed
-        earned_points = possible_points
-
-        # Apply timing penalty
-        if not completion.is_on_schedule:
-            days_late = completion.days_late or 0
-            tolerance_days = (step.tolerance_hours or 0) / 24.0
-
-            if days_late <= tolerance_days:
-                # Slightly late but within extended tolerance: 10% penalty
-                timing_penalty = possible_points * 0.10
-            elif days_late <= (tolerance_days + 1):
-                # 1 day past tolerance: 25% penalty
-                timing_penalty = possible_points * 0.25
-            else:
-                # 2+ days late: 50% penalty
-                timing_penalty = min(possible_points * 0.50, possible_points)
-
-            earned_points -= timing_penalty
-
-        earned_points = max(earned_points, 0)
-
-        return StepCompletionBreakdown(
-            step_id=step.id,
-            step_type=step.step_type.value,
-            earned_points=earned_points,
-            possible_points=possible_points,
-            completed_at=completion.completed_at,
-            days_late=completion.days_late or 0,
-            notes=f"On-time: {completion.is_on_schedule}; Days late: {completion.days_late or 0}",
-            was_skipped=False,
-        )
-
-    async def _calculate_timing_score(
-        self,
-        execution: ProtocolExecution,
-    ) -> TimingScore:
-        """
-        Calculate timing score (percentage of on-time completions).
-
-        Only counts non-skipped steps.
-        """
-        completions = await self.completion_repo.get_by_execution(execution.id)
-        non_skipped = [c for c in completions if not c.was_skipped]
-
-        if not non_skipped:
-            return TimingScore(
-                score=100,  # No completed steps = no timing issues yet
-                on_time_count=0,
-                late_count=0,
-                total_completed=0,
-            )
-
-        on_time_count = sum(1 for c in non_skipped if c.is_on_schedule)
-        late_count = len(non_skipped) - on_time_count
-
-        score = (on_time_count / len(non_skipped)) * 100 if non_skipped else 0
-
-        return TimingScore(
-            score=round(score, 2),
-            on_time_count=on_time_count,
-            late_count=late_count,
-            total_completed=len(non_skipped),
-        )
-
-    async def _calculate_critical_completion_pct(
-        self,
-        protocol: FermentationProtocol,
-        execution: ProtocolExecution,
-    ) -> float:
-        """Calculate percentage of critical steps that are completed (not skipped)."""
+    async def _evaluate(self, execution: ProtocolExecution) -> ExecutionEvaluation:
+        """Load the execution's completions once and evaluate them against its steps."""
         completions = await self.completion_repo.get_by_execution(execution.id)
-        critical_steps = [s for s in protocol.steps if s.is_critical]
-
-        if not critical_steps:
-            return 100.0
-
-        completed_critical = sum(
-            1
-            for step in critical_steps
-            if any(c.step_id == step.id and not c.was_skipped for c in completions)
+        return ExecutionEvaluation.evaluate(
+            execution.protocol.steps,
+            completions,
+            start_date=execution.start_date,
+            now=datetime.utcnow(),
         )
 
-        return (completed_critical / len(critical_steps)) * 100
-
     async def _update_execution_compliance_score(self, execution_id: int) -> None:
         """
         Recalculate and persist compliance score for an execution.
@@ -10,9 +10,11 @@ Provides high-level protocol operations:
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
+from sqlalchemy.orm.attributes import set_committed_value
+
 from src.modules.fermentation.src.domain.entities.protocol_protocol import (
     FermentationProtocol,
 )
@@ -35,6 +37,21 @@ from src.modules.fermentation.src.service_component.services.protocol_compliance
     ProtocolComplianceService,
 )
 
+# Step columns copied when a protocol is cloned or instantiated; IDs,
+# protocol_id and depends_on_step_id are assigned for each copy
+_COPIED_STEP_FIELDS = (
+    "step_order",
+    "step_type",
+    "description",
+    "expected_day",
+    "tolerance_hours",
+    "duration_minutes",
+    "is_critical",
+    "criticality_score",
+    "can_repeat_daily",
+    "notes",
+)
+
 # ============================================================================
 # Data Models
 # ============================================================================
@@ -711,29 +728,51 @@ class ProtocolService:
         await self.protocol_repo.create(cloned)
         await self.protocol_repo.session.flush()
 
-        # Deep-copy all steps (preserve order; drop IDs and dependency links
-        # that reference old step IDs to avoid FK violations)
         source_steps = await self.step_repo.get_by_protocol(source_protocol_id)
-        for s in sorted(source_steps, key=lambda x: x.step_order):
-            new_step = ProtocolStep(
-                protocol_id=cloned.id,
-                step_order=s.step_order,
-                step_type=s.step_type,
-                description=s.description,
-                expected_day=s.expected_day,
-                tolerance_hours=s.tolerance_hours,
-                duration_minutes=s.duration_minutes,
-                is_critical=s.is_critical,
-                criticality_score=s.criticality_score,
-                can_repeat_daily=s.can_repeat_daily,
-                notes=s.notes,
-                depends_on_step_id=None,  # Reset cross-step deps (old IDs invalid)
-            )
-            await self.step_repo.create(new_step)
+        await self._copy_steps(source_steps, [cloned])
 
         await self.protocol_repo.session.commit()
         return cloned
 
+    async def _copy_steps(
+        self,
+        source_steps: Sequence[ProtocolStep],
+        protocols: Sequence[FermentationProtocol],
+    ) -> None:
+        """
+        Deep-copy steps into each of the given (flushed) protocols.
+
+        All copies are inserted with one multi-row INSERT, then dependency
+        links are remapped from source step IDs to the new step IDs of the
+        same copy and written with one executemany UPDATE. The copies are
+        attached to ``protocol.steps`` without another round-trip.
+        """
+        ordered = sorted(source_steps, key=lambda x: x.step_order)
+        rows = [
+            {
+                **{field: getattr(step, field) for field in _COPIED_STEP_FIELDS},
+                "protocol_id": protocol.id,
+                # Remapped below; source IDs would point into the old protocol
+                "depends_on_step_id": None,
+            }
+            for protocol in protocols
+            for step in ordered
+        ]
+        created = await self.step_repo.bulk_create(rows)
+
+        dependencies: Dict[int, int] = {}
+        for index, protocol in enumerate(protocols):
+            copies = created[index * len(ordered) : (index + 1) * len(ordered)]
+            new_ids = {old.id: new.id for old, new in zip(ordered, copies)}
+            for old, new in zip(ordered, copies):
+                depends_on = new_ids.get(old.depends_on_step_id)
+                if depends_on is not None:
+                    dependencies[new.id] = depends_on
+                    set_committed_value(new, "depends_on_step_id", depends_on)
+            set_committed_value(protocol, "steps", list(copies))
+
+        await self.step_repo.bulk_set_dependencies(dependencies)
+
     async def add_custom_step(
         self,
         protocol_id: int,
@@ -1088,8 +1127,44 @@ class ProtocolService:
         Raises:
             ValueError: If template not found, not in FINAL state, or not a template
         """
+        instances = await self.instantiate_from_template_bulk(
+            template_id, winery_id, [fermentation_batch_name], created_by_user_id
+        )
+        return instances[0]
+
+    async def instantiate_from_template_bulk(
+        self,
+        template_id: int,
+        winery_id: int,
+        fermentation_batch_names: Sequence[str],
+        created_by_user_id: int,
+    ) -> List[FermentationProtocol]:
+        """
+        Create one protocol instance of a FINAL master template per fermentation.
+
+        Used when a harvest starts many fermentations at once. All instances
+        are inserted with one statement and all their steps with another,
+        dependency links are remapped to each instance's own steps, and
+        everything is committed in a single transaction.
+
+        Args:
+            template_id: ID of the FINAL master template to copy
+            winery_id: Owning winery (access control)
+            fermentation_batch_names: Fermentation batch names, one instance each
+            created_by_user_id: User creating the instances
+
+        Returns:
+            Newly created instances, in the order of ``fermentation_batch_names``
+
+        Raises:
+            ValueError: If no batch names are given, or the template is not found,
+                        not in FINAL state, or not a template
+        """
         from src.modules.fermentation.src.domain.enums.step_type import ProtocolState
 
+        if not fermentation_batch_names:
+            raise ValueError("At least one fermentation batch name is required")
+
         template = await self.get_protocol(template_id, winery_id)
 
         if not template.is_template:
@@ -1102,46 +1177,30 @@ class ProtocolService:
                 f"Current state: {template.state}"
             )
 
-        instance_name = (
-            f"{template.varietal_name} v{template.version} — {fermentation_batch_name}"
-        )
-
-        instance = FermentationProtocol(
-            winery_id=winery_id,
-            created_by_user_id=created_by_user_id,
-            varietal_code=template.varietal_code,
-            varietal_name=template.varietal_name,
-            color=template.color,
-            protocol_name=instance_name,
-            version=template.version,
-            description=template.description,
-            expected_duration_days=template.expected_duration_days,
-            is_active=True,
-            is_template=False,
-            state=ProtocolState.FINAL,
-            template_id=template.id,
-        )
-        await self.protocol_repo.create(instance)
-        await self.protocol_repo.session.flush()
+        rows: List[Dict[str, Any]] = [
+            {
+                "winery_id": winery_id,
+                "created_by_user_id": created_by_user_id,
+                "varietal_code": template.varietal_code,
+                "varietal_name": template.varietal_name,
+                "color": template.color,
+                "protocol_name": (
+                    f"{template.varietal_name} v{template.version} — {batch_name}"
+                ),
+                "version": template.version,
+                "description": template.description,
+                "expected_duration_days": template.expected_duration_days,
+                "is_active": True,
+                "is_template": False,
+                "state": ProtocolState.FINAL,
+                "template_id": template.id,
+            }
+            for batch_name in fermentation_batch_names
+        ]
+        instances = await self.protocol_repo.bulk_create(rows)
 
-        # Deep-copy all steps (reset dependency IDs to avoid FK violations)
         source_steps = await self.step_repo.get_by_protocol(template_id)
-        for s in sorted(source_steps, key=lambda x: x.step_order):
-            new_step = ProtocolStep(
-                protocol_id=instance.id,
-                step_order=s.step_order,
-                step_type=s.step_type,
-                description=s.description,
-                expected_day=s.expected_day,
-                tolerance_hours=s.tolerance_hours,
-                duration_minutes=s.duration_minutes,
-                is_critical=s.is_critical,
-                criticality_score=s.criticality_score,
-                can_repeat_daily=s.can_repeat_daily,
-                notes=s.notes,
-                depends_on_step_id=None,
-            )
-            await self.step_repo.create(new_step)
+        await self._copy_steps(source_steps, instances)
 
         await self.protocol_repo.session.commit()
-        return instance
+        return instances
@@ -12,16 +12,18 @@ All 6 methods implemented via Test-Driven Development (TDD):
 - get_latest_sample: ✅ Complete (5 tests)
 - get_samples_in_timerange: ✅ Complete (5 tests)
 - validate_sample_data: ✅ Complete (3 tests)
+- add_samples_batch: batch ingestion (set-based validation, one multi-row write)
 
 Test Coverage: 27/27 tests passing (25 service + 2 interface compliance)
 Production Ready: Yes
 """
 
-from typing import Optional, List
-from datetime import datetime
+from typing import Dict, Optional, List
+from datetime import datetime, timezone
 
 # ADR-027: Structured logging
 from src.shared.wine_fermentator_logging import get_logger, LogTimer
+from src.shared.infra.events import EventBus, get_event_bus
 
 from src.modules.fermentation.src.service_component.interfaces.sample_service_interface import (
     ISampleService,
@@ -35,15 +37,28 @@ from src.modules.fermentation.src.domain.repositories.sample_repository_interfac
 from src.modules.fermentation.src.domain.repositories.fermentation_repository_interface import (
     IFermentationRepository,
 )
+from src.modules.fermentation.src.domain.repositories.fermentation_archive_store_interface import (
+    IFermentationArchiveStore,
+)
 from src.modules.fermentation.src.domain.entities.samples.base_sample import BaseSample
-from src.modules.fermentation.src.domain.dtos.sample_dtos import SampleCreate
+from src.modules.fermentation.src.domain.dtos.sample_dtos import (
+    SampleCreate,
+    SampleBatchItem,
+    SampleBatchItemResult,
+)
 from src.modules.fermentation.src.domain.enums.sample_type import SampleType
+from src.modules.fermentation.src.service_component.models.schemas.validations.validation_error import (
+    ValidationError as ValidationErrorModel,
+)
 from src.modules.fermentation.src.service_component.models.schemas.validations.validation_result import (
     ValidationResult,
 )
 
 logger = get_logger(__name__)
 
+# Upper bound for one add_samples_batch call (keeps the INSERT and response bounded)
+MAX_SAMPLE_BATCH_SIZE = 500
+
 
 class SampleService(ISampleService):
     """
@@ -67,6 +82,8 @@ class SampleService(ISampleService):
         sample_repo: ISampleRepository,
         validation_orchestrator: IValidationOrchestrator,
         fermentation_repo: IFermentationRepository,
+        event_bus: Optional[EventBus] = None,
+        archive_store: Optional[IFermentationArchiveStore] = None,
     ):
         """
         Initialize service with dependencies (Dependency Injection).
@@ -75,10 +92,14 @@ class SampleService(ISampleService):
             sample_repo: Repository for sample data access
             validation_orchestrator: Orchestrator for sample validation
             fermentation_repo: Repository for fermentation verification
+            event_bus: Bus for sample.created events (default: process bus)
+            archive_store: Cold storage of archived fermentations' samples
         """
         self._sample_repo = sample_repo
         self._validation_orchestrator = validation_orchestrator
         self._fermentation_repo = fermentation_repo
+        self._event_bus = event_bus or get_event_bus()
+        self._archive_store = archive_store
 
     async def add_sample(
         self, fermentation_id: int, winery_id: int, user_id: int, data: SampleCreate
@@ -88,7 +109,8 @@ class SampleService(ISampleService):
 
         Business logic:
         1. Verifies fermentation exists and belongs to winery
-        2. Verifies fermentation is not COMPLETED
+        2. Verifies fermentation is not COMPLETED and the sample is not
+           recorded before its start_date
         3. Validates sample completely:
            - Chronology validation (timestamp after last sample)
            - Value validation (range correct for sample_type)
@@ -137,7 +159,15 @@ class SampleService(ISampleService):
                 f"Cannot add sample to fermentation {fermentation_id}: status is COMPLETED"
             )
 
-        # Step 3: Create BaseSample entity for validation
+        # Step 3: Reject samples recorded before the fermentation started
+        before_start = self._before_start_error(fermentation, data.recorded_at)
+        if before_start is not None:
+            raise ServiceValidationError(
+                f"Sample validation failed:\n- {before_start.field}: {before_start.message}",
+                errors=[before_start],
+            )
+
+        # Step 3b: Create BaseSample entity for validation
         sample = self._create_sample_entity(
             fermentation_id=fermentation_id, user_id=user_id, data=data
         )
@@ -180,8 +210,189 @@ class SampleService(ISampleService):
                 sample_type=data.sample_type.value,
             )
 
+            self._publish_sample_created(winery_id, created_sample)
             return created_sample
 
+    async def add_samples_batch(
+        self, winery_id: int, user_id: int, items: List[SampleBatchItem]
+    ) -> List[SampleBatchItemResult]:
+        """
+        Adds many samples, possibly across fermentations, in one operation.
+
+        Same rules as add_sample, applied set-wise:
+        1. One ownership query for all distinct fermentations
+        2. Items of missing/foreign or COMPLETED fermentations, and items
+           recorded before their fermentation's start_date, are rejected
+        3. One query prefetches the latest sample per type of every
+           fermentation; the orchestrator validates each fermentation's
+           samples against that window in memory
+        4. Valid samples are persisted with a single multi-row write
+
+        Args:
+            winery_id: Winery ID for access control
+            user_id: ID of user recording samples (audit)
+            items: Samples with their fermentation IDs
+
+        Returns:
+            List[SampleBatchItemResult]: Per-item outcome, in request order
+
+        Raises:
+            ValidationError: If the batch exceeds MAX_SAMPLE_BATCH_SIZE
+            RepositoryError: If database operation fails
+        """
+        from src.modules.fermentation.src.service_component.errors import (
+            ValidationError as ServiceValidationError,
+        )
+        from src.modules.fermentation.src.domain.enums.fermentation_status import (
+            FermentationStatus,
+        )
+
+        if len(items) > MAX_SAMPLE_BATCH_SIZE:
+            raise ServiceValidationError(
+                f"Sample batch too large: {len(items)} items "
+                f"(maximum {MAX_SAMPLE_BATCH_SIZE})"
+            )
+
+        results = [
+            SampleBatchItemResult(index=i, fermentation_id=item.fermentation_id)
+            for i, item in enumerate(items)
+        ]
+        if not items:
+            return results
+
+        with LogTimer(logger, "add_samples_batch_service"):
+            # Step 1: One ownership check for every distinct fermentation
+            fermentation_ids = list(dict.fromkeys(i.fermentation_id for i in items))
+            fermentations = {
+                f.id: f
+                for f in await self._fermentation_repo.get_by_ids(
+                    fermentation_ids=fermentation_ids, winery_id=winery_id
+                )
+            }
+
+            # Step 2: Group acceptable items per fermentation
+            indexes_by_fermentation: Dict[int, List[int]] = {}
+            for result, item in zip(results, items):
+                fermentation = fermentations.get(item.fermentation_id)
+                if fermentation is None:
+                    result.errors.append(
+                        ValidationErrorModel(
+                            field="fermentation_id",
+                            message=f"Fermentation {item.fermentation_id} not found or access denied",
+                            current_value=item.fermentation_id,
+                        )
+                    )
+                elif fermentation.status == FermentationStatus.COMPLETED:
+                    result.errors.append(
+                        ValidationErrorModel(
+                            field="fermentation_id",
+                            message=f"Cannot add sample to fermentation {item.fermentation_id}: status is COMPLETED",
+                            current_value=item.fermentation_id,
+                        )
+                    )
+                else:
+                    before_start = self._before_start_error(
+                        fermentation, item.sample.recorded_at
+                    )
+                    if before_start is not None:
+                        result.errors.append(before_start)
+                        continue
+                    indexes_by_fermentation.setdefault(
+                        item.fermentation_id, []
+                    ).append(result.index)
+
+            # Step 3: Validate against one prefetched window per fermentation
+            windows = (
+                await self._sample_repo.get_latest_samples_by_fermentation_ids(
+                    list(indexes_by_fermentation)
+                )
+                if indexes_by_fermentation
+                else {}
+            )
+            accepted_indexes: List[int] = []
+            accepted_samples: List[BaseSample] = []
+            for fermentation_id, indexes in indexes_by_fermentation.items():
+                samples = [
+                    self._create_sample_entity(
+                        fermentation_id=fermentation_id,
+                        user_id=user_id,
+                        data=items[i].sample,
+                    )
+                    for i in indexes
+                ]
+                validations = (
+                    await self._validation_orchestrator.validate_sample_batch(
+                        fermentation_id=fermentation_id,
+                        samples=samples,
+                        latest_by_type=windows.get(fermentation_id),
+                    )
+                )
+                for i, sample, validation in zip(indexes, samples, validations):
+                    if validation.is_valid:
+                        accepted_indexes.append(i)
+                        accepted_samples.append(sample)
+                    else:
+                        results[i].errors.extend(validation.errors)
+
+            # Step 4: Single multi-row write
+            if accepted_samples:
+                persisted = await self._sample_repo.bulk_upsert_samples(
+                    accepted_samples
+                )
+                for i, sample in zip(accepted_indexes, persisted):
+                    results[i].sample = sample
+                    self._publish_sample_created(winery_id, sample)
+
+            logger.info(
+                "sample_batch_added",
+                winery_id=winery_id,
+                user_id=user_id,
+                item_count=len(items),
+                fermentation_count=len(fermentation_ids),
+                accepted=len(accepted_samples),
+                rejected=len(items) - len(accepted_samples),
+            )
+
+        return results
+
+    def _publish_sample_created(self, winery_id: int, sample: BaseSample) -> None:
+        """Push the new sample to the winery's open event streams."""
+        self._event_bus.publish(
+            winery_id,
+            "sample.created",
+            {
+                "id": sample.id,
+                "fermentation_id": sample.fermentation_id,
+                "sample_type": sample.sample_type,
+                "value": sample.value,
+                "units": sample.units,
+                "recorded_at": sample.recorded_at,
+            },
+        )
+
+    @staticmethod
+    def _before_start_error(
+        fermentation, recorded_at: Optional[datetime]
+    ) -> Optional[ValidationErrorModel]:
+        """
+        Error if recorded_at predates the fermentation's start_date.
+
+        Sample reads rely on recorded_at >= start_date to prune partitions
+        (SampleRepository), so no write path may store an earlier sample.
+        """
+        if recorded_at is None:
+            return None
+        if recorded_at.tzinfo is not None:
+            # start_date is stored as naive UTC
+            recorded_at = recorded_at.astimezone(timezone.utc).replace(tzinfo=None)
+        if recorded_at >= fermentation.start_date:
+            return None
+        return ValidationErrorModel(
+            field="recorded_at",
+            message="Sample timestamp cannot be before fermentation start date",
+            current_value=recorded_at,
+        )
+
     def _create_sample_entity(
         self, fermentation_id: int, user_id: int, data: SampleCreate
     ) -> BaseSample:
@@ -258,7 +469,7 @@ class SampleService(ISampleService):
 
         Business logic:
         1. Verifies fermentation exists and belongs to winery
-        2. Gets samples via repository
+        2. Gets samples via repository (archive store if archived)
         3. Returns ordered by recorded_at ASC
 
         Args:
@@ -297,10 +508,16 @@ class SampleService(ISampleService):
                 f"Fermentation {fermentation_id} not found or access denied"
             )
 
-        # Step 2: Get samples via repository (already ordered chronologically)
-        samples = await self._sample_repo.get_samples_by_fermentation_id(
-            fermentation_id=fermentation_id
-        )
+        # Step 2: Get samples (already ordered chronologically); archived
+        # fermentations have theirs in cold storage
+        if self._archive_store is not None and fermentation.archived_at is not None:
+            samples = await self._archive_store.read_samples(
+                winery_id=winery_id, fermentation_id=fermentation_id
+            )
+        else:
+            samples = await self._sample_repo.get_samples_by_fermentation_id(
+                fermentation_id=fermentation_id
+            )
 
         logger.info(
             "samples_retrieved_by_fermentation_service",
@@ -0,0 +1,221 @@
+"""
+Delta Sync Service
+
+Change feed for the web and mobile clients: instead of re-fetching full
+fermentation/sample/alert lists, a client sends the cursor from its last
+sync and receives only what changed since, including deletions.
+
+Streams (SyncEntity): fermentation, sample, note, alert, action. Each has
+its own keyset position (updated_at, id) inside the cursor, so streams
+page independently and a filtered sync (``entities=...``) never skips rows
+of the streams it didn't ask for.
+
+Deletions:
+- Soft deletes (fermentations, samples, notes): the row itself, sent as
+  a deletion instead of a payload
+- Hard deletes (actions): sync_tombstones rows, a separate position per
+  stream
+
+Watermark and overlap: updated_at is stamped at flush, not at commit, so
+a row can become visible well after rows with later timestamps (ETL import
+of one fermentation, telemetry COPY flush, 500-item batch ingest, archival
+purge). Two settings cover that:
+
+- Every page is read up to ``now - safety_lag_seconds``, which hides rows
+  of transactions that are still running for most of a short write.
+- When a sync catches up (has_more is False), each stream position is
+  moved back to ``watermark - overlap_seconds`` (never forward past the
+  last row sent). The next sync re-reads that window, so a row committed
+  up to ``overlap_seconds`` late is still delivered. Size it to the
+  longest write transaction; the alert scheduler uses the same 2 minutes.
+
+Rows of the overlap window are sent again: clients dedupe by
+``(id, updated_at)`` (an unchanged row is a no-op upsert).
+
+Cursor format (opaque to clients): urlsafe base64 of
+``{"v": 1, "w": winery_id, "p": {stream: [updated_at_iso, id]}}``.
+
+Environment Variables:
+    SYNC_SAFETY_LAG_SECONDS: Age below which rows are not served yet (default: 2)
+    SYNC_OVERLAP_SECONDS: Window re-read after catching up (default: 120)
+"""
+
+import base64
+import binascii
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
+
+from src.shared.wine_fermentator_logging import get_logger
+
+from src.modules.fermentation.src.domain.dtos.sync_dtos import (
+    FeedPosition,
+    SyncChangeSet,
+    SyncDeletion,
+)
+from src.modules.fermentation.src.domain.enums.sync_entity import SyncEntity
+from src.modules.fermentation.src.domain.repositories.change_feed_repository_interface import (
+    IChangeFeedRepository,
+)
+from src.modules.fermentation.src.service_component.errors import InvalidSyncCursor
+
+logger = get_logger(__name__)
+
+CURSOR_VERSION = 1
+DEFAULT_SYNC_PAGE_SIZE = 500
+
+# Streams whose rows are physically deleted and need tombstones
+TOMBSTONED_ENTITIES = frozenset({SyncEntity.ACTION})
+
+
+def _tombstone_stream(entity: SyncEntity) -> str:
+    return f"{entity.value}.deleted"
+
+
+class SyncService:
+    """
+    Builds change-feed pages from IChangeFeedRepository.
+
+    Stateless: all client progress lives in the cursor.
+    """
+
+    def __init__(
+        self,
+        change_feed_repo: IChangeFeedRepository,
+        safety_lag_seconds: float = 2.0,
+        overlap_seconds: float = 120.0,
+    ) -> None:
+        self._repo = change_feed_repo
+        self.safety_lag_seconds = safety_lag_seconds
+        self.overlap_seconds = overlap_seconds
+
+    @classmethod
+    def from_env(cls, change_feed_repo: IChangeFeedRepository) -> "SyncService":
+        """Build a service configured from SYNC_* environment variables."""
+        return cls(
+            change_feed_repo,
+            safety_lag_seconds=float(os.getenv("SYNC_SAFETY_LAG_SECONDS", "2")),
+            overlap_seconds=float(os.getenv("SYNC_OVERLAP_SECONDS", "120")),
+        )
+
+    async def get_changes(
+        self,
+        winery_id: int,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_SYNC_PAGE_SIZE,
+        entities: Optional[Iterable[SyncEntity]] = None,
+    ) -> SyncChangeSet:
+        """
+        Return everything that changed since ``cursor``.
+
+        Args:
+            winery_id: Winery ID for access control
+            cursor: Cursor from the previous page, None for a full sync
+            limit: Maximum rows per stream in this page
+            entities: Streams to read (default: all)
+
+        Returns:
+            SyncChangeSet: Changed rows, deletions and the next cursor.
+                Call again with next_cursor while has_more is True. Rows of
+                the overlap window may repeat across syncs.
+
+        Raises:
+            InvalidSyncCursor: If the cursor is malformed or from another winery
+        """
+        positions = self.decode_cursor(cursor, winery_id) if cursor else {}
+        until = datetime.utcnow() - timedelta(seconds=self.safety_lag_seconds)
+        requested = list(dict.fromkeys(entities)) if entities else list(SyncEntity)
+
+        change_set = SyncChangeSet(server_time=until)
+        for entity in requested:
+            rows = await self._repo.get_changes(
+                winery_id=winery_id,
+                entity=entity,
+                after=positions.get(entity.value),
+                until=until,
+                limit=limit + 1,
+            )
+            if len(rows) > limit:
+                rows = rows[:limit]
+                change_set.has_more = True
+            if rows:
+                positions[entity.value] = (rows[-1].updated_at, rows[-1].id)
+
+            live = []
+            for row in rows:
+                if getattr(row, "is_deleted", False):
+                    change_set.deletions.append(
+                        SyncDeletion(entity, row.id, row.updated_at)
+                    )
+                else:
+                    live.append(row)
+            change_set.upserts[entity] = live
+
+            if entity in TOMBSTONED_ENTITIES:
+                stream = _tombstone_stream(entity)
+                tombstones = await self._repo.get_tombstones(
+                    winery_id=winery_id,
+                    entity=entity,
+                    after=positions.get(stream),
+                    until=until,
+                    limit=limit + 1,
+                )
+                if len(tombstones) > limit:
+                    tombstones = tombstones[:limit]
+                    change_set.has_more = True
+                if tombstones:
+                    positions[stream] = (tombstones[-1].updated_at, tombstones[-1].id)
+                change_set.deletions.extend(
+                    SyncDeletion(entity, t.entity_id, t.updated_at) for t in tombstones
+                )
+
+        if not change_set.has_more:
+            # Caught up: re-read the overlap window next time for late commits
+            floor = (until - timedelta(seconds=self.overlap_seconds), 0)
+            positions = {
+                stream: min(position, floor) for stream, position in positions.items()
+            }
+        change_set.next_cursor = self.encode_cursor(winery_id, positions)
+        logger.info(
+            "sync_changes_served",
+            winery_id=winery_id,
+            full_sync=cursor is None,
+            upserts=sum(len(rows) for rows in change_set.upserts.values()),
+            deletions=len(change_set.deletions),
+            has_more=change_set.has_more,
+        )
+        return change_set
+
+    # ─── Cursor codec ───────────────────────────────────────────────────────
+
+    @staticmethod
+    def encode_cursor(winery_id: int, positions: Dict[str, FeedPosition]) -> str:
+        payload = {
+            "v": CURSOR_VERSION,
+            "w": winery_id,
+            "p": {
+                stream: [updated_at.isoformat(), row_id]
+                for stream, (updated_at, row_id) in sorted(positions.items())
+            },
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str, winery_id: int) -> Dict[str, FeedPosition]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            if payload["v"] != CURSOR_VERSION:
+                raise ValueError("unsupported cursor version")
+            cursor_winery = payload["w"]
+            positions = {
+                stream: (datetime.fromisoformat(updated_at), int(row_id))
+                for stream, (updated_at, row_id) in payload["p"].items()
+            }
+        except (binascii.Error, UnicodeDecodeError, KeyError, TypeError, ValueError):
+            raise InvalidSyncCursor("Malformed sync cursor, start a full sync")
+        if cursor_winery != winery_id:
+            raise InvalidSyncCursor("Sync cursor was issued for another winery")
+        return positions
@@ -0,0 +1,549 @@
+"""
+Telemetry Ingestion Buffer
+
+High-rate ingestion path for tank sensors (temperature/density probes at
+about one reading per minute per tank). Instead of running every reading
+through the REST sample pipeline (ownership lookup, full-history
+chronology validation, single-row ORM insert), readings are:
+
+1. Buffered in memory, keyed by (fermentation_id, sample_type)
+2. Coalesced per key: duplicate timestamps collapse, and readings closer
+   than ``coalesce_seconds`` to the previous buffered one replace it
+3. Flushed with one bulk write (COPY on PostgreSQL) when ``flush_size``
+   readings are buffered or every ``flush_interval_seconds``
+4. Backpressured: when ``max_buffered`` is reached, ``submit`` waits up to
+   ``submit_timeout_seconds`` for a flush, then raises TelemetryBufferFull
+
+Failed flushes: the bulk write is all-or-nothing, so one bad row would
+fail every retry and keep the buffer full. Data errors (constraint
+violations, rejected values) split the batch in halves until the bad rows
+are isolated; those are dead-lettered (logged with their values) and the
+rest is written. Only transient errors (lost connection, deadlock,
+shutdown) put the unwritten readings back, and only for
+``max_flush_retries`` consecutive failed flushes before they are
+dead-lettered too.
+
+Visibility: a reading accepted by ``submit`` is committed to the samples
+table within ``flush_interval_seconds`` plus one bulk write, so the
+timeline/latest-sample queries see it after at most ``max_visibility_delay``.
+Written readings are then pushed to the winery's event streams as
+``sample.created`` (``id`` is null: the bulk write does not return IDs).
+
+Wire-up:
+    Call ``start()`` on FastAPI startup and ``await stop()`` on shutdown
+    (stop flushes whatever is still buffered).
+
+Environment Variables:
+    TELEMETRY_FLUSH_SIZE: Buffered readings that trigger a flush (default: 500)
+    TELEMETRY_FLUSH_INTERVAL_SECONDS: Max time between flushes (default: 5)
+    TELEMETRY_MAX_BUFFERED: Buffer capacity before backpressure (default: 10000)
+    TELEMETRY_SUBMIT_TIMEOUT_SECONDS: Max wait for room in submit (default: 2)
+    TELEMETRY_COALESCE_SECONDS: Merge window per key (default: 0, disabled)
+    TELEMETRY_SENSOR_USER_ID: Audit user for sensor rows (default: 0)
+    TELEMETRY_MAX_FLUSH_RETRIES: Failed flushes before readings are dead-lettered (default: 5)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.shared.infra.repository.errors import (
+    DatabaseConnectionError,
+    RetryableConcurrencyError,
+)
+from src.shared.infra.events import EventBus, get_event_bus
+from src.shared.wine_fermentator_logging import get_logger
+from src.shared.wine_fermentator_logging.metrics import get_metrics_registry
+
+from src.modules.fermentation.src.domain.dtos.sample_dtos import (
+    TelemetryIngestResult,
+    TelemetryReading,
+)
+from src.modules.fermentation.src.domain.enums.fermentation_status import (
+    FermentationStatus,
+)
+from src.modules.fermentation.src.domain.repositories.fermentation_repository_interface import (
+    IFermentationRepository,
+)
+from src.modules.fermentation.src.domain.repositories.telemetry_sample_repository_interface import (
+    ITelemetrySampleRepository,
+)
+from src.modules.fermentation.src.service_component.errors import (
+    TelemetryBufferFull,
+)
+
+logger = get_logger(__name__)
+
+BufferKey = Tuple[int, str]
+
+# SQLSTATEs worth retrying: connection exceptions, deadlock/serialization,
+# insufficient resources, operator intervention (shutdown, restart)
+_TRANSIENT_SQLSTATES = ("08", "40001", "40P01", "53", "57P")
+
+# Dead-lettered rows written to the log per event
+_DEAD_LETTER_LOGGED_ROWS = 100
+
+# Probe clocks drift; readings this far ahead of the server are still accepted
+_FUTURE_TOLERANCE = timedelta(minutes=5)
+
+
+def _is_transient(error: BaseException) -> bool:
+    """Whether a failed bulk write may succeed unchanged on a later flush."""
+    seen = error
+    while seen is not None:
+        if isinstance(
+            seen,
+            (DatabaseConnectionError, RetryableConcurrencyError, OSError, asyncio.TimeoutError),
+        ):
+            return True
+        if getattr(seen, "connection_invalidated", False):
+            return True
+        sqlstate = getattr(seen, "sqlstate", None) or getattr(seen, "pgcode", None)
+        if isinstance(sqlstate, str) and sqlstate.startswith(_TRANSIENT_SQLSTATES):
+            return True
+        seen = seen.__cause__ or getattr(seen, "orig", None)
+    return False
+
+
+class _FlushInterrupted(Exception):
+    """A transient error stopped a flush; carries what was not written."""
+
+    def __init__(
+        self, written: int, unwritten: List[TelemetryReading], error: BaseException
+    ) -> None:
+        super().__init__(str(error))
+        self.written = written
+        self.unwritten = unwritten
+        self.error = error
+
+
+class TelemetryIngestionBuffer:
+    """
+    In-memory, coalescing write buffer in front of ITelemetrySampleRepository.
+
+    Safe for concurrent ``submit`` calls from many request handlers on one
+    event loop; a single background task performs the flushes.
+    """
+
+    def __init__(
+        self,
+        repository: ITelemetrySampleRepository,
+        flush_size: int = 500,
+        flush_interval_seconds: float = 5.0,
+        max_buffered: int = 10_000,
+        submit_timeout_seconds: float = 2.0,
+        coalesce_seconds: float = 0.0,
+        sensor_user_id: int = 0,
+        max_flush_retries: int = 5,
+        event_bus: Optional[EventBus] = None,
+    ) -> None:
+        """
+        Args:
+            repository:              Bulk writer for readings
+            flush_size:              Buffered readings that trigger a flush
+            flush_interval_seconds:  Max time a reading waits before a flush
+            max_buffered:            Capacity; beyond it submit applies backpressure
+            submit_timeout_seconds:  How long submit waits for room
+            coalesce_seconds:        Readings of one key closer than this merge
+            sensor_user_id:          recorded_by_user_id written for sensor rows
+            max_flush_retries:       Consecutive transiently failed flushes before
+                                     the unwritten readings are dead-lettered
+            event_bus:               Bus for sample.created events (default: process bus)
+        """
+        if flush_size > max_buffered:
+            raise ValueError("flush_size must not exceed max_buffered")
+        self._repository = repository
+        self.flush_size = flush_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_buffered = max_buffered
+        self.submit_timeout_seconds = submit_timeout_seconds
+        self.coalesce_seconds = coalesce_seconds
+        self.sensor_user_id = sensor_user_id
+        self.max_flush_retries = max_flush_retries
+        self._failed_flushes = 0
+        self._event_bus = event_bus or get_event_bus()
+        # fermentation_id -> winery_id of submitted readings, for event routing
+        self._wineries: Dict[int, int] = {}
+
+        self._buffer: Dict[BufferKey, List[TelemetryReading]] = {}
+        self._buffered = 0
+        self._room = asyncio.Condition()
+        self._flush_requested = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+        registry = get_metrics_registry()
+        self._readings_total = registry.counter(
+            "telemetry_readings_total", "Sensor readings by outcome"
+        )
+        self._flush_duration = registry.histogram(
+            "telemetry_flush_duration_seconds", "Bulk write duration per flush"
+        )
+        registry.gauge(
+            "telemetry_buffered_readings", "Readings waiting to be flushed"
+        ).add_collector(lambda: {(): float(self._buffered)})
+
+    @classmethod
+    def from_env(
+        cls, repository: ITelemetrySampleRepository
+    ) -> "TelemetryIngestionBuffer":
+        """Build a buffer configured from TELEMETRY_* environment variables."""
+        return cls(
+            repository,
+            flush_size=int(os.getenv("TELEMETRY_FLUSH_SIZE", "500")),
+            flush_interval_seconds=float(
+                os.getenv("TELEMETRY_FLUSH_INTERVAL_SECONDS", "5")
+            ),
+            max_buffered=int(os.getenv("TELEMETRY_MAX_BUFFERED", "10000")),
+            submit_timeout_seconds=float(
+                os.getenv("TELEMETRY_SUBMIT_TIMEOUT_SECONDS", "2")
+            ),
+            coalesce_seconds=float(os.getenv("TELEMETRY_COALESCE_SECONDS", "0")),
+            sensor_user_id=int(os.getenv("TELEMETRY_SENSOR_USER_ID", "0")),
+            max_flush_retries=int(os.getenv("TELEMETRY_MAX_FLUSH_RETRIES", "5")),
+        )
+
+    # ─── Properties ─────────────────────────────────────────────────────────
+
+    @property
+    def buffered(self) -> int:
+        """Readings currently waiting to be flushed."""
+        return self._buffered
+
+    @property
+    def max_visibility_delay(self) -> float:
+        """Upper bound (seconds, excluding write time) before readings are queryable."""
+        return self.flush_interval_seconds
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    # ─── Lifecycle ──────────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        """Start the background flusher (call on FastAPI startup)."""
+        if self.running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._flush_loop())
+        logger.info(
+            "telemetry_buffer_started",
+            flush_size=self.flush_size,
+            flush_interval_seconds=self.flush_interval_seconds,
+            max_buffered=self.max_buffered,
+        )
+
+    async def stop(self) -> None:
+        """Stop the flusher and write out everything still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        written = await self.flush()
+        logger.info("telemetry_buffer_stopped", final_flush_rows=written)
+
+    # ─── Ingestion ──────────────────────────────────────────────────────────
+
+    async def submit(
+        self, readings: Iterable[TelemetryReading], winery_id: Optional[int] = None
+    ) -> int:
+        """
+        Buffer readings for the next flush, waiting for room if full.
+
+        Args:
+            readings: Sensor readings (ownership already checked by the caller)
+            winery_id: Owner of the readings; written ones are published to its
+                event streams (None: not published)
+
+        Returns:
+            int: Readings added to the buffer (coalesced ones excluded)
+
+        Raises:
+            TelemetryBufferFull: If no room frees up within submit_timeout_seconds
+        """
+        readings = list(readings)
+        if not readings:
+            return 0
+        if len(readings) > self.max_buffered:
+            raise TelemetryBufferFull(
+                f"Batch of {len(readings)} readings exceeds buffer capacity "
+                f"{self.max_buffered}",
+                buffered=self._buffered,
+            )
+
+        async with self._room:
+            if self._buffered + len(readings) > self.max_buffered:
+                self._flush_requested.set()
+                try:
+                    await asyncio.wait_for(
+                        self._room.wait_for(
+                            lambda: self._buffered + len(readings)
+                            <= self.max_buffered
+                        ),
+                        timeout=self.submit_timeout_seconds,
+                    )
+                except asyncio.TimeoutError:
+                    self._readings_total.inc(len(readings), outcome="rejected")
+                    logger.warning(
+                        "telemetry_backpressure_rejected",
+                        readings=len(readings),
+                        buffered=self._buffered,
+                        max_buffered=self.max_buffered,
+                    )
+                    raise TelemetryBufferFull(
+                        "Telemetry buffer is full, retry later",
+                        buffered=self._buffered,
+                    )
+
+            added = sum(self._add(reading) for reading in readings)
+            if winery_id is not None:
+                for reading in readings:
+                    self._wineries[reading.fermentation_id] = winery_id
+
+        self._readings_total.inc(added, outcome="accepted")
+        if added < len(readings):
+            self._readings_total.inc(len(readings) - added, outcome="coalesced")
+        if self._buffered >= self.flush_size:
+            self._flush_requested.set()
+        return added
+
+    def _add(self, reading: TelemetryReading) -> bool:
+        """Add one reading, coalescing with the key's last one. True if it grew the buffer."""
+        key = (reading.fermentation_id, reading.sample_type.value)
+        pending = self._buffer.setdefault(key, [])
+        if pending:
+            last = pending[-1]
+            gap = abs((reading.recorded_at - last.recorded_at).total_seconds())
+            if gap <= self.coalesce_seconds:
+                # Same instant (duplicate delivery) or inside merge window: keep newest
+                if reading.recorded_at >= last.recorded_at:
+                    pending[-1] = reading
+                return False
+        pending.append(reading)
+        self._buffered += 1
+        return True
+
+    # ─── Flushing ───────────────────────────────────────────────────────────
+
+    async def flush(self) -> int:
+        """
+        Write everything buffered in one bulk write.
+
+        Rows rejected by the database are dead-lettered and the rest is
+        written. On a transient error the unwritten readings are put back
+        (as far as capacity allows) and retried on the next flush, up to
+        ``max_flush_retries`` consecutive failures.
+
+        Returns:
+            int: Rows written
+        """
+        async with self._flush_lock:
+            async with self._room:
+                batch, self._buffer, self._buffered = self._buffer, {}, 0
+                self._room.notify_all()
+            readings = [r for pending in batch.values() for r in pending]
+            if not readings:
+                return 0
+
+            started = time.perf_counter()
+            try:
+                written = await self._write(readings)
+            except _FlushInterrupted as interrupted:
+                self._flush_duration.observe(
+                    time.perf_counter() - started, status="error"
+                )
+                self._failed_flushes += 1
+                logger.error(
+                    "telemetry_flush_failed",
+                    readings=len(interrupted.unwritten),
+                    written=interrupted.written,
+                    attempt=self._failed_flushes,
+                    max_attempts=self.max_flush_retries,
+                    error=str(interrupted.error),
+                )
+                if self._failed_flushes >= self.max_flush_retries:
+                    self._failed_flushes = 0
+                    self._dead_letter(
+                        interrupted.unwritten, interrupted.error, reason="retries_exhausted"
+                    )
+                else:
+                    await self._requeue(interrupted.unwritten)
+                return interrupted.written
+
+            self._failed_flushes = 0
+            self._flush_duration.observe(time.perf_counter() - started, status="success")
+            logger.debug(
+                "telemetry_flushed", rows=written, keys=len(batch), buffered=self._buffered
+            )
+            return written
+
+    async def _write(self, readings: List[TelemetryReading]) -> int:
+        """
+        Bulk write, bisecting on data errors to isolate the rejected rows.
+
+        Raises:
+            _FlushInterrupted: On a transient error, with the readings not yet written
+        """
+        written = 0
+        chunks = [readings]
+        while chunks:
+            chunk = chunks.pop()
+            try:
+                written += await self._repository.bulk_insert_readings(
+                    chunk, recorded_by_user_id=self.sensor_user_id
+                )
+            except Exception as e:
+                if _is_transient(e):
+                    unwritten = [r for pending in reversed(chunks) for r in pending]
+                    raise _FlushInterrupted(written, chunk + unwritten, e)
+                if len(chunk) == 1:
+                    self._dead_letter(chunk, e, reason="rejected")
+                    continue
+                middle = len(chunk) // 2
+                # Popped from the end: first half is written first
+                chunks += [chunk[middle:], chunk[:middle]]
+            else:
+                self._publish_samples_created(chunk)
+        return written
+
+    def _publish_samples_created(self, readings: List[TelemetryReading]) -> None:
+        """Push committed readings to their winery's open event streams."""
+        for r in readings:
+            winery_id = self._wineries.get(r.fermentation_id)
+            if winery_id is None:
+                continue
+            self._event_bus.publish(
+                winery_id,
+                "sample.created",
+                {
+                    "id": None,
+                    "fermentation_id": r.fermentation_id,
+                    "sample_type": r.sample_type.value,
+                    "value": r.value,
+                    "units": r.units,
+                    "recorded_at": r.recorded_at,
+                },
+            )
+
+    def _dead_letter(
+        self, readings: List[TelemetryReading], error: BaseException, reason: str
+    ) -> None:
+        """Give up on readings: count them and log their values for replay."""
+        self._readings_total.inc(len(readings), outcome="dead_lettered")
+        logger.error(
+            "telemetry_readings_dead_lettered",
+            reason=reason,
+            readings=len(readings),
+            error=str(error)[:500],
+            rows=[
+                {
+                    "fermentation_id": r.fermentation_id,
+                    "sample_type": r.sample_type.value,
+                    "value": r.value,
+                    "units": r.units,
+                    "recorded_at": r.recorded_at.isoformat(),
+                }
+                for r in readings[:_DEAD_LETTER_LOGGED_ROWS]
+            ],
+        )
+
+    async def _requeue(self, readings: List[TelemetryReading]) -> None:
+        batch: Dict[BufferKey, List[TelemetryReading]] = {}
+        for reading in readings:
+            batch.setdefault((reading.fermentation_id, reading.sample_type.value), []).append(
+                reading
+            )
+        dropped = 0
+        async with self._room:
+            for key, pending in batch.items():
+                room = self.max_buffered - self._buffered
+                kept = pending[:room]
+                dropped += len(pending) - len(kept)
+                if kept:
+                    self._buffer[key] = kept + self._buffer.get(key, [])
+                    self._buffered += len(kept)
+        if dropped:
+            self._readings_total.inc(dropped, outcome="dropped")
+            logger.error("telemetry_readings_dropped", readings=dropped)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._flush_requested.wait(), timeout=self.flush_interval_seconds
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            await self.flush()
+
+
+class TelemetryIngestionService:
+    """
+    Request-scoped entry point: checks ownership, then hands readings to the buffer.
+
+    One fermentation query per submission (all distinct IDs at once);
+    readings of unknown, foreign or COMPLETED fermentations are dropped and
+    reported back, as are readings timestamped before their fermentation's
+    start or in the future (naive UTC, like the request schema produces).
+    """
+
+    def __init__(
+        self,
+        fermentation_repo: IFermentationRepository,
+        buffer: TelemetryIngestionBuffer,
+    ) -> None:
+        self._fermentation_repo = fermentation_repo
+        self._buffer = buffer
+
+    async def ingest(
+        self, winery_id: int, readings: List[TelemetryReading]
+    ) -> TelemetryIngestResult:
+        """
+        Buffer sensor readings of the winery's active fermentations.
+
+        Args:
+            winery_id: Winery ID for access control
+            readings: Sensor readings
+
+        Returns:
+            TelemetryIngestResult: Accepted/coalesced counts, rejected
+                fermentations and out-of-range readings
+
+        Raises:
+            TelemetryBufferFull: If the buffer stays full (client should retry)
+        """
+        fermentation_ids = list(dict.fromkeys(r.fermentation_id for r in readings))
+        fermentations = await self._fermentation_repo.get_by_ids(
+            fermentation_ids=fermentation_ids, winery_id=winery_id
+        )
+        start_dates = {
+            f.id: f.start_date
+            for f in fermentations
+            if f.status != FermentationStatus.COMPLETED
+        }
+        latest = datetime.utcnow() + _FUTURE_TOLERANCE
+        owned = [r for r in readings if r.fermentation_id in start_dates]
+        kept = [
+            r
+            for r in owned
+            if start_dates[r.fermentation_id] <= r.recorded_at <= latest
+        ]
+
+        accepted = await self._buffer.submit(kept, winery_id=winery_id)
+        return TelemetryIngestResult(
+            accepted=accepted,
+            coalesced=len(kept) - accepted,
+            rejected_fermentation_ids=[
+                fid for fid in fermentation_ids if fid not in start_dates
+            ],
+            rejected_readings=len(owned) - len(kept),
+            max_visibility_delay_seconds=self._buffer.max_visibility_delay,
+        )
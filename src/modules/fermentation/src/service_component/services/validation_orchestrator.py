@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List, Optional
 
 # ADR-027: Structured logging
 from src.shared.wine_fermentator_logging import get_logger
@@ -17,6 +17,9 @@ from src.modules.fermentation.src.service_component.interfaces.validation_orches
 from src.modules.fermentation.src.service_component.interfaces.value_validation_service_interface import (
     IValueValidationService,
 )
+from src.modules.fermentation.src.service_component.models.schemas.validations.validation_error import (
+    ValidationError,
+)
 from src.modules.fermentation.src.service_component.models.schemas.validations.validation_result import (
     ValidationResult,
 )
@@ -142,16 +145,121 @@ class ValidationOrchestrator(IValidationOrchestrator):
         return overall_result
 
     async def validate_sample_batch(
-        self, fermentation_id: int, samples: List[BaseSample]
-    ) -> ValidationResult:
+        self,
+        fermentation_id: int,
+        samples: List[BaseSample],
+        latest_by_type: Optional[Dict[str, BaseSample]] = None,
+    ) -> List[ValidationResult]:
         """
-        Validates a batch of samples for both value correctness and chronology.
+        Validates a batch of samples against a prefetched history window.
+
+        Applies the same rules as validate_sample_complete (chronology per
+        sample type, value range, sugar trend) in memory: samples are visited
+        in recorded_at order and each accepted sample advances the window.
 
         Args:
             fermentation_id: ID of the fermentation
             samples: List of sample entities to validate
+            latest_by_type: Latest stored sample per sample_type value
 
         Returns:
-            ValidationResult: Comprehensive validation results with errors and warnings
+            List[ValidationResult]: One result per sample, in input order
         """
-        NotImplementedError("Batch validation not implemented yet.")
+        window = dict(latest_by_type or {})
+        results: List[ValidationResult] = [None] * len(samples)
+
+        # Samples without timestamp are rejected below; sort them first
+        order = sorted(
+            range(len(samples)),
+            key=lambda i: (
+                samples[i].recorded_at is not None,
+                samples[i].recorded_at or 0,
+            ),
+        )
+        for i in order:
+            result = self._validate_against_window(samples[i], window)
+            if result.is_valid:
+                window[self._sample_type_value(samples[i])] = samples[i]
+            results[i] = result
+
+        rejected = sum(1 for r in results if not r.is_valid)
+        logger.debug(
+            "sample_batch_validation_complete",
+            fermentation_id=fermentation_id,
+            sample_count=len(samples),
+            rejected=rejected,
+        )
+        return results
+
+    def _validate_against_window(
+        self, sample: BaseSample, window: Dict[str, BaseSample]
+    ) -> ValidationResult:
+        """Chronology, value and sugar trend checks for one sample of a batch."""
+        if not sample.sample_type:
+            return ValidationResult.failure(
+                [
+                    ValidationError(
+                        field="sample_type",
+                        message="Sample type is required for chronology validation",
+                        current_value=sample.sample_type,
+                    )
+                ]
+            )
+        if not sample.recorded_at:
+            return ValidationResult.failure(
+                [
+                    ValidationError(
+                        field="recorded_at",
+                        message="Sample timestamp is required for chronology validation",
+                        current_value=sample.recorded_at,
+                    )
+                ]
+            )
+
+        sample_type_value = self._sample_type_value(sample)
+        previous = window.get(sample_type_value)
+
+        # Chronology Validation
+        if previous is not None and previous.recorded_at > sample.recorded_at:
+            return ValidationResult.failure(
+                [
+                    ValidationError(
+                        field="recorded_at",
+                        message="New sample's timestamp must be after the latest sample of the same type",
+                        current_value=sample.recorded_at,
+                    )
+                ]
+            )
+
+        # Value Validation
+        value_result = self.value_validator.validate_sample_value(
+            sample_type=sample.sample_type, value=sample.value
+        )
+        if not value_result.is_valid:
+            return value_result
+
+        # Business Rules Validation (same tolerance as validate_sample_complete)
+        if sample_type_value == SampleType.SUGAR.value and sample.value is not None:
+            previous_value = previous.value if previous is not None else None
+            if previous_value and sample.value > previous_value + 0.1:
+                return value_result.merge(
+                    ValidationResult.failure(
+                        errors=[
+                            ValidationError(
+                                field="sugar",
+                                message="Increasing trend is not allowed",
+                                current_value=sample.value,
+                            )
+                        ]
+                    )
+                )
+
+        return value_result
+
+    @staticmethod
+    def _sample_type_value(sample: BaseSample) -> str:
+        return (
+            sample.sample_type
+            if isinstance(sample.sample_type, str)
+            else sample.sample_type.value
+        )
@@ -224,6 +224,7 @@ def create_test_app(
     )
     from src.shared.infra.database.fastapi_session import (
         get_db_session as real_get_db_session,
+        get_read_only_db_session,
     )
     from src.modules.fermentation.src.api.routers.fermentation_router import (
         router as fermentation_router,
@@ -232,6 +233,9 @@ def create_test_app(
         router as sample_router,
         samples_router,
     )
+    from src.modules.fermentation.src.api.routers.sync_router import (
+        router as sync_router,
+    )
     from src.modules.fermentation.src.api.error_handlers import register_error_handlers
 
     # Create minimal FastAPI app for testing
@@ -244,6 +248,7 @@ def create_test_app(
         samples_router, prefix=API_V1_PREFIX
     )  # New: non-nested sample endpoints
     app.include_router(fermentation_router, prefix=API_V1_PREFIX)
+    app.include_router(sync_router, prefix=API_V1_PREFIX)
 
     # Register error handlers for domain exceptions
     register_error_handlers(app)
@@ -265,6 +270,8 @@ def create_test_app(
             yield db_override
 
         app.dependency_overrides[real_get_db_session] = override_get_db
+        # Single test database: replica reads go to the same session
+        app.dependency_overrides[get_read_only_db_session] = override_get_db
 
     return app
 
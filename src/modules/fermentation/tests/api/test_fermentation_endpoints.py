@@ -727,6 +727,47 @@ class TestPatchFermentationEndpoint:
         assert data["yeast_strain"] == "D47"
         assert data["vintage_year"] == 2024  # Unchanged
 
+    def test_update_start_date_past_earliest_sample_rejected(self, client):
+        """
+        Should refuse a start_date that would leave samples before the start.
+
+        Given: Fermentation started 2024-11-01 with a sample on 2024-11-03
+        When: PATCH start_date to 2024-11-04, then to 2024-11-03
+        Then: 422 for the first (sample would be hidden), 200 for the second
+        """
+        create_data = {
+            "vintage_year": 2024,
+            "yeast_strain": "EC-1118",
+            "input_mass_kg": 1000.0,
+            "initial_sugar_brix": 22.5,
+            "initial_density": 1.095,
+            "start_date": "2024-11-01T10:00:00",
+        }
+        fermentation_id = client.post("/api/v1/fermentations", json=create_data).json()[
+            "id"
+        ]
+        client.post(
+            f"/api/v1/fermentations/{fermentation_id}/samples",
+            json={
+                "sample_type": "sugar",
+                "value": 20.0,
+                "units": "°Brix",
+                "recorded_at": "2024-11-03T10:00:00",
+            },
+        )
+
+        rejected = client.patch(
+            f"/api/v1/fermentations/{fermentation_id}",
+            json={"start_date": "2024-11-04T10:00:00"},
+        )
+        allowed = client.patch(
+            f"/api/v1/fermentations/{fermentation_id}",
+            json={"start_date": "2024-11-03T10:00:00"},
+        )
+
+        assert rejected.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert allowed.status_code == status.HTTP_200_OK
+
 
 # =============================================================================
 # PHASE 2e: Status Transitions Endpoints
@@ -270,3 +270,57 @@ def test_sample_update_request_partial():
     request2 = SampleUpdateRequest(value=18.5, units="g/100mL")
     assert request2.value == 18.5
     assert request2.units == "g/100mL"
+
+
+# =============================================================================
+# TEST 11: TelemetryReadingRequest - Timestamps and values
+# =============================================================================
+def test_telemetry_reading_request_normalizes_to_naive_utc():
+    """
+    Test: TelemetryReadingRequest should store offset timestamps as naive UTC
+
+    Naive and aware timestamps can't be compared once buffered together.
+    """
+    from src.modules.fermentation.src.api.schemas.requests.sample_requests import (
+        TelemetryReadingRequest,
+    )
+
+    aware = TelemetryReadingRequest(
+        fermentation_id=1,
+        sample_type="temperature",
+        value=18.0,
+        units="°C",
+        recorded_at="2024-11-02T12:00:00+02:00",
+    )
+    naive = TelemetryReadingRequest(
+        fermentation_id=1,
+        sample_type="temperature",
+        value=18.0,
+        units="°C",
+        recorded_at="2024-11-02T10:00:00",
+    )
+
+    assert aware.recorded_at == datetime(2024, 11, 2, 10, 0, 0)
+    assert aware.recorded_at.tzinfo is None
+    assert naive.recorded_at == aware.recorded_at
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf")])
+def test_telemetry_reading_request_rejects_non_finite_value(value):
+    """
+    Test: TelemetryReadingRequest should reject NaN/inf probe values
+    """
+    from src.modules.fermentation.src.api.schemas.requests.sample_requests import (
+        TelemetryReadingRequest,
+    )
+
+    with pytest.raises(ValidationError) as exc_info:
+        TelemetryReadingRequest(
+            fermentation_id=1,
+            sample_type="temperature",
+            value=value,
+            units="°C",
+            recorded_at=datetime(2024, 11, 2, 10, 0, 0),
+        )
+
+    assert any("value" in str(err["loc"]) for err in exc_info.value.errors())
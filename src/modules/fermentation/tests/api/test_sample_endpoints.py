@@ -9,12 +9,20 @@ Test Structure:
 - Phase 3b: GET /fermentations/{id}/samples (List samples)
 - Phase 3c: GET /fermentations/{id}/samples/{sample_id} (Get sample)
 - Phase 3d: GET /fermentations/{id}/samples/latest (Latest sample)
+- POST /samples/batch (Batch ingestion)
+- POST /samples/telemetry (Buffered sensor ingestion)
 """
 
+import asyncio
 import pytest
+from unittest.mock import AsyncMock
 from fastapi import status
 from datetime import datetime, timedelta
 
+from src.modules.fermentation.src.service_component.services.telemetry_ingestion_service import (
+    TelemetryIngestionBuffer,
+)
+
 # ======================================================================================
 # PHASE 3a: POST /fermentations/{fermentation_id}/samples - Create Sample
 # ======================================================================================
@@ -790,6 +798,260 @@ class TestValidateSample:
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
 
+# =============================================================================
+# POST /api/v1/samples/batch
+# =============================================================================
+
+
+class TestPostSamplesBatch:
+    """Tests for POST /api/v1/samples/batch endpoint."""
+
+    FERMENTATION_DATA = {
+        "vintage_year": 2024,
+        "yeast_strain": "EC-1118",
+        "input_mass_kg": 1000.0,
+        "initial_sugar_brix": 22.5,
+        "initial_density": 1.095,
+        "start_date": "2024-11-01T10:00:00",
+    }
+
+    def _create_fermentation(self, client):
+        response = client.post("/api/v1/fermentations", json=self.FERMENTATION_DATA)
+        return response.json()["id"]
+
+    def test_batch_across_fermentations_with_per_item_results(
+        self, client, mock_user_context
+    ):
+        """
+        Should store valid items in one call and report rejected ones.
+
+        Given: Two fermentations, one with an existing sugar sample
+        When: POST a batch mixing valid, out-of-order and foreign items
+        Then: Returns 200 with per-item status in request order
+        """
+        first_id = self._create_fermentation(client)
+        second_id = self._create_fermentation(client)
+        client.post(
+            f"/api/v1/fermentations/{first_id}/samples",
+            json={
+                "sample_type": "sugar",
+                "value": 21.0,
+                "units": "°Brix",
+                "recorded_at": "2024-11-02T10:00:00",
+            },
+        )
+
+        batch = {
+            "samples": [
+                {  # after stored sample, decreasing
+                    "fermentation_id": first_id,
+                    "sample_type": "sugar",
+                    "value": 19.5,
+                    "units": "°Brix",
+                    "recorded_at": "2024-11-03T10:00:00",
+                },
+                {  # older than stored sample
+                    "fermentation_id": first_id,
+                    "sample_type": "sugar",
+                    "value": 21.5,
+                    "units": "°Brix",
+                    "recorded_at": "2024-11-01T12:00:00",
+                },
+                {
+                    "fermentation_id": second_id,
+                    "sample_type": "temperature",
+                    "value": 24.0,
+                    "units": "°C",
+                    "recorded_at": "2024-11-02T10:00:00",
+                },
+                {
+                    "fermentation_id": 99999,
+                    "sample_type": "sugar",
+                    "value": 20.0,
+                    "units": "°Brix",
+                    "recorded_at": "2024-11-02T10:00:00",
+                },
+            ]
+        }
+        response = client.post("/api/v1/samples/batch", json=batch)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["created"] == 2
+        assert data["rejected"] == 2
+        assert [item["status"] for item in data["items"]] == [
+            "created",
+            "rejected",
+            "created",
+            "rejected",
+        ]
+        assert data["items"][0]["sample"]["value"] == 19.5
+        assert data["items"][1]["errors"][0]["field"] == "recorded_at"
+        assert data["items"][3]["errors"][0]["field"] == "fermentation_id"
+
+        samples = client.get(f"/api/v1/fermentations/{first_id}/samples").json()
+        assert [s["value"] for s in samples] == [21.0, 19.5]
+
+    def test_batch_invalid_payload(self, client, mock_user_context):
+        """Should return 422 for an empty batch or an unknown sample type."""
+        empty = client.post("/api/v1/samples/batch", json={"samples": []})
+        unknown_type = client.post(
+            "/api/v1/samples/batch",
+            json={
+                "samples": [
+                    {
+                        "fermentation_id": 1,
+                        "sample_type": "unknown",
+                        "value": 1.0,
+                        "units": "x",
+                        "recorded_at": "2024-11-02T10:00:00",
+                    }
+                ]
+            },
+        )
+
+        assert empty.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert unknown_type.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_batch_without_authentication(self, unauthenticated_client):
+        """Should require authentication."""
+        response = unauthenticated_client.post(
+            "/api/v1/samples/batch",
+            json={
+                "samples": [
+                    {
+                        "fermentation_id": 1,
+                        "sample_type": "sugar",
+                        "value": 20.5,
+                        "units": "°Brix",
+                        "recorded_at": "2024-11-02T10:00:00",
+                    }
+                ]
+            },
+        )
+
+        assert response.status_code in [
+            status.HTTP_401_UNAUTHORIZED,
+            status.HTTP_403_FORBIDDEN,
+        ]
+
+
+# =============================================================================
+# POST /api/v1/samples/telemetry
+# =============================================================================
+
+
+class TestPostSamplesTelemetry:
+    """Tests for POST /api/v1/samples/telemetry endpoint."""
+
+    def _create_fermentation(self, client):
+        response = client.post(
+            "/api/v1/fermentations", json=TestPostSamplesBatch.FERMENTATION_DATA
+        )
+        return response.json()["id"]
+
+    @staticmethod
+    def _reading(fermentation_id, minute):
+        return {
+            "fermentation_id": fermentation_id,
+            "sample_type": "temperature",
+            "value": 18.0 + minute / 10,
+            "units": "°C",
+            "recorded_at": f"2024-11-02T10:{minute:02d}:00",
+        }
+
+    def test_telemetry_accepted_into_buffer(self, client, mock_user_context):
+        """
+        Should buffer readings of owned fermentations and return 202.
+
+        Given: One fermentation and a running ingestion buffer
+        When: POST readings for it (one duplicated) and for an unknown fermentation
+        Then: Returns 202 with counts; unknown fermentation reported as rejected
+        """
+        fermentation_id = self._create_fermentation(client)
+        buffer = TelemetryIngestionBuffer(AsyncMock(), flush_interval_seconds=5)
+        client.app.state.telemetry_buffer = buffer
+
+        response = client.post(
+            "/api/v1/samples/telemetry",
+            json={
+                "readings": [
+                    self._reading(fermentation_id, 0),
+                    self._reading(fermentation_id, 1),
+                    self._reading(fermentation_id, 1),
+                    self._reading(99999, 0),
+                ]
+            },
+        )
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.json() == {
+            "accepted": 2,
+            "coalesced": 1,
+            "rejected_fermentation_ids": [99999],
+            "rejected_readings": 0,
+            "max_visibility_delay_seconds": 5.0,
+        }
+        assert buffer.buffered == 2
+
+    def test_telemetry_timestamps_normalized_and_range_checked(
+        self, client, mock_user_context
+    ):
+        """
+        Should store offset timestamps as naive UTC and drop out-of-range ones.
+
+        Given: A fermentation started 2024-11-01T10:00 and a running buffer
+        When: POST a reading with a +02:00 offset, one before the start and
+              one in the future
+        Then: Only the offset reading is buffered, as naive UTC; the other
+              two are reported as rejected readings
+        """
+        fermentation_id = self._create_fermentation(client)
+        telemetry_repo = AsyncMock()
+        telemetry_repo.bulk_insert_readings.side_effect = (
+            lambda readings, recorded_by_user_id: len(readings)
+        )
+        buffer = TelemetryIngestionBuffer(telemetry_repo)
+        client.app.state.telemetry_buffer = buffer
+
+        def at(recorded_at):
+            return {**self._reading(fermentation_id, 0), "recorded_at": recorded_at}
+
+        response = client.post(
+            "/api/v1/samples/telemetry",
+            json={
+                "readings": [
+                    at("2024-11-02T12:00:00+02:00"),
+                    at("2024-10-31T10:00:00"),
+                    at("2099-01-01T00:00:00Z"),
+                ]
+            },
+        )
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.json()["accepted"] == 1
+        assert response.json()["rejected_readings"] == 2
+        asyncio.run(buffer.flush())
+        (written,) = telemetry_repo.bulk_insert_readings.call_args.args[0]
+        assert written.recorded_at == datetime(2024, 11, 2, 10, 0)
+
+    def test_telemetry_unavailable_without_buffer(self, client, mock_user_context):
+        """Should return 503 when the ingestion buffer is not running."""
+        response = client.post(
+            "/api/v1/samples/telemetry", json={"readings": [self._reading(1, 0)]}
+        )
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+    def test_telemetry_invalid_payload(self, client, mock_user_context):
+        """Should return 422 for an empty reading list."""
+        client.app.state.telemetry_buffer = TelemetryIngestionBuffer(AsyncMock())
+
+        response = client.post("/api/v1/samples/telemetry", json={"readings": []})
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 # =============================================================================
 # DELETE /api/v1/samples/{id}
 # =============================================================================
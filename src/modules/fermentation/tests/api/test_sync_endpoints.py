@@ -0,0 +1,158 @@
+"""
+Tests for the delta sync API endpoint.
+
+Test Structure:
+- GET /sync/changes: full sync, incremental sync, deletions, paging, errors
+
+The endpoint runs against the shared SQLite test database through the real
+ChangeFeedRepository; the safety lag is disabled so freshly written rows
+are visible immediately.
+"""
+
+import pytest
+from fastapi import status
+
+from src.modules.fermentation.src.api.dependencies import get_sync_service
+from src.modules.fermentation.src.repository_component.repositories.change_feed_repository import (
+    ChangeFeedRepository,
+)
+from src.modules.fermentation.src.service_component.services.sync_service import (
+    SyncService,
+)
+from src.shared.infra.repository.fastapi_session_manager import FastAPISessionManager
+
+FERMENTATION_DATA = {
+    "vintage_year": 2024,
+    "yeast_strain": "EC-1118",
+    "input_mass_kg": 1000.0,
+    "initial_sugar_brix": 22.5,
+    "initial_density": 1.095,
+    "start_date": "2024-11-01T10:00:00",
+}
+
+
+@pytest.fixture
+def sync_client(client, override_db_session):
+    """Client whose sync service reads without the commit safety lag."""
+    client.app.dependency_overrides[get_sync_service] = lambda: SyncService(
+        change_feed_repo=ChangeFeedRepository(
+            FastAPISessionManager(override_db_session)
+        ),
+        safety_lag_seconds=0,
+    )
+    return client
+
+
+def _add_sample(client, fermentation_id, day, value):
+    response = client.post(
+        f"/api/v1/fermentations/{fermentation_id}/samples",
+        json={
+            "sample_type": "sugar",
+            "value": value,
+            "units": "°Brix",
+            "recorded_at": f"2024-11-{day:02d}T10:00:00",
+        },
+    )
+    return response.json()["id"]
+
+
+class TestGetSyncChanges:
+    """Tests for GET /api/v1/sync/changes endpoint."""
+
+    def test_full_then_incremental_sync(self, sync_client):
+        """
+        Should return a snapshot first, then only what changed since.
+
+        Given: A fermentation with one sample
+        When: Full sync, add a sample, sync with the returned cursor
+        Then: Second response adds the new sample; anything else is an
+              unchanged re-send from the overlap window
+        """
+        fermentation_id = sync_client.post(
+            "/api/v1/fermentations", json=FERMENTATION_DATA
+        ).json()["id"]
+        first_sample = _add_sample(sync_client, fermentation_id, 2, 21.0)
+
+        full = sync_client.get("/api/v1/sync/changes")
+
+        assert full.status_code == status.HTTP_200_OK
+        data = full.json()
+        assert fermentation_id in [f["id"] for f in data["fermentations"]]
+        assert first_sample in [s["id"] for s in data["samples"]]
+        assert data["has_more"] is False
+
+        second_sample = _add_sample(sync_client, fermentation_id, 3, 19.5)
+        delta = sync_client.get(
+            "/api/v1/sync/changes", params={"cursor": data["next_cursor"]}
+        ).json()
+
+        seen = {(s["id"], s["updated_at"]) for s in data["samples"]}
+        seen |= {(f["id"], f["updated_at"]) for f in data["fermentations"]}
+        new_samples = [
+            s["id"] for s in delta["samples"] if (s["id"], s["updated_at"]) not in seen
+        ]
+        assert new_samples == [second_sample]
+        assert all(
+            (f["id"], f["updated_at"]) in seen for f in delta["fermentations"]
+        )
+        assert delta["deleted"] == []
+
+    def test_soft_deleted_sample_reported_as_deletion(self, sync_client):
+        """Should send deleted samples as tombstones, not payloads."""
+        fermentation_id = sync_client.post(
+            "/api/v1/fermentations", json=FERMENTATION_DATA
+        ).json()["id"]
+        sample_id = _add_sample(sync_client, fermentation_id, 2, 21.0)
+        cursor = sync_client.get("/api/v1/sync/changes").json()["next_cursor"]
+
+        sync_client.delete(
+            f"/api/v1/samples/{sample_id}", params={"fermentation_id": fermentation_id}
+        )
+        delta = sync_client.get(
+            "/api/v1/sync/changes", params={"cursor": cursor}
+        ).json()
+
+        assert delta["samples"] == []
+        assert [(d["entity"], d["id"]) for d in delta["deleted"]] == [
+            ("sample", sample_id)
+        ]
+
+    def test_paging_with_limit(self, sync_client):
+        """Should page through a stream with has_more and next_cursor."""
+        fermentation_id = sync_client.post(
+            "/api/v1/fermentations", json=FERMENTATION_DATA
+        ).json()["id"]
+        cursor = sync_client.get("/api/v1/sync/changes").json()["next_cursor"]
+        created = [
+            _add_sample(sync_client, fermentation_id, day, 22.0 - day)
+            for day in (2, 3, 4)
+        ]
+
+        seen = []
+        has_more = True
+        while has_more:
+            page = sync_client.get(
+                "/api/v1/sync/changes",
+                params={"cursor": cursor, "limit": 2, "entities": "sample"},
+            ).json()
+            seen.extend(s["id"] for s in page["samples"])
+            cursor, has_more = page["next_cursor"], page["has_more"]
+
+        assert seen == created
+
+    def test_invalid_cursor(self, sync_client):
+        """Should return 400 for a cursor the server didn't issue."""
+        response = sync_client.get(
+            "/api/v1/sync/changes", params={"cursor": "garbage"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_sync_without_authentication(self, unauthenticated_client):
+        """Should require authentication."""
+        response = unauthenticated_client.get("/api/v1/sync/changes")
+
+        assert response.status_code in [
+            status.HTTP_401_UNAUTHORIZED,
+            status.HTTP_403_FORBIDDEN,
+        ]
@@ -65,8 +65,9 @@ async def test_get_fermentation_service():
 
     repository = await get_fermentation_repository(mock_session)
     validator = get_fermentation_validator()
+    sample_repo = await get_sample_repository(mock_session)
 
-    service = await get_fermentation_service(repository, validator)
+    service = await get_fermentation_service(repository, validator, sample_repo)
 
     assert service is not None
     assert "Service" in service.__class__.__name__
@@ -206,7 +207,8 @@ async def test_full_fermentation_dependency_chain():
     # Simulate FastAPI dependency resolution
     repository = await get_fermentation_repository(mock_session)
     validator = get_fermentation_validator()
-    service = await get_fermentation_service(repository, validator)
+    sample_repo = await get_sample_repository(mock_session)
+    service = await get_fermentation_service(repository, validator, sample_repo)
 
     # Verify all components are properly initialized
     assert service is not None
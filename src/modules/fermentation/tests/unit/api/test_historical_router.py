@@ -18,7 +18,9 @@ from src.modules.fermentation.src.api.routers.historical_router import (
     router,
     get_winery_id,
 )
+from src.modules.fermentation.src.api.error_handlers import register_error_handlers
 from src.modules.fermentation.src.api.dependencies import (
+    get_export_service,
     get_fermentation_service,
     get_pattern_analysis_service,
     get_sample_service,
@@ -34,17 +36,33 @@ from src.modules.fermentation.src.service_component.interfaces.sample_service_in
 )
 from src.modules.fermentation.src.domain.entities.fermentation import Fermentation
 from src.modules.fermentation.src.domain.entities.samples.base_sample import BaseSample
-from src.modules.fermentation.src.service_component.errors import NotFoundError
+from src.modules.fermentation.src.service_component.errors import (
+    ExportUnavailable,
+    InvalidPageCursor,
+    NotFoundError,
+)
+from src.modules.fermentation.src.domain.enums.export_dataset import ExportDataset
+from src.modules.fermentation.src.service_component.services.fermentation_export_service import (
+    DEFAULT_EXPORT_CHUNK_SIZE,
+)
+from src.modules.fermentation.src.domain.dtos import (
+    FermentationListFilter,
+    FermentationPage,
+)
 from src.shared.api.constants import API_V1_PREFIX
+from src.shared.auth.domain.dtos import UserContext
+from src.shared.auth.domain.enums.user_role import UserRole
+from src.shared.auth.infra.api.dependencies import get_current_user
 
 # Test Fixtures
 
 
 @pytest.fixture
 def app():
-    """Create FastAPI app with router."""
+    """Create FastAPI app with router and the module's error handlers."""
     app = FastAPI()
     app.include_router(router, prefix=API_V1_PREFIX)
+    register_error_handlers(app)
     return app
 
 
@@ -54,6 +72,7 @@ def mock_fermentation_service():
     service = create_autospec(IFermentationService, instance=True)
     service.get_fermentation = AsyncMock()
     service.get_fermentations_by_winery = AsyncMock()
+    service.list_fermentations_page = AsyncMock()
     return service
 
 
@@ -152,9 +171,9 @@ class TestListHistoricalFermentations:
     ):
         """Test listing fermentations with filters returns paginated response."""
         # Arrange
-        mock_fermentation_service.get_fermentations_by_winery.return_value = [
-            mock_fermentation
-        ]
+        mock_fermentation_service.list_fermentations_page.return_value = (
+            FermentationPage(items=[mock_fermentation], total=1)
+        )
 
         # Act
         response = client.get(
@@ -176,20 +195,25 @@ class TestListHistoricalFermentations:
         assert "total" in data
         assert "limit" in data
         assert "offset" in data
+        assert data["next_cursor"] is None
         assert len(data["items"]) == 1
         assert data["items"][0]["id"] == 1
         assert data["items"][0]["winery_id"] == 1
         assert data["items"][0]["status"] == "completed"
 
-        # Verify service was called with correct parameters (ADR-034: uses get_fermentations_by_winery)
-        mock_fermentation_service.get_fermentations_by_winery.assert_called_once()
-        call_kwargs = (
-            mock_fermentation_service.get_fermentations_by_winery.call_args.kwargs
-        )
+        # All filters are passed down to the query (ADR-034: data_source='HISTORICAL')
+        mock_fermentation_service.list_fermentations_page.assert_called_once()
+        call_kwargs = mock_fermentation_service.list_fermentations_page.call_args.kwargs
         assert call_kwargs["winery_id"] == 1
-        assert call_kwargs["data_source"] == "HISTORICAL"  # ADR-034
-        assert call_kwargs["status"] == "completed"
-        assert call_kwargs["include_completed"] == True
+        assert call_kwargs["filters"] == FermentationListFilter(
+            data_source="HISTORICAL",
+            start_date_from=date(2024, 1, 1),
+            start_date_to=date(2024, 12, 31),
+            fruit_origin_id=5,
+            status="completed",
+        )
+        assert call_kwargs["limit"] == 100
+        assert call_kwargs["cursor"] is None
 
     @pytest.mark.asyncio
     async def test_list_with_minimal_parameters(
@@ -197,9 +221,9 @@ class TestListHistoricalFermentations:
     ):
         """Test listing fermentations with only required parameters."""
         # Arrange
-        mock_fermentation_service.get_fermentations_by_winery.return_value = [
-            mock_fermentation
-        ]
+        mock_fermentation_service.list_fermentations_page.return_value = (
+            FermentationPage(items=[mock_fermentation], total=1)
+        )
 
         # Act
         response = client.get("/api/v1/fermentation/historical")
@@ -210,17 +234,54 @@ class TestListHistoricalFermentations:
         assert len(data["items"]) == 1
 
         # Verify service called with data_source='HISTORICAL' (ADR-034)
-        call_kwargs = (
-            mock_fermentation_service.get_fermentations_by_winery.call_args.kwargs
+        call_kwargs = mock_fermentation_service.list_fermentations_page.call_args.kwargs
+        assert call_kwargs["filters"] == FermentationListFilter(data_source="HISTORICAL")
+
+    @pytest.mark.asyncio
+    async def test_list_passes_cursor_and_returns_next_cursor(
+        self, client, mock_fermentation_service, mock_fermentation
+    ):
+        """Test that cursor pages forward the cursor and expose the next one."""
+        # Arrange
+        mock_fermentation_service.list_fermentations_page.return_value = (
+            FermentationPage(items=[mock_fermentation], next_cursor="next-page")
         )
-        assert call_kwargs["data_source"] == "HISTORICAL"
-        assert call_kwargs["include_completed"] == True
+
+        # Act
+        response = client.get(
+            "/api/v1/fermentation/historical", params={"cursor": "this-page"}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["next_cursor"] == "next-page"
+        assert data["total"] is None
+        call_kwargs = mock_fermentation_service.list_fermentations_page.call_args.kwargs
+        assert call_kwargs["cursor"] == "this-page"
+
+    @pytest.mark.asyncio
+    async def test_list_rejects_invalid_cursor(self, client, mock_fermentation_service):
+        """Test that a malformed or foreign cursor is a client error."""
+        # Arrange
+        mock_fermentation_service.list_fermentations_page.side_effect = (
+            InvalidPageCursor("Page cursor was issued for another winery")
+        )
+
+        # Act
+        response = client.get(
+            "/api/v1/fermentation/historical", params={"cursor": "foreign"}
+        )
+
+        # Assert
+        assert response.status_code == 400
+        assert "another winery" in response.json()["detail"]
 
     @pytest.mark.asyncio
     async def test_list_handles_service_errors(self, client, mock_fermentation_service):
         """Test that service errors are handled gracefully."""
         # Arrange
-        mock_fermentation_service.get_fermentations_by_winery.side_effect = Exception(
+        mock_fermentation_service.list_fermentations_page.side_effect = Exception(
             "Database error"
         )
 
@@ -586,3 +647,89 @@ class TestListImportJobs:
 
         # Assert
         assert response.status_code == 200
+
+
+# Test Class: GET /api/fermentation/historical/export/{dataset}
+
+
+class TestExportHistory:
+    """Test suite for the columnar export endpoint."""
+
+    @pytest.fixture
+    def mock_export_service(self, app):
+        service = Mock()
+
+        async def _stream(winery_id, dataset, chunk_size):
+            yield b"schema"
+            yield b"batch"
+
+        service.stream_ipc = Mock(side_effect=_stream)
+        app.dependency_overrides[get_export_service] = lambda: service
+        app.dependency_overrides[get_current_user] = lambda: UserContext(
+            user_id=1, email="winemaker@test.com", winery_id=1, role=UserRole.WINEMAKER
+        )
+        return service
+
+    @pytest.mark.asyncio
+    async def test_export_streams_arrow_ipc(self, client, mock_export_service):
+        """Test that the dataset is streamed chunk by chunk as Arrow IPC."""
+        # Act
+        response = client.get(
+            "/api/v1/fermentation/historical/export/samples",
+            params={"chunk_size": 500},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+        assert "winery_1_samples.arrows" in response.headers["content-disposition"]
+        assert response.content == b"schemabatch"
+        mock_export_service.stream_ipc.assert_called_once_with(
+            1, ExportDataset.SAMPLES, 500
+        )
+
+    @pytest.mark.asyncio
+    async def test_export_scoped_by_user_not_header(
+        self, app, client, mock_export_service
+    ):
+        """Test that an X-Winery-ID header can't export another winery."""
+        # The header dependency would resolve to the other winery
+        app.dependency_overrides.pop(get_winery_id)
+
+        # Act
+        response = client.get(
+            "/api/v1/fermentation/historical/export/fermentations",
+            headers={"X-Winery-ID": "2"},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert "winery_1_fermentations.arrows" in response.headers["content-disposition"]
+        mock_export_service.stream_ipc.assert_called_once_with(
+            1, ExportDataset.FERMENTATIONS, DEFAULT_EXPORT_CHUNK_SIZE
+        )
+
+    @pytest.mark.asyncio
+    async def test_export_rejects_unknown_dataset(self, client, mock_export_service):
+        """Test that only the known datasets can be exported."""
+        # Act
+        response = client.get("/api/v1/fermentation/historical/export/users")
+
+        # Assert
+        assert response.status_code == 422
+        mock_export_service.stream_ipc.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_export_unavailable_without_pyarrow(self, client, mock_export_service):
+        """Test that a missing Arrow runtime is reported before streaming."""
+        # Arrange
+        mock_export_service.schema.side_effect = ExportUnavailable(
+            "Columnar export requires pyarrow"
+        )
+
+        # Act
+        response = client.get("/api/v1/fermentation/historical/export/fermentations")
+
+        # Assert
+        assert response.status_code == 503
+        mock_export_service.stream_ipc.assert_not_called()
@@ -21,6 +21,9 @@ from src.modules.fermentation.src.service_component.etl.etl_service import (
     ETLService,
     ImportResult,
 )
+from src.modules.fermentation.src.service_component.etl.etl_validator import (
+    PostValidationResult,
+)
 from src.modules.fermentation.src.domain.enums.data_source import DataSource
 from src.modules.fermentation.src.domain.interfaces.harvest_lot_provider_interface import (
     IHarvestLotProvider,
@@ -642,6 +645,40 @@ class TestETLService:
         call_args = mock_fruit_origin_service.ensure_harvest_lot_for_import.call_args
         assert call_args.kwargs["winery_id"] == 5
 
+    @pytest.mark.asyncio
+    async def test_sample_before_fermentation_start_fails_that_fermentation(
+        self, etl_service, tmp_path
+    ):
+        """ETL should never write a sample that predates its fermentation."""
+        excel_file = tmp_path / "sample_before_start.xlsx"
+        df = pd.DataFrame(
+            {
+                "fermentation_code": ["FERM-001", "FERM-001"],
+                # Fermentation is created with the first row's start date
+                "fermentation_start_date": ["2023-03-10", "2023-03-01"],
+                "fermentation_end_date": ["2023-04-10", "2023-04-10"],
+                "harvest_date": ["2023-02-25", "2023-02-25"],
+                "vineyard_name": ["Viña Norte", "Viña Norte"],
+                "grape_variety": ["Cabernet", "Cabernet"],
+                "harvest_mass_kg": [1500, 1500],
+                "sample_date": ["2023-03-12", "2023-03-05"],
+                "density": [1.090, 1.085],
+                "temperature_celsius": [18, 19],
+            }
+        )
+        df.to_excel(excel_file, index=False, engine="openpyxl")
+        etl_service.validator.post_validate = AsyncMock(
+            return_value=PostValidationResult(valid_row_count=2)
+        )
+
+        result = await etl_service.import_file(excel_file, winery_id=1, user_id=1)
+
+        assert result.fermentations_created == 0
+        assert result.samples_created == 0
+        assert result.failed_fermentations[0]["code"] == "FERM-001"
+        assert "before fermentation_start_date" in result.failed_fermentations[0]["error"]
+        etl_service._mock_session_manager.commit.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_partial_success_one_fermentation_fails(
         self,
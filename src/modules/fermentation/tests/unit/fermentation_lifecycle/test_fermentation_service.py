@@ -25,7 +25,15 @@ from src.modules.fermentation.src.domain.repositories.fermentation_repository_in
     IFermentationRepository,
 )
 from src.modules.fermentation.src.domain.entities.fermentation import Fermentation
-from src.modules.fermentation.src.domain.dtos import FermentationCreate
+from src.modules.fermentation.src.domain.dtos import (
+    FermentationCreate,
+    FermentationListFilter,
+    FermentationUpdate,
+)
+from src.modules.fermentation.src.service_component.errors import (
+    BusinessRuleViolation,
+    InvalidPageCursor,
+)
 from src.modules.fermentation.src.service_component.models.schemas.validations.validation_result import (
     ValidationResult,
 )
@@ -2213,3 +2221,190 @@ class TestCreateFermentationWithBlend:
         # Assert
         assert result == expected_fermentation_entity
         mock_uow.commit.assert_called_once()
+
+
+class TestListFermentationsPage:
+    """
+    Test suite for FermentationService.list_fermentations_page()
+
+    Business Rules:
+    - Filters and pagination are delegated to the repository query
+    - next_cursor is set only when another page exists
+    - Cursors are bound to the winery and the filters they were issued for
+    - The total is counted for the first page only
+    """
+
+    FILTERS = FermentationListFilter(data_source="HISTORICAL", status="COMPLETED")
+
+    @pytest.fixture
+    def mock_fermentation_repo(self) -> Mock:
+        repo = create_autospec(IFermentationRepository, instance=True)
+        repo.count_by_data_source.return_value = 3
+        return repo
+
+    @pytest.fixture
+    def service(self, mock_fermentation_repo: Mock) -> FermentationService:
+        return FermentationService(
+            fermentation_repo=mock_fermentation_repo,
+            validator=create_autospec(IFermentationValidator, instance=True),
+        )
+
+    @staticmethod
+    def _fermentations(*ids: int) -> List[Mock]:
+        rows = []
+        for row_id in ids:
+            f = Mock(spec=Fermentation)
+            f.id = row_id
+            f.start_date = datetime(2015, 9, row_id, 8, 0, 0)
+            rows.append(f)
+        return rows
+
+    @pytest.mark.asyncio
+    async def test_first_page_has_cursor_and_total(
+        self, service: FermentationService, mock_fermentation_repo: Mock
+    ):
+        # One row more than the limit means there is a next page
+        mock_fermentation_repo.list_page_by_data_source.return_value = (
+            self._fermentations(3, 2, 1)
+        )
+
+        page = await service.list_fermentations_page(
+            winery_id=1, filters=self.FILTERS, limit=2
+        )
+
+        assert [f.id for f in page.items] == [3, 2]
+        assert page.total == 3
+        assert page.next_cursor is not None
+        mock_fermentation_repo.list_page_by_data_source.assert_called_once_with(
+            winery_id=1, filters=self.FILTERS, limit=3, after=None, offset=0
+        )
+
+    @pytest.mark.asyncio
+    async def test_cursor_continues_after_last_row_without_recounting(
+        self, service: FermentationService, mock_fermentation_repo: Mock
+    ):
+        cursor = service.encode_list_cursor(
+            1, self.FILTERS, (datetime(2015, 9, 2, 8, 0, 0), 2)
+        )
+        mock_fermentation_repo.list_page_by_data_source.return_value = (
+            self._fermentations(1)
+        )
+
+        page = await service.list_fermentations_page(
+            winery_id=1, filters=self.FILTERS, limit=2, cursor=cursor
+        )
+
+        assert [f.id for f in page.items] == [1]
+        assert page.next_cursor is None
+        assert page.total is None
+        call_kwargs = mock_fermentation_repo.list_page_by_data_source.call_args.kwargs
+        assert call_kwargs["after"] == (datetime(2015, 9, 2, 8, 0, 0), 2)
+        mock_fermentation_repo.count_by_data_source.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "winery_id, filters, message",
+        [
+            (2, FILTERS, "another winery"),
+            (1, FermentationListFilter(data_source="HISTORICAL"), "different filters"),
+        ],
+    )
+    async def test_cursor_is_bound_to_winery_and_filters(
+        self, service: FermentationService, winery_id, filters, message
+    ):
+        cursor = service.encode_list_cursor(
+            1, self.FILTERS, (datetime(2015, 9, 2, 8, 0, 0), 2)
+        )
+
+        with pytest.raises(InvalidPageCursor, match=message):
+            await service.list_fermentations_page(
+                winery_id=winery_id, filters=filters, cursor=cursor
+            )
+
+    @pytest.mark.asyncio
+    async def test_malformed_cursor_is_rejected(self, service: FermentationService):
+        with pytest.raises(InvalidPageCursor, match="Malformed"):
+            await service.list_fermentations_page(
+                winery_id=1, filters=self.FILTERS, cursor="not-a-cursor"
+            )
+
+
+class TestUpdateFermentationStartDate:
+    """
+    Test suite for start_date changes in FermentationService.update_fermentation()
+
+    Business Rules:
+    - start_date may move earlier freely
+    - start_date may not move past the earliest recorded sample (sample
+      reads are bounded by recorded_at >= start_date)
+    """
+
+    START = datetime(2024, 11, 1, 10, 0, 0)
+
+    @pytest.fixture
+    def mock_fermentation_repo(self) -> Mock:
+        repo = create_autospec(IFermentationRepository, instance=True)
+        fermentation = Mock(spec=Fermentation)
+        fermentation.start_date = self.START
+        repo.get_by_id.return_value = fermentation
+        return repo
+
+    @pytest.fixture
+    def mock_sample_repo(self) -> Mock:
+        from src.modules.fermentation.src.domain.repositories.sample_repository_interface import (
+            ISampleRepository,
+        )
+
+        repo = create_autospec(ISampleRepository, instance=True)
+        repo.get_earliest_recorded_at.return_value = datetime(2024, 11, 3, 10, 0, 0)
+        return repo
+
+    @pytest.fixture
+    def service(
+        self, mock_fermentation_repo: Mock, mock_sample_repo: Mock
+    ) -> FermentationService:
+        return FermentationService(
+            fermentation_repo=mock_fermentation_repo,
+            validator=create_autospec(IFermentationValidator, instance=True),
+            sample_repo=mock_sample_repo,
+        )
+
+    @pytest.mark.asyncio
+    async def test_start_date_past_earliest_sample_rejected(
+        self, service: FermentationService
+    ):
+        with pytest.raises(BusinessRuleViolation, match="earliest sample"):
+            await service.update_fermentation(
+                fermentation_id=1,
+                winery_id=1,
+                user_id=1,
+                data=FermentationUpdate(start_date=datetime(2024, 11, 4, 10, 0, 0)),
+            )
+
+    @pytest.mark.asyncio
+    async def test_start_date_up_to_earliest_sample_allowed(
+        self, service: FermentationService
+    ):
+        new_start = datetime(2024, 11, 3, 10, 0, 0)
+
+        fermentation = await service.update_fermentation(
+            fermentation_id=1,
+            winery_id=1,
+            user_id=1,
+            data=FermentationUpdate(start_date=new_start),
+        )
+
+        assert fermentation.start_date == new_start
+
+    @pytest.mark.asyncio
+    async def test_earlier_start_date_skips_sample_lookup(
+        self, service: FermentationService, mock_sample_repo: Mock
+    ):
+        await service.update_fermentation(
+            fermentation_id=1,
+            winery_id=1,
+            user_id=1,
+            data=FermentationUpdate(start_date=datetime(2024, 10, 30, 10, 0, 0)),
+        )
+
+        mock_sample_repo.get_earliest_recorded_at.assert_not_called()
@@ -37,6 +37,7 @@ def test_fermentation_service_interface_methods() -> None:
         "create_fermentation_with_blend",  # New method for blend creation
         "get_fermentation",
         "get_fermentations_by_winery",
+        "list_fermentations_page",  # Filtered, cursor-paginated listing
         "update_fermentation",
         "update_status",
         "complete_fermentation",
@@ -20,10 +20,13 @@ def test_fermentation_repository_interface_methods() -> None:
     required_methods = {
         "create",
         "get_by_id",
+        "get_by_ids",  # Batch ownership checks
         "update_status",
         "get_by_status",
         "get_by_winery",
         "list_by_data_source",  # ADR-029: Data source tracking
+        "list_page_by_data_source",  # Filtered keyset listing
+        "count_by_data_source",
     }
 
     # NOTE: Sample operations removed (ADR-003: Separation of Concerns)
@@ -24,7 +24,9 @@ def test_sample_repository_interface_methods() -> None:
         "get_samples_in_timerange",
         "get_latest_sample",
         "get_fermentation_start_date",
+        "get_earliest_recorded_at",  # start_date updates may not pass a sample
         "get_latest_sample_by_type",
+        "get_latest_samples_by_fermentation_ids",  # Batch ingestion window
         "soft_delete_sample",
         "check_duplicate_timestamp",
         "bulk_upsert_samples",
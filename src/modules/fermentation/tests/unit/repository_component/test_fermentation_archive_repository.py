@@ -0,0 +1,140 @@
+"""
+Unit tests for FermentationArchiveRepository (hot-table side of archival).
+
+Following ADR-012 testing patterns: only the session manager is mocked.
+"""
+
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from src.modules.fermentation.src.domain.dtos import ArchivedRows
+from src.modules.fermentation.src.repository_component.repositories.fermentation_archive_repository import (
+    FermentationArchiveRepository,
+)
+
+# Import User so SQLAlchemy can configure Fermentation when compiling queries
+from src.shared.auth.domain.entities.user import User  # noqa: F401
+
+from src.shared.testing.unit import MockSessionManagerBuilder, create_query_result
+
+
+def _rowcount(count):
+    result = MagicMock()
+    result.rowcount = count
+    return result
+
+
+def _stats(count, max_updated_at=None):
+    result = MagicMock()
+    result.one.return_value = (count, max_updated_at)
+    return result
+
+
+def _row(day):
+    return SimpleNamespace(updated_at=datetime(2025, 9, day))
+
+
+def _repo(results):
+    statements = []
+    queue = list(results)
+
+    async def _execute(statement, *args, **kwargs):
+        statements.append(statement)
+        return queue.pop(0)
+
+    builder = MockSessionManagerBuilder().with_execute_side_effect(_execute)
+    return FermentationArchiveRepository(builder.build()), statements
+
+
+def _sql(statement) -> str:
+    return str(
+        statement.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+class TestFermentationArchiveRepository:
+    @pytest.mark.asyncio
+    async def test_list_archivable_selects_completed_unarchived(self):
+        repo, statements = _repo([create_query_result([])])
+
+        await repo.list_archivable(completed_before=datetime(2025, 10, 1), limit=20)
+
+        sql = _sql(statements[0])
+        assert "fermentations.status = 'COMPLETED'" in sql
+        assert "fermentations.archived_at IS NULL" in sql
+        assert "fermentations.updated_at < '2025-10-01 00:00:00'" in sql
+        assert "LIMIT 20" in sql
+
+    @pytest.mark.asyncio
+    async def test_purge_commits_when_rows_match_the_export(self):
+        rows = ArchivedRows(samples=[_row(1), _row(3)], notes=[_row(2)])
+        repo, statements = _repo(
+            [
+                _stats(2, datetime(2025, 9, 3)),
+                _rowcount(2),
+                _stats(1, datetime(2025, 9, 2)),
+                _rowcount(1),
+                _rowcount(1),
+            ]
+        )
+
+        assert await repo.purge_archived(5, rows, archived_at=datetime(2026, 10, 18))
+
+        sql = [_sql(s) for s in statements]
+        assert "max(samples.updated_at)" in sql[0]
+        assert sql[1].startswith("DELETE FROM samples WHERE samples.fermentation_id = 5")
+        assert "samples.updated_at <= '2025-09-03 00:00:00'" in sql[1]
+        assert sql[3].startswith("DELETE FROM fermentation_notes")
+        assert "SET archived_at='2026-10-18 00:00:00'" in sql[4]
+        session = await repo.get_session()
+        async with session as s:
+            s.commit.assert_awaited_once()
+            s.rollback.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_purge_rolls_back_when_rows_were_added(self):
+        rows = ArchivedRows(samples=[_row(1)], notes=[])
+        # A note was added after the export
+        repo, _ = _repo(
+            [
+                _stats(1, datetime(2025, 9, 1)),
+                _rowcount(1),
+                _stats(1, datetime(2025, 9, 4)),
+                _rowcount(1),
+                _rowcount(1),
+            ]
+        )
+
+        assert not await repo.purge_archived(5, rows, archived_at=datetime(2026, 10, 18))
+
+        session = await repo.get_session()
+        async with session as s:
+            s.rollback.assert_awaited_once()
+            s.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_purge_rolls_back_when_a_row_was_edited(self):
+        rows = ArchivedRows(samples=[_row(1), _row(2)], notes=[])
+        # Same count, but a sample was corrected after the export
+        repo, _ = _repo(
+            [
+                _stats(2, datetime(2025, 9, 20)),
+                _rowcount(1),
+                _stats(0),
+                _rowcount(0),
+                _rowcount(1),
+            ]
+        )
+
+        assert not await repo.purge_archived(5, rows, archived_at=datetime(2026, 10, 18))
+
+        session = await repo.get_session()
+        async with session as s:
+            s.rollback.assert_awaited_once()
+            s.commit.assert_not_called()
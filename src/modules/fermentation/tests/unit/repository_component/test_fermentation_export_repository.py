@@ -0,0 +1,137 @@
+"""
+Unit tests for FermentationExportRepository (chunked history export reads).
+
+Following ADR-012 testing patterns: only the session manager is mocked.
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from src.modules.fermentation.src.domain.enums.export_dataset import ExportDataset
+from src.modules.fermentation.src.repository_component.repositories.fermentation_export_repository import (
+    FermentationExportRepository,
+)
+from src.shared.infra.repository.errors import RepositoryError
+
+# Import User so SQLAlchemy can configure Fermentation when compiling queries
+from src.shared.auth.domain.entities.user import User  # noqa: F401
+
+from src.shared.testing.unit import MockSessionManagerBuilder
+
+
+def _sql(statement) -> str:
+    return str(
+        statement.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+def _streaming_repo(partitions=None, error=None):
+    """Repository whose session streams the given partitions of rows."""
+
+    async def _partitions(size):
+        for partition in partitions or []:
+            yield partition
+
+    result = MagicMock()
+    result.mappings.return_value.partitions.side_effect = _partitions
+    session = AsyncMock()
+    session.stream.side_effect = error
+    session.stream.return_value = result
+    builder = MockSessionManagerBuilder().with_session(session)
+    return FermentationExportRepository(builder.build()), session, result
+
+
+async def _collect(stream):
+    return [chunk async for chunk in stream]
+
+
+class TestExportQueries:
+    def test_samples_are_pivoted_by_type(self):
+        repo = FermentationExportRepository(MockSessionManagerBuilder().build())
+
+        sql = _sql(repo.query(7, ExportDataset.SAMPLES))
+
+        assert (
+            "max(CASE WHEN (samples.sample_type = 'sugar') THEN samples.value END) AS sugar"
+            in sql
+        )
+        assert "AS acetic_acid" in sql
+        assert "fermentations.winery_id = 7" in sql
+        assert "samples.is_deleted = false" in sql
+        assert "GROUP BY samples.fermentation_id, samples.recorded_at" in sql
+
+    def test_lot_sources_are_scoped_through_their_fermentation(self):
+        repo = FermentationExportRepository(MockSessionManagerBuilder().build())
+
+        sql = _sql(repo.query(7, ExportDataset.LOT_SOURCES))
+
+        assert (
+            "JOIN fermentations "
+            "ON fermentations.id = fermentation_lot_sources.fermentation_id" in sql
+        )
+        assert "fermentations.winery_id = 7" in sql
+
+    def test_analyses_are_scoped_by_the_winery_uuid_mapping(self):
+        repo = FermentationExportRepository(MockSessionManagerBuilder().build())
+
+        sql = _sql(repo.query(7, ExportDataset.ANALYSES))
+
+        assert "analysis.winery_id = '00000000-0000-0000-0000-000000000007'" in sql
+        assert (
+            "JOIN fermentations ON analysis.fermentation_id = "
+            "CAST(lpad(to_hex(fermentations.id), 32, '0') AS UUID)" in sql
+        )
+        assert "fermentations.winery_id = 7" in sql
+        assert "fermentations.is_deleted = false" in sql
+
+    def test_columns_match_the_selected_columns(self):
+        repo = FermentationExportRepository(MockSessionManagerBuilder().build())
+
+        assert repo.columns(ExportDataset.SAMPLES) == [
+            ("fermentation_id", "int64"),
+            ("recorded_at", "timestamp"),
+            ("sugar", "float64"),
+            ("temperature", "float64"),
+            ("density", "float64"),
+            ("acetic_acid", "float64"),
+        ]
+        assert ("harvest_lot_id", "int64") in repo.columns(ExportDataset.LOT_SOURCES)
+        assert ("archived_at", "timestamp") in repo.columns(ExportDataset.FERMENTATIONS)
+        assert repo.columns(ExportDataset.ANALYSES) == [
+            ("id", "string"),
+            ("fermentation_id", "int64"),
+            ("status", "string"),
+            ("analyzed_at", "timestamp"),
+            ("historical_samples_count", "int64"),
+        ]
+
+
+class TestStream:
+    @pytest.mark.asyncio
+    async def test_yields_one_chunk_per_cursor_partition(self):
+        recorded_at = datetime(2024, 9, 2, 8)
+        repo, session, result = _streaming_repo(
+            [
+                [{"fermentation_id": 1, "recorded_at": recorded_at}],
+                [{"fermentation_id": 2, "recorded_at": recorded_at}],
+            ]
+        )
+
+        chunks = await _collect(repo.stream(7, ExportDataset.SAMPLES, chunk_size=500))
+
+        assert [chunk[0]["fermentation_id"] for chunk in chunks] == [1, 2]
+        statement = session.stream.await_args.args[0]
+        assert statement.get_execution_options()["yield_per"] == 500
+        result.mappings.return_value.partitions.assert_called_once_with(500)
+
+    @pytest.mark.asyncio
+    async def test_database_errors_are_mapped(self):
+        repo, _, _ = _streaming_repo(error=RuntimeError("connection lost"))
+
+        with pytest.raises(RepositoryError):
+            await _collect(repo.stream(7, ExportDataset.FERMENTATIONS, chunk_size=10))
@@ -5,11 +5,20 @@ Following ADR-012 testing patterns for proper mocking.
 """
 
 import pytest
+from datetime import date, datetime
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
 from src.modules.fermentation.src.repository_component.repositories.fermentation_repository import (
     FermentationRepository,
 )
 from src.modules.fermentation.src.domain.entities.fermentation import Fermentation
 from src.modules.fermentation.src.domain.enums import DataSource
+from src.modules.fermentation.src.domain.dtos import FermentationListFilter
+
+# Import User so SQLAlchemy can configure Fermentation when compiling queries
+from src.shared.auth.domain.entities.user import User  # noqa: F401
 
 # Import ADR-012 testing utilities
 from src.shared.testing.unit import (
@@ -269,3 +278,100 @@ class TestFermentationRepositoryListByDataSource:
         )
 
         assert result == []
+
+
+class TestFermentationRepositoryListPageByDataSource:
+    """Test suite for list_page_by_data_source() / count_by_data_source()"""
+
+    @staticmethod
+    def _capturing_repo(result):
+        """Repository whose session records the executed statements."""
+        statements = []
+
+        async def _execute(statement, *args, **kwargs):
+            statements.append(statement)
+            return result
+
+        session_manager = (
+            MockSessionManagerBuilder().with_execute_side_effect(_execute).build()
+        )
+        return FermentationRepository(session_manager), statements
+
+    @staticmethod
+    def _sql(statement) -> str:
+        return str(
+            statement.compile(
+                dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_filters_and_order_are_pushed_to_the_query(self):
+        """
+        Given: Date range, status and fruit origin filters
+        When: Listing the first page
+        Then: All filters, the order and the limit are in the SQL
+        """
+        repo, statements = self._capturing_repo(create_query_result([]))
+        filters = FermentationListFilter(
+            data_source="HISTORICAL",
+            start_date_from=date(2020, 1, 1),
+            start_date_to=date(2020, 12, 31),
+            fruit_origin_id=7,
+            status="COMPLETED",
+        )
+
+        await repo.list_page_by_data_source(winery_id=3, filters=filters, limit=26)
+
+        sql = self._sql(statements[0])
+        assert "fermentations.winery_id = 3" in sql
+        assert "fermentations.data_source = 'HISTORICAL'" in sql
+        assert "fermentations.start_date >= '2020-01-01 00:00:00'" in sql
+        # Inclusive end date: strictly before the next day
+        assert "fermentations.start_date < '2021-01-01 00:00:00'" in sql
+        assert "fermentations.status = 'COMPLETED'" in sql
+        assert "EXISTS" in sql and "fermentation_lot_sources.harvest_lot_id = 7" in sql
+        assert "ORDER BY fermentations.start_date DESC, fermentations.id DESC" in sql
+        assert "LIMIT 26" in sql
+
+    @pytest.mark.asyncio
+    async def test_keyset_position_replaces_offset(self):
+        """
+        Given: The (start_date, id) of the last row sent
+        When: Listing the next page
+        Then: The query seeks past that row instead of using OFFSET
+        """
+        repo, statements = self._capturing_repo(create_query_result([]))
+
+        await repo.list_page_by_data_source(
+            winery_id=1,
+            filters=FermentationListFilter(data_source="HISTORICAL"),
+            limit=10,
+            after=(datetime(2019, 9, 14, 8, 0), 412),
+            offset=500,
+        )
+
+        sql = self._sql(statements[0])
+        assert (
+            "(fermentations.start_date, fermentations.id) < ('2019-09-14 08:00:00', 412)"
+            in sql
+        )
+        assert "OFFSET" not in sql
+
+    @pytest.mark.asyncio
+    async def test_count_uses_same_filters(self):
+        """count_by_data_source counts rows matching the listing filter."""
+        result = MagicMock()
+        result.scalar_one.return_value = 42
+        repo, statements = self._capturing_repo(result)
+
+        total = await repo.count_by_data_source(
+            winery_id=1,
+            filters=FermentationListFilter(data_source="HISTORICAL", status="STUCK"),
+        )
+
+        sql = self._sql(statements[0])
+        assert total == 42
+        assert "count(*)" in sql
+        assert "fermentations.status = 'STUCK'" in sql
+        assert "ORDER BY" not in sql
@@ -0,0 +1,133 @@
+"""
+Unit tests for ParquetArchiveStore (cold storage of archived fermentations).
+
+Row conversion is tested on plain entities; file round trips need pyarrow
+and are skipped without it.
+"""
+
+import pytest
+from datetime import datetime
+
+from src.modules.fermentation.src.domain.dtos import ArchivedRows
+from src.shared.domain.errors import ArchiveUnavailable
+from src.modules.fermentation.src.domain.entities.fermentation_note import (
+    FermentationNote,
+)
+from src.modules.fermentation.src.domain.entities.samples.density_sample import (
+    DensitySample,
+)
+from src.modules.fermentation.src.domain.entities.samples.sugar_sample import (
+    SugarSample,
+)
+from src.modules.fermentation.src.repository_component.repositories.parquet_archive_store import (
+    ParquetArchiveStore,
+    entities_to_rows,
+    rows_to_notes,
+    rows_to_samples,
+)
+
+# Import User so SQLAlchemy can configure the mappers when building entities
+from src.shared.auth.domain.entities.user import User  # noqa: F401
+
+
+def _sample(sample_class, sample_id, hour, value):
+    return sample_class(
+        id=sample_id,
+        fermentation_id=3,
+        recorded_at=datetime(2024, 9, 2, hour),
+        recorded_by_user_id=1,
+        is_deleted=False,
+        data_source="system",
+        imported_at=None,
+        value=value,
+        units="unit",
+        created_at=datetime(2024, 9, 2, hour),
+        updated_at=datetime(2024, 9, 2, hour),
+    )
+
+
+def _note(note_id, day, is_deleted=False):
+    return FermentationNote(
+        id=note_id,
+        fermentation_id=3,
+        created_by_user_id=1,
+        note_text=f"note {note_id}",
+        action_taken="none",
+        is_deleted=is_deleted,
+        created_at=datetime(2024, 9, day),
+        updated_at=datetime(2024, 9, day),
+    )
+
+
+class TestRowConversion:
+    def test_samples_round_trip_to_their_concrete_class(self):
+        samples = [_sample(DensitySample, 2, 10, 1050.0), _sample(SugarSample, 1, 8, 22.5)]
+
+        restored = rows_to_samples(entities_to_rows(samples))
+
+        assert [type(s) for s in restored] == [SugarSample, DensitySample]
+        assert [s.id for s in restored] == [1, 2]
+        assert restored[0].value == 22.5
+        assert restored[0].sample_type == "sugar"
+        assert restored[0].recorded_at == datetime(2024, 9, 2, 8)
+
+    def test_notes_drop_deleted_and_sort_newest_first(self):
+        notes = [_note(1, 1), _note(2, 3), _note(3, 5, is_deleted=True)]
+
+        restored = rows_to_notes(entities_to_rows(notes))
+
+        assert [n.id for n in restored] == [2, 1]
+        assert restored[0].note_text == "note 2"
+
+
+class TestParquetFiles:
+    @pytest.mark.asyncio
+    async def test_missing_archive_is_unavailable(self, tmp_path):
+        store = ParquetArchiveStore(root=str(tmp_path))
+
+        with pytest.raises(ArchiveUnavailable):
+            await store.read_samples(winery_id=1, fermentation_id=3)
+        with pytest.raises(ArchiveUnavailable):
+            await store.read_notes(winery_id=1, fermentation_id=3)
+
+    @pytest.mark.asyncio
+    async def test_write_then_read_round_trip(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        store = ParquetArchiveStore(root=str(tmp_path))
+        rows = ArchivedRows(
+            samples=[_sample(SugarSample, 1, 8, 22.5), _sample(DensitySample, 2, 9, 1050.0)],
+            notes=[_note(1, 1)],
+        )
+
+        await store.write(winery_id=1, fermentation_id=3, rows=rows)
+
+        samples = await store.read_samples(winery_id=1, fermentation_id=3)
+        assert [(type(s), s.value) for s in samples] == [
+            (SugarSample, 22.5),
+            (DensitySample, 1050.0),
+        ]
+        assert [n.id for n in await store.read_notes(winery_id=1, fermentation_id=3)] == [1]
+        # Archives are keyed by winery: another winery can't read it
+        with pytest.raises(ArchiveUnavailable):
+            await store.read_samples(winery_id=2, fermentation_id=3)
+        assert not list(store.directory(1, 3).glob(".*.partial"))
+
+    @pytest.mark.asyncio
+    async def test_write_fsyncs_files_and_directory(self, tmp_path, monkeypatch):
+        pytest.importorskip("pyarrow")
+        from src.modules.fermentation.src.repository_component.repositories import (
+            parquet_archive_store,
+        )
+
+        synced = []
+        monkeypatch.setattr(parquet_archive_store, "_fsync", synced.append)
+        store = ParquetArchiveStore(root=str(tmp_path))
+
+        await store.write(winery_id=1, fermentation_id=3, rows=ArchivedRows())
+
+        directory = store.directory(1, 3)
+        assert synced == [
+            directory / ".samples.parquet.partial",
+            directory / ".notes.parquet.partial",
+            directory,
+        ]
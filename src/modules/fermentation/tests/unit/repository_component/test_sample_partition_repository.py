@@ -0,0 +1,172 @@
+"""
+Unit tests for SamplePartitionRepository and the partition-pruning bound of
+SampleRepository lookups by fermentation (migration 010).
+
+Following ADR-012 testing patterns: only the session manager is mocked;
+statements are captured and checked as SQL text.
+"""
+
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from src.modules.fermentation.src.domain.dtos import SamplePartition
+from src.modules.fermentation.src.repository_component.repositories.sample_partition_repository import (
+    SamplePartitionRepository,
+    partition_name,
+)
+from src.modules.fermentation.src.repository_component.repositories.sample_repository import (
+    SampleRepository,
+)
+
+# Import User so SQLAlchemy can configure Fermentation when compiling queries
+from src.shared.auth.domain.entities.user import User  # noqa: F401
+
+from src.shared.testing.unit import MockSessionManagerBuilder, create_query_result
+
+
+def _result(rows=(), scalar=None, rowcount=0):
+    result = MagicMock()
+    result.all.return_value = list(rows)
+    result.scalar.return_value = scalar
+    result.rowcount = rowcount
+    return result
+
+
+def _repo(dialect="postgresql", results=None):
+    """Partition repository on a session of ``dialect`` recording its SQL."""
+    statements = []
+    queue = list(results or [])
+
+    async def _execute(statement, *args, **kwargs):
+        statements.append(str(statement))
+        return queue.pop(0) if queue else _result()
+
+    session = AsyncMock()
+    session.connection.return_value = SimpleNamespace(
+        dialect=SimpleNamespace(name=dialect)
+    )
+    session_manager = (
+        MockSessionManagerBuilder()
+        .with_session(session)
+        .with_execute_side_effect(_execute)
+        .build()
+    )
+    return SamplePartitionRepository(session_manager), statements, session
+
+
+class TestSamplePartitionRepository:
+    def test_partition_name(self):
+        assert partition_name(2024) == "samples_y2024"
+
+    @pytest.mark.asyncio
+    async def test_other_dialects_are_a_no_op(self):
+        repo, statements, session = _repo(dialect="sqlite")
+
+        assert await repo.list_partitions() == []
+        assert await repo.ensure_partitions(2025, 2026) == []
+        assert statements == []
+        session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_partitions_orders_years_and_default_last(self):
+        rows = [("samples_default", 3), ("samples_y2025", 1200), ("samples_y2024", -1)]
+        repo, _, _ = _repo(results=[_result(rows=rows)])
+
+        partitions = await repo.list_partitions()
+
+        assert partitions == [
+            SamplePartition(name="samples_y2024", year=2024, estimated_rows=0),
+            SamplePartition(name="samples_y2025", year=2025, estimated_rows=1200),
+            SamplePartition(name="samples_default", year=None, estimated_rows=3),
+        ]
+        assert partitions[-1].is_default
+
+    @pytest.mark.asyncio
+    async def test_ensure_creates_only_missing_years(self):
+        listing = _result(rows=[("samples_y2025", 0), ("samples_default", 0)])
+        repo, statements, session = _repo(results=[listing])
+
+        created = await repo.ensure_partitions(2025, 2026)
+
+        assert created == ["samples_y2026"]
+        ddl = [s for s in statements if "PARTITION OF" in s]
+        assert ddl == [
+            "CREATE TABLE IF NOT EXISTS samples_y2026 PARTITION OF samples "
+            "FOR VALUES FROM ('2026-01-01') TO ('2027-01-01')"
+        ]
+        assert not any("DETACH" in s for s in statements)
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_ensure_moves_rows_stranded_in_default_partition(self):
+        listing = _result(rows=[("samples_default", 10)])
+        stranded = _result(scalar=True)
+        repo, statements, _ = _repo(results=[listing, stranded])
+
+        await repo.ensure_partitions(2026, 2026)
+
+        steps = statements[2:]
+        assert steps[0] == "ALTER TABLE samples DETACH PARTITION samples_default"
+        assert steps[1].startswith("CREATE TABLE IF NOT EXISTS samples_y2026")
+        assert "DELETE FROM samples_default" in steps[2]
+        assert "INSERT INTO samples" in steps[2]
+        assert steps[3] == "ALTER TABLE samples ATTACH PARTITION samples_default DEFAULT"
+
+    @pytest.mark.asyncio
+    async def test_ensure_rejects_inverted_range(self):
+        repo, _, _ = _repo()
+        with pytest.raises(ValueError):
+            await repo.ensure_partitions(2027, 2026)
+
+    @pytest.mark.asyncio
+    async def test_detach_refuses_current_year(self):
+        repo, statements, _ = _repo()
+        with pytest.raises(ValueError, match="still"):
+            await repo.detach_partition(datetime.utcnow().year)
+        assert statements == []
+
+    @pytest.mark.asyncio
+    async def test_detach_refuses_unattached_year(self):
+        repo, _, _ = _repo(results=[_result(rows=[("samples_y2020", 5)])])
+        with pytest.raises(ValueError, match="not attached"):
+            await repo.detach_partition(2019)
+
+    @pytest.mark.asyncio
+    async def test_detach_past_year(self):
+        repo, statements, session = _repo(results=[_result(rows=[("samples_y2019", 5)])])
+
+        assert await repo.detach_partition(2019) == "samples_y2019"
+        assert statements[-1] == "ALTER TABLE samples DETACH PARTITION samples_y2019"
+        session.commit.assert_awaited_once()
+
+
+class TestSampleLookupsArePrunable:
+    """Lookups by fermentation carry a recorded_at bound usable for pruning."""
+
+    @pytest.mark.asyncio
+    async def test_samples_by_fermentation_bounded_by_start_date(self):
+        statements = []
+
+        async def _execute(statement, *args, **kwargs):
+            statements.append(statement)
+            return create_query_result([])
+
+        session_manager = (
+            MockSessionManagerBuilder().with_execute_side_effect(_execute).build()
+        )
+
+        await SampleRepository(session_manager).get_samples_by_fermentation_id(42)
+
+        assert statements
+        for statement in statements:
+            sql = str(
+                statement.compile(
+                    dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+                )
+            )
+            assert "samples.recorded_at >= (SELECT fermentations.start_date" in sql
+            assert "fermentations.id = 42" in sql
@@ -11,6 +11,7 @@ Test Structure:
 - TestGetLatestSample: Latest sample retrieval with optional type filter
 - TestGetSamplesInTimerange: Time-based sample queries
 - TestValidateSampleData: Pre-creation validation (dry-run)
+- TestAddSamplesBatch: Batch ingestion with set-based validation
 - TestServiceImplementsInterface: Interface compliance verification
 """
 
@@ -26,7 +27,10 @@ from src.modules.fermentation.src.service_component.interfaces.sample_service_in
 )
 from src.modules.fermentation.src.domain.entities.samples.base_sample import BaseSample
 from src.modules.fermentation.src.domain.entities.fermentation import Fermentation
-from src.modules.fermentation.src.domain.dtos.sample_dtos import SampleCreate
+from src.modules.fermentation.src.domain.dtos.sample_dtos import (
+    SampleCreate,
+    SampleBatchItem,
+)
 from src.modules.fermentation.src.domain.enums.sample_type import SampleType
 from src.modules.fermentation.src.domain.enums.fermentation_status import (
     FermentationStatus,
@@ -221,6 +225,42 @@ class TestAddSample:
         mock_validation_orchestrator.validate_sample_complete.assert_awaited_once()
         mock_sample_repo.upsert_sample.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_add_sample_publishes_sample_created(
+        self,
+        mock_sample_repo,
+        mock_validation_orchestrator,
+        mock_fermentation_repo,
+        sample_fermentation,
+        sample_create_dto,
+        sample_entity,
+        valid_validation_result,
+    ):
+        """Should push the stored sample to the winery's event streams."""
+        event_bus = Mock()
+        service = SampleService(
+            sample_repo=mock_sample_repo,
+            validation_orchestrator=mock_validation_orchestrator,
+            fermentation_repo=mock_fermentation_repo,
+            event_bus=event_bus,
+        )
+        mock_fermentation_repo.get_by_id.return_value = sample_fermentation
+        mock_validation_orchestrator.validate_sample_complete.return_value = (
+            valid_validation_result
+        )
+        mock_sample_repo.upsert_sample.return_value = sample_entity
+        service._create_sample_entity = Mock(return_value=sample_entity)
+
+        await service.add_sample(
+            fermentation_id=1, winery_id=100, user_id=1, data=sample_create_dto
+        )
+
+        event_bus.publish.assert_called_once()
+        winery_id, event_type, data = event_bus.publish.call_args.args
+        assert (winery_id, event_type) == (100, "sample.created")
+        assert data["id"] == sample_entity.id
+        assert data["fermentation_id"] == 1
+
     @pytest.mark.asyncio
     async def test_add_sample_fermentation_not_found(
         self, sample_service, mock_fermentation_repo, sample_create_dto
@@ -285,6 +325,34 @@ class TestAddSample:
 
         mock_validation_orchestrator.validate_sample_complete.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_add_sample_before_fermentation_start(
+        self,
+        sample_service,
+        mock_fermentation_repo,
+        mock_validation_orchestrator,
+        mock_sample_repo,
+        sample_fermentation,
+    ):
+        """Should reject a sample recorded before the fermentation started."""
+        # Arrange
+        mock_fermentation_repo.get_by_id.return_value = sample_fermentation
+        data = SampleCreate(
+            sample_type=SampleType.SUGAR,
+            value=15.5,
+            units="Brix",
+            recorded_at=datetime(2025, 9, 30, 23, 0, 0),
+        )
+
+        # Act & Assert
+        with pytest.raises(ValidationError, match="before fermentation start"):
+            await sample_service.add_sample(
+                fermentation_id=1, winery_id=100, user_id=1, data=data
+            )
+
+        mock_validation_orchestrator.validate_sample_complete.assert_not_called()
+        mock_sample_repo.upsert_sample.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_add_sample_repository_error(
         self,
@@ -486,6 +554,67 @@ class TestGetSamplesByFermentation:
                 fermentation_id=1, winery_id=100
             )
 
+    @pytest.mark.asyncio
+    async def test_archived_fermentation_reads_from_archive_store(
+        self,
+        mock_sample_repo,
+        mock_validation_orchestrator,
+        mock_fermentation_repo,
+        sample_fermentation,
+        sample_entity,
+    ):
+        """Should rehydrate samples from cold storage once archived."""
+        # Arrange
+        archive_store = AsyncMock()
+        archive_store.read_samples.return_value = [sample_entity]
+        service = SampleService(
+            sample_repo=mock_sample_repo,
+            validation_orchestrator=mock_validation_orchestrator,
+            fermentation_repo=mock_fermentation_repo,
+            archive_store=archive_store,
+        )
+        sample_fermentation.archived_at = datetime(2026, 1, 1)
+        mock_fermentation_repo.get_by_id.return_value = sample_fermentation
+
+        # Act
+        result = await service.get_samples_by_fermentation(
+            fermentation_id=1, winery_id=100
+        )
+
+        # Assert
+        assert result == [sample_entity]
+        archive_store.read_samples.assert_awaited_once_with(
+            winery_id=100, fermentation_id=1
+        )
+        mock_sample_repo.get_samples_by_fermentation_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_hot_fermentation_skips_archive_store(
+        self,
+        mock_sample_repo,
+        mock_validation_orchestrator,
+        mock_fermentation_repo,
+        sample_fermentation,
+    ):
+        """Should read the hot table while the fermentation is not archived."""
+        # Arrange
+        archive_store = AsyncMock()
+        service = SampleService(
+            sample_repo=mock_sample_repo,
+            validation_orchestrator=mock_validation_orchestrator,
+            fermentation_repo=mock_fermentation_repo,
+            archive_store=archive_store,
+        )
+        sample_fermentation.archived_at = None
+        mock_fermentation_repo.get_by_id.return_value = sample_fermentation
+        mock_sample_repo.get_samples_by_fermentation_id.return_value = []
+
+        # Act
+        await service.get_samples_by_fermentation(fermentation_id=1, winery_id=100)
+
+        # Assert
+        archive_store.read_samples.assert_not_called()
+
 
 # ==================================================================================
 # TEST: get_latest_sample() - Latest sample retrieval
@@ -806,3 +935,184 @@ class TestValidateSampleData:
             await sample_service.validate_sample_data(
                 fermentation_id=999, winery_id=1, data=sample_create_dto
             )
+
+
+# ==================================================================================
+# TEST: add_samples_batch() - Batch ingestion
+# ==================================================================================
+
+
+class TestAddSamplesBatch:
+    """Test add_samples_batch() - one ownership query, one window, one write."""
+
+    @staticmethod
+    def _fermentation(fermentation_id, status=FermentationStatus.ACTIVE):
+        fermentation = Mock(spec=Fermentation)
+        fermentation.id = fermentation_id
+        fermentation.status = status
+        fermentation.start_date = datetime(2025, 10, 1)
+        return fermentation
+
+    @staticmethod
+    def _item(fermentation_id, value, hour):
+        return SampleBatchItem(
+            fermentation_id=fermentation_id,
+            sample=SampleCreate(
+                sample_type=SampleType.SUGAR,
+                value=value,
+                units="Brix",
+                recorded_at=datetime(2025, 10, 21, hour),
+            ),
+        )
+
+    @pytest.fixture
+    def batch_service(self, sample_service):
+        def create_entity(fermentation_id, user_id, data):
+            sample = Mock(spec=BaseSample)
+            sample.fermentation_id = fermentation_id
+            sample.value = data.value
+            return sample
+
+        sample_service._create_sample_entity = Mock(side_effect=create_entity)
+        return sample_service
+
+    @pytest.mark.asyncio
+    async def test_batch_happy_path_single_queries(
+        self,
+        batch_service,
+        mock_fermentation_repo,
+        mock_validation_orchestrator,
+        mock_sample_repo,
+    ):
+        """Should check ownership, prefetch windows and write once for all items."""
+        items = [self._item(1, 20.0, 8), self._item(2, 22.0, 8), self._item(1, 19.0, 9)]
+        mock_fermentation_repo.get_by_ids.return_value = [
+            self._fermentation(1),
+            self._fermentation(2),
+        ]
+        window = {SampleType.SUGAR.value: Mock()}
+        mock_sample_repo.get_latest_samples_by_fermentation_ids.return_value = {
+            1: window
+        }
+        mock_validation_orchestrator.validate_sample_batch.side_effect = (
+            lambda fermentation_id, samples, latest_by_type: [
+                ValidationResult.success() for _ in samples
+            ]
+        )
+        mock_sample_repo.bulk_upsert_samples.side_effect = lambda samples: samples
+
+        results = await batch_service.add_samples_batch(
+            winery_id=100, user_id=7, items=items
+        )
+
+        assert [r.accepted for r in results] == [True, True, True]
+        assert [r.sample.value for r in results] == [20.0, 22.0, 19.0]
+        mock_fermentation_repo.get_by_ids.assert_awaited_once_with(
+            fermentation_ids=[1, 2], winery_id=100
+        )
+        mock_sample_repo.get_latest_samples_by_fermentation_ids.assert_awaited_once_with(
+            [1, 2]
+        )
+        calls = mock_validation_orchestrator.validate_sample_batch.await_args_list
+        assert [c.kwargs["fermentation_id"] for c in calls] == [1, 2]
+        assert calls[0].kwargs["latest_by_type"] is window
+        assert calls[1].kwargs["latest_by_type"] is None
+        mock_sample_repo.bulk_upsert_samples.assert_awaited_once()
+        mock_fermentation_repo.get_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_rejects_foreign_completed_and_invalid_items(
+        self,
+        batch_service,
+        mock_fermentation_repo,
+        mock_validation_orchestrator,
+        mock_sample_repo,
+        invalid_validation_result,
+    ):
+        """Should report per-item errors and persist only valid items."""
+        items = [
+            self._item(1, 20.0, 8),
+            self._item(3, 20.0, 8),  # not found / other winery
+            self._item(2, 20.0, 8),  # completed
+            self._item(1, 25.0, 9),  # fails validation
+        ]
+        mock_fermentation_repo.get_by_ids.return_value = [
+            self._fermentation(1),
+            self._fermentation(2, FermentationStatus.COMPLETED),
+        ]
+        mock_sample_repo.get_latest_samples_by_fermentation_ids.return_value = {}
+        mock_validation_orchestrator.validate_sample_batch.return_value = [
+            ValidationResult.success(),
+            invalid_validation_result,
+        ]
+        mock_sample_repo.bulk_upsert_samples.side_effect = lambda samples: samples
+
+        results = await batch_service.add_samples_batch(
+            winery_id=100, user_id=7, items=items
+        )
+
+        assert [r.accepted for r in results] == [True, False, False, False]
+        assert "not found" in results[1].errors[0].message
+        assert "COMPLETED" in results[2].errors[0].message
+        assert results[3].errors == invalid_validation_result.errors
+        persisted = mock_sample_repo.bulk_upsert_samples.await_args.args[0]
+        assert len(persisted) == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_rejects_items_before_fermentation_start(
+        self,
+        batch_service,
+        mock_fermentation_repo,
+        mock_validation_orchestrator,
+        mock_sample_repo,
+    ):
+        """Should reject items recorded before their fermentation started."""
+        items = [self._item(1, 20.0, 8), self._item(1, 21.0, 8)]
+        items[1].sample.recorded_at = datetime(2025, 9, 30, 8)  # start: Oct 1
+        mock_fermentation_repo.get_by_ids.return_value = [self._fermentation(1)]
+        mock_sample_repo.get_latest_samples_by_fermentation_ids.return_value = {}
+        mock_validation_orchestrator.validate_sample_batch.side_effect = (
+            lambda fermentation_id, samples, latest_by_type: [
+                ValidationResult.success() for _ in samples
+            ]
+        )
+        mock_sample_repo.bulk_upsert_samples.side_effect = lambda samples: samples
+
+        results = await batch_service.add_samples_batch(
+            winery_id=100, user_id=7, items=items
+        )
+
+        assert [r.accepted for r in results] == [True, False]
+        assert results[1].errors[0].field == "recorded_at"
+        assert "before fermentation start" in results[1].errors[0].message
+        validated = mock_validation_orchestrator.validate_sample_batch.await_args
+        assert len(validated.kwargs["samples"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_nothing_valid_skips_write(
+        self, batch_service, mock_fermentation_repo, mock_sample_repo
+    ):
+        """Should not touch the sample tables when no fermentation is accessible."""
+        mock_fermentation_repo.get_by_ids.return_value = []
+
+        results = await batch_service.add_samples_batch(
+            winery_id=100, user_id=7, items=[self._item(5, 20.0, 8)]
+        )
+
+        assert not results[0].accepted
+        mock_sample_repo.get_latest_samples_by_fermentation_ids.assert_not_called()
+        mock_sample_repo.bulk_upsert_samples.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_too_large(self, batch_service, mock_fermentation_repo):
+        """Should raise ValidationError when the batch exceeds the limit."""
+        from src.modules.fermentation.src.service_component.services.sample_service import (
+            MAX_SAMPLE_BATCH_SIZE,
+        )
+
+        items = [self._item(1, 20.0, 8)] * (MAX_SAMPLE_BATCH_SIZE + 1)
+
+        with pytest.raises(ValidationError, match="batch too large"):
+            await batch_service.add_samples_batch(winery_id=100, user_id=7, items=items)
+
+        mock_fermentation_repo.get_by_ids.assert_not_called()
@@ -0,0 +1,371 @@
+"""
+Test suite for the telemetry ingestion path.
+
+Tests the in-memory buffer in front of the bulk sample writer and the
+request-scoped ingestion service.
+
+Test Structure:
+- TestBufferCoalescing: Per (fermentation, sample_type) merging
+- TestBufferFlushing: Size/time triggered flushes, retry/dead-letter on failure
+- TestBufferBackpressure: TelemetryBufferFull when no room frees up
+- TestTelemetryIngestionService: Ownership/timestamp filters and result reporting
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+from datetime import datetime, timedelta
+
+from src.modules.fermentation.src.service_component.services.telemetry_ingestion_service import (
+    TelemetryIngestionBuffer,
+    TelemetryIngestionService,
+)
+from src.modules.fermentation.src.domain.dtos.sample_dtos import TelemetryReading
+from src.modules.fermentation.src.domain.enums.sample_type import SampleType
+from src.modules.fermentation.src.domain.enums.fermentation_status import (
+    FermentationStatus,
+)
+from src.modules.fermentation.src.service_component.errors import (
+    TelemetryBufferFull,
+)
+from src.shared.infra.repository.errors import DatabaseConnectionError, RepositoryError
+
+BASE_TIME = datetime(2026, 3, 1, 12, 0, 0)
+
+
+def reading(fermentation_id=1, sample_type=SampleType.TEMPERATURE, minutes=0, value=18.0):
+    return TelemetryReading(
+        fermentation_id=fermentation_id,
+        sample_type=sample_type,
+        value=value,
+        units="°C",
+        recorded_at=BASE_TIME + timedelta(minutes=minutes),
+    )
+
+
+@pytest.fixture
+def mock_telemetry_repo():
+    """Mock ITelemetrySampleRepository that reports every row written."""
+    repo = AsyncMock()
+    repo.bulk_insert_readings.side_effect = lambda readings, recorded_by_user_id: len(
+        readings
+    )
+    return repo
+
+
+def written_readings(repo):
+    return [r for call in repo.bulk_insert_readings.await_args_list for r in call.args[0]]
+
+
+# ==================================================================================
+# BUFFER
+# ==================================================================================
+
+
+class TestBufferCoalescing:
+    async def test_duplicate_timestamp_keeps_latest_delivery(self, mock_telemetry_repo):
+        buffer = TelemetryIngestionBuffer(mock_telemetry_repo)
+
+        added = await buffer.submit([reading(value=18.0), reading(value=18.4)])
+
+        assert added == 1
+        assert buffer.buffered == 1
+        await buffer.flush()
+        assert [r.value for r in written_readings(mock_telemetry_repo)] == [18.4]
+
+    async def test_keys_are_fermentation_and_sample_type(self, mock_telemetry_repo):
+        buffer = TelemetryIngestionBuffer(mock_telemetry_repo)
+
+        added = await buffer.submit(
+            [
+                reading(fermentation_id=1),
+                reading(fermentation_id=2),
+                reading(fermentation_id=1, sample_type=SampleType.DENSITY, value=1.05),
+            ]
+        )
+
+        assert added == 3
+
+    async def test_coalesce_window_merges_close_readings(self, mock_telemetry_repo):
+        buffer = TelemetryIngestionBuffer(mock_telemetry_repo, coalesce_seconds=120)
+
+        added = await buffer.submit(
+            [reading(minutes=0), reading(minutes=1, value=18.2), reading(minutes=5)]
+        )
+
+        assert added == 2
+        await buffer.flush()
+        assert [r.recorded_at for r in written_readings(mock_telemetry_repo)] == [
+            BASE_TIME + timedelta(minutes=1),
+            BASE_TIME + timedelta(minutes=5),
+        ]
+
+
+class TestBufferFlushing:
+    async def test_flush_writes_everything_in_one_call(self, mock_telemetry_repo):
+        buffer = TelemetryIngestionBuffer(mock_telemetry_repo, sensor_user_id=7)
+        await buffer.submit([reading(minutes=i) for i in range(10)])
+
+        written = await buffer.flush()
+
+        assert written == 10
+        assert buffer.buffered == 0
+        mock_telemetry_repo.bulk_insert_readings.assert_awaited_once()
+        assert mock_telemetry_repo.bulk_insert_readings.await_args.kwargs == {
+            "recorded_by_user_id": 7
+        }
+
+    async def test_empty_flush_skips_repository(self, mock_telemetry_repo):
+        buffer = TelemetryIngestionBuffer(mock_telemetry_repo)
+
+        assert await buffer.flush() == 0
+        mock_telemetry_repo.bulk_insert_readings.assert_not_awaited()
+
+    async def test_size_threshold_triggers_background_flush(self, mock_telemetry_repo):
+        buffer = TelemetryIngestionBuffer(
+            mock_telemetry_repo, flush_size=5, flush_interval_seconds=60
+        )
+        buffer.start()
+        try:
+            await buffer.submit([reading(minutes=i) for i in range(5)])
+            for _ in range(10):
+                await asyncio.sleep(0)
+            assert len(written_readings(mock_telemetry_repo)) == 5
+        finally:
+            await buffer.stop()
+
+    async def test_interval_triggers_background_flush(self, mock_telemetry_repo):
+        buffer = TelemetryIngestionBuffer(
+            mock_telemetry_repo, flush_size=100, flush_interval_seconds=0.01
+        )
+        buffer.start()
+        try:
+            await buffer.submit([reading()])
+            await asyncio.sleep(0.05)
+            assert len(written_readings(mock_telemetry_repo)) == 1
+        finally:
+            await buffer.stop()
+
+    async def test_stop_flushes_remaining_readings(self, mock_telemetry_repo):
+        buffer = TelemetryIngestionBuffer(mock_telemetry_repo, flush_interval_seconds=60)
+        buffer.start()
+        await buffer.submit([reading(minutes=i) for i in range(3)])
+
+        await buffer.stop()
+
+        assert not buffer.running
+        assert len(written_readings(mock_telemetry_repo)) == 3
+
+    async def test_transient_failure_requeues_readings(self, mock_telemetry_repo):
+        buffer = TelemetryIngestionBuffer(mock_telemetry_repo)
+        await buffer.submit([reading(minutes=i) for i in range(3)])
+        mock_telemetry_repo.bulk_insert_readings.side_effect = DatabaseConnectionError(
+            "db down"
+        )
+
+        assert await buffer.flush() == 0
+        assert buffer.buffered == 3
+
+        mock_telemetry_repo.bulk_insert_readings.side_effect = (
+            lambda readings, recorded_by_user_id: len(readings)
+        )
+        assert await buffer.flush() == 3
+
+    async def test_transient_failures_dead_letter_after_max_retries(
+        self, mock_telemetry_repo
+    ):
+        buffer = TelemetryIngestionBuffer(mock_telemetry_repo, max_flush_retries=3)
+        await buffer.submit([reading(minutes=i) for i in range(3)])
+        mock_telemetry_repo.bulk_insert_readings.side_effect = ConnectionResetError()
+
+        for _ in range(2):
+            await buffer.flush()
+            assert buffer.buffered == 3
+        await buffer.flush()
+
+        assert buffer.buffered == 0
+
+    async def test_rejected_rows_are_isolated_and_the_rest_written(
+        self, mock_telemetry_repo
+    ):
+        def write(readings, recorded_by_user_id):
+            if any(r.value < 0 for r in readings):
+                raise RepositoryError("Foreign key constraint violated")
+            return len(readings)
+
+        mock_telemetry_repo.bulk_insert_readings.side_effect = write
+        buffer = TelemetryIngestionBuffer(mock_telemetry_repo)
+        values = [18.0, 18.5, -1.0, 19.0, 19.5, -1.0, 20.0]
+        await buffer.submit([reading(minutes=i, value=v) for i, v in enumerate(values)])
+
+        assert await buffer.flush() == 5
+        assert buffer.buffered == 0
+        # Nothing is left to fail the next flush
+        assert await buffer.flush() == 0
+
+    async def test_transient_failure_while_bisecting_requeues_only_unwritten(
+        self, mock_telemetry_repo
+    ):
+        calls = []
+
+        def write(readings, recorded_by_user_id):
+            calls.append(len(readings))
+            if len(calls) == 1:
+                raise RepositoryError("Foreign key constraint violated")
+            if len(calls) == 3:
+                raise ConnectionResetError()
+            return len(readings)
+
+        mock_telemetry_repo.bulk_insert_readings.side_effect = write
+        buffer = TelemetryIngestionBuffer(mock_telemetry_repo)
+        await buffer.submit([reading(minutes=i) for i in range(4)])
+
+        assert await buffer.flush() == 2
+        assert buffer.buffered == 2
+
+    async def test_written_readings_published_to_owner_winery(
+        self, mock_telemetry_repo
+    ):
+        def write(readings, recorded_by_user_id):
+            if any(r.value < 0 for r in readings):
+                raise RepositoryError("Foreign key constraint violated")
+            return len(readings)
+
+        mock_telemetry_repo.bulk_insert_readings.side_effect = write
+        event_bus = Mock()
+        buffer = TelemetryIngestionBuffer(mock_telemetry_repo, event_bus=event_bus)
+        await buffer.submit(
+            [reading(minutes=0, value=18.0), reading(minutes=1, value=-1.0)],
+            winery_id=10,
+        )
+
+        await buffer.flush()
+
+        event_bus.publish.assert_called_once()
+        winery_id, event_type, data = event_bus.publish.call_args.args
+        assert (winery_id, event_type) == (10, "sample.created")
+        assert data["fermentation_id"] == 1
+        assert data["value"] == 18.0
+        assert data["id"] is None
+
+    async def test_failed_flush_publishes_nothing(self, mock_telemetry_repo):
+        mock_telemetry_repo.bulk_insert_readings.side_effect = ConnectionResetError()
+        event_bus = Mock()
+        buffer = TelemetryIngestionBuffer(mock_telemetry_repo, event_bus=event_bus)
+        await buffer.submit([reading()], winery_id=10)
+
+        await buffer.flush()
+
+        event_bus.publish.assert_not_called()
+
+    def test_flush_size_above_capacity_rejected(self, mock_telemetry_repo):
+        with pytest.raises(ValueError):
+            TelemetryIngestionBuffer(mock_telemetry_repo, flush_size=10, max_buffered=5)
+
+
+class TestBufferBackpressure:
+    async def test_full_buffer_raises_after_timeout(self, mock_telemetry_repo):
+        buffer = TelemetryIngestionBuffer(
+            mock_telemetry_repo, flush_size=2, max_buffered=2, submit_timeout_seconds=0.01
+        )
+        await buffer.submit([reading(minutes=0), reading(minutes=1)])
+
+        with pytest.raises(TelemetryBufferFull):
+            await buffer.submit([reading(minutes=2)])
+        assert buffer.buffered == 2
+
+    async def test_waiting_submit_resumes_after_flush(self, mock_telemetry_repo):
+        buffer = TelemetryIngestionBuffer(
+            mock_telemetry_repo, flush_size=2, max_buffered=2, submit_timeout_seconds=1
+        )
+        await buffer.submit([reading(minutes=0), reading(minutes=1)])
+
+        pending = asyncio.ensure_future(buffer.submit([reading(minutes=2)]))
+        await asyncio.sleep(0)
+        await buffer.flush()
+
+        assert await pending == 1
+        assert buffer.buffered == 1
+
+    async def test_batch_larger_than_capacity_rejected_immediately(
+        self, mock_telemetry_repo
+    ):
+        buffer = TelemetryIngestionBuffer(mock_telemetry_repo, flush_size=2, max_buffered=2)
+
+        with pytest.raises(TelemetryBufferFull):
+            await buffer.submit([reading(minutes=i) for i in range(3)])
+
+
+# ==================================================================================
+# SERVICE
+# ==================================================================================
+
+
+class TestTelemetryIngestionService:
+    @staticmethod
+    def fermentation(
+        fermentation_id,
+        status=FermentationStatus.ACTIVE,
+        start_date=BASE_TIME - timedelta(days=1),
+    ):
+        fermentation = Mock()
+        fermentation.id = fermentation_id
+        fermentation.status = status
+        fermentation.start_date = start_date
+        return fermentation
+
+    async def test_ingest_filters_unowned_and_completed(self, mock_telemetry_repo):
+        fermentation_repo = AsyncMock()
+        fermentation_repo.get_by_ids.return_value = [
+            self.fermentation(1),
+            self.fermentation(2, FermentationStatus.COMPLETED),
+        ]
+        buffer = TelemetryIngestionBuffer(mock_telemetry_repo, flush_interval_seconds=3)
+        service = TelemetryIngestionService(fermentation_repo, buffer)
+
+        result = await service.ingest(
+            winery_id=10,
+            readings=[
+                reading(fermentation_id=1, minutes=0),
+                reading(fermentation_id=1, minutes=0),
+                reading(fermentation_id=2),
+                reading(fermentation_id=3),
+            ],
+        )
+
+        fermentation_repo.get_by_ids.assert_awaited_once_with(
+            fermentation_ids=[1, 2, 3], winery_id=10
+        )
+        assert result.accepted == 1
+        assert result.coalesced == 1
+        assert result.rejected_fermentation_ids == [2, 3]
+        assert result.max_visibility_delay_seconds == 3
+        assert buffer.buffered == 1
+
+    async def test_ingest_drops_readings_outside_fermentation_timeline(
+        self, mock_telemetry_repo
+    ):
+        fermentation_repo = AsyncMock()
+        fermentation_repo.get_by_ids.return_value = [
+            self.fermentation(1, start_date=BASE_TIME)
+        ]
+        buffer = TelemetryIngestionBuffer(mock_telemetry_repo)
+        service = TelemetryIngestionService(fermentation_repo, buffer)
+        future = datetime.utcnow() + timedelta(days=1)
+
+        result = await service.ingest(
+            winery_id=10,
+            readings=[
+                reading(minutes=-1),
+                reading(minutes=0),
+                reading(minutes=int((future - BASE_TIME).total_seconds() // 60)),
+            ],
+        )
+
+        assert result.accepted == 1
+        assert result.rejected_readings == 2
+        assert result.rejected_fermentation_ids == []
+        await buffer.flush()
+        assert [r.recorded_at for r in written_readings(mock_telemetry_repo)] == [
+            BASE_TIME
+        ]
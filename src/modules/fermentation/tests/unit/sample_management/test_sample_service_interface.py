@@ -38,6 +38,7 @@ def test_sample_service_interface_methods() -> None:
 
     required_methods = {
         "add_sample",
+        "add_samples_batch",
         "get_sample",
         "get_samples_by_fermentation",
         "get_latest_sample",
@@ -0,0 +1,133 @@
+"""
+Unit tests for FermentationArchiveService (cold-storage archival) and the
+archive read-through of PatternAnalysisService.
+
+All tests use MagicMock / AsyncMock to avoid any database or file access.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from src.modules.fermentation.src.domain.dtos import ArchivedRows
+from src.modules.fermentation.src.service_component.services.fermentation_archive_service import (
+    FermentationArchiveService,
+)
+from src.modules.fermentation.src.service_component.services.pattern_analysis_service import (
+    PatternAnalysisService,
+)
+
+NOW = datetime(2026, 10, 18, 3, 0, 0)
+
+
+def _fermentation(fermentation_id, winery_id=100, archived_at=None):
+    fermentation = MagicMock()
+    fermentation.id = fermentation_id
+    fermentation.winery_id = winery_id
+    fermentation.archived_at = archived_at
+    fermentation.status = "COMPLETED"
+    fermentation.start_date = datetime(2024, 9, 1)
+    fermentation.initial_density = 1090.0
+    fermentation.initial_sugar_brix = 24.0
+    fermentation.fruit_origin_id = None
+    return fermentation
+
+
+def _rows(samples=2, notes=1):
+    return ArchivedRows(
+        samples=[MagicMock() for _ in range(samples)],
+        notes=[MagicMock() for _ in range(notes)],
+    )
+
+
+def _make_service(candidates, rows=None):
+    repo = AsyncMock()
+    repo.list_archivable.return_value = candidates
+    repo.export_rows.return_value = rows or _rows()
+    repo.purge_archived.return_value = True
+    store = AsyncMock()
+    return FermentationArchiveService(archive_repo=repo, archive_store=store), repo, store
+
+
+class TestArchiveCompleted:
+    @pytest.mark.asyncio
+    async def test_candidates_are_older_than_the_cutoff(self):
+        service, repo, _ = _make_service([])
+
+        await service.archive_completed(older_than_days=30, limit=5, now=NOW)
+
+        repo.list_archivable.assert_awaited_once_with(
+            completed_before=NOW - timedelta(days=30), limit=5
+        )
+
+    @pytest.mark.asyncio
+    async def test_writes_archive_before_purging(self):
+        rows = _rows(samples=3, notes=2)
+        service, repo, store = _make_service([_fermentation(1, winery_id=7)], rows)
+        order = []
+        store.write.side_effect = lambda *a, **k: order.append("write")
+        repo.purge_archived.side_effect = lambda *a, **k: order.append("purge") or True
+
+        result = await service.archive_completed(now=NOW)
+
+        assert order == ["write", "purge"]
+        store.write.assert_awaited_once_with(7, 1, rows)
+        repo.purge_archived.assert_awaited_once_with(1, rows, archived_at=NOW)
+        assert result.archived == [1]
+        assert result.samples_archived == 3
+        assert result.notes_archived == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_write_keeps_rows_hot(self):
+        service, repo, store = _make_service([_fermentation(1), _fermentation(2)])
+        store.write.side_effect = [OSError("disk full"), None]
+
+        result = await service.archive_completed(now=NOW)
+
+        assert result.failed == [1]
+        assert result.archived == [2]
+        repo.purge_archived.assert_awaited_once()
+        assert repo.purge_archived.await_args.args[0] == 2
+
+    @pytest.mark.asyncio
+    async def test_purge_mismatch_is_reported_as_failed(self):
+        service, repo, _ = _make_service([_fermentation(1)])
+        repo.purge_archived.return_value = False
+
+        result = await service.archive_completed(now=NOW)
+
+        assert result.archived == []
+        assert result.failed == [1]
+        assert result.samples_archived == 0
+
+    @pytest.mark.asyncio
+    async def test_negative_age_rejected(self):
+        service, _, _ = _make_service([])
+        with pytest.raises(ValueError):
+            await service.archive_completed(older_than_days=-1)
+
+
+class TestPatternAnalysisReadsArchive:
+    @pytest.mark.asyncio
+    async def test_archived_fermentations_use_archive_samples(self):
+        hot = _fermentation(1)
+        archived = _fermentation(2, winery_id=100, archived_at=NOW)
+        fermentation_repo = AsyncMock()
+        fermentation_repo.get_by_winery.return_value = [hot, archived]
+        sample_repo = AsyncMock()
+        sample_repo.get_samples_by_fermentation_id.return_value = []
+        archive_store = AsyncMock()
+        archive_store.read_samples.return_value = []
+        service = PatternAnalysisService(
+            fermentation_repo=fermentation_repo,
+            sample_repo=sample_repo,
+            archive_store=archive_store,
+        )
+
+        result = await service.extract_patterns(winery_id=100)
+
+        assert result["total_fermentations"] == 2
+        sample_repo.get_samples_by_fermentation_id.assert_awaited_once_with(1)
+        archive_store.read_samples.assert_awaited_once_with(
+            winery_id=100, fermentation_id=2
+        )
@@ -0,0 +1,164 @@
+"""
+Unit tests for FermentationExportService (columnar history export).
+
+The export repository and archive store are mocked. Arrow encoding needs
+pyarrow; those tests are skipped without it.
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from src.modules.fermentation.src.domain.enums.export_dataset import ExportDataset
+from src.modules.fermentation.src.service_component.services.fermentation_export_service import (
+    FermentationExportService,
+    pivot_samples,
+)
+
+SAMPLE_COLUMNS = [
+    ("fermentation_id", "int64"),
+    ("recorded_at", "timestamp"),
+    ("sugar", "float64"),
+    ("density", "float64"),
+]
+
+T1 = datetime(2024, 9, 2, 8)
+T2 = datetime(2024, 9, 2, 20)
+
+
+def _sample(sample_type, recorded_at, value, fermentation_id=3, is_deleted=False):
+    sample = MagicMock()
+    sample.fermentation_id = fermentation_id
+    sample.sample_type = sample_type
+    sample.recorded_at = recorded_at
+    sample.value = value
+    sample.is_deleted = is_deleted
+    return sample
+
+
+def _make_service(chunks, archived_ids=(), archived_samples=()):
+    repo = MagicMock()
+    repo.columns.return_value = SAMPLE_COLUMNS
+
+    async def _stream(winery_id, dataset, chunk_size):
+        for chunk in chunks:
+            yield chunk
+
+    repo.stream.side_effect = _stream
+    repo.list_archived_ids = AsyncMock(return_value=list(archived_ids))
+    store = AsyncMock()
+    store.read_samples.return_value = list(archived_samples)
+    return FermentationExportService(export_repo=repo, archive_store=store), repo, store
+
+
+async def _collect(stream):
+    return [item async for item in stream]
+
+
+class TestPivotSamples:
+    def test_one_row_per_reading_time(self):
+        rows = pivot_samples(
+            [
+                _sample("density", T2, 1040.0),
+                _sample("sugar", T1, 22.5),
+                _sample("density", T1, 1050.0),
+            ],
+            SAMPLE_COLUMNS,
+        )
+
+        assert rows == [
+            {"fermentation_id": 3, "recorded_at": T1, "sugar": 22.5, "density": 1050.0},
+            {"fermentation_id": 3, "recorded_at": T2, "sugar": None, "density": 1040.0},
+        ]
+
+    def test_matches_the_sql_pivot_semantics(self):
+        rows = pivot_samples(
+            [
+                _sample("sugar", T1, 22.5),
+                _sample("sugar", T1, 23.0),
+                _sample("sugar", T1, 30.0, is_deleted=True),
+                _sample("temperature", T1, 18.0),
+            ],
+            SAMPLE_COLUMNS,
+        )
+
+        # Highest value wins, deleted samples and unexported types are ignored
+        assert rows == [
+            {"fermentation_id": 3, "recorded_at": T1, "sugar": 23.0, "density": None}
+        ]
+
+
+class TestRecordBatches:
+    @pytest.mark.asyncio
+    async def test_one_batch_per_chunk_then_archived_samples(self):
+        pytest.importorskip("pyarrow")
+        service, repo, store = _make_service(
+            chunks=[
+                [{"fermentation_id": 1, "recorded_at": T1, "sugar": 22.5, "density": None}],
+                [{"fermentation_id": 2, "recorded_at": T1, "sugar": None, "density": 1050.0}],
+            ],
+            archived_ids=[9],
+            archived_samples=[_sample("sugar", T2, 21.0, fermentation_id=9)],
+        )
+
+        batches = await _collect(
+            service.record_batches(100, ExportDataset.SAMPLES, chunk_size=1000)
+        )
+
+        assert [batch.num_rows for batch in batches] == [1, 1, 1]
+        assert all(batch.schema == service.schema(ExportDataset.SAMPLES) for batch in batches)
+        assert batches[2].to_pylist()[0]["fermentation_id"] == 9
+        repo.stream.assert_called_once_with(100, ExportDataset.SAMPLES, 1000)
+        store.read_samples.assert_awaited_once_with(winery_id=100, fermentation_id=9)
+
+    @pytest.mark.asyncio
+    async def test_archive_is_only_read_for_samples(self):
+        pytest.importorskip("pyarrow")
+        service, repo, store = _make_service(chunks=[], archived_ids=[9])
+
+        await _collect(service.record_batches(100, ExportDataset.LOT_SOURCES))
+
+        repo.list_archived_ids.assert_not_awaited()
+        store.read_samples.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_ipc_stream_round_trips(self):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.ipc  # noqa: F401
+
+        service, _, _ = _make_service(
+            chunks=[
+                [{"fermentation_id": 1, "recorded_at": T1, "sugar": 22.5, "density": None}],
+                [{"fermentation_id": 1, "recorded_at": T2, "sugar": 21.0, "density": None}],
+            ]
+        )
+
+        data = b"".join(
+            await _collect(service.stream_ipc(100, ExportDataset.SAMPLES, chunk_size=1))
+        )
+
+        table = pa.ipc.open_stream(data).read_all()
+        assert table.column("sugar").to_pylist() == [22.5, 21.0]
+
+
+class TestExportParquet:
+    @pytest.mark.asyncio
+    async def test_writes_one_file_per_dataset(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        service, _, _ = _make_service(
+            chunks=[
+                [{"fermentation_id": 1, "recorded_at": T1, "sugar": 22.5, "density": None}],
+                [{"fermentation_id": 2, "recorded_at": T1, "sugar": 20.0, "density": None}],
+            ]
+        )
+
+        written = await service.export_parquet(
+            100, str(tmp_path), datasets=[ExportDataset.SAMPLES]
+        )
+
+        assert written == {ExportDataset.SAMPLES: 2}
+        parquet = pq.ParquetFile(tmp_path / "samples.parquet")
+        assert parquet.metadata.num_row_groups == 2
+        assert not list(tmp_path.glob(".*.partial"))
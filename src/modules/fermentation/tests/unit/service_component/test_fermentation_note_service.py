@@ -182,6 +182,57 @@ class TestGetNotesForFermentation:
 
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_reads_archived_notes_of_an_archived_fermentation(self):
+        repo = AsyncMock()
+        repo.get_by_fermentation.return_value = []
+        archive = AsyncMock()
+        archived = [_make_note(id=7)]
+        archive.read_notes.return_value = archived
+        fermentation_repo = AsyncMock()
+        fermentation_repo.get_by_id.return_value = MagicMock(
+            archived_at=datetime(2026, 1, 1)
+        )
+        service = FermentationNoteService(
+            note_repo=repo, archive_store=archive, fermentation_repo=fermentation_repo
+        )
+
+        result = await service.get_notes_for_fermentation(
+            fermentation_id=10, winery_id=100
+        )
+
+        assert result == archived
+        archive.read_notes.assert_awaited_once_with(winery_id=100, fermentation_id=10)
+
+    @pytest.mark.asyncio
+    async def test_unarchived_fermentation_without_notes_skips_the_archive(self):
+        repo = AsyncMock()
+        repo.get_by_fermentation.return_value = []
+        archive = AsyncMock()
+        fermentation_repo = AsyncMock()
+        fermentation_repo.get_by_id.return_value = MagicMock(archived_at=None)
+        service = FermentationNoteService(
+            note_repo=repo, archive_store=archive, fermentation_repo=fermentation_repo
+        )
+
+        result = await service.get_notes_for_fermentation(
+            fermentation_id=10, winery_id=100
+        )
+
+        assert result == []
+        archive.read_notes.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_hot_notes_skip_the_archive(self):
+        repo = AsyncMock()
+        repo.get_by_fermentation.return_value = [_make_note(id=1)]
+        archive = AsyncMock()
+        service = FermentationNoteService(note_repo=repo, archive_store=archive)
+
+        await service.get_notes_for_fermentation(fermentation_id=10, winery_id=100)
+
+        archive.read_notes.assert_not_called()
+
 
 # =============================================================================
 # update_note
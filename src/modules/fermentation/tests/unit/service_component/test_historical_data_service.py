@@ -29,6 +29,7 @@ from src.modules.fermentation.src.domain.repositories.sample_repository_interfac
 )
 
 # Domain entities
+from src.modules.fermentation.src.domain.dtos import FermentationListFilter
 from src.modules.fermentation.src.domain.entities.fermentation import Fermentation
 from src.modules.fermentation.src.domain.entities.samples.base_sample import BaseSample
 from src.modules.fermentation.src.domain.entities.samples.density_sample import (
@@ -115,7 +116,7 @@ class TestGetHistoricalFermentations:
                 status=filters["status"],
             ),
         ]
-        mock_fermentation_repo.list_by_data_source.return_value = mock_fermentations
+        mock_fermentation_repo.list_page_by_data_source.return_value = mock_fermentations
 
         # Act
         result = await service.get_historical_fermentations(
@@ -125,8 +126,17 @@ class TestGetHistoricalFermentations:
         # Assert
         assert len(result) == 2
         assert all(f.data_source == "HISTORICAL" for f in result)
-        mock_fermentation_repo.list_by_data_source.assert_called_once_with(
-            winery_id=winery_id, data_source="HISTORICAL", include_deleted=False
+        mock_fermentation_repo.list_page_by_data_source.assert_called_once_with(
+            winery_id=winery_id,
+            filters=FermentationListFilter(
+                data_source="HISTORICAL",
+                start_date_from=date(2024, 1, 1),
+                start_date_to=date(2024, 12, 31),
+                fruit_origin_id=5,
+                status="completed",
+            ),
+            limit=limit,
+            offset=offset,
         )
 
     @pytest.mark.asyncio
@@ -136,7 +146,7 @@ class TestGetHistoricalFermentations:
         """Test query with only required parameters (winery_id)."""
         # Arrange
         winery_id = 2
-        mock_fermentation_repo.list_by_data_source.return_value = []
+        mock_fermentation_repo.list_page_by_data_source.return_value = []
 
         # Act
         result = await service.get_historical_fermentations(
@@ -145,8 +155,11 @@ class TestGetHistoricalFermentations:
 
         # Assert
         assert result == []
-        mock_fermentation_repo.list_by_data_source.assert_called_once_with(
-            winery_id=winery_id, data_source="HISTORICAL", include_deleted=False
+        mock_fermentation_repo.list_page_by_data_source.assert_called_once_with(
+            winery_id=winery_id,
+            filters=FermentationListFilter(data_source="HISTORICAL"),
+            limit=100,
+            offset=0,
         )
 
     @pytest.mark.asyncio
@@ -159,12 +172,12 @@ class TestGetHistoricalFermentations:
         limit = 10
         offset = 20
 
-        # Create 100 mock fermentations as actual Python list (not Mock)
-        all_fermentations = [
+        # The repository returns the requested page (fermentations 21-30)
+        page = [
             Mock(spec=Fermentation, id=i, winery_id=winery_id, data_source="HISTORICAL")
-            for i in range(1, 101)
+            for i in range(21, 31)
         ]
-        mock_fermentation_repo.list_by_data_source.return_value = all_fermentations
+        mock_fermentation_repo.list_page_by_data_source.return_value = page
 
         # Act
         result = await service.get_historical_fermentations(
@@ -172,11 +185,11 @@ class TestGetHistoricalFermentations:
         )
 
         # Assert
-        assert len(result) == 10
-        # Check that we got fermentations 21-30 (offset=20, limit=10)
-        assert result[0].id == 21
-        assert result[9].id == 30
-        mock_fermentation_repo.list_by_data_source.assert_called_once()
+        assert result == page
+        # Pagination is pushed to the query, not applied in memory
+        call_kwargs = mock_fermentation_repo.list_page_by_data_source.call_args.kwargs
+        assert call_kwargs["limit"] == 10
+        assert call_kwargs["offset"] == 20
 
 
 class TestGetHistoricalFermentationById:
@@ -423,7 +436,7 @@ class TestExtractPatterns:
     def mock_fermentation_repo(self) -> Mock:
         """Mock repository."""
         repo = create_autospec(IFermentationRepository, instance=True)
-        repo.list_by_data_source.return_value = []
+        repo.list_page_by_data_source.return_value = []
         return repo
 
     @pytest.fixture
@@ -480,7 +493,7 @@ class TestExtractPatterns:
                 status="completed",
             ),
         ]
-        mock_fermentation_repo.list_by_data_source.return_value = mock_fermentations
+        mock_fermentation_repo.list_page_by_data_source.return_value = mock_fermentations
 
         # Mock samples for each fermentation (add data_source and recorded_at)
         mock_sample_repo.get_samples_by_fermentation_id.side_effect = [
@@ -531,10 +544,11 @@ class TestExtractPatterns:
         assert "total_fermentations" in result
 
         # Verify repository called with correct filters
-        mock_fermentation_repo.list_by_data_source.assert_called_once()
-        call_kwargs = mock_fermentation_repo.list_by_data_source.call_args.kwargs
+        mock_fermentation_repo.list_page_by_data_source.assert_called_once()
+        call_kwargs = mock_fermentation_repo.list_page_by_data_source.call_args.kwargs
         assert call_kwargs["winery_id"] == winery_id
-        assert call_kwargs["data_source"] == "HISTORICAL"
+        assert call_kwargs["filters"].data_source == "HISTORICAL"
+        assert call_kwargs["filters"].fruit_origin_id == fruit_origin_id
 
     @pytest.mark.asyncio
     async def test_extract_patterns_returns_empty_when_no_data(
@@ -543,7 +557,7 @@ class TestExtractPatterns:
         """Test pattern extraction with no fermentations."""
         # Arrange
         winery_id = 1
-        mock_fermentation_repo.list_by_data_source.return_value = []
+        mock_fermentation_repo.list_page_by_data_source.return_value = []
 
         # Act
         result = await service.extract_patterns(
@@ -578,7 +592,7 @@ class TestExtractPatterns:
                 status="stuck",
             ),
         ]
-        mock_fermentation_repo.list_by_data_source.return_value = mock_fermentations
+        mock_fermentation_repo.list_page_by_data_source.return_value = mock_fermentations
         mock_sample_repo.get_samples_by_fermentation_id.return_value = []
 
         # Act
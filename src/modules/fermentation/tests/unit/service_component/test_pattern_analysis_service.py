@@ -0,0 +1,60 @@
+"""
+Unit tests for PatternAnalysisService.
+
+Repositories are autospecced from their interfaces, so calling a method the
+interface does not declare fails the test.
+"""
+
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import create_autospec
+
+from src.modules.fermentation.src.domain.repositories.fermentation_repository_interface import (
+    IFermentationRepository,
+)
+from src.modules.fermentation.src.domain.repositories.sample_repository_interface import (
+    ISampleRepository,
+)
+from src.modules.fermentation.src.service_component.services.pattern_analysis_service import (
+    PatternAnalysisService,
+)
+
+
+@pytest.fixture
+def fermentation_repo():
+    return create_autospec(IFermentationRepository, instance=True)
+
+
+@pytest.fixture
+def sample_repo():
+    repo = create_autospec(ISampleRepository, instance=True)
+    repo.get_samples_by_fermentation_id.return_value = []
+    return repo
+
+
+class TestExtractPatterns:
+    """Test fermentation selection for pattern extraction."""
+
+    @pytest.mark.asyncio
+    async def test_without_data_source_reads_all_winery_fermentations(
+        self, fermentation_repo, sample_repo
+    ):
+        fermentation_repo.get_by_winery.return_value = [
+            SimpleNamespace(
+                id=1,
+                fruit_origin_id=None,
+                start_date=datetime(2025, 9, 1),
+                initial_density=1100.0,
+                initial_sugar_brix=24.0,
+                status="COMPLETED",
+            )
+        ]
+        service = PatternAnalysisService(fermentation_repo, sample_repo)
+
+        pattern = await service.extract_patterns(winery_id=7)
+
+        assert pattern["total_fermentations"] == 1
+        fermentation_repo.get_by_winery.assert_awaited_once_with(
+            winery_id=7, include_completed=True, include_deleted=False
+        )
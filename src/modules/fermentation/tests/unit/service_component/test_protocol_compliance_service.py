@@ -20,6 +20,7 @@ from typing import Optional, List
 from src.modules.fermentation.src.service_component.services.protocol_compliance_service import (
     ProtocolComplianceService,
     ComplianceScoreResult,
+    ExecutionEvaluation,
     StepDeviation,
     WeightedCompletionScore,
     TimingScore,
@@ -634,6 +635,32 @@ class TestDetectDeviations:
         assert unjustified is not None
         assert unjustified.severity == "CRITICAL"
 
+    @pytest.mark.asyncio
+    async def test_steps_loaded_with_string_step_type(
+        self,
+        compliance_service,
+        sample_execution,
+        sample_protocol,
+        mock_execution_repo,
+        mock_completion_repo,
+    ):
+        """Steps read from the database hold step_type as its stored string."""
+        for step in sample_protocol.steps:
+            step.step_type = step.step_type.value
+
+        mock_execution_repo.get_by_id = AsyncMock(return_value=sample_execution)
+        mock_completion_repo.get_by_execution = AsyncMock(return_value=[])
+
+        deviations = await compliance_service.detect_deviations(1)
+        result = await compliance_service.calculate_compliance_score(1)
+
+        assert {d.step_type for d in deviations} == {"INITIALIZATION", "MONITORING"}
+        assert [b.step_type for b in result.breakdown["completion"].step_breakdown] == [
+            "INITIALIZATION",
+            "MONITORING",
+            "ADDITIONS",
+        ]
+
 
 class TestGetExecutionStatus:
     """Test execution status tracking."""
@@ -760,3 +787,99 @@ class TestComplianceScoringFormula:
         assert result.compliance_score >= 90
         assert result.weighted_completion > 0
         assert result.timing_score > 0
+
+
+class TestExecutionEvaluation:
+    """Test the single-pass evaluation behind every score and report."""
+
+    @staticmethod
+    def _completion(step_id, day, on_schedule=True, days_late=0, skip_reason=None):
+        return StepCompletion(
+            execution_id=1,
+            step_id=step_id,
+            completed_at=datetime(2026, 2, 1) + timedelta(days=day),
+            is_on_schedule=None if skip_reason else on_schedule,
+            days_late=days_late,
+            was_skipped=skip_reason is not None,
+            skip_reason=skip_reason,
+        )
+
+    def test_repeated_daily_completions_count_once_per_step(self, sample_protocol):
+        """Step 3 repeats daily: every record is timed, the latest one is scored."""
+        completions = [
+            self._completion(1, 0),
+            self._completion(3, 5, on_schedule=False, days_late=3),
+            self._completion(3, 6),
+            self._completion(3, 7),
+        ]
+
+        evaluation = ExecutionEvaluation.evaluate(
+            sample_protocol.steps,
+            completions,
+            start_date=datetime(2026, 2, 1, 12),
+            now=datetime(2026, 2, 10),
+        )
+
+        assert evaluation.completion.completed_count == 2
+        assert evaluation.completion.pending_count == 1
+        assert evaluation.completion.step_breakdown[2].days_late == 0
+        assert (evaluation.timing.on_time_count, evaluation.timing.late_count) == (3, 1)
+        assert evaluation.critical_steps_completion_pct == 50.0
+        # The first record of step 3 was late; step 2 (critical) is missing
+        assert [(d.step_id, d.deviation_type) for d in evaluation.deviations] == [
+            (2, "MISSING"),
+            (3, "LATE"),
+        ]
+        assert [o["step_id"] for o in evaluation.overdue_steps] == [2]
+        assert evaluation.overdue_steps[0]["days_overdue"] == 7
+
+    def test_unjustified_then_justified_skip_is_credited(self, sample_protocol):
+        """Any justified skip credits a critical step; only the first skip is reported."""
+        unjustified = self._completion(
+            2, 2, skip_reason=SkipReason.EQUIPMENT_FAILURE.value
+        )
+        justified = self._completion(
+            2, 3, skip_reason=SkipReason.CONDITION_NOT_MET.value
+        )
+
+        only_unjustified = ExecutionEvaluation.evaluate(
+            sample_protocol.steps, [unjustified], datetime(2026, 2, 1), datetime(2026, 2, 1)
+        )
+        both = ExecutionEvaluation.evaluate(
+            sample_protocol.steps,
+            [unjustified, justified],
+            datetime(2026, 2, 1),
+            datetime(2026, 2, 1),
+        )
+
+        assert ("UNJUSTIFIED_SKIP", 2) in [
+            (d.deviation_type, d.step_id) for d in only_unjustified.deviations
+        ]
+        assert 2 not in [d.step_id for d in both.deviations]
+        assert both.by_step[2].first_skip is unjustified
+        assert both.skipped_records == 2
+
+    @pytest.mark.asyncio
+    async def test_execution_status_loads_completions_once(
+        self,
+        compliance_service,
+        sample_execution,
+        mock_execution_repo,
+        mock_completion_repo,
+    ):
+        """Score, progress and deviations share one load of the execution data."""
+        mock_execution_repo.get_by_id = AsyncMock(return_value=sample_execution)
+        mock_completion_repo.get_by_execution = AsyncMock(
+            return_value=[self._completion(1, 0)]
+        )
+
+        status = await compliance_service.get_execution_status(1)
+
+        assert status["steps_progress"] == {
+            "completed": 1,
+            "skipped": 0,
+            "pending": 2,
+            "total": 3,
+        }
+        assert mock_execution_repo.get_by_id.await_count == 1
+        assert mock_completion_repo.get_by_execution.await_count == 1
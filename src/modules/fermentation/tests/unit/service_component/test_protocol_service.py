@@ -40,7 +40,7 @@ from src.modules.fermentation.src.domain.entities.protocol_execution import (
     ProtocolExecution,
 )
 from src.modules.fermentation.src.domain.entities.protocol_step import ProtocolStep
-from src.modules.fermentation.src.domain.enums.step_type import StepType
+from src.modules.fermentation.src.domain.enums.step_type import ProtocolState, StepType
 
 # ============================================================================
 # Fixtures
@@ -703,6 +703,32 @@ def _make_step(step_id: int, order: int, protocol_id: int = 1) -> MagicMock:
     return s
 
 
+def _created(spec, rows: List[dict], first_id: int) -> List[MagicMock]:
+    """Helper: mock entities as returned by a repository bulk_create."""
+    created = []
+    for i, row in enumerate(rows):
+        entity = MagicMock(spec=spec)
+        entity.configure_mock(id=first_id + i, **row)
+        created.append(entity)
+    return created
+
+
+def _created_steps(rows: List[dict]) -> List[MagicMock]:
+    """Helper: steps created by ProtocolStepRepository.bulk_create (IDs from 100)."""
+    return _created(ProtocolStep, rows, first_id=100)
+
+
+@pytest.fixture
+def plain_committed_value():
+    """Copies are mocks, not mapped instances: write their loaded state directly."""
+    with patch(
+        "src.modules.fermentation.src.service_component.services.protocol_service.set_committed_value",
+        side_effect=setattr,
+    ):
+        yield
+
+
+@pytest.mark.usefixtures("plain_committed_value")
 class TestCloneProtocol:
     """Tests for ProtocolService.clone_protocol (ADR-039)."""
 
@@ -739,7 +765,7 @@ class TestCloneProtocol:
 
         steps = [_make_step(1, 1), _make_step(2, 2)]
         mock_step_repo.get_by_protocol = AsyncMock(return_value=steps)
-        mock_step_repo.create = AsyncMock(side_effect=lambda s: s)
+        mock_step_repo.bulk_create = AsyncMock(side_effect=_created_steps)
 
         result = await protocol_service.clone_protocol(
             source_protocol_id=1,
@@ -750,7 +776,7 @@ class TestCloneProtocol:
         assert result.is_active is False
         assert result.version == "2.0"
         assert result.varietal_code == "PN"
-        mock_step_repo.create.assert_awaited()
+        mock_step_repo.bulk_create.assert_awaited_once()
 
     @pytest.mark.asyncio
     @patch(
@@ -778,13 +804,18 @@ class TestCloneProtocol:
         mock_protocol_repo.session.flush = AsyncMock()
         mock_protocol_repo.session.commit = AsyncMock()
 
-        steps = [_make_step(1, 1), _make_step(2, 2), _make_step(3, 3)]
+        steps = [_make_step(3, 3), _make_step(1, 1), _make_step(2, 2)]
         mock_step_repo.get_by_protocol = AsyncMock(return_value=steps)
-        mock_step_repo.create = AsyncMock(side_effect=lambda s: s)
+        mock_step_repo.bulk_create = AsyncMock(side_effect=_created_steps)
 
         await protocol_service.clone_protocol(1, 1, "2.0")
 
-        assert mock_step_repo.create.await_count == 3
+        # One multi-row insert, in step order, into the clone
+        mock_step_repo.bulk_create.assert_awaited_once()
+        rows = mock_step_repo.bulk_create.await_args.args[0]
+        assert [r["step_order"] for r in rows] == [1, 2, 3]
+        assert {r["protocol_id"] for r in rows} == {10}
+        mock_step_repo.create.assert_not_called()
 
     @pytest.mark.asyncio
     @patch(
@@ -1052,3 +1083,139 @@ class TestOverrideStep:
                 winery_id=1,
                 tolerance_hours=6,
             )
+
+
+@pytest.mark.usefixtures("plain_committed_value")
+class TestInstantiateFromTemplate:
+    """Tests for ProtocolService.instantiate_from_template(_bulk) (ADR-039)."""
+
+    @pytest.fixture
+    def template(self, sample_protocol):
+        sample_protocol.is_template = True
+        sample_protocol.state = ProtocolState.FINAL
+        return sample_protocol
+
+    @pytest.fixture
+    def template_steps(self, mock_step_repo):
+        """Template steps 1 -> 2: step 2 depends on step 1."""
+        first, second = _make_step(1, 1), _make_step(2, 2)
+        second.depends_on_step_id = 1
+        mock_step_repo.get_by_protocol = AsyncMock(return_value=[second, first])
+        mock_step_repo.bulk_create = AsyncMock(side_effect=_created_steps)
+        return [first, second]
+
+    @staticmethod
+    def _created_protocols(rows: List[dict]) -> List[MagicMock]:
+        return _created(FermentationProtocol, rows, first_id=20)
+
+    @pytest.mark.asyncio
+    async def test_bulk_inserts_all_instances_and_steps_at_once(
+        self,
+        protocol_service,
+        mock_protocol_repo,
+        mock_step_repo,
+        template,
+        template_steps,
+    ):
+        """One insert for the instances, one for their steps, one commit."""
+        mock_protocol_repo.get_by_id = AsyncMock(return_value=template)
+        mock_protocol_repo.bulk_create = AsyncMock(side_effect=self._created_protocols)
+
+        instances = await protocol_service.instantiate_from_template_bulk(
+            template_id=1,
+            winery_id=1,
+            fermentation_batch_names=["T1", "T2", "T3"],
+            created_by_user_id=7,
+        )
+
+        assert [i.protocol_name for i in instances] == [
+            "Pinot Noir v1.0 — T1",
+            "Pinot Noir v1.0 — T2",
+            "Pinot Noir v1.0 — T3",
+        ]
+        assert all(
+            i.is_template is False and i.template_id == 1 and i.version == "1.0"
+            for i in instances
+        )
+        mock_protocol_repo.bulk_create.assert_awaited_once()
+        mock_step_repo.bulk_create.assert_awaited_once()
+        rows = mock_step_repo.bulk_create.await_args.args[0]
+        assert [(r["protocol_id"], r["step_order"]) for r in rows] == [
+            (20, 1), (20, 2), (21, 1), (21, 2), (22, 1), (22, 2)
+        ]
+        mock_step_repo.create.assert_not_called()
+        mock_protocol_repo.create.assert_not_called()
+        mock_protocol_repo.session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_bulk_remaps_dependencies_to_each_instance(
+        self,
+        protocol_service,
+        mock_protocol_repo,
+        mock_step_repo,
+        template,
+        template_steps,
+    ):
+        """depends_on_step_id points at the copied step of the same instance."""
+        mock_protocol_repo.get_by_id = AsyncMock(return_value=template)
+        mock_protocol_repo.bulk_create = AsyncMock(side_effect=self._created_protocols)
+
+        instances = await protocol_service.instantiate_from_template_bulk(
+            1, 1, ["T1", "T2"], 7
+        )
+
+        # New step IDs: 100, 101 (T1) and 102, 103 (T2)
+        mock_step_repo.bulk_set_dependencies.assert_awaited_once_with(
+            {101: 100, 103: 102}
+        )
+        assert [
+            [(s.id, s.depends_on_step_id) for s in i.steps] for i in instances
+        ] == [[(100, None), (101, 100)], [(102, None), (103, 102)]]
+
+    @pytest.mark.asyncio
+    async def test_single_instantiate_uses_bulk_path(
+        self,
+        protocol_service,
+        mock_protocol_repo,
+        mock_step_repo,
+        template,
+        template_steps,
+    ):
+        """instantiate_from_template is the bulk path with one batch name."""
+        mock_protocol_repo.get_by_id = AsyncMock(return_value=template)
+        mock_protocol_repo.bulk_create = AsyncMock(side_effect=self._created_protocols)
+
+        instance = await protocol_service.instantiate_from_template(1, 1, "T1", 7)
+
+        assert instance.id == 20
+        assert instance.protocol_name == "Pinot Noir v1.0 — T1"
+        assert len(mock_protocol_repo.bulk_create.await_args.args[0]) == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_requires_final_template(
+        self, protocol_service, mock_protocol_repo, template
+    ):
+        """DRAFT templates cannot be instantiated."""
+        template.state = ProtocolState.DRAFT
+        mock_protocol_repo.get_by_id = AsyncMock(return_value=template)
+
+        with pytest.raises(ValueError, match="Only FINAL templates"):
+            await protocol_service.instantiate_from_template_bulk(1, 1, ["T1"], 7)
+        mock_protocol_repo.bulk_create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bulk_rejects_instances_as_source(
+        self, protocol_service, mock_protocol_repo, template
+    ):
+        """Instances cannot be instantiated again."""
+        template.is_template = False
+        mock_protocol_repo.get_by_id = AsyncMock(return_value=template)
+
+        with pytest.raises(ValueError, match="already a fermentation instance"):
+            await protocol_service.instantiate_from_template_bulk(1, 1, ["T1"], 7)
+
+    @pytest.mark.asyncio
+    async def test_bulk_requires_batch_names(self, protocol_service):
+        """An empty batch list is rejected before touching the database."""
+        with pytest.raises(ValueError, match="At least one"):
+            await protocol_service.instantiate_from_template_bulk(1, 1, [], 7)
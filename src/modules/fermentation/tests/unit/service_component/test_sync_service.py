@@ -0,0 +1,217 @@
+"""
+Unit tests for SyncService (delta sync change feed).
+
+All tests use SimpleNamespace rows and an AsyncMock IChangeFeedRepository
+to avoid any database dependency.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from src.modules.fermentation.src.domain.enums.sync_entity import SyncEntity
+from src.modules.fermentation.src.service_component.errors import InvalidSyncCursor
+from src.modules.fermentation.src.service_component.services.sync_service import (
+    SyncService,
+)
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+T0 = datetime(2026, 4, 1, 10, 0, 0)
+
+
+def _row(row_id, minutes=0, is_deleted=False):
+    return SimpleNamespace(
+        id=row_id, updated_at=T0 + timedelta(minutes=minutes), is_deleted=is_deleted
+    )
+
+
+def _tombstone(row_id, entity_id, minutes=0):
+    return SimpleNamespace(
+        id=row_id, entity_id=entity_id, updated_at=T0 + timedelta(minutes=minutes)
+    )
+
+
+def _make_service(changes=None, tombstones=None) -> tuple:
+    """Return (service, repo_mock); changes maps SyncEntity -> rows."""
+    changes = changes or {}
+    repo = AsyncMock()
+    repo.get_changes.side_effect = lambda winery_id, entity, after, until, limit: list(
+        changes.get(entity, [])
+    )[:limit]
+    repo.get_tombstones.side_effect = (
+        lambda winery_id, entity, after, until, limit: list(tombstones or [])[:limit]
+    )
+    return SyncService(change_feed_repo=repo, safety_lag_seconds=0), repo
+
+
+# =============================================================================
+# Change sets
+# =============================================================================
+
+
+class TestGetChanges:
+    async def test_full_sync_reads_every_stream_without_position(self):
+        service, repo = _make_service()
+
+        await service.get_changes(winery_id=1)
+
+        entities = [call.kwargs["entity"] for call in repo.get_changes.await_args_list]
+        assert entities == list(SyncEntity)
+        assert all(
+            call.kwargs["after"] is None for call in repo.get_changes.await_args_list
+        )
+        repo.get_tombstones.assert_awaited_once()
+        assert repo.get_tombstones.await_args.kwargs["entity"] == SyncEntity.ACTION
+
+    async def test_soft_deleted_rows_become_deletions(self):
+        service, _ = _make_service(
+            {SyncEntity.SAMPLE: [_row(1, 0), _row(2, 1, is_deleted=True)]}
+        )
+
+        change_set = await service.get_changes(winery_id=1)
+
+        assert [s.id for s in change_set.upserts[SyncEntity.SAMPLE]] == [1]
+        assert [(d.entity, d.entity_id) for d in change_set.deletions] == [
+            (SyncEntity.SAMPLE, 2)
+        ]
+
+    async def test_tombstones_become_deletions(self):
+        service, _ = _make_service(tombstones=[_tombstone(7, entity_id=42)])
+
+        change_set = await service.get_changes(
+            winery_id=1, entities=[SyncEntity.ACTION]
+        )
+
+        assert [(d.entity, d.entity_id) for d in change_set.deletions] == [
+            (SyncEntity.ACTION, 42)
+        ]
+
+    async def test_cursor_resumes_each_stream_after_last_row(self):
+        service, repo = _make_service(
+            {
+                SyncEntity.FERMENTATION: [_row(3, 5)],
+                SyncEntity.SAMPLE: [_row(8, 2), _row(9, 4)],
+            }
+        )
+        first = await service.get_changes(winery_id=1)
+        repo.get_changes.reset_mock()
+
+        await service.get_changes(winery_id=1, cursor=first.next_cursor)
+
+        after = {
+            call.kwargs["entity"]: call.kwargs["after"]
+            for call in repo.get_changes.await_args_list
+        }
+        assert after[SyncEntity.FERMENTATION] == (T0 + timedelta(minutes=5), 3)
+        assert after[SyncEntity.SAMPLE] == (T0 + timedelta(minutes=4), 9)
+        assert after[SyncEntity.NOTE] is None
+
+    async def test_page_limit_sets_has_more(self):
+        service, repo = _make_service(
+            {SyncEntity.SAMPLE: [_row(1, 0), _row(2, 1), _row(3, 2)]}
+        )
+
+        change_set = await service.get_changes(
+            winery_id=1, limit=2, entities=[SyncEntity.SAMPLE]
+        )
+
+        assert change_set.has_more is True
+        assert [s.id for s in change_set.upserts[SyncEntity.SAMPLE]] == [1, 2]
+        assert repo.get_changes.await_args.kwargs["limit"] == 3
+        positions = SyncService.decode_cursor(change_set.next_cursor, winery_id=1)
+        assert positions["sample"] == (T0 + timedelta(minutes=1), 2)
+
+    async def test_filtered_sync_keeps_other_positions(self):
+        service, _ = _make_service({SyncEntity.NOTE: [_row(5, 1)]})
+        cursor = SyncService.encode_cursor(1, {"sample": (T0, 9)})
+
+        change_set = await service.get_changes(
+            winery_id=1, cursor=cursor, entities=[SyncEntity.NOTE]
+        )
+
+        positions = SyncService.decode_cursor(change_set.next_cursor, winery_id=1)
+        assert positions == {
+            "sample": (T0, 9),
+            "note": (T0 + timedelta(minutes=1), 5),
+        }
+
+    async def test_watermark_applies_safety_lag(self):
+        repo = AsyncMock()
+        repo.get_changes.return_value = []
+        repo.get_tombstones.return_value = []
+        service = SyncService(change_feed_repo=repo, safety_lag_seconds=30)
+
+        change_set = await service.get_changes(
+            winery_id=1, entities=[SyncEntity.FERMENTATION]
+        )
+
+        assert repo.get_changes.await_args.kwargs["until"] == change_set.server_time
+        assert change_set.server_time <= datetime.utcnow() - timedelta(seconds=29)
+
+    async def test_caught_up_stream_rewinds_to_overlap_window(self):
+        """A row committed late with an older updated_at must still be re-read."""
+        recent = SimpleNamespace(id=4, updated_at=datetime.utcnow(), is_deleted=False)
+        service, _ = _make_service({SyncEntity.SAMPLE: [recent]})
+
+        change_set = await service.get_changes(
+            winery_id=1, entities=[SyncEntity.SAMPLE]
+        )
+
+        positions = SyncService.decode_cursor(change_set.next_cursor, winery_id=1)
+        floor = change_set.server_time - timedelta(seconds=service.overlap_seconds)
+        assert change_set.has_more is False
+        assert positions["sample"] == (floor, 0)
+
+    async def test_paging_does_not_rewind_while_has_more(self):
+        now = datetime.utcnow()
+        rows = [
+            SimpleNamespace(id=i, updated_at=now, is_deleted=False) for i in (1, 2, 3)
+        ]
+        service, _ = _make_service({SyncEntity.SAMPLE: rows})
+
+        change_set = await service.get_changes(
+            winery_id=1, limit=2, entities=[SyncEntity.SAMPLE]
+        )
+
+        positions = SyncService.decode_cursor(change_set.next_cursor, winery_id=1)
+        assert change_set.has_more is True
+        assert positions["sample"] == (now, 2)
+
+    def test_from_env_reads_lag_and_overlap(self, monkeypatch):
+        monkeypatch.setenv("SYNC_SAFETY_LAG_SECONDS", "45")
+        monkeypatch.setenv("SYNC_OVERLAP_SECONDS", "600")
+
+        service = SyncService.from_env(AsyncMock())
+
+        assert service.safety_lag_seconds == 45.0
+        assert service.overlap_seconds == 600.0
+
+
+# =============================================================================
+# Cursor codec
+# =============================================================================
+
+
+class TestCursor:
+    def test_round_trip(self):
+        positions = {"fermentation": (T0, 3), "action.deleted": (T0, 1)}
+
+        cursor = SyncService.encode_cursor(7, positions)
+
+        assert "=" not in cursor
+        assert SyncService.decode_cursor(cursor, winery_id=7) == positions
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", "!!!"])
+    def test_malformed_cursor_rejected(self, cursor):
+        with pytest.raises(InvalidSyncCursor):
+            SyncService.decode_cursor(cursor, winery_id=1)
+
+    def test_cursor_of_other_winery_rejected(self):
+        cursor = SyncService.encode_cursor(2, {"sample": (T0, 1)})
+
+        with pytest.raises(InvalidSyncCursor):
+            SyncService.decode_cursor(cursor, winery_id=1)
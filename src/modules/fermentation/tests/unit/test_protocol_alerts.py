@@ -178,9 +178,13 @@ class TestIProtocolAlertRepositoryContract:
             "get_by_id",
             "get_by_execution",
             "get_pending_by_winery",
+            "get_inbox",
             "acknowledge",
             "dismiss",
             "count_pending",
+            "get_winery_counts",
+            "get_execution_counts",
+            "remove_execution_counts",
         }
         actual = set(IProtocolAlertRepository.__abstractmethods__)
         assert required == actual
@@ -334,6 +338,161 @@ class TestProtocolAlertRepository:
         count = await repo.count_pending(execution_id=10)
         assert count == 0
 
+    @staticmethod
+    def _statements(session):
+        return [call.args[0] for call in session.execute.await_args_list]
+
+    @pytest.mark.asyncio
+    async def test_create_many_upserts_grouped_counters(self):
+        repo, session = self._make_repo()
+        alerts = [
+            make_alert(id=1, execution_id=10, severity="WARNING"),
+            make_alert(id=2, execution_id=10, severity="WARNING"),
+            make_alert(id=3, execution_id=11, severity="CRITICAL"),
+        ]
+        await repo.create_many(alerts)
+
+        winery_stmt, execution_stmt = self._statements(session)
+        assert winery_stmt.table.name == "alert_inbox_winery_counts"
+        assert execution_stmt.table.name == "alert_inbox_execution_counts"
+        winery_rows = winery_stmt.compile().params
+        assert sorted(v for k, v in winery_rows.items() if k.startswith("alert_count")) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_acknowledge_moves_count_between_statuses(self):
+        repo, session = self._make_repo()
+        alert = make_alert(status="PENDING")
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.first.return_value = alert
+        session.execute.return_value = mock_result
+
+        await repo.acknowledge(alert.id)
+
+        # Lookup, then winery and execution counter upserts
+        _, winery_stmt, _ = self._statements(session)
+        params = winery_stmt.compile().params
+        moved = {
+            params[k.replace("alert_count", "status")]: v
+            for k, v in params.items()
+            if k.startswith("alert_count")
+        }
+        assert moved == {"ACKNOWLEDGED": 1, "PENDING": -1}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", ["acknowledge", "dismiss"])
+    async def test_status_change_locks_the_alert_row(self, method):
+        from sqlalchemy.dialects import postgresql
+
+        repo, session = self._make_repo()
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.first.return_value = None
+        session.execute.return_value = mock_result
+
+        await getattr(repo, method)(1)
+
+        lookup = session.execute.await_args_list[0].args[0]
+        assert "FOR UPDATE" in str(lookup.compile(dialect=postgresql.dialect()))
+
+    @pytest.mark.asyncio
+    async def test_acknowledge_twice_leaves_counters_alone(self):
+        repo, session = self._make_repo()
+        alert = make_alert(status="ACKNOWLEDGED")
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.first.return_value = alert
+        session.execute.return_value = mock_result
+
+        await repo.acknowledge(alert.id)
+
+        assert session.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_winery_counts_builds_alert_counts(self):
+        repo, session = self._make_repo()
+        mock_result = MagicMock()
+        mock_result.all.return_value = [
+            ("PENDING", "CRITICAL", 2),
+            ("PENDING", "WARNING", 3),
+            ("DISMISSED", "WARNING", 1),
+        ]
+        session.execute.return_value = mock_result
+
+        counts = await repo.get_winery_counts(winery_id=5)
+
+        assert counts.total == 6
+        assert counts.pending == 5
+        assert counts.by_severity("PENDING") == {"CRITICAL": 2, "WARNING": 3}
+        assert counts.by_status() == {"PENDING": 5, "DISMISSED": 1}
+
+    @pytest.mark.asyncio
+    async def test_get_execution_counts_groups_by_execution(self):
+        repo, session = self._make_repo()
+        mock_result = MagicMock()
+        mock_result.all.return_value = [
+            (10, "PENDING", "WARNING", 2),
+            (11, "PENDING", "CRITICAL", 1),
+        ]
+        session.execute.return_value = mock_result
+
+        counts = await repo.get_execution_counts(winery_id=5)
+
+        assert {e: c.pending for e, c in counts.items()} == {10: 2, 11: 1}
+
+    @pytest.mark.asyncio
+    async def test_get_execution_counts_for_no_executions(self):
+        repo, session = self._make_repo()
+        assert await repo.get_execution_counts(winery_id=5, execution_ids=[]) == {}
+        session.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_get_inbox_returns_page(self):
+        repo, session = self._make_repo()
+        alerts = [make_alert(id=2), make_alert(id=1)]
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = alerts
+        session.execute.return_value = mock_result
+
+        result = await repo.get_inbox(winery_id=5, after=(datetime(2026, 1, 1), 3), limit=2)
+
+        assert result == alerts
+        assert "LIMIT" in str(self._statements(session)[0])
+
+
+class TestInboxCursor:
+    """Inbox cursors round-trip and stay bound to the winery and status filter."""
+
+    POSITION = (datetime(2026, 3, 1, 8, 30), 17)
+
+    def test_round_trip(self):
+        from src.modules.fermentation.src.api.routers.alert_router import (
+            decode_inbox_cursor,
+            encode_inbox_cursor,
+        )
+
+        cursor = encode_inbox_cursor(5, "PENDING", self.POSITION)
+        assert decode_inbox_cursor(cursor, 5, "PENDING") == self.POSITION
+
+    @pytest.mark.parametrize(
+        "winery_id, status_filter, message",
+        [(6, "PENDING", "another winery"), (5, None, "different filters")],
+    )
+    def test_cursor_is_bound_to_winery_and_status(self, winery_id, status_filter, message):
+        from src.modules.fermentation.src.api.routers.alert_router import (
+            decode_inbox_cursor,
+            encode_inbox_cursor,
+        )
+        from src.modules.fermentation.src.service_component.errors import InvalidPageCursor
+
+        cursor = encode_inbox_cursor(5, "PENDING", self.POSITION)
+        with pytest.raises(InvalidPageCursor, match=message):
+            decode_inbox_cursor(cursor, winery_id, status_filter)
+
+    def test_malformed_cursor_is_rejected(self):
+        from src.modules.fermentation.src.api.routers.alert_router import decode_inbox_cursor
+        from src.modules.fermentation.src.service_component.errors import InvalidPageCursor
+
+        with pytest.raises(InvalidPageCursor, match="Malformed"):
+            decode_inbox_cursor("not-a-cursor", 5, "PENDING")
+
 
 # =============================================================================
 # ProtocolAlertService — repository integration tests
@@ -1,6 +1,7 @@
 import pytest
 import sys
 from pathlib import Path
+from datetime import datetime
 from unittest.mock import Mock, AsyncMock
 
 from src.modules.fermentation.src.domain.enums.sample_type import SampleType
@@ -196,3 +197,89 @@ async def test_validate_sample_complete_chronology_and_validation_value_complete
     mock_value_validation_service.validate_sample_value.assert_called_once()
     # Temperature validation is currently disabled - TODO: enable when FermentationRepository.get_fermentation_temperature_range is implemented
     # mock_business_rule_validation_service.validate_temperature_range.assert_awaited_once()
+
+
+def _batch_sample(sample_type, value, hour):
+    sample = Mock()
+    sample.sample_type = sample_type.value
+    sample.value = value
+    sample.recorded_at = datetime(2025, 10, 1, hour)
+    return sample
+
+
+@pytest.mark.asyncio
+async def test_validate_sample_batch_uses_window_without_history_queries(
+    validation_orchestrator,
+    mock_chronology_service,
+    mock_value_validation_service,
+    mock_business_rule_validation_service,
+):
+    mock_value_validation_service.validate_sample_value = Mock(
+        return_value=ValidationResult.success()
+    )
+    latest_sugar = _batch_sample(SampleType.SUGAR, 20.0, 8)
+    samples = [
+        _batch_sample(SampleType.SUGAR, 18.0, 12),  # decreasing: ok
+        _batch_sample(SampleType.SUGAR, 19.0, 10),  # validated first (earlier)
+        _batch_sample(SampleType.SUGAR, 18.5, 7),  # older than stored sample
+        _batch_sample(SampleType.TEMPERATURE, 22.0, 7),  # first of its type
+    ]
+
+    results = await validation_orchestrator.validate_sample_batch(
+        fermentation_id=1,
+        samples=samples,
+        latest_by_type={SampleType.SUGAR.value: latest_sugar},
+    )
+
+    assert [r.is_valid for r in results] == [True, True, False, True]
+    assert results[2].errors[0].field == "recorded_at"
+    mock_chronology_service.validate_sample_chronology.assert_not_called()
+    mock_business_rule_validation_service.validate_sugar_trend.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_validate_sample_batch_sugar_trend_against_accepted_samples(
+    validation_orchestrator,
+    mock_value_validation_service,
+):
+    mock_value_validation_service.validate_sample_value = Mock(
+        return_value=ValidationResult.success()
+    )
+    samples = [
+        _batch_sample(SampleType.SUGAR, 15.0, 9),
+        _batch_sample(SampleType.SUGAR, 16.0, 10),  # increases vs accepted 15.0
+        _batch_sample(SampleType.SUGAR, 14.0, 11),  # compared to 15.0, not 16.0
+    ]
+
+    results = await validation_orchestrator.validate_sample_batch(
+        fermentation_id=1, samples=samples
+    )
+
+    assert [r.is_valid for r in results] == [True, False, True]
+    assert results[1].errors[0].field == "sugar"
+
+
+@pytest.mark.asyncio
+async def test_validate_sample_batch_value_failure(
+    validation_orchestrator,
+    mock_value_validation_service,
+):
+    mock_value_validation_service.validate_sample_value = Mock(
+        side_effect=[
+            ValidationResult.success(),
+            ValidationResult.failure(
+                errors=[ValidationError(field="value", message="out of range")]
+            ),
+        ]
+    )
+    samples = [
+        _batch_sample(SampleType.DENSITY, 1.05, 9),
+        _batch_sample(SampleType.DENSITY, 9.0, 10),
+    ]
+
+    results = await validation_orchestrator.validate_sample_batch(
+        fermentation_id=1, samples=samples, latest_by_type={}
+    )
+
+    assert [r.is_valid for r in results] == [True, False]
+    assert results[1].errors[0].field == "value"
@@ -4,7 +4,7 @@ Vineyard Router - REST API endpoints
 Handles HTTP requests for vineyard management operations.
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import Annotated
+from typing import Annotated, Optional
 
 from src.modules.fruit_origin.src.api_component.schemas.requests.vineyard_requests import (
     VineyardCreateRequest,
@@ -116,7 +116,12 @@ async def get_vineyard(
 async def list_vineyards(
     user: Annotated[UserContext, Depends(get_current_user)],
     service: Annotated[IFruitOriginService, Depends(get_fruit_origin_service)],
-    include_deleted: bool = False
+    include_deleted: bool = False,
+    include_counts: bool = Query(False, description="Include block and harvest lot counts"),
+    page: Optional[int] = Query(None, ge=1, description="Page number (default 1 when paging)"),
+    page_size: Optional[int] = Query(
+        None, ge=1, le=500, description="Vineyards per page (default 50 when paging)"
+    )
 ) -> VineyardListResponse:
     """
     List vineyards for user's winery.
@@ -127,17 +132,39 @@ async def list_vineyards(
     
     **Query Parameters:**
     - `include_deleted`: Include soft-deleted vineyards (default: false)
+    - `include_counts`: Populate `blocks_count` / `harvest_lots_count` (default: false)
+    - `page`, `page_size`: Pagination, opt-in. Without either, every vineyard
+      is returned as before; with one of them, page defaults to 1 and
+      page_size to 50
     
-    **Returns:** List of vineyards with total count
+    **Returns:** The vineyards (or one page of them) with the total count
     """
-    vineyards = await service.list_vineyards(
+    if page is None and page_size is None:
+        vineyards = await service.list_vineyards(
+            winery_id=user.winery_id,
+            include_deleted=include_deleted,
+            include_counts=include_counts
+        )
+        return VineyardListResponse(
+            vineyards=[VineyardResponse.model_validate(v) for v in vineyards],
+            total=len(vineyards)
+        )
+    
+    page = page or 1
+    page_size = page_size or 50
+    vineyards, total = await service.list_vineyards_paginated(
         winery_id=user.winery_id,
-        include_deleted=include_deleted
+        page=page,
+        page_size=page_size,
+        include_deleted=include_deleted,
+        include_counts=include_counts
     )
     
     return VineyardListResponse(
         vineyards=[VineyardResponse.model_validate(v) for v in vineyards],
-        total=len(vineyards)
+        total=total,
+        page=page,
+        page_size=page_size
     )
 
 
@@ -27,6 +27,10 @@ class VineyardResponse(BaseModel):
         None,
         description="Number of blocks in this vineyard"
     )
+    harvest_lots_count: Optional[int] = Field(
+        None,
+        description="Number of harvest lots across this vineyard's blocks"
+    )
 
 
 class VineyardListResponse(BaseModel):
@@ -40,6 +44,8 @@ class VineyardListResponse(BaseModel):
         ...,
         description="Total number of vineyards"
     )
+    page: Optional[int] = Field(None, description="Current page number")
+    page_size: Optional[int] = Field(None, description="Number of items per page")
     
     model_config = {
         "json_schema_extra": {
@@ -55,10 +61,13 @@ class VineyardListResponse(BaseModel):
                             "is_deleted": False,
                             "created_at": "2025-01-15T10:00:00Z",
                             "updated_at": "2025-01-15T10:00:00Z",
-                            "blocks_count": 5
+                            "blocks_count": 5,
+                            "harvest_lots_count": 12
                         }
                     ],
-                    "total": 1
+                    "total": 1,
+                    "page": 1,
+                    "page_size": 50
                 }
             ]
         }
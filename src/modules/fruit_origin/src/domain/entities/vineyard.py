@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, query_expression
 from sqlalchemy import String, BigInteger, ForeignKey, Boolean, UniqueConstraint
 from typing import List, Optional
 from src.shared.infra.orm.base_entity import BaseEntity
@@ -20,5 +20,10 @@ class Vineyard(BaseEntity):
 
     blocks: Mapped[List["VineyardBlock"]] = relationship("VineyardBlock", back_populates="vineyard", cascade="all, delete-orphan")
 
+    # Aggregates computed in SQL on demand (VineyardRepository.list_paginated
+    # with include_counts=True); None when not loaded
+    blocks_count: Mapped[Optional[int]] = query_expression()
+    harvest_lots_count: Mapped[Optional[int]] = query_expression()
+
     def __repr__(self) -> str:
         return f"<Vineyard(id={self.id}, code='{self.code}', name='{self.name}', winery_id={self.winery_id})>"
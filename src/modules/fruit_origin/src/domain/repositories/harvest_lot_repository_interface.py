@@ -182,6 +182,28 @@ class IHarvestLotRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_by_vineyard(self, vineyard_id: int, winery_id: int) -> List[HarvestLot]:
+        """
+        Retrieves all harvest lots from every block of a vineyard in one query.
+
+        Args:
+            vineyard_id: ID of the vineyard
+            winery_id: Winery ID for access control
+
+        Returns:
+            List[HarvestLot]: Harvest lots from the vineyard's blocks, newest
+            harvest first (empty if the vineyard is missing or deleted)
+
+        Raises:
+            RepositoryError: If database operation fails
+        
+        Use Cases:
+            - Harvest lot list filtered by vineyard
+            - Vineyard harvest history
+        """
+        pass
+
     @abstractmethod
     async def get_by_harvest_date_range(
         self,
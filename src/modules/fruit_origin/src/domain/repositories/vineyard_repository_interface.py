@@ -1,6 +1,6 @@
 """Vineyard repository interface for fruit origin module."""
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from src.modules.fruit_origin.src.domain.entities.vineyard import Vineyard
 from src.modules.fruit_origin.src.domain.dtos.vineyard_dtos import (
@@ -95,6 +95,37 @@ class IVineyardRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def list_paginated(
+        self,
+        winery_id: int,
+        page: int = 1,
+        page_size: Optional[int] = 50,
+        include_deleted: bool = False,
+        include_counts: bool = False,
+    ) -> Tuple[List[Vineyard], int]:
+        """
+        Get one page of vineyards for a winery, ordered by code.
+
+        The soft-delete filter, ordering and pagination run in SQL. With
+        include_counts, blocks_count and harvest_lots_count (non-deleted)
+        are computed by correlated subqueries in the same statement, so a
+        page costs two queries (page + total) regardless of estate size.
+        With page_size None every matching vineyard is returned in one
+        query.
+
+        Args:
+            winery_id: ID of the winery (for multi-tenant security)
+            page: Page number (1-indexed)
+            page_size: Number of vineyards per page (None: no paging)
+            include_deleted: Include soft-deleted vineyards
+            include_counts: Populate blocks_count and harvest_lots_count
+
+        Returns:
+            Tuple of (vineyards on the page, total matching vineyards)
+        """
+        pass
+
     @abstractmethod
     async def update(
         self, vineyard_id: int, winery_id: int, data: VineyardUpdate
@@ -23,11 +23,17 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 # ADR-027: Structured Logging Middleware
-from src.shared.wine_fermentator_logging import configure_logging, get_logger
+from src.shared.wine_fermentator_logging import (
+    configure_logging,
+    get_logger,
+    shutdown_logging,
+)
 from src.shared.wine_fermentator_logging.middleware import (
     LoggingMiddleware,
     UserContextMiddleware,
 )
+from src.shared.wine_fermentator_logging.metrics import MetricsMiddleware
+from src.shared.wine_fermentator_logging.loop_monitor import EventLoopMonitor
 
 # ADR-026: Domain error handlers (fruit_origin-specific)
 from src.modules.fruit_origin.src.api_component.error_handlers import register_error_handlers
@@ -38,6 +44,11 @@ from src.modules.fruit_origin.src.api_component.routers.harvest_lot_router impor
 
 from src.shared.auth.infra.api.auth_router import router as auth_router
 from src.shared.api.constants import API_V1_PREFIX
+from src.shared.api.metrics_router import router as metrics_router
+from src.shared.infra.database.query_inspector import (
+    QueryInspectionMiddleware,
+    query_inspection_enabled,
+)
 from src.shared.infra.database.fastapi_session import close_database, initialize_database
 
 
@@ -48,11 +59,16 @@ logger = get_logger(__name__)
 
 @asynccontextmanager
 async def _lifespan(app: FastAPI):
-    """Initialise DB connection pool on startup; release it on shutdown."""
+    """Initialise DB connection pool and loop monitor on startup; release them on shutdown."""
+    # ADR-027: event loop lag / blocked-loop reporting (GET /metrics, logs)
+    loop_monitor = EventLoopMonitor.from_env()
+    loop_monitor.start()
     initialize_database()
     logger.info("database_initialised")
     yield
     await close_database()
+    await loop_monitor.stop()
+    shutdown_logging()
 
 
 def create_app() -> FastAPI:
@@ -71,6 +87,14 @@ def create_app() -> FastAPI:
         lifespan=_lifespan,
     )
 
+    # Staging only (DB_QUERY_INSPECTION=true): flag N+1 query patterns per request
+    if query_inspection_enabled():
+        app.add_middleware(QueryInspectionMiddleware)
+
+    # ADR-027: Request/query metrics (innermost, so its timing excludes the
+    # logging layers); exposed on GET /metrics.
+    app.add_middleware(MetricsMiddleware)
+
     # ADR-027: Structured logging middleware.
     # Starlette wraps LIFO: the last add_middleware call is the outermost layer.
     # We want:  LoggingMiddleware (outer, runs first — clears ctx, binds
@@ -106,6 +130,9 @@ def create_app() -> FastAPI:
     app.include_router(vineyard_router, prefix=API_V1_PREFIX)       # /api/v1/vineyards
     app.include_router(harvest_lot_router, prefix=API_V1_PREFIX)    # /api/v1/harvest-lots
 
+    # ADR-027: In-process metrics (Prometheus text / ?format=json)
+    app.include_router(metrics_router)
+
     # Health check
     @app.get("/health", tags=["health"])
     async def health_check():
@@ -317,6 +317,42 @@ class HarvestLotRepository(BaseRepository, IHarvestLotRepository):
 
         return await self.execute_with_error_mapping(_get_operation)
 
+    async def get_by_vineyard(self, vineyard_id: int, winery_id: int) -> List[HarvestLot]:
+        """
+        Retrieves all harvest lots from every block of a vineyard in one query.
+
+        Args:
+            vineyard_id: ID of the vineyard
+            winery_id: Winery ID for access control
+
+        Returns:
+            List[HarvestLot]: Harvest lots from the vineyard's blocks
+        """
+        async def _get_operation():
+            with LogTimer(logger, "get_harvest_lots_by_vineyard"):
+                session_cm = await self.get_session()
+                async with session_cm as session:
+                    # Multi-tenant security: vineyard must belong to winery
+                    query = (
+                        select(HarvestLot)
+                        .join(VineyardBlock, HarvestLot.block_id == VineyardBlock.id)
+                        .join(Vineyard, VineyardBlock.vineyard_id == Vineyard.id)
+                        .where(
+                            Vineyard.id == vineyard_id,
+                            Vineyard.winery_id == winery_id,
+                            Vineyard.is_deleted == False,
+                            HarvestLot.is_deleted == False
+                        )
+                        .order_by(HarvestLot.harvest_date.desc(), HarvestLot.id.asc())
+                    )
+
+                    result = await session.execute(query)
+                    harvest_lots = result.scalars().all()
+
+                    return list(harvest_lots)
+
+        return await self.execute_with_error_mapping(_get_operation)
+
     async def get_by_harvest_date_range(
         self,
         winery_id: int,
@@ -6,8 +6,9 @@ Implements ADR-027 Structured Logging:
 - Query performance metrics
 - Security audit trail for vineyard data access
 """
-from typing import List, Optional
-from sqlalchemy import select
+from typing import List, Optional, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.orm import with_expression
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
@@ -15,6 +16,8 @@ from sqlalchemy.exc import IntegrityError
 from src.shared.wine_fermentator_logging import get_logger, LogTimer
 
 from src.modules.fruit_origin.src.domain.entities.vineyard import Vineyard
+from src.modules.fruit_origin.src.domain.entities.vineyard_block import VineyardBlock
+from src.modules.fruit_origin.src.domain.entities.harvest_lot import HarvestLot
 from src.modules.fruit_origin.src.domain.repositories.vineyard_repository_interface import (
     IVineyardRepository,
 )
@@ -228,6 +231,82 @@ class VineyardRepository(BaseRepository, IVineyardRepository):
             )
             raise RepositoryError(f"Failed to batch load vineyards: {str(e)}") from e
 
+    async def list_paginated(
+        self,
+        winery_id: int,
+        page: int = 1,
+        page_size: Optional[int] = 50,
+        include_deleted: bool = False,
+        include_counts: bool = False,
+    ) -> Tuple[List[Vineyard], int]:
+        """Get one page of vineyards (soft-delete filter and counts in SQL)."""
+        async def _list_operation():
+            with LogTimer(logger, "list_vineyards_paginated"):
+                filters = [Vineyard.winery_id == winery_id]
+                if not include_deleted:
+                    filters.append(Vineyard.is_deleted == False)
+
+                session_cm = await self.get_session()
+                async with session_cm as session:
+                    query = (
+                        select(Vineyard)
+                        .where(*filters)
+                        .order_by(Vineyard.code.asc(), Vineyard.id.asc())
+                    )
+                    total = None
+                    if page_size is not None:
+                        count_query = select(func.count(Vineyard.id)).where(*filters)
+                        total = (await session.execute(count_query)).scalar_one()
+                        query = query.offset((page - 1) * page_size).limit(page_size)
+                    if include_counts:
+                        blocks_count = (
+                            select(func.count(VineyardBlock.id))
+                            .where(
+                                VineyardBlock.vineyard_id == Vineyard.id,
+                                VineyardBlock.is_deleted == False,
+                            )
+                            .correlate(Vineyard)
+                            .scalar_subquery()
+                        )
+                        lots_count = (
+                            select(func.count(HarvestLot.id))
+                            .join(VineyardBlock, HarvestLot.block_id == VineyardBlock.id)
+                            .where(
+                                VineyardBlock.vineyard_id == Vineyard.id,
+                                HarvestLot.is_deleted == False,
+                            )
+                            .correlate(Vineyard)
+                            .scalar_subquery()
+                        )
+                        # populate_existing: refresh the expressions on
+                        # vineyards already in the identity map
+                        query = query.options(
+                            with_expression(Vineyard.blocks_count, blocks_count),
+                            with_expression(Vineyard.harvest_lots_count, lots_count),
+                        ).execution_options(populate_existing=True)
+
+                    result = await session.execute(query)
+                    vineyards = list(result.scalars().all())
+                    if total is None:
+                        total = len(vineyards)
+
+                    logger.debug(
+                        "vineyards_page_loaded",
+                        winery_id=winery_id,
+                        page=page,
+                        page_size=page_size,
+                        count=len(vineyards),
+                        total=total,
+                    )
+                    return vineyards, total
+
+        try:
+            return await _list_operation()
+        except Exception as e:
+            raise RepositoryError(
+                f"Failed to list vineyards for winery {winery_id}: {str(e)}"
+            ) from e
+
     async def update(
         self, vineyard_id: int, winery_id: int, data: VineyardUpdate
     ) -> Optional[Vineyard]:
@@ -19,7 +19,7 @@ Related ADRs:
 - ADR-027: Structured Logging (observability)
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from src.modules.fruit_origin.src.domain.entities.vineyard import Vineyard
 from src.modules.fruit_origin.src.domain.entities.harvest_lot import HarvestLot
@@ -107,20 +107,46 @@ class IFruitOriginService(ABC):
     async def list_vineyards(
         self,
         winery_id: int,
-        include_deleted: bool = False
+        include_deleted: bool = False,
+        include_counts: bool = False
     ) -> List[Vineyard]:
         """
-        List all vineyards for a winery.
+        List all vineyards for a winery, unpaged (filtering done in SQL).
         
         Args:
             winery_id: Winery ID (multi-tenant filter)
             include_deleted: Include soft-deleted vineyards
+            include_counts: Populate blocks_count / harvest_lots_count
             
         Returns:
             List of vineyards (may be empty)
         """
         pass
     
+    @abstractmethod
+    async def list_vineyards_paginated(
+        self,
+        winery_id: int,
+        page: int = 1,
+        page_size: int = 50,
+        include_deleted: bool = False,
+        include_counts: bool = False
+    ) -> Tuple[List[Vineyard], int]:
+        """
+        List one page of vineyards for a winery (filtering done in SQL).
+        
+        Args:
+            winery_id: Winery ID (multi-tenant filter)
+            page: Page number (1-indexed)
+            page_size: Vineyards per page
+            include_deleted: Include soft-deleted vineyards
+            include_counts: Populate blocks_count / harvest_lots_count
+            
+        Returns:
+            Tuple of (vineyards on the page, total matching vineyards)
+        """
+        pass
+    
     @abstractmethod
     async def update_vineyard(
         self,
@@ -13,7 +13,7 @@ Related ADRs:
 - ADR-027: Structured Logging (observability)
 - ADR-030: ETL Cross-Module Architecture (batch loading, orchestration)
 """
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime, timezone, date
 from decimal import Decimal
 from sqlalchemy import select
@@ -170,21 +170,23 @@ class FruitOriginService(IFruitOriginService):
     async def list_vineyards(
         self,
         winery_id: int,
-        include_deleted: bool = False
+        include_deleted: bool = False,
+        include_counts: bool = False
     ) -> List[Vineyard]:
-        """List all vineyards for a winery."""
-        with LogTimer(logger, "list_vineyards_service"):
-            logger.info(
+        """List all vineyards for a winery (soft-delete filter in SQL)."""
+        with LogTimer(logger, "list_vineyards_service", level="debug"):
+            logger.debug(
                 "listing_vineyards",
                 winery_id=winery_id,
                 include_deleted=include_deleted
             )
             
-            vineyards = await self._vineyard_repo.get_by_winery(winery_id=winery_id)
-            
-            # Filter out deleted if requested
-            if not include_deleted:
-                vineyards = [v for v in vineyards if not v.is_deleted]
+            vineyards, _ = await self._vineyard_repo.list_paginated(
+                winery_id=winery_id,
+                page_size=None,
+                include_deleted=include_deleted,
+                include_counts=include_counts
+            )
             
             logger.info(
                 "vineyards_listed",
@@ -195,6 +197,35 @@ class FruitOriginService(IFruitOriginService):
             
             return vineyards
     
+    async def list_vineyards_paginated(
+        self,
+        winery_id: int,
+        page: int = 1,
+        page_size: int = 50,
+        include_deleted: bool = False,
+        include_counts: bool = False
+    ) -> Tuple[List[Vineyard], int]:
+        """List one page of vineyards (soft-delete filter and counts in SQL)."""
+        with LogTimer(logger, "list_vineyards_paginated_service", level="debug"):
+            vineyards, total = await self._vineyard_repo.list_paginated(
+                winery_id=winery_id,
+                page=page,
+                page_size=page_size,
+                include_deleted=include_deleted,
+                include_counts=include_counts
+            )
+            
+            logger.info(
+                "vineyards_listed",
+                winery_id=winery_id,
+                count=len(vineyards),
+                total=total,
+                page=page,
+                include_deleted=include_deleted
+            )
+            
+            return vineyards, total
+    
     async def update_vineyard(
         self,
         vineyard_id: int,
@@ -441,29 +472,17 @@ class FruitOriginService(IFruitOriginService):
         vineyard_id: Optional[int] = None
     ) -> List[HarvestLot]:
         """List harvest lots for a winery, optionally filtered by vineyard."""
-        with LogTimer(logger, "list_harvest_lots_service"):
-            logger.info(
+        with LogTimer(logger, "list_harvest_lots_service", level="debug"):
+            logger.debug(
                 "listing_harvest_lots",
                 winery_id=winery_id,
                 vineyard_id=vineyard_id
             )
             
             if vineyard_id:
-                # Get vineyard to get all its blocks
-                vineyard = await self._vineyard_repo.get_by_id(vineyard_id, winery_id)
-                if not vineyard:
-                    logger.warning(
-                        "vineyard_not_found_for_harvest_lots_list",
-                        vineyard_id=vineyard_id,
-                        winery_id=winery_id
-                    )
-                    return []
-                
-                # Get lots for all blocks in this vineyard
-                all_lots = []
-                for block in vineyard.blocks:
-                    lots = await self._harvest_lot_repo.get_by_block(block.id, winery_id)
-                    all_lots.extend(lots)
+                # Single join query across all blocks of the vineyard
+                # (missing/foreign/deleted vineyard → empty list)
+                all_lots = await self._harvest_lot_repo.get_by_vineyard(vineyard_id, winery_id)
                 
                 logger.info(
                     "harvest_lots_listed_by_vineyard",
@@ -266,6 +266,41 @@ async def test_list_vineyards_success(fruit_origin_client, override_db_session):
     assert "VYD-LIST-3" in codes
 
 
+@pytest.mark.asyncio
+async def test_list_vineyards_without_paging_params_returns_every_vineyard(
+    fruit_origin_client, override_db_session
+):
+    """Test: Without page/page_size the list is not truncated to a page."""
+    await create_test_winery(override_db_session, winery_id=1)
+    for i in range(3):
+        await create_test_vineyard(override_db_session, 1, f"VYD-ALL-{i}", f"Vineyard {i}")
+    
+    response = fruit_origin_client.get("/api/v1/vineyards/")
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert len(data["vineyards"]) == data["total"] == 3
+    assert data["page"] is None
+    assert data["page_size"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_vineyards_pages_when_asked(fruit_origin_client, override_db_session):
+    """Test: page_size alone opts into paging (page defaults to 1)."""
+    await create_test_winery(override_db_session, winery_id=1)
+    for i in range(3):
+        await create_test_vineyard(override_db_session, 1, f"VYD-PAGE-{i}", f"Vineyard {i}")
+    
+    response = fruit_origin_client.get("/api/v1/vineyards/", params={"page_size": 2})
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [v["code"] for v in data["vineyards"]] == ["VYD-PAGE-0", "VYD-PAGE-1"]
+    assert data["total"] == 3
+    assert data["page"] == 1
+    assert data["page_size"] == 2
+
+
 @pytest.mark.asyncio
 async def test_list_vineyards_excludes_deleted(fruit_origin_client, override_db_session):
     """Test: List excludes soft-deleted vineyards by default."""
@@ -543,6 +543,74 @@ class TestHarvestLotRepositoryCRUD:
         assert success is False
 
 
+    @pytest.mark.asyncio
+    async def test_get_by_vineyard_returns_lots_from_all_blocks_in_one_query(
+        self,
+        test_models,
+        harvest_lot_repository,
+        test_winery,
+        test_vineyard,
+        db_session,
+        query_recorder,
+    ):
+        """Test that get_by_vineyard() returns lots across blocks with a single query."""
+        # Arrange: 5 blocks with 2 lots each, plus a deleted lot
+        VineyardBlock = test_models['VineyardBlock']
+        HarvestLot = test_models['HarvestLot']
+        
+        blocks = [VineyardBlock(vineyard_id=test_vineyard.id, code=f"BLK-V{i}") for i in range(5)]
+        db_session.add_all(blocks)
+        await db_session.flush()
+        lots = [
+            HarvestLot(
+                winery_id=test_winery.id,
+                block_id=block.id,
+                code=f"HL-V{b}-{n}",
+                harvest_date=date(2024, 3, 10 + n),
+                weight_kg=1000.0,
+            )
+            for b, block in enumerate(blocks)
+            for n in range(2)
+        ]
+        deleted = HarvestLot(
+            winery_id=test_winery.id,
+            block_id=blocks[0].id,
+            code="HL-V-DELETED",
+            harvest_date=date(2024, 3, 1),
+            weight_kg=500.0,
+            is_deleted=True,
+        )
+        db_session.add_all(lots + [deleted])
+        await db_session.flush()
+        
+        # Act
+        with query_recorder.budget(max_queries=1):
+            results = await harvest_lot_repository.get_by_vineyard(
+                vineyard_id=test_vineyard.id,
+                winery_id=test_winery.id
+            )
+        
+        # Assert
+        assert len(results) == 10
+        assert "HL-V-DELETED" not in [lot.code for lot in results]
+        assert results[0].harvest_date >= results[-1].harvest_date
+
+    @pytest.mark.asyncio
+    async def test_get_by_vineyard_respects_winery_isolation(
+        self,
+        harvest_lot_repository,
+        test_harvest_lot,
+        test_vineyard,
+    ):
+        """Test that get_by_vineyard() returns nothing for another winery."""
+        results = await harvest_lot_repository.get_by_vineyard(
+            vineyard_id=test_vineyard.id,
+            winery_id=99999
+        )
+        
+        assert results == []
+
+
 class TestHarvestLotRepositoryMultiTenant:
     """Integration tests for multi-tenant isolation."""
 
@@ -348,3 +348,97 @@ class TestVineyardRepositoryCRUD:
             winery_id=test_winery.id
         )
         assert retrieved is None
+
+    @pytest.mark.asyncio
+    async def test_list_paginated_filters_deleted_and_pages_in_sql(
+        self,
+        test_models,
+        vineyard_repository,
+        test_winery,
+        db_session,
+    ):
+        """Test that list_paginated() applies soft-delete filter and pagination."""
+        # Arrange
+        Vineyard = test_models['Vineyard']
+        db_session.add_all(
+            [Vineyard(winery_id=test_winery.id, code=f"PG-{i:02d}", name=f"V{i}") for i in range(5)]
+            + [Vineyard(winery_id=test_winery.id, code="PG-DEL", name="Deleted", is_deleted=True)]
+        )
+        await db_session.flush()
+        
+        # Act
+        page_1, total = await vineyard_repository.list_paginated(
+            winery_id=test_winery.id, page=1, page_size=2
+        )
+        page_3, _ = await vineyard_repository.list_paginated(
+            winery_id=test_winery.id, page=3, page_size=2
+        )
+        _, total_with_deleted = await vineyard_repository.list_paginated(
+            winery_id=test_winery.id, include_deleted=True
+        )
+        
+        # Assert
+        assert total == 5
+        assert [v.code for v in page_1] == ["PG-00", "PG-01"]
+        assert [v.code for v in page_3] == ["PG-04"]
+        assert total_with_deleted == 6
+        assert page_1[0].blocks_count is None
+
+    @pytest.mark.asyncio
+    async def test_list_paginated_without_page_size_returns_all_in_one_query(
+        self,
+        test_models,
+        vineyard_repository,
+        test_winery,
+        db_session,
+        query_recorder,
+    ):
+        """Test that page_size=None lists every vineyard without a count query."""
+        # Arrange
+        Vineyard = test_models['Vineyard']
+        db_session.add_all(
+            [Vineyard(winery_id=test_winery.id, code=f"ALL-{i:02d}", name=f"V{i}") for i in range(60)]
+            + [Vineyard(winery_id=test_winery.id, code="ALL-DEL", name="Deleted", is_deleted=True)]
+        )
+        await db_session.flush()
+        
+        # Act
+        with query_recorder.budget(max_queries=1):
+            vineyards, total = await vineyard_repository.list_paginated(
+                winery_id=test_winery.id, page_size=None
+            )
+        
+        # Assert
+        assert total == len(vineyards) == 60
+        assert "ALL-DEL" not in {v.code for v in vineyards}
+
+    @pytest.mark.asyncio
+    async def test_list_paginated_counts_blocks_and_lots_in_two_queries(
+        self,
+        test_models,
+        vineyard_repository,
+        test_winery,
+        test_vineyard,
+        test_vineyard_block,
+        test_harvest_lot,
+        db_session,
+        query_recorder,
+    ):
+        """Test that include_counts computes block/lot counts without per-vineyard queries."""
+        # Arrange: second vineyard without blocks
+        Vineyard = test_models['Vineyard']
+        VineyardBlock = test_models['VineyardBlock']
+        db_session.add(Vineyard(winery_id=test_winery.id, code="ZZ-EMPTY", name="Empty"))
+        db_session.add(VineyardBlock(vineyard_id=test_vineyard.id, code="BLK-DEL", is_deleted=True))
+        await db_session.flush()
+        
+        # Act
+        with query_recorder.budget(max_queries=2):
+            vineyards, total = await vineyard_repository.list_paginated(
+                winery_id=test_winery.id, include_counts=True
+            )
+        
+        # Assert
+        counts = {v.code: (v.blocks_count, v.harvest_lots_count) for v in vineyards}
+        assert total == 2
+        assert counts == {test_vineyard.code: (1, 1), "ZZ-EMPTY": (0, 0)}
@@ -382,46 +382,29 @@ class TestHarvestLotOperations:
         mock_harvest_lot_repo: Mock
     ):
         """
-        GIVEN vineyard has harvest lots
+        GIVEN vineyard has harvest lots across several blocks
         WHEN list_harvest_lots is called with vineyard_id filter
         THEN it returns only lots for that vineyard
         
         LOGIC:
-        1. Get vineyard to get all blocks
-        2. Get lots for each block
-        3. Aggregate results
+        Single join query (no per-block queries, no vineyard preload)
         """
         # Arrange
         winery_id = 1
         vineyard_id = 1
-        
-        # Vineyard with 2 blocks
-        block1 = Mock(spec=VineyardBlock, id=1)
-        block2 = Mock(spec=VineyardBlock, id=2)
-        vineyard = Mock(spec=Vineyard, id=1, blocks=[block1, block2])
-        mock_vineyard_repo.get_by_id.return_value = vineyard
-        
-        # Block 1 has 2 lots, Block 2 has 1 lot
         lot1 = Mock(spec=HarvestLot, id=1, code="LOT-001", block_id=1)
         lot2 = Mock(spec=HarvestLot, id=2, code="LOT-002", block_id=1)
         lot3 = Mock(spec=HarvestLot, id=3, code="LOT-003", block_id=2)
-        
-        def get_by_block_side_effect(block_id, winery_id):
-            if block_id == 1:
-                return [lot1, lot2]
-            elif block_id == 2:
-                return [lot3]
-            return []
-        
-        mock_harvest_lot_repo.get_by_block.side_effect = get_by_block_side_effect
+        mock_harvest_lot_repo.get_by_vineyard.return_value = [lot1, lot2, lot3]
         
         # Act
         result = await service.list_harvest_lots(winery_id, vineyard_id=vineyard_id)
         
         # Assert
         assert len(result) == 3
-        mock_vineyard_repo.get_by_id.assert_called_once_with(vineyard_id, winery_id)
-        assert mock_harvest_lot_repo.get_by_block.call_count == 2
+        mock_harvest_lot_repo.get_by_vineyard.assert_called_once_with(vineyard_id, winery_id)
+        mock_harvest_lot_repo.get_by_block.assert_not_called()
+        mock_vineyard_repo.get_by_id.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_list_harvest_lots_vineyard_not_found(
@@ -438,7 +421,7 @@ class TestHarvestLotOperations:
         # Arrange
         winery_id = 1
         vineyard_id = 999
-        mock_vineyard_repo.get_by_id.return_value = None
+        mock_harvest_lot_repo.get_by_vineyard.return_value = []
         
         # Act
         result = await service.list_harvest_lots(winery_id, vineyard_id=vineyard_id)
@@ -268,14 +268,19 @@ class TestVineyardOperations:
         """
         # Arrange
         winery_id = 1
-        mock_vineyard_repo.get_by_winery.return_value = []
+        mock_vineyard_repo.list_paginated.return_value = ([], 0)
         
         # Act
         result = await service.list_vineyards(winery_id)
         
         # Assert
         assert result == []
-        mock_vineyard_repo.get_by_winery.assert_called_once_with(winery_id=winery_id)
+        mock_vineyard_repo.list_paginated.assert_called_once_with(
+            winery_id=winery_id,
+            page_size=None,
+            include_deleted=False,
+            include_counts=False
+        )
     
     @pytest.mark.asyncio
     async def test_list_vineyards_multiple(
@@ -292,7 +297,7 @@ class TestVineyardOperations:
         winery_id = 1
         vineyard1 = Mock(spec=Vineyard, id=1, code="VIN-001", is_deleted=False)
         vineyard2 = Mock(spec=Vineyard, id=2, code="VIN-002", is_deleted=False)
-        mock_vineyard_repo.get_by_winery.return_value = [vineyard1, vineyard2]
+        mock_vineyard_repo.list_paginated.return_value = ([vineyard1, vineyard2], 2)
         
         # Act
         result = await service.list_vineyards(winery_id)
@@ -311,13 +316,12 @@ class TestVineyardOperations:
         """
         GIVEN winery has deleted and active vineyards
         WHEN list_vineyards is called without include_deleted
-        THEN it returns only active vineyards
+        THEN the soft-delete filter is applied by the repository query
         """
         # Arrange
         winery_id = 1
         vineyard1 = Mock(spec=Vineyard, id=1, code="VIN-001", is_deleted=False)
-        vineyard2 = Mock(spec=Vineyard, id=2, code="VIN-002", is_deleted=True)
-        mock_vineyard_repo.get_by_winery.return_value = [vineyard1, vineyard2]
+        mock_vineyard_repo.list_paginated.return_value = ([vineyard1], 1)
         
         # Act
         result = await service.list_vineyards(winery_id, include_deleted=False)
@@ -325,6 +329,7 @@ class TestVineyardOperations:
         # Assert
         assert len(result) == 1
         assert result[0].code == "VIN-001"
+        assert mock_vineyard_repo.list_paginated.call_args.kwargs["include_deleted"] is False
     
     @pytest.mark.asyncio
     async def test_list_vineyards_includes_deleted_when_requested(
@@ -341,13 +346,14 @@ class TestVineyardOperations:
         winery_id = 1
         vineyard1 = Mock(spec=Vineyard, id=1, code="VIN-001", is_deleted=False)
         vineyard2 = Mock(spec=Vineyard, id=2, code="VIN-002", is_deleted=True)
-        mock_vineyard_repo.get_by_winery.return_value = [vineyard1, vineyard2]
+        mock_vineyard_repo.list_paginated.return_value = ([vineyard1, vineyard2], 2)
         
         # Act
         result = await service.list_vineyards(winery_id, include_deleted=True)
         
         # Assert
         assert len(result) == 2
+        assert mock_vineyard_repo.list_paginated.call_args.kwargs["include_deleted"] is True
     
     # ==================================================================================
     # UPDATE VINEYARD TESTS
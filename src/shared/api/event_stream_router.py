@@ -0,0 +1,108 @@
+"""
+Event stream endpoint shared by all services (Server-Sent Events).
+
+Pushes the events published to this process's event bus for the user's
+winery, so dashboards don't poll for alerts and samples:
+
+    GET /api/v1/events/stream            (Accept: text/event-stream)
+    GET /api/v1/events/stream?types=alert.created&types=sample.created
+
+Each service streams what it publishes itself, under its own path so the
+gateway can route it (the bus is per process):
+
+    GET /api/v1/events/stream            fermentation: alert.created, sample.created
+    GET /api/v1/analyses/events/stream   analysis engine: analysis.completed
+
+Protocol:
+- Frames are ``id``/``event``/``data`` (JSON); the browser EventSource
+  reconnects by itself and sends ``Last-Event-ID`` to get what it missed
+- A ``: keep-alive`` comment is sent every EVENT_STREAM_HEARTBEAT_SECONDS
+  (default 15) so proxies keep the connection open and dead clients are
+  noticed
+- ``stream.lagged`` means events were lost (slow client, restart, long
+  disconnect): the client should catch up via GET /api/v1/sync/changes
+- 429 when the per-winery or per-process stream limit is reached
+
+Usage:
+    from src.shared.api.event_stream_router import router as event_stream_router
+
+    app.include_router(event_stream_router, prefix=API_V1_PREFIX)  # fermentation
+    app.include_router(event_stream_router, prefix=f"{API_V1_PREFIX}/analyses")  # analysis engine
+"""
+
+import os
+from typing import AsyncIterator, List, Optional
+
+from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi.responses import StreamingResponse
+
+from src.shared.auth.domain.dtos import UserContext
+from src.shared.auth.infra.api.dependencies import get_current_user
+from src.shared.infra.events import (
+    LAGGED_EVENT_TYPE,
+    EventBus,
+    Subscription,
+    get_event_bus,
+)
+
+HEARTBEAT_SECONDS = float(os.getenv("EVENT_STREAM_HEARTBEAT_SECONDS", "15"))
+RECONNECT_DELAY_MS = 3000
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+
+def _parse_last_event_id(value: Optional[str]) -> Optional[int]:
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+async def _event_frames(
+    request: Request,
+    subscription: Subscription,
+    types: Optional[List[str]],
+    heartbeat_seconds: float,
+) -> AsyncIterator[str]:
+    """Yield SSE frames until the client disconnects."""
+    wanted = set(types) if types else None
+    try:
+        yield f"retry: {RECONNECT_DELAY_MS}\n\n"
+        while True:
+            event = await subscription.next_event(timeout=heartbeat_seconds)
+            if event is None:
+                if await request.is_disconnected():
+                    break
+                yield ": keep-alive\n\n"
+            elif wanted is None or event.type in wanted or event.type == LAGGED_EVENT_TYPE:
+                yield event.frame
+    finally:
+        subscription.close()
+
+
+@router.get(
+    "/stream",
+    summary="Stream events of the user's winery (SSE)",
+    response_class=StreamingResponse,
+    responses={429: {"description": "Too many open event streams"}},
+)
+async def stream_events(
+    request: Request,
+    types: Optional[List[str]] = Query(
+        None, description="Only these event types, e.g. alert.created"
+    ),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    current_user: UserContext = Depends(get_current_user),
+    event_bus: EventBus = Depends(get_event_bus),
+) -> StreamingResponse:
+    # Subscribe before streaming so limit errors become a 429, not a broken stream
+    subscription = event_bus.subscribe(
+        current_user.winery_id, last_event_id=_parse_last_event_id(last_event_id)
+    )
+    return StreamingResponse(
+        _event_frames(request, subscription, types, HEARTBEAT_SECONDS),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,38 @@
+"""
+Metrics endpoint shared by all services.
+
+Exposes the in-process metrics registry (ADR-027) at ``GET /metrics``:
+- Prometheus text exposition format (default, for scrapers)
+- JSON snapshot with p50/p95/p99 estimates (``?format=json``)
+
+Mounted at the application root (no API version prefix), next to /health.
+The nginx gateway only forwards /api/v1/* paths, so the endpoint is
+reachable from the internal network only.
+
+Usage:
+    from src.shared.api.metrics_router import router as metrics_router
+
+    app.include_router(metrics_router)
+"""
+
+from fastapi import APIRouter, Query
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from src.shared.wine_fermentator_logging.metrics import get_metrics_registry
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics(
+    format: str = Query("prometheus", pattern="^(prometheus|json)$"),
+):
+    """Return request, query, pool and operation metrics for this process."""
+    registry = get_metrics_registry()
+    if format == "json":
+        return JSONResponse(registry.snapshot())
+    return PlainTextResponse(
+        registry.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE
+    )
@@ -98,6 +98,36 @@ class InvalidSampleValue(FermentationError):
     error_code = "INVALID_SAMPLE_VALUE"
 
 
+class TelemetryBufferFull(FermentationError):
+    """Raised when the sensor ingestion buffer has no room (backpressure; retry later)"""
+    http_status = 503
+    error_code = "TELEMETRY_BUFFER_FULL"
+
+
+class InvalidSyncCursor(FermentationError):
+    """Raised when a change-feed cursor is malformed or issued for another winery"""
+    http_status = 400
+    error_code = "INVALID_SYNC_CURSOR"
+
+
+class InvalidPageCursor(FermentationError):
+    """Raised when a listing cursor is malformed or issued for another winery or filter"""
+    http_status = 400
+    error_code = "INVALID_PAGE_CURSOR"
+
+
+class ArchiveUnavailable(FermentationError):
+    """Raised when an archived fermentation's cold-storage files can't be read"""
+    http_status = 503
+    error_code = "ARCHIVE_UNAVAILABLE"
+
+
+class ExportUnavailable(FermentationError):
+    """Raised when the columnar history export can't run (pyarrow missing)"""
+    http_status = 503
+    error_code = "EXPORT_UNAVAILABLE"
+
+
 # ============================================
 # Fruit Origin-specific errors
 # ============================================
@@ -226,3 +256,9 @@ class CrossWineryAccessDenied(DomainError):
     """Raised when attempting to access resources from a different winery"""
     http_status = 403  # Forbidden
     error_code = "CROSS_WINERY_ACCESS_DENIED"
+
+
+class EventStreamLimitReached(DomainError):
+    """Raised when opening an event stream would exceed the per-winery or per-process limit"""
+    http_status = 429  # Too Many Requests
+    error_code = "EVENT_STREAM_LIMIT_REACHED"
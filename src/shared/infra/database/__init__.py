@@ -1,6 +1,25 @@
 """Database configuration and session management module."""
 
 from .config import DatabaseConfig
+from .engine_registry import (
+    POOL_API,
+    POOL_BACKGROUND,
+    POOL_ETL,
+    POOL_REPLICA,
+    EngineRegistry,
+    PoolSettings,
+    get_engine_registry,
+)
 from .session import DatabaseSession
 
-__all__ = ["DatabaseConfig", "DatabaseSession"]
+__all__ = [
+    "DatabaseConfig",
+    "DatabaseSession",
+    "EngineRegistry",
+    "PoolSettings",
+    "get_engine_registry",
+    "POOL_API",
+    "POOL_BACKGROUND",
+    "POOL_ETL",
+    "POOL_REPLICA",
+]
@@ -1,20 +1,38 @@
 import os
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.engine import URL
 
+from src.shared.infra.database.engine_registry import (
+    POOL_API,
+    POOL_REPLICA,
+    PoolSettings,
+    build_engine,
+    get_engine_registry,
+)
+
 
 class DatabaseConfig:
     """
     Database configuration management implementing IDatabaseConfig interface.
     
     Provides async engine creation and configuration for repository infrastructure.
+    Engines come from the process-wide EngineRegistry: every DatabaseConfig of
+    the same pool shares one engine (see engine_registry for pool names).
     """
-    def __init__(self):
+    def __init__(self, pool: str = POOL_API):
         self.url = self._build_database_url()
+        # Optional read replica for read-only sessions (falls back to primary)
+        replica_url = os.getenv("DATABASE_REPLICA_URL")
+        self.replica_url = self._normalize_url(replica_url) if replica_url else None
+        self.pool = pool
         self.echo = os.getenv("DB_ECHO", "False").lower() == "true"
-        self.pool_size = int(os.getenv("DB_POOL_SIZE", "10"))
-        self.max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+        settings = PoolSettings.from_env(pool)
+        self.pool_size = settings.pool_size
+        self.max_overflow = settings.max_overflow
         self._engine = None
+        self._replica_engine = None
 
     @property
     def async_engine(self) -> AsyncEngine:
@@ -28,9 +46,30 @@ class DatabaseConfig:
             DatabaseConfigError: If engine is not properly configured
         """
         if self._engine is None:
-            self._engine = self.create_engine()
+            self._engine = get_engine_registry().get_engine(self.pool, self.url)
         return self._engine
 
+    @property
+    def has_replica(self) -> bool:
+        """True when DATABASE_REPLICA_URL points read-only sessions elsewhere."""
+        return self.replica_url is not None
+
+    @property
+    def read_engine(self) -> AsyncEngine:
+        """
+        Get the engine for read-only sessions.
+
+        Returns:
+            AsyncEngine: The replica engine if configured, else the primary engine
+        """
+        if not self.has_replica:
+            return self.async_engine
+        if self._replica_engine is None:
+            self._replica_engine = get_engine_registry().get_engine(
+                POOL_REPLICA, self.replica_url
+            )
+        return self._replica_engine
+
     def _is_running_in_docker(self) -> bool:
         """Detect if we're running inside a Docker container."""
         try:
@@ -42,28 +81,32 @@ class DatabaseConfig:
         except:
             return False
 
+    def _normalize_url(self, env_url: str) -> str:
+        """Use the asyncpg driver and resolve the db host for local development."""
+        # Convert postgres:// to postgresql+asyncpg:// for async support
+        if env_url.startswith("postgres://"):
+            env_url = env_url.replace("postgres://", "postgresql+asyncpg://", 1)
+        elif env_url.startswith("postgresql://"):
+            env_url = env_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+        
+        # Smart host resolution for development
+        if not self._is_running_in_docker():
+            # Development mode: use localhost for host connections
+            if "@db:" in env_url:
+                env_url = env_url.replace("@db:", "@localhost:")
+                print(f"🔧 Development mode: Using localhost instead of db service")
+            elif "localhost" in env_url:
+                # For Windows Docker Desktop, try 127.0.0.1 for better compatibility
+                env_url = env_url.replace("localhost", "127.0.0.1")
+        
+        return env_url
+
     def _build_database_url(self) -> str:
         # Try environment variable first
         env_url = os.getenv("DATABASE_URL")
         if env_url:
-            # Convert postgres:// to postgresql+asyncpg:// for async support
-            if env_url.startswith("postgres://"):
-                env_url = env_url.replace("postgres://", "postgresql+asyncpg://", 1)
-            elif env_url.startswith("postgresql://"):
-                env_url = env_url.replace("postgresql://", "postgresql+asyncpg://", 1)
-            
-            # Smart host resolution for development
-            if not self._is_running_in_docker():
-                # Development mode: use localhost for host connections
-                if "@db:" in env_url:
-                    env_url = env_url.replace("@db:", "@localhost:")
-                    print(f"🔧 Development mode: Using localhost instead of db service")
-                elif "localhost" in env_url:
-                    # For Windows Docker Desktop, try 127.0.0.1 for better compatibility
-                    env_url = env_url.replace("localhost", "127.0.0.1")
-            
-            return env_url
-        
+            return self._normalize_url(env_url)
+
         # Fallback to individual components
         host = os.getenv("DB_HOST", "localhost")
         
@@ -83,21 +126,13 @@ class DatabaseConfig:
             database=os.getenv("DB_NAME", "wine_fermentation"),
         ).render_as_string(hide_password=False)
     
-    def create_engine(self) -> AsyncEngine:
-        # Build engine kwargs based on database type
-        engine_kwargs = {"echo": self.echo}
-        
-        # SQLite doesn't support pool_size/max_overflow parameters
-        if not self.url.startswith("sqlite"):
-            engine_kwargs["pool_size"] = self.pool_size
-            engine_kwargs["max_overflow"] = self.max_overflow
-            # PostgreSQL-specific connection parameters
-            engine_kwargs["connect_args"] = {
-                "server_settings": {
-                    "application_name": "wine_fermentation",
-                },
-                "timeout": 30,
-                "command_timeout": 30,
-            }
-        
-        return create_async_engine(self.url, **engine_kwargs)
\ No newline at end of file
+    def create_engine(self, url: Optional[str] = None) -> AsyncEngine:
+        """
+        Create a private engine with this config's pool settings.
+
+        Not shared and not drained by the registry: the caller disposes it.
+        Prefer ``async_engine`` unless a separate pool is really needed.
+        """
+        return build_engine(
+            url or self.url, PoolSettings.from_env(self.pool), echo=self.echo
+        )
@@ -0,0 +1,285 @@
+"""
+Process-wide engine registry with named connection pools.
+
+Every service, scheduler and script gets its engine here instead of calling
+``create_async_engine`` itself, so a process holds one pool per workload:
+
+    api         request sessions (get_db_session, get_read_only_db_session)
+    replica     read-only sessions when DATABASE_REPLICA_URL is set
+    background  schedulers and buffers (alert scan, telemetry flush)
+    etl         scripts, imports, seeding
+
+Separate pools mean background jobs cannot exhaust the API's connections:
+each has its own size limit and checkout timeout.
+
+All engines share the same connection hygiene: pre-ping, recycle, asyncpg
+prepared-statement caching, /metrics instrumentation (ADR-027) and a
+graceful drain on shutdown (wait for checked-out connections, then dispose).
+
+Environment Variables (``<POOL>`` is API, REPLICA, BACKGROUND or ETL):
+    DB_POOL_<POOL>_SIZE: Persistent connections (api default: DB_POOL_SIZE or 10)
+    DB_POOL_<POOL>_MAX_OVERFLOW: Extra connections under load (api default: DB_MAX_OVERFLOW or 20)
+    DB_POOL_<POOL>_TIMEOUT: Seconds to wait for a free connection (default: 30)
+    DB_POOL_RECYCLE_SECONDS: Reconnect connections older than this (default: 1800)
+    DB_STATEMENT_CACHE_SIZE: asyncpg prepared statements per connection,
+        0 behind pgbouncer in transaction mode (default: 500)
+    DB_POOL_DRAIN_SECONDS: Max wait for checked-out connections on shutdown (default: 10)
+
+Usage:
+    from src.shared.infra.database.engine_registry import (
+        POOL_BACKGROUND,
+        get_engine_registry,
+    )
+
+    session_factory = get_engine_registry().session_factory(POOL_BACKGROUND)
+    async with session_factory() as session:
+        ...
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from src.shared.wine_fermentator_logging import get_logger
+from src.shared.wine_fermentator_logging.metrics import (
+    get_metrics_registry,
+    instrument_engine,
+)
+
+logger = get_logger(__name__)
+
+POOL_API = "api"
+POOL_REPLICA = "replica"
+POOL_BACKGROUND = "background"
+POOL_ETL = "etl"
+
+# (pool_size, max_overflow) per pool when not configured
+_DEFAULT_SIZES: Dict[str, Tuple[int, int]] = {
+    POOL_API: (10, 20),
+    POOL_REPLICA: (10, 20),
+    POOL_BACKGROUND: (2, 3),
+    POOL_ETL: (2, 2),
+}
+
+# Statement timeout (seconds) per pool; ETL statements are long bulk writes
+_COMMAND_TIMEOUTS: Dict[str, int] = {POOL_ETL: 300}
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Connection pool settings of one named pool."""
+
+    pool_size: int
+    max_overflow: int
+    pool_timeout: int = 30
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    statement_cache_size: int = 500
+    command_timeout: int = 30
+
+    @classmethod
+    def from_env(cls, name: str) -> "PoolSettings":
+        """Build the settings of pool ``name`` from the environment."""
+        size, overflow = _DEFAULT_SIZES.get(name, _DEFAULT_SIZES[POOL_BACKGROUND])
+        if name == POOL_API:
+            # Pre-registry knobs keep working for the API pool
+            size = _env_int("DB_POOL_SIZE", size)
+            overflow = _env_int("DB_MAX_OVERFLOW", overflow)
+        prefix = f"DB_POOL_{name.upper()}"
+        return cls(
+            pool_size=_env_int(f"{prefix}_SIZE", size),
+            max_overflow=_env_int(f"{prefix}_MAX_OVERFLOW", overflow),
+            pool_timeout=_env_int(f"{prefix}_TIMEOUT", 30),
+            pool_recycle=_env_int("DB_POOL_RECYCLE_SECONDS", 1800),
+            statement_cache_size=_env_int("DB_STATEMENT_CACHE_SIZE", 500),
+            command_timeout=_COMMAND_TIMEOUTS.get(name, 30),
+        )
+
+
+def build_engine(url: str, settings: PoolSettings, echo: bool = False) -> AsyncEngine:
+    """
+    Create an engine with the given pool settings.
+
+    SQLite (tests, local scripts) gets SQLAlchemy's default pool: it has no
+    server-side connection limit and doesn't accept the pool arguments.
+    """
+    if url.startswith("sqlite"):
+        return create_async_engine(url, echo=echo)
+    return create_async_engine(
+        url,
+        echo=echo,
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow,
+        pool_timeout=settings.pool_timeout,
+        pool_recycle=settings.pool_recycle,
+        pool_pre_ping=settings.pool_pre_ping,
+        connect_args={
+            "server_settings": {
+                "application_name": "wine_fermentation",
+            },
+            "timeout": 30,
+            "command_timeout": settings.command_timeout,
+            # SQLAlchemy's per-connection cache of asyncpg prepared statements
+            "prepared_statement_cache_size": settings.statement_cache_size,
+        },
+    )
+
+
+class EngineRegistry:
+    """Creates, shares and drains the named engines of this process."""
+
+    def __init__(self, drain_timeout_seconds: Optional[float] = None) -> None:
+        self._engines: Dict[Tuple[str, str], AsyncEngine] = {}
+        self._session_factories: Dict[Tuple[str, str], async_sessionmaker] = {}
+        self._default_url: Optional[str] = None
+        self.drain_timeout_seconds = (
+            drain_timeout_seconds
+            if drain_timeout_seconds is not None
+            else float(os.getenv("DB_POOL_DRAIN_SECONDS", "10"))
+        )
+        registry = get_metrics_registry()
+        self._connects_total = registry.counter(
+            "db_pool_connects_total", "New DB connections opened by a pool"
+        )
+        self._invalidated_total = registry.counter(
+            "db_pool_invalidated_total", "DB connections discarded as broken"
+        )
+
+    def get_engine(self, name: str, url: Optional[str] = None) -> AsyncEngine:
+        """
+        Return the engine of pool ``name``, creating it on first use.
+
+        Args:
+            name: Pool name (POOL_API, POOL_BACKGROUND, POOL_ETL, ...)
+            url: Database URL (default: DatabaseConfig's primary URL)
+
+        Returns:
+            AsyncEngine: Engine shared by every caller of the same pool and URL
+        """
+        key = (name, self._resolve_url(url))
+        engine = self._engines.get(key)
+        if engine is None:
+            echo = os.getenv("DB_ECHO", "False").lower() == "true"
+            settings = PoolSettings.from_env(name)
+            engine = build_engine(key[1], settings, echo=echo)
+            instrument_engine(engine, name=name)
+            self._instrument_pool(engine, name)
+            self._engines[key] = engine
+            logger.info(
+                "db_pool_created",
+                pool=name,
+                pool_size=settings.pool_size,
+                max_overflow=settings.max_overflow,
+            )
+        return engine
+
+    def session_factory(
+        self, name: str, url: Optional[str] = None
+    ) -> async_sessionmaker:
+        """Return a session factory bound to the engine of pool ``name``."""
+        key = (name, self._resolve_url(url))
+        engine = self.get_engine(*key)
+        factory = self._session_factories.get(key)
+        if factory is None:
+            factory = async_sessionmaker(
+                bind=engine, class_=AsyncSession, expire_on_commit=False
+            )
+            self._session_factories[key] = factory
+        return factory
+
+    def owns(self, engine: AsyncEngine) -> bool:
+        """True if ``engine`` is one of this registry's pools (dispose it here, not elsewhere)."""
+        return any(engine is owned for owned in self._engines.values())
+
+    def pool_status(self) -> Dict[str, Dict[str, int]]:
+        """Snapshot of connections per pool (for health checks and logs)."""
+        status: Dict[str, Dict[str, int]] = {}
+        for (name, _), engine in self._engines.items():
+            pool = engine.sync_engine.pool
+            if not hasattr(pool, "checkedout"):
+                continue
+            status[name] = {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "idle": pool.checkedin(),
+            }
+        return status
+
+    async def dispose(self, name: Optional[str] = None) -> None:
+        """
+        Drain and dispose one pool (or all of them).
+
+        Waits up to ``drain_timeout_seconds`` for checked-out connections to
+        come back so in-flight work can finish, then closes the pool. A
+        disposed pool is recreated on next use.
+        """
+        keys = [key for key in self._engines if name is None or key[0] == name]
+        await asyncio.gather(*(self._drain(key) for key in keys))
+
+    async def _drain(self, key: Tuple[str, str]) -> None:
+        engine = self._engines.pop(key)
+        self._session_factories.pop(key, None)
+        pool = engine.sync_engine.pool
+        deadline = time.monotonic() + self.drain_timeout_seconds
+        checked_out = getattr(pool, "checkedout", lambda: 0)
+        while checked_out() and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        if checked_out():
+            logger.warning(
+                "db_pool_drain_timeout", pool=key[0], checked_out=checked_out()
+            )
+        await engine.dispose()
+        logger.info("db_pool_disposed", pool=key[0])
+
+    def _resolve_url(self, url: Optional[str]) -> str:
+        if url is not None:
+            return url
+        if self._default_url is None:
+            # Read the environment once, not on every session_factory() call
+            from src.shared.infra.database.config import DatabaseConfig
+
+            self._default_url = DatabaseConfig().url
+        return self._default_url
+
+    def _instrument_pool(self, engine: AsyncEngine, name: str) -> None:
+        """
+        Count new and broken connections of one pool.
+
+        Occupancy (size/checked_out/overflow/idle) is already exported by
+        instrument_engine as db_pool_connections.
+        """
+        connects, invalidated = self._connects_total, self._invalidated_total
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _on_connect(dbapi_connection, connection_record):
+            connects.inc(engine=name)
+
+        @event.listens_for(engine.sync_engine, "invalidate")
+        def _on_invalidate(dbapi_connection, connection_record, exception):
+            invalidated.inc(engine=name)
+
+
+_registry: Optional[EngineRegistry] = None
+
+
+def get_engine_registry() -> EngineRegistry:
+    """Return the process-wide engine registry."""
+    global _registry
+    if _registry is None:
+        _registry = EngineRegistry()
+    return _registry
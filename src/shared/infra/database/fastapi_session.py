@@ -3,24 +3,53 @@ FastAPI Database Session Management
 
 Provides async session lifecycle management for FastAPI applications.
 Implements dependency injection pattern for database sessions.
+
+Two session dependencies:
+- get_db_session: read-write session on the primary, committed per request
+- get_read_only_db_session: session on the read replica (DATABASE_REPLICA_URL,
+  primary if unset) whose transactions are READ ONLY and never committed.
+  Repositories opt in per method via BaseRepository.get_read_session().
 """
 
 from typing import AsyncGenerator, Optional
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
 
 from src.shared.infra.database.config import DatabaseConfig
+from src.shared.infra.database.query_inspector import (
+    instrument_query_recording,
+    query_inspection_enabled,
+)
+from src.shared.infra.database.engine_registry import get_engine_registry
 
 
 # Global database configuration
 _db_config: Optional[DatabaseConfig] = None
 _async_session_maker: Optional[async_sessionmaker[AsyncSession]] = None
+_read_session_maker: Optional[async_sessionmaker[AsyncSession]] = None
+
+
+class ReadOnlySession(Session):
+    """Session whose transactions are opened READ ONLY on PostgreSQL."""
+
+
+@event.listens_for(ReadOnlySession, "after_begin")
+def _set_transaction_read_only(session, transaction, connection) -> None:
+    # Must be the first statement of the transaction. SQLite has no
+    # per-transaction equivalent; there the session just never commits.
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("SET TRANSACTION READ ONLY")
 
 
 def initialize_database(config: Optional[DatabaseConfig] = None) -> None:
     """
     Initialize database configuration and session maker.
     
-    Should be called once during application startup.
+    Should be called once during application startup. The engines are the
+    registry's "api" (and "replica") pools, instrumented for the /metrics
+    endpoint (query timing, pool utilization) and, when DB_QUERY_INSPECTION
+    is set, for N+1 query detection.
     
     Args:
         config: Optional DatabaseConfig instance. If None, creates default config.
@@ -33,18 +62,30 @@ def initialize_database(config: Optional[DatabaseConfig] = None) -> None:
         initialize_database()  # Uses default config from environment
         ```
     """
-    global _db_config, _async_session_maker
+    global _db_config, _async_session_maker, _read_session_maker
     
     if config is None:
         config = DatabaseConfig()
     
     _db_config = config
+    # Engines come from the registry, already instrumented for /metrics
+    if query_inspection_enabled():
+        instrument_query_recording(config.async_engine)
+        if config.has_replica:
+            instrument_query_recording(config.read_engine)
     _async_session_maker = async_sessionmaker(
         bind=config.async_engine,
         class_=AsyncSession,
         expire_on_commit=False,  # Keep objects accessible after commit
         autoflush=False,  # Explicit control over flushes
     )
+    _read_session_maker = async_sessionmaker(
+        bind=config.read_engine,
+        class_=AsyncSession,
+        sync_session_class=ReadOnlySession,
+        expire_on_commit=False,
+        autoflush=False,
+    )
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -90,11 +131,48 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_only_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency: Provides a read-only session for pure reads.
+    
+    Yields:
+        AsyncSession: Session on the read replica (or the primary when no
+            replica is configured) in a READ ONLY transaction
+    
+    Lifecycle:
+        1. Creates session from the read session maker
+        2. Yields session to endpoint
+        3. Rolls back (nothing to commit; ends the snapshot)
+        4. Closes session
+    
+    No connection is checked out until the first query, so injecting it
+    next to get_db_session costs nothing for requests that don't read
+    through it. Replicas lag the primary: don't use it to read rows the
+    same request has just written.
+    
+    Raises:
+        RuntimeError: If database not initialized (call initialize_database first)
+    """
+    if _read_session_maker is None:
+        raise RuntimeError(
+            "Database not initialized. Call initialize_database() during app startup."
+        )
+    
+    async with _read_session_maker() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+            await session.close()
+
+
 async def close_database() -> None:
     """
     Cleanup database resources.
     
-    Should be called during application shutdown.
+    Should be called during application shutdown, after background work
+    (schedulers, buffers) has stopped: drains every pool of the engine
+    registry, letting in-flight requests return their connections first.
     
     Example:
         ```python
@@ -104,7 +182,4 @@ async def close_database() -> None:
             await close_database()
         ```
     """
-    global _db_config
-    
-    if _db_config and _db_config._engine:
-        await _db_config._engine.dispose()
+    await get_engine_registry().dispose()
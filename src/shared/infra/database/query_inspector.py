@@ -0,0 +1,362 @@
+"""
+Query inspection: statement recording, N+1 detection and query budgets.
+
+Records every SQL statement executed by an instrumented engine and groups
+them by *shape* (the statement with literals, bound parameters and IN-lists
+normalized away). A shape that repeats many times within one request or
+test is the signature of an N+1 access pattern (one query per loop item).
+
+Two ways to use it:
+
+- Tests: the ``query_recorder`` integration fixture (see
+  ``src.shared.testing.integration.base_conftest``) records everything on
+  the test engine and lets tests assert query budgets::
+
+      async def test_lists_without_n_plus_one(query_recorder, repository):
+          with query_recorder.budget(max_queries=2, repeat_threshold=2):
+              await repository.get_by_winery(winery_id=1)
+
+- Staging: ``QueryInspectionMiddleware`` records per request and logs
+  ``n_plus_one_detected`` / ``query_budget_exceeded`` warnings. Opt-in via
+  ``DB_QUERY_INSPECTION=true`` (the API engine is only instrumented then).
+
+Environment Variables:
+    DB_QUERY_INSPECTION: Enable per-request inspection (default: false)
+    DB_QUERY_REPEAT_THRESHOLD: Repeats of one shape flagged as N+1 (default: 5)
+    DB_QUERY_BUDGET: Per-request statement budget (default: unset)
+
+Related ADR: ADR-027 (Structured Logging & Observability)
+"""
+
+import os
+import re
+import time
+import weakref
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from starlette.datastructures import MutableHeaders
+
+from src.shared.wine_fermentator_logging import get_logger
+
+logger = get_logger(__name__)
+
+
+DEFAULT_REPEAT_THRESHOLD = 5
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|(?<!:):\w+|\?")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """
+    Normalize a SQL statement so executions differing only in values match.
+
+    String/number literals and bound parameters (``?``, ``$1``, ``:name``,
+    ``%(name)s``) become ``?``; value lists such as ``IN (?, ?, ?)`` collapse
+    to ``(?)``; whitespace is collapsed.
+
+    Args:
+        statement: SQL text as sent to the DBAPI cursor
+
+    Returns:
+        Normalized statement shape
+    """
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _VALUE_LIST.sub("(?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when recorded statements exceed a query budget (test failure)."""
+
+
+@dataclass(frozen=True)
+class RecordedQuery:
+    """One executed statement."""
+
+    statement: str
+    shape: str
+    duration_seconds: float
+
+
+class QueryRecorder:
+    """
+    Collects executed statements and reports repeated statement shapes.
+
+    Attributes:
+        queries: Recorded statements in execution order
+    """
+
+    def __init__(self):
+        self.queries: List[RecordedQuery] = []
+
+    @property
+    def count(self) -> int:
+        """Number of statements recorded."""
+        return len(self.queries)
+
+    def record(self, statement: str, duration_seconds: float) -> None:
+        self.queries.append(
+            RecordedQuery(statement, statement_shape(statement), duration_seconds)
+        )
+
+    def reset(self) -> None:
+        """Forget recorded statements (e.g. after test data setup)."""
+        self.queries.clear()
+
+    def shape_counts(self, start: int = 0) -> Counter:
+        """Executions per statement shape (from index ``start`` on)."""
+        return Counter(q.shape for q in self.queries[start:])
+
+    def repeated_shapes(
+        self, threshold: int = DEFAULT_REPEAT_THRESHOLD, start: int = 0
+    ) -> Dict[str, int]:
+        """
+        Statement shapes executed at least ``threshold`` times.
+
+        Args:
+            threshold: Minimum executions of one shape to report
+            start: Only consider statements recorded from this index on
+
+        Returns:
+            Mapping of shape → execution count, most frequent first
+        """
+        return {
+            shape: count
+            for shape, count in self.shape_counts(start).most_common()
+            if count >= threshold
+        }
+
+    def assert_max_queries(self, max_queries: int, start: int = 0) -> None:
+        """
+        Fail if more than ``max_queries`` statements were recorded.
+
+        Raises:
+            QueryBudgetExceeded: If the budget is exceeded
+        """
+        executed = self.count - start
+        if executed > max_queries:
+            raise QueryBudgetExceeded(
+                f"Expected at most {max_queries} queries, executed {executed}:\n"
+                + self._describe(self.shape_counts(start))
+            )
+
+    def assert_no_repeated_queries(
+        self, threshold: int = DEFAULT_REPEAT_THRESHOLD, start: int = 0
+    ) -> None:
+        """
+        Fail if any statement shape ran ``threshold`` times or more (N+1).
+
+        Raises:
+            QueryBudgetExceeded: If a repeated shape is found
+        """
+        repeated = self.repeated_shapes(threshold, start)
+        if repeated:
+            raise QueryBudgetExceeded(
+                f"Statement shapes repeated {threshold}+ times (N+1 pattern):\n"
+                + self._describe(repeated)
+            )
+
+    @contextmanager
+    def budget(
+        self,
+        max_queries: Optional[int] = None,
+        repeat_threshold: Optional[int] = None,
+    ) -> Iterator["QueryRecorder"]:
+        """
+        Assert a query budget for the statements executed inside the block.
+
+        Args:
+            max_queries: Maximum statements allowed in the block
+            repeat_threshold: Fail if any shape repeats this many times
+
+        Raises:
+            QueryBudgetExceeded: On exit, if the budget is exceeded
+        """
+        start = self.count
+        yield self
+        if max_queries is not None:
+            self.assert_max_queries(max_queries, start)
+        if repeat_threshold is not None:
+            self.assert_no_repeated_queries(repeat_threshold, start)
+
+    @staticmethod
+    def _describe(counts) -> str:
+        items = counts.most_common() if isinstance(counts, Counter) else counts.items()
+        return "\n".join(f"  {count}x {shape[:300]}" for shape, count in items)
+
+
+# =============================================================================
+# Engine instrumentation
+# =============================================================================
+
+# Recorders scoped to the current request/task (context-local)
+_context_recorders: ContextVar[Tuple[QueryRecorder, ...]] = ContextVar(
+    "query_recorders", default=()
+)
+# Recorders capturing everything on one engine (tests)
+_engine_recorders: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_instrumented_engines: "weakref.WeakSet" = weakref.WeakSet()
+
+
+def instrument_query_recording(engine) -> None:
+    """
+    Attach statement recording to a SQLAlchemy (async) engine.
+
+    Idempotent. Adds negligible overhead while no recorder is active.
+
+    Args:
+        engine: AsyncEngine or Engine
+    """
+    from sqlalchemy import event
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if sync_engine in _instrumented_engines:
+        return
+    _instrumented_engines.add(sync_engine)
+    engine_ref = weakref.ref(sync_engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("_recorder_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("_recorder_start")
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        recorders = _context_recorders.get() + tuple(
+            _engine_recorders.get(engine_ref(), ())
+        )
+        for recorder in recorders:
+            recorder.record(statement, elapsed)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _on_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None:
+            starts = conn.info.get("_recorder_start")
+            if starts:
+                starts.pop()
+
+
+@contextmanager
+def record_queries(engine=None) -> Iterator[QueryRecorder]:
+    """
+    Record SQL statements executed inside the block.
+
+    Without ``engine``, records statements run in the current context
+    (request/task, across awaits) on any instrumented engine. With
+    ``engine``, instruments it and records every statement it executes,
+    regardless of context (used by test fixtures).
+
+    Args:
+        engine: Optional engine to record unconditionally
+
+    Yields:
+        QueryRecorder filled live as statements run
+    """
+    recorder = QueryRecorder()
+    if engine is None:
+        token = _context_recorders.set(_context_recorders.get() + (recorder,))
+        try:
+            yield recorder
+        finally:
+            _context_recorders.reset(token)
+        return
+
+    instrument_query_recording(engine)
+    sync_engine = getattr(engine, "sync_engine", engine)
+    _engine_recorders.setdefault(sync_engine, []).append(recorder)
+    try:
+        yield recorder
+    finally:
+        _engine_recorders[sync_engine].remove(recorder)
+
+
+def query_inspection_enabled() -> bool:
+    """True if per-request query inspection is enabled (DB_QUERY_INSPECTION)."""
+    return os.getenv("DB_QUERY_INSPECTION", "false").lower() in ("1", "true", "yes")
+
+
+# =============================================================================
+# ASGI middleware (staging)
+# =============================================================================
+
+class QueryInspectionMiddleware:
+    """
+    Pure ASGI middleware flagging N+1 patterns and query budget overruns.
+
+    Logs a ``n_plus_one_detected`` warning when a statement shape repeats
+    ``repeat_threshold`` times in one request, and ``query_budget_exceeded``
+    when a request runs more than ``max_queries`` statements. Adds an
+    ``X-Query-Count`` response header (statements executed before the
+    response started). Meant for staging; enable with DB_QUERY_INSPECTION.
+    """
+
+    def __init__(
+        self,
+        app,
+        repeat_threshold: Optional[int] = None,
+        max_queries: Optional[int] = None,
+        exclude_paths: Optional[List[str]] = None,
+    ):
+        self.app = app
+        self.repeat_threshold = repeat_threshold or int(
+            os.getenv("DB_QUERY_REPEAT_THRESHOLD", str(DEFAULT_REPEAT_THRESHOLD))
+        )
+        budget = os.getenv("DB_QUERY_BUDGET")
+        self.max_queries = max_queries if max_queries is not None else (
+            int(budget) if budget else None
+        )
+        self.exclude_paths = frozenset(
+            exclude_paths or ["/metrics", "/health", "/healthz", "/docs", "/redoc", "/openapi.json"]
+        )
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        with record_queries() as recorder:
+
+            async def send_with_count(message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append("X-Query-Count", str(recorder.count))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_count)
+            finally:
+                self._report(scope, recorder)
+
+    def _report(self, scope, recorder: QueryRecorder) -> None:
+        route = getattr(scope.get("route"), "path", None) or scope["path"]
+        repeated = recorder.repeated_shapes(self.repeat_threshold)
+        if repeated:
+            logger.warning(
+                "n_plus_one_detected",
+                method=scope["method"],
+                route=route,
+                statement_count=recorder.count,
+                repeated_shapes={shape[:300]: n for shape, n in repeated.items()},
+            )
+        if self.max_queries is not None and recorder.count > self.max_queries:
+            logger.warning(
+                "query_budget_exceeded",
+                method=scope["method"],
+                route=route,
+                statement_count=recorder.count,
+                max_queries=self.max_queries,
+            )
@@ -7,6 +7,7 @@ Integrates with IDatabaseConfig interface to provide session factory and context
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from ..interfaces import IDatabaseConfig
+from .engine_registry import get_engine_registry
 
 
 class DatabaseSession:
@@ -56,8 +57,10 @@ class DatabaseSession:
         """
         Close the session manager and cleanup resources.
         
-        This properly disposes of the underlying engine and
-        cleans up any pending connections.
+        Disposes the underlying engine only if this config created it.
+        Engines of the shared registry (every DatabaseConfig) serve other
+        sessions too; they are drained by close_database() on shutdown.
         """
-        if hasattr(self._config, 'async_engine') and self._config.async_engine:
-            await self._config.async_engine.dispose()
\ No newline at end of file
+        engine = getattr(self._config, 'async_engine', None)
+        if engine and not get_engine_registry().owns(engine):
+            await engine.dispose()
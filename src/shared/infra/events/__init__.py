@@ -0,0 +1,17 @@
+"""In-process event bus feeding the server-sent event streams."""
+
+from .event_bus import (
+    LAGGED_EVENT_TYPE,
+    Event,
+    EventBus,
+    Subscription,
+    get_event_bus,
+)
+
+__all__ = [
+    "LAGGED_EVENT_TYPE",
+    "Event",
+    "EventBus",
+    "Subscription",
+    "get_event_bus",
+]
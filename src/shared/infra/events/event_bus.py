@@ -0,0 +1,311 @@
+"""
+In-process event bus for server push (SSE).
+
+Publishers (alert scheduler, sample service, analysis orchestrator) call
+``get_event_bus().publish(winery_id, type, data)``; every open event stream
+of that winery receives the event. Nothing leaves the process: each
+service streams the events it produces itself.
+
+Fan-out cost:
+- Subscribers are indexed by winery, so a publish touches only the
+  connections of one tenant
+- The SSE frame is encoded once per event and shared by all subscribers
+- Delivery is a deque append plus an asyncio.Event set per subscriber:
+  no task, no await, so publishers never block on slow clients
+
+Slow consumers: each subscription holds at most ``queue_size`` events;
+on overflow the oldest are dropped and the stream receives a
+``stream.lagged`` event telling the client to catch up via the change
+feed (GET /sync/changes).
+
+Winery keys: wineries are integer ids, but the analysis engine carries
+them as ``UUID(int=id)``. Both forms map to the same key, so events
+published by any service reach streams opened with the integer id.
+
+Reconnects: the last ``replay_size`` events per winery are kept, so a
+client reconnecting with ``Last-Event-ID`` gets what it missed (or a
+``stream.lagged`` event if that is no longer possible).
+
+Environment Variables:
+    EVENT_STREAM_MAX_CONNECTIONS: Open streams per process (default: 5000)
+    EVENT_STREAM_MAX_PER_WINERY: Open streams per winery (default: 200)
+    EVENT_STREAM_QUEUE_SIZE: Buffered events per stream (default: 100)
+    EVENT_STREAM_REPLAY_SIZE: Events kept per winery for reconnects (default: 256)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import os
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, Optional, Set
+from uuid import UUID
+
+from src.shared.domain.errors import EventStreamLimitReached
+from src.shared.wine_fermentator_logging import get_logger
+from src.shared.wine_fermentator_logging.metrics import get_metrics_registry
+
+logger = get_logger(__name__)
+
+LAGGED_EVENT_TYPE = "stream.lagged"
+
+# UUID(int=id) of an integer winery id; real UUIDs set bits above this
+_INTEGER_ID_LIMIT = 2 ** 63
+
+
+def _winery_key(winery_id: Any) -> str:
+    """Bus key of a winery: an integer id and its UUID(int=id) form share one key."""
+    if isinstance(winery_id, UUID) and winery_id.int < _INTEGER_ID_LIMIT:
+        return str(winery_id.int)
+    return str(winery_id)
+
+
+@dataclass(frozen=True)
+class Event:
+    """
+    One published event with its pre-encoded SSE frame.
+
+    ``id`` is None for stream control events (``stream.lagged``): their
+    frame has no ``id:`` line, so the client's Last-Event-ID keeps pointing
+    at the last event it actually received.
+    """
+
+    id: Optional[int]
+    type: str
+    winery_id: str
+    data: Dict[str, Any]
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    frame: str = ""
+
+    @classmethod
+    def create(
+        cls,
+        event_id: Optional[int],
+        event_type: str,
+        winery_id: str,
+        data: Dict[str, Any],
+    ) -> "Event":
+        payload = json.dumps(data, default=str, separators=(",", ":"))
+        frame = f"event: {event_type}\ndata: {payload}\n\n"
+        if event_id is not None:
+            frame = f"id: {event_id}\n{frame}"
+        return cls(event_id, event_type, winery_id, data, frame=frame)
+
+
+class Subscription:
+    """
+    One open stream: a bounded queue filled by the bus.
+
+    Use as an async context manager (or call ``close()``) so the slot is
+    released when the client goes away.
+    """
+
+    def __init__(self, bus: "EventBus", winery_id: str, queue_size: int) -> None:
+        self.winery_id = winery_id
+        self.dropped = 0
+        self._bus = bus
+        self._queue: Deque[Event] = deque(maxlen=queue_size)
+        self._ready = asyncio.Event()
+        self._lagged = False
+        self._closed = False
+
+    def _deliver(self, event: Event) -> None:
+        if len(self._queue) == self._queue.maxlen:
+            self.dropped += 1
+            self._lagged = True
+        self._queue.append(event)
+        self._ready.set()
+
+    def _mark_lagged(self) -> None:
+        self._lagged = True
+        self._ready.set()
+
+    async def next_event(self, timeout: float) -> Optional[Event]:
+        """
+        Wait for the next event.
+
+        Returns:
+            Optional[Event]: The next event, a ``stream.lagged`` event if
+                events were lost, or None if nothing arrived within timeout
+        """
+        if self._lagged:
+            self._lagged = False
+            return Event.create(
+                None, LAGGED_EVENT_TYPE, self.winery_id, {"dropped": self.dropped}
+            )
+        if not self._queue:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return None
+            return await self.next_event(timeout)
+        return self._queue.popleft()
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._bus._unsubscribe(self)
+
+    async def __aenter__(self) -> "Subscription":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class EventBus:
+    """Per-process pub/sub keyed by winery."""
+
+    def __init__(
+        self,
+        max_connections: int = 5000,
+        max_per_winery: int = 200,
+        queue_size: int = 100,
+        replay_size: int = 256,
+    ) -> None:
+        self.max_connections = max_connections
+        self.max_per_winery = max_per_winery
+        self.queue_size = queue_size
+        self.replay_size = replay_size
+
+        self._ids = itertools.count(1)
+        self._last_id = 0
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self._recent: Dict[str, Deque[Event]] = {}
+        self._evicted: Dict[str, int] = {}
+        self._connections = 0
+
+        registry = get_metrics_registry()
+        self._published_total = registry.counter(
+            "events_published_total", "Events published to the in-process bus"
+        )
+        self._dropped_total = registry.counter(
+            "events_dropped_total", "Events dropped for slow stream consumers"
+        )
+        self._rejected_total = registry.counter(
+            "event_streams_rejected_total", "Streams refused by connection limits"
+        )
+        registry.gauge(
+            "event_stream_connections", "Open event streams"
+        ).add_collector(lambda: {(): float(self._connections)})
+
+    @classmethod
+    def from_env(cls) -> "EventBus":
+        """Build a bus configured from EVENT_STREAM_* environment variables."""
+        return cls(
+            max_connections=int(os.getenv("EVENT_STREAM_MAX_CONNECTIONS", "5000")),
+            max_per_winery=int(os.getenv("EVENT_STREAM_MAX_PER_WINERY", "200")),
+            queue_size=int(os.getenv("EVENT_STREAM_QUEUE_SIZE", "100")),
+            replay_size=int(os.getenv("EVENT_STREAM_REPLAY_SIZE", "256")),
+        )
+
+    @property
+    def connections(self) -> int:
+        return self._connections
+
+    def publish(self, winery_id: Any, event_type: str, data: Dict[str, Any]) -> Event:
+        """
+        Deliver an event to every open stream of the winery (non-blocking).
+
+        Args:
+            winery_id: Tenant the event belongs to
+            event_type: SSE event name, e.g. ``alert.created``
+            data: JSON-serialisable payload
+
+        Returns:
+            Event: The published event
+        """
+        key = _winery_key(winery_id)
+        event = Event.create(next(self._ids), event_type, key, data)
+        self._last_id = event.id
+        recent = self._recent.setdefault(key, deque(maxlen=self.replay_size))
+        if len(recent) == self.replay_size:
+            self._evicted[key] = recent[0].id
+        recent.append(event)
+
+        subscribers = self._subscribers.get(key, ())
+        for subscription in subscribers:
+            before = subscription.dropped
+            subscription._deliver(event)
+            if subscription.dropped != before:
+                self._dropped_total.inc(event_type=event_type)
+        self._published_total.inc(event_type=event_type)
+        return event
+
+    def subscribe(
+        self, winery_id: Any, last_event_id: Optional[int] = None
+    ) -> Subscription:
+        """
+        Open a stream for a winery.
+
+        Args:
+            winery_id: Tenant to receive events for
+            last_event_id: Last event the client saw (SSE Last-Event-ID), if any
+
+        Returns:
+            Subscription: Open stream (close it when the client disconnects)
+
+        Raises:
+            EventStreamLimitReached: If the process or winery limit is reached
+        """
+        key = _winery_key(winery_id)
+        subscribers = self._subscribers.setdefault(key, set())
+        if self._connections >= self.max_connections:
+            self._rejected_total.inc(limit="process")
+            logger.warning(
+                "event_stream_rejected", limit="process", connections=self._connections
+            )
+            raise EventStreamLimitReached(
+                "Too many open event streams on this server, retry later",
+                limit=self.max_connections,
+            )
+        if len(subscribers) >= self.max_per_winery:
+            self._rejected_total.inc(limit="winery")
+            logger.warning("event_stream_rejected", limit="winery", winery_id=key)
+            raise EventStreamLimitReached(
+                "Too many open event streams for this winery",
+                limit=self.max_per_winery,
+            )
+
+        subscription = Subscription(self, key, self.queue_size)
+        subscribers.add(subscription)
+        self._connections += 1
+        if last_event_id is not None:
+            self._replay(subscription, last_event_id)
+        return subscription
+
+    def _replay(self, subscription: Subscription, last_event_id: int) -> None:
+        """Queue events after last_event_id, or flag the gap if they're gone."""
+        if last_event_id > self._last_id or last_event_id < self._evicted.get(
+            subscription.winery_id, 0
+        ):
+            # Id from before a restart, or older than the replay window
+            subscription._mark_lagged()
+            return
+        for event in self._recent.get(subscription.winery_id, ()):
+            if event.id > last_event_id:
+                subscription._deliver(event)
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._subscribers.get(subscription.winery_id)
+        if subscribers and subscription in subscribers:
+            subscribers.discard(subscription)
+            self._connections -= 1
+            if not subscribers:
+                del self._subscribers[subscription.winery_id]
+
+
+_bus: Optional[EventBus] = None
+
+
+def get_event_bus() -> EventBus:
+    """Return the process-wide event bus (created on first use)."""
+    global _bus
+    if _bus is None:
+        _bus = EventBus.from_env()
+    return _bus
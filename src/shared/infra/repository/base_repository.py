@@ -60,6 +60,23 @@ class BaseRepository:
         """
         return self.session_manager.get_session()
 
+    async def get_read_session(self):
+        """
+        Get a session for a pure read that may run on the read replica.
+
+        Methods opt in by calling this instead of get_session(). Session
+        managers without read routing fall back to get_session(). Only use
+        it for reads that tolerate replica lag (lists, dashboards), never
+        for read-before-write checks.
+
+        Returns:
+            AsyncContextManager[AsyncSession]: Database session context manager
+        """
+        get_read_session = getattr(self.session_manager, "get_read_session", None)
+        if get_read_session is None:
+            return self.session_manager.get_session()
+        return get_read_session()
+
     async def close(self) -> None:
         """
         Close the repository and cleanup resources.
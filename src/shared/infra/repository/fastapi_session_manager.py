@@ -5,6 +5,8 @@ Wraps FastAPI's AsyncSession to implement ISessionManager protocol
 for compatibility with BaseRepository.
 """
 
+from typing import Optional
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from contextlib import asynccontextmanager
 
@@ -31,16 +33,26 @@ class FastAPISessionManager(ISessionManager):
             session_manager = FastAPISessionManager(session)
             return FermentationRepository(session_manager)
         ```
+    
+    Read routing:
+        Pass the get_read_only_db_session() session as ``read_session`` and
+        repository methods that opt in via ``get_read_session()`` run on it
+        (read replica, READ ONLY transaction). Without it they use the
+        primary session like everything else.
     """
     
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self, session: AsyncSession, read_session: Optional[AsyncSession] = None
+    ):
         """
         Initialize with FastAPI-managed AsyncSession.
         
         Args:
             session: AsyncSession from get_db_session() dependency
+            read_session: Optional AsyncSession from get_read_only_db_session()
         """
         self._session = session
+        self._read_session = read_session
     
     @asynccontextmanager
     async def get_session(self):
@@ -54,6 +66,16 @@ class FastAPISessionManager(ISessionManager):
         """
         yield self._session
     
+    @asynccontextmanager
+    async def get_read_session(self):
+        """
+        Yield the read-only session, or the primary one if none was given.
+        
+        Yields:
+            AsyncSession: Session for pure reads
+        """
+        yield self._read_session if self._read_session is not None else self._session
+    
     async def close(self) -> None:
         """
         Close session (no-op for FastAPI).
@@ -26,9 +26,9 @@ class TestDatabaseConfigInterface:
     def test_database_config_implements_interface(self):
         """Test that DatabaseConfig properly implements IDatabaseConfig protocol."""
         # Arrange
-        with patch('src.shared.infra.database.config.create_async_engine') as mock_create_engine:
+        with patch('src.shared.infra.database.config.get_engine_registry') as mock_registry:
             mock_engine = Mock(spec=AsyncEngine)
-            mock_create_engine.return_value = mock_engine
+            mock_registry.return_value.get_engine.return_value = mock_engine
             
             # Act
             config = DatabaseConfig()
@@ -40,9 +40,9 @@ class TestDatabaseConfigInterface:
     def test_database_config_async_engine_property(self):
         """Test that async_engine property returns AsyncEngine."""
         # Arrange
-        with patch('src.shared.infra.database.config.create_async_engine') as mock_create_engine:
+        with patch('src.shared.infra.database.config.get_engine_registry') as mock_registry:
             mock_engine = Mock(spec=AsyncEngine)
-            mock_create_engine.return_value = mock_engine
+            mock_registry.return_value.get_engine.return_value = mock_engine
             
             config = DatabaseConfig()
             
@@ -0,0 +1,157 @@
+"""
+Unit tests for query inspection (statement shapes, N+1 detection, budgets).
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
+
+from src.shared.infra.database import query_inspector
+from src.shared.infra.database.query_inspector import (
+    QueryBudgetExceeded,
+    QueryInspectionMiddleware,
+    QueryRecorder,
+    instrument_query_recording,
+    record_queries,
+    statement_shape,
+)
+
+
+def _run_statements(engine, statements):
+    async def run():
+        async with engine.connect() as conn:
+            for statement, params in statements:
+                await conn.execute(text(statement), params)
+
+    asyncio.run(run())
+
+
+@pytest.fixture
+def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+class TestStatementShape:
+    """statement_shape normalizes values so repeated queries match."""
+
+    def test_literals_and_placeholders_normalized(self):
+        a = statement_shape("SELECT * FROM lots WHERE block_id = 1 AND code = 'A'")
+        b = statement_shape("SELECT *  FROM lots\n WHERE block_id = $1 AND code = :code")
+
+        assert a == b == "SELECT * FROM lots WHERE block_id = ? AND code = ?"
+
+    def test_in_lists_collapse(self):
+        assert statement_shape("SELECT 1 FROM t WHERE id IN (?, ?, ?)") == statement_shape(
+            "SELECT 1 FROM t WHERE id IN (?)"
+        )
+
+    def test_identifiers_and_casts_untouched(self):
+        shape = statement_shape("SELECT anon_1.id, t2.x::text FROM t2")
+
+        assert shape == "SELECT anon_1.id, t2.x::text FROM t2"
+
+
+class TestQueryRecorder:
+    """QueryRecorder reports repeated shapes and enforces budgets."""
+
+    def _recorder(self, *statements):
+        recorder = QueryRecorder()
+        for statement in statements:
+            recorder.record(statement, 0.001)
+        return recorder
+
+    def test_repeated_shapes(self):
+        recorder = self._recorder(
+            "SELECT * FROM vineyards WHERE id = 1",
+            *[f"SELECT * FROM lots WHERE block_id = {i}" for i in range(6)],
+        )
+
+        assert recorder.repeated_shapes(threshold=5) == {
+            "SELECT * FROM lots WHERE block_id = ?": 6
+        }
+        assert recorder.repeated_shapes(threshold=7) == {}
+
+    def test_assert_max_queries_lists_shapes(self):
+        recorder = self._recorder("SELECT 1", "SELECT 2", "SELECT 3")
+
+        with pytest.raises(QueryBudgetExceeded, match="at most 2 queries, executed 3"):
+            recorder.assert_max_queries(2)
+
+    def test_budget_only_counts_block(self):
+        recorder = self._recorder("INSERT INTO t VALUES (1)", "INSERT INTO t VALUES (2)")
+
+        with recorder.budget(max_queries=1, repeat_threshold=2):
+            recorder.record("SELECT * FROM t", 0.001)
+
+        with pytest.raises(QueryBudgetExceeded, match="N\\+1"):
+            with recorder.budget(repeat_threshold=2):
+                recorder.record("SELECT * FROM t WHERE id = 1", 0.001)
+                recorder.record("SELECT * FROM t WHERE id = 2", 0.001)
+
+
+class TestRecordQueries:
+    """record_queries captures statements per context or per engine."""
+
+    def test_engine_scoped_recording(self, engine):
+        with record_queries(engine) as recorder:
+            _run_statements(engine, [("SELECT :x", {"x": i}) for i in range(3)])
+
+        assert recorder.count == 3
+        assert recorder.repeated_shapes(threshold=3) == {"SELECT ?": 3}
+
+    def test_context_scoped_recording_ignores_other_contexts(self, engine):
+        instrument_query_recording(engine)
+
+        async def run():
+            async def other_task():
+                async with engine.connect() as conn:
+                    await conn.execute(text("SELECT 2"))
+
+            with record_queries() as recorder:
+                async with engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+            await asyncio.create_task(other_task())
+            return recorder
+
+        recorder = asyncio.run(run())
+
+        assert [q.statement for q in recorder.queries] == ["SELECT 1"]
+
+
+class TestQueryInspectionMiddleware:
+    """The staging middleware logs N+1 patterns and adds X-Query-Count."""
+
+    def test_flags_repeated_statements(self, engine, monkeypatch):
+        instrument_query_recording(engine)
+        warnings = []
+        monkeypatch.setattr(
+            query_inspector.logger, "warning", lambda event, **kw: warnings.append((event, kw))
+        )
+
+        app = FastAPI()
+        app.add_middleware(QueryInspectionMiddleware, repeat_threshold=3, max_queries=4)
+
+        @app.get("/blocks/{vineyard_id}/lots")
+        async def list_lots(vineyard_id: int):
+            async with engine.connect() as conn:
+                for block_id in range(5):
+                    await conn.execute(text("SELECT :b"), {"b": block_id})
+            return []
+
+        response = TestClient(app).get("/blocks/1/lots")
+
+        assert response.headers["X-Query-Count"] == "5"
+        events = {event: kw for event, kw in warnings}
+        assert events["n_plus_one_detected"]["route"] == "/blocks/{vineyard_id}/lots"
+        assert events["n_plus_one_detected"]["repeated_shapes"] == {"SELECT ?": 5}
+        assert events["query_budget_exceeded"]["statement_count"] == 5
@@ -0,0 +1,146 @@
+"""
+Tests for read-only sessions and read-replica routing.
+
+Primary and replica are two SQLite files holding a different marker row,
+so each test can tell which database a session actually read from.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.shared.infra.database import fastapi_session
+from src.shared.infra.database.config import DatabaseConfig
+from src.shared.infra.database.fastapi_session import (
+    _set_transaction_read_only,
+    close_database,
+    get_db_session,
+    get_read_only_db_session,
+    initialize_database,
+)
+from src.shared.infra.repository.base_repository import BaseRepository
+from src.shared.infra.repository.fastapi_session_manager import FastAPISessionManager
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _create_marker_db(path, marker: str) -> str:
+    url = f"sqlite+aiosqlite:///{path}"
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE marker (name TEXT)"))
+        await conn.execute(text("INSERT INTO marker VALUES (:m)"), {"m": marker})
+    await engine.dispose()
+    return url
+
+
+async def _marker(session) -> str:
+    return (await session.execute(text("SELECT name FROM marker"))).scalar_one()
+
+
+@pytest_asyncio.fixture
+async def databases(tmp_path, monkeypatch):
+    """Initialise the app database with a primary and, optionally, a replica."""
+    primary = await _create_marker_db(tmp_path / "primary.db", "primary")
+    replica = await _create_marker_db(tmp_path / "replica.db", "replica")
+    monkeypatch.setenv("DATABASE_URL", primary)
+
+    def _init(with_replica: bool) -> DatabaseConfig:
+        if with_replica:
+            monkeypatch.setenv("DATABASE_REPLICA_URL", replica)
+        else:
+            monkeypatch.delenv("DATABASE_REPLICA_URL", raising=False)
+        config = DatabaseConfig()
+        initialize_database(config)
+        return config
+
+    yield _init
+    await close_database()
+    monkeypatch.setattr(fastapi_session, "_db_config", None)
+    monkeypatch.setattr(fastapi_session, "_async_session_maker", None)
+    monkeypatch.setattr(fastapi_session, "_read_session_maker", None)
+
+
+async def _first(dependency):
+    generator = dependency()
+    return generator, await generator.__anext__()
+
+
+async def _finish(generator):
+    with pytest.raises(StopAsyncIteration):
+        await generator.__anext__()
+
+
+class TestReadOnlySessionRouting:
+    async def test_read_session_uses_replica(self, databases):
+        config = databases(with_replica=True)
+        assert config.has_replica
+
+        write_gen, write_session = await _first(get_db_session)
+        read_gen, read_session = await _first(get_read_only_db_session)
+
+        assert await _marker(write_session) == "primary"
+        assert await _marker(read_session) == "replica"
+        await _finish(write_gen)
+        await _finish(read_gen)
+
+    async def test_read_session_falls_back_to_primary(self, databases):
+        config = databases(with_replica=False)
+
+        read_gen, read_session = await _first(get_read_only_db_session)
+
+        assert config.read_engine is config.async_engine
+        assert await _marker(read_session) == "primary"
+        await _finish(read_gen)
+
+    async def test_read_session_never_commits(self, databases):
+        databases(with_replica=False)
+
+        read_gen, read_session = await _first(get_read_only_db_session)
+        await read_session.execute(text("INSERT INTO marker VALUES ('stray')"))
+        await _finish(read_gen)
+
+        check_gen, check_session = await _first(get_db_session)
+        count = (
+            await check_session.execute(text("SELECT COUNT(*) FROM marker"))
+        ).scalar_one()
+        await _finish(check_gen)
+        assert count == 1
+
+    @pytest.mark.parametrize("dialect, statements", [("postgresql", 1), ("sqlite", 0)])
+    async def test_transactions_begin_read_only_on_postgres(self, dialect, statements):
+        connection = Mock()
+        connection.dialect.name = dialect
+
+        _set_transaction_read_only(None, None, connection)
+
+        assert connection.exec_driver_sql.call_count == statements
+        if statements:
+            connection.exec_driver_sql.assert_called_with("SET TRANSACTION READ ONLY")
+
+
+class TestRepositoryOptIn:
+    async def test_get_read_session_uses_read_session(self, databases):
+        databases(with_replica=True)
+        write_gen, write_session = await _first(get_db_session)
+        read_gen, read_session = await _first(get_read_only_db_session)
+        repo = BaseRepository(
+            FastAPISessionManager(write_session, read_session=read_session)
+        )
+
+        async with await repo.get_session() as session:
+            assert await _marker(session) == "primary"
+        async with await repo.get_read_session() as session:
+            assert await _marker(session) == "replica"
+        await _finish(write_gen)
+        await _finish(read_gen)
+
+    async def test_get_read_session_without_read_session_uses_primary(self):
+        session = object()
+        repo = BaseRepository(FastAPISessionManager(session))
+
+        async with await repo.get_read_session() as got:
+            assert got is session
@@ -0,0 +1,39 @@
+"""
+Benchmark testing infrastructure.
+
+Times repository and service hot paths and keeps their results as JSON
+baselines, so a change's performance impact shows up in review.
+
+Key Components:
+- BenchmarkRunner: Times a sync or async callable over repeated rounds
+- BenchmarkStats: Per-benchmark timing statistics
+- save_results() / load_results(): JSON baseline files
+- compare_results(): Median-to-median regression comparison
+"""
+
+from .runner import BenchmarkRunner, BenchmarkStats
+from .baseline import (
+    DEFAULT_REGRESSION_THRESHOLD,
+    REGRESSED,
+    BenchmarkComparison,
+    benchmark_key,
+    compare_results,
+    format_comparison,
+    format_results,
+    load_results,
+    save_results,
+)
+
+__all__ = [
+    "BenchmarkRunner",
+    "BenchmarkStats",
+    "DEFAULT_REGRESSION_THRESHOLD",
+    "REGRESSED",
+    "BenchmarkComparison",
+    "benchmark_key",
+    "compare_results",
+    "format_comparison",
+    "format_results",
+    "load_results",
+    "save_results",
+]
@@ -0,0 +1,189 @@
+"""
+JSON benchmark baselines and regression comparison.
+
+A baseline file records the statistics of every benchmark of a run plus
+the machine it ran on:
+
+    {
+        "created_at": "2026-10-18T21:40:12",
+        "machine": {"python": "3.11.7", "platform": "Linux-6.18...", ...},
+        "benchmarks": {
+            "sample_repository::test_get_samples_by_fermentation_id": {
+                "rounds": 112, "median": 0.0031, ...
+            }
+        }
+    }
+
+Benchmarks are compared on their median round time, which is the
+statistic least disturbed by a stray GC pause or scheduler hiccup.
+"""
+
+import json
+import os
+import platform
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .runner import BenchmarkStats
+
+# A benchmark whose median grew by more than this fraction has regressed
+DEFAULT_REGRESSION_THRESHOLD = 0.25
+
+REGRESSED = "regressed"
+IMPROVED = "improved"
+UNCHANGED = "unchanged"
+NEW = "new"
+MISSING = "missing"
+
+
+def benchmark_key(stats: BenchmarkStats) -> str:
+    """Identifier of a benchmark in a baseline file."""
+    return f"{stats.group}::{stats.name}" if stats.group else stats.name
+
+
+def machine_info() -> Dict[str, Any]:
+    """Describes where a run happened; timings only compare on like machines."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def save_results(
+    path: Union[str, Path],
+    results: Iterable[BenchmarkStats],
+    previous: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """
+    Write a run's statistics as a baseline file; returns the document.
+
+    Benchmarks of ``previous`` that were not run this time are kept, so
+    saving a partial run only updates the benchmarks it ran.
+    """
+    benchmarks = dict(previous or {})
+    for stats in results:
+        benchmarks[benchmark_key(stats)] = {
+            # 0.1us resolution keeps baseline diffs readable
+            key: round(value, 7) if isinstance(value, float) else value
+            for key, value in stats.to_dict().items()
+            if key not in ("name", "group")
+        }
+    document = {
+        "created_at": datetime.utcnow().replace(microsecond=0).isoformat(),
+        "machine": machine_info(),
+        "benchmarks": dict(sorted(benchmarks.items())),
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2, sort_keys=False) + "\n", encoding="utf-8")
+    return document
+
+
+def load_results(path: Union[str, Path]) -> Dict[str, Dict[str, Any]]:
+    """Benchmarks of a baseline file, keyed by benchmark_key()."""
+    document = json.loads(Path(path).read_text(encoding="utf-8"))
+    return document.get("benchmarks", {})
+
+
+@dataclass(frozen=True)
+class BenchmarkComparison:
+    """Median of one benchmark in the baseline and in the current run."""
+
+    key: str
+    baseline: Optional[float]
+    current: Optional[float]
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative change of the median (0.10 = 10% slower)."""
+        if not self.baseline or self.current is None:
+            return None
+        return self.current / self.baseline - 1.0
+
+    @property
+    def status(self) -> str:
+        if self.baseline is None:
+            return NEW
+        if self.current is None:
+            return MISSING
+        change = self.change or 0.0
+        if change > self.threshold:
+            return REGRESSED
+        if change < -self.threshold:
+            return IMPROVED
+        return UNCHANGED
+
+
+def compare_results(
+    baseline: Dict[str, Dict[str, Any]],
+    current: Dict[str, Dict[str, Any]],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> List[BenchmarkComparison]:
+    """Compare the medians of two runs, benchmark by benchmark."""
+    return [
+        BenchmarkComparison(
+            key=key,
+            baseline=baseline[key]["median"] if key in baseline else None,
+            current=current[key]["median"] if key in current else None,
+            threshold=threshold,
+        )
+        for key in sorted(set(baseline) | set(current))
+    ]
+
+
+def _format_time(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.3f}s"
+
+
+def _table(rows: List[tuple]) -> List[str]:
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return [
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in rows
+    ]
+
+
+def format_comparison(comparisons: Iterable[BenchmarkComparison]) -> List[str]:
+    """Aligned text table of a comparison, one line per benchmark."""
+    rows = [("benchmark", "baseline", "current", "change", "status")]
+    for comparison in comparisons:
+        change = comparison.change
+        rows.append(
+            (
+                comparison.key,
+                _format_time(comparison.baseline),
+                _format_time(comparison.current),
+                "-" if change is None else f"{change:+.1%}",
+                comparison.status,
+            )
+        )
+    return _table(rows)
+
+
+def format_results(results: Iterable[BenchmarkStats]) -> List[str]:
+    """Aligned text table of a run's statistics."""
+    rows = [("benchmark", "rounds", "min", "median", "mean", "stddev")]
+    for stats in sorted(results, key=benchmark_key):
+        rows.append(
+            (
+                benchmark_key(stats),
+                str(stats.rounds),
+                _format_time(stats.min),
+                _format_time(stats.median),
+                _format_time(stats.mean),
+                _format_time(stats.stddev),
+            )
+        )
+    return _table(rows)
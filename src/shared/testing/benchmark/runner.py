@@ -0,0 +1,144 @@
+"""
+BenchmarkRunner - times a sync or async callable over repeated rounds.
+
+A dependency-free stand-in for pytest-benchmark's ``benchmark`` fixture
+that also understands coroutines, so repository and service hot paths can
+be timed exactly as the application awaits them.
+"""
+
+import inspect
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+
+@dataclass(frozen=True)
+class BenchmarkStats:
+    """Timing statistics of one benchmark (seconds per round)."""
+
+    name: str
+    group: str
+    rounds: int
+    min: float
+    max: float
+    mean: float
+    median: float
+    stddev: float
+
+    @classmethod
+    def from_timings(cls, name: str, group: str, timings: List[float]) -> "BenchmarkStats":
+        """Summarize the per-round timings of a benchmark."""
+        if not timings:
+            raise ValueError(f"Benchmark {name} has no timed rounds")
+        return cls(
+            name=name,
+            group=group,
+            rounds=len(timings),
+            min=min(timings),
+            max=max(timings),
+            mean=statistics.fmean(timings),
+            median=statistics.median(timings),
+            stddev=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        )
+
+    @property
+    def ops(self) -> float:
+        """Rounds per second at the median round time."""
+        return 1.0 / self.median if self.median else float("inf")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+Setup = Callable[[], Union[Optional[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]]
+
+
+async def _resolve(value):
+    return await value if inspect.isawaitable(value) else value
+
+
+class BenchmarkRunner:
+    """
+    Calls a target repeatedly and records its round timings.
+
+    Without an explicit round count the target runs at least ``min_rounds``
+    times and keeps going until ``max_time`` seconds have been spent or
+    ``max_rounds`` is reached. Warmup rounds are run first and not timed.
+
+    Usage:
+        runner = BenchmarkRunner("test_get_samples", group="sample_repository")
+        samples = await runner(repository.get_samples_by_fermentation_id, 7)
+        runner.stats.median
+    """
+
+    def __init__(
+        self,
+        name: str,
+        group: str = "",
+        min_rounds: int = 5,
+        max_rounds: int = 200,
+        max_time: float = 1.0,
+        warmup_rounds: int = 1,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.name = name
+        self.group = group
+        self.min_rounds = min_rounds
+        self.max_rounds = max_rounds
+        self.max_time = max_time
+        self.warmup_rounds = warmup_rounds
+        self._clock = clock
+        self.stats: Optional[BenchmarkStats] = None
+
+    async def __call__(
+        self,
+        target: Callable[..., Any],
+        *args: Any,
+        setup: Optional[Setup] = None,
+        rounds: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Benchmark ``target(*args, **kwargs)``.
+
+        Args:
+            target: Function or coroutine function to time
+            setup: Untimed callable run before every round; keyword
+                arguments it returns are passed to that round's call
+            rounds: Exact number of timed rounds (default: time-boxed)
+
+        Returns:
+            The result of the last timed round
+        """
+        if self.stats is not None:
+            raise RuntimeError(f"Benchmark {self.name} was already run")
+
+        for _ in range(self.warmup_rounds):
+            await self._round(target, args, kwargs, setup)
+
+        timings: List[float] = []
+        started = self._clock()
+        result = None
+        while True:
+            elapsed, result = await self._round(target, args, kwargs, setup)
+            timings.append(elapsed)
+            if rounds is not None:
+                if len(timings) >= rounds:
+                    break
+            elif len(timings) >= self.max_rounds or (
+                len(timings) >= self.min_rounds
+                and self._clock() - started >= self.max_time
+            ):
+                break
+
+        self.stats = BenchmarkStats.from_timings(self.name, self.group, timings)
+        return result
+
+    async def _round(self, target, args, kwargs, setup):
+        call_kwargs = dict(kwargs)
+        if setup is not None:
+            call_kwargs.update(await _resolve(setup()) or {})
+        start = self._clock()
+        result = await _resolve(target(*args, **call_kwargs))
+        return self._clock() - start, result
@@ -40,12 +40,13 @@ def create_integration_fixtures(config: IntegrationTestConfig) -> Dict[str, Any]
     """
     Factory function that creates standard integration test fixtures.
     
-    This function generates three fixtures that are automatically available
+    This function generates four fixtures that are automatically available
     in test files when imported into conftest.py:
     
     1. test_models: Dict of model classes by name
     2. db_engine: Async SQLAlchemy engine (FUNCTION-scoped to prevent metadata conflicts)
     3. db_session: Async session with automatic rollback
+    4. query_recorder: Records statements on db_engine for query budget asserts
     
     Usage in module conftest.py:
         from shared.testing.integration import (
@@ -66,7 +67,7 @@ def create_integration_fixtures(config: IntegrationTestConfig) -> Dict[str, Any]
         config: Configuration object with module name and models
     
     Returns:
-        Dict with three pytest fixtures: test_models, db_engine, db_session
+        Dict with pytest fixtures: test_models, db_engine, db_session, query_recorder
     
     Note:
         db_engine is FUNCTION-scoped (not session) to avoid SQLAlchemy
@@ -174,8 +175,31 @@ def create_integration_fixtures(config: IntegrationTestConfig) -> Dict[str, Any]
                 yield session
                 await session.rollback()
     
+    @pytest.fixture
+    def query_recorder(db_engine):
+        """
+        Record every SQL statement executed on the test engine.
+        
+        Schema creation happens before recording starts. Call reset() after
+        arranging test data, or assert on a block only:
+        
+            with query_recorder.budget(max_queries=2, repeat_threshold=3):
+                await repository.get_by_winery(winery_id)
+        
+        Args:
+            db_engine: Database engine from db_engine fixture
+        
+        Yields:
+            QueryRecorder: Recorded statements and N+1 assertions
+        """
+        from src.shared.infra.database.query_inspector import record_queries
+        
+        with record_queries(db_engine) as recorder:
+            yield recorder
+    
     return {
         'test_models': test_models,
         'db_engine': db_engine,
         'db_session': db_session,
+        'query_recorder': query_recorder,
     }
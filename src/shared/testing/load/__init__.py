@@ -0,0 +1,53 @@
+"""
+Load testing infrastructure.
+
+Drives the HTTP services with a realistic mix of user journeys and
+reports per-endpoint latency percentiles, so capacity and tail latency
+can be checked before a release.
+
+Key Components:
+- LoadTestRunner: Runs weighted scenarios with a ramping number of virtual users
+- RampProfile: Virtual users over time ("30s:10,2m:10,30s:0")
+- asgi_gateway() / http_gateway(): create_app() instances in-process, or running services
+- LoadReport: Per-endpoint throughput, errors and p50/p95/p99 latency
+"""
+
+from .profile import RampProfile, Stage, parse_duration
+from .report import (
+    EndpointStats,
+    LatencyRecorder,
+    LoadReport,
+    format_report,
+    percentile,
+    save_report,
+)
+from .runner import (
+    Gateway,
+    LoadTestRunner,
+    PeriodicJob,
+    Scenario,
+    VirtualUser,
+    asgi_gateway,
+    http_gateway,
+    request_name,
+)
+
+__all__ = [
+    "RampProfile",
+    "Stage",
+    "parse_duration",
+    "EndpointStats",
+    "LatencyRecorder",
+    "LoadReport",
+    "format_report",
+    "percentile",
+    "save_report",
+    "Gateway",
+    "LoadTestRunner",
+    "PeriodicJob",
+    "Scenario",
+    "VirtualUser",
+    "asgi_gateway",
+    "http_gateway",
+    "request_name",
+]
@@ -0,0 +1,84 @@
+"""
+RampProfile - how many virtual users a load test runs over time.
+
+A profile is a list of stages; each stage ramps linearly from the previous
+stage's user count to its own over its duration, so "1m:50,5m:50,1m:0"
+ramps up to 50 users, holds them for five minutes and ramps down.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List, Sequence
+
+_DURATION = re.compile(r"^(\d+(?:\.\d+)?)(ms|s|m|h)?$")
+_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_duration(text: str) -> float:
+    """Parse "500ms", "30s", "2m", "1h" (or bare seconds) into seconds."""
+    match = _DURATION.match(text.strip())
+    if not match:
+        raise ValueError(f"Invalid duration: {text!r}")
+    value, unit = match.groups()
+    return float(value) * _UNIT_SECONDS[unit or "s"]
+
+
+@dataclass(frozen=True)
+class Stage:
+    """Ramp to ``users`` virtual users over ``duration`` seconds."""
+
+    duration: float
+    users: int
+
+    def __post_init__(self):
+        if self.duration < 0 or self.users < 0:
+            raise ValueError("Stage duration and users must not be negative")
+
+
+class RampProfile:
+    """Piecewise-linear virtual user count over the duration of a load test."""
+
+    def __init__(self, stages: Sequence[Stage], start_users: int = 0):
+        if not stages:
+            raise ValueError("A ramp profile needs at least one stage")
+        self.stages: List[Stage] = list(stages)
+        self.start_users = start_users
+
+    @classmethod
+    def parse(cls, text: str) -> "RampProfile":
+        """Build a profile from "DURATION:USERS,..." (e.g. "30s:10,2m:10,30s:0")."""
+        stages = []
+        for part in text.split(","):
+            duration, sep, users = part.partition(":")
+            if not sep:
+                raise ValueError(f"Invalid stage {part!r}: expected DURATION:USERS")
+            stages.append(Stage(duration=parse_duration(duration), users=int(users)))
+        return cls(stages)
+
+    @classmethod
+    def constant(cls, users: int, duration: float) -> "RampProfile":
+        """``users`` virtual users for the whole ``duration``."""
+        return cls([Stage(duration=duration, users=users)], start_users=users)
+
+    @property
+    def duration(self) -> float:
+        return sum(stage.duration for stage in self.stages)
+
+    @property
+    def peak_users(self) -> int:
+        return max([self.start_users] + [stage.users for stage in self.stages])
+
+    def users_at(self, elapsed: float) -> int:
+        """Target virtual users ``elapsed`` seconds into the test."""
+        previous = self.start_users
+        for stage in self.stages:
+            if elapsed < stage.duration:
+                progress = elapsed / stage.duration
+                return round(previous + (stage.users - previous) * progress)
+            elapsed -= stage.duration
+            previous = stage.users
+        return previous
+
+    def __repr__(self) -> str:
+        stages = ",".join(f"{s.duration:g}s:{s.users}" for s in self.stages)
+        return f"RampProfile({stages!r})"
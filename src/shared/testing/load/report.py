@@ -0,0 +1,179 @@
+"""
+Load test results - per-endpoint latency percentiles and error counts.
+
+Every request is recorded under a name, e.g. "POST /fermentations/{id}/samples";
+whole scenario runs and background job runs are recorded next to them
+(kinds "scenario" and "job"). The report summarizes each name by
+throughput, errors and p50/p95/p99 latency.
+"""
+
+import json
+import math
+import platform
+from collections import Counter, defaultdict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from ..benchmark.baseline import _format_time, _table
+
+# Kinds of recorded timings: single HTTP requests, whole scenario runs and
+# background job runs. Totals and error rates count requests only.
+REQUEST = "request"
+SCENARIO = "scenario"
+JOB = "job"
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values (``fraction`` in 0..1)."""
+    if not sorted_values:
+        raise ValueError("No values")
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+@dataclass(frozen=True)
+class EndpointStats:
+    """Latency (seconds) and outcome summary of one request name."""
+
+    name: str
+    requests: int
+    errors: int
+    rps: float
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+    kind: str = REQUEST
+    error_kinds: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class LatencyRecorder:
+    """Collects the latency and outcome of every request of a load test."""
+
+    def __init__(self):
+        self._timings: Dict[str, List[float]] = defaultdict(list)
+        self._errors: Dict[str, Counter] = defaultdict(Counter)
+        self._kinds: Dict[str, str] = {}
+
+    def record(
+        self, name: str, seconds: float, error: Optional[str] = None, kind: str = REQUEST
+    ) -> None:
+        """Record one request; ``error`` names the failure (e.g. "HTTP 500")."""
+        self._timings[name].append(seconds)
+        self._kinds.setdefault(name, kind)
+        if error is not None:
+            self._errors[name][error] += 1
+
+    def summarize(self, elapsed: float) -> List[EndpointStats]:
+        """Per-name statistics over a test that ran ``elapsed`` seconds."""
+        stats = []
+        for name in sorted(self._timings):
+            timings = sorted(self._timings[name])
+            errors = self._errors.get(name, Counter())
+            stats.append(
+                EndpointStats(
+                    name=name,
+                    requests=len(timings),
+                    errors=sum(errors.values()),
+                    rps=len(timings) / elapsed if elapsed else 0.0,
+                    mean=sum(timings) / len(timings),
+                    p50=percentile(timings, 0.50),
+                    p95=percentile(timings, 0.95),
+                    p99=percentile(timings, 0.99),
+                    max=timings[-1],
+                    kind=self._kinds[name],
+                    error_kinds=dict(errors),
+                )
+            )
+        return stats
+
+
+@dataclass
+class LoadReport:
+    """Outcome of a load test run."""
+
+    profile: str
+    duration: float
+    peak_users: int
+    endpoints: List[EndpointStats]
+    started_at: datetime = field(default_factory=datetime.utcnow)
+
+    @property
+    def total_requests(self) -> int:
+        return sum(e.requests for e in self.endpoints if e.kind == REQUEST)
+
+    @property
+    def total_errors(self) -> int:
+        return sum(e.errors for e in self.endpoints if e.kind == REQUEST)
+
+    def endpoint(self, name: str) -> EndpointStats:
+        for stats in self.endpoints:
+            if stats.name == name:
+                return stats
+        raise KeyError(name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "started_at": self.started_at.replace(microsecond=0).isoformat(),
+            "machine": {"python": platform.python_version(), "system": platform.system()},
+            "profile": self.profile,
+            "duration": round(self.duration, 3),
+            "peak_users": self.peak_users,
+            "total_requests": self.total_requests,
+            "total_errors": self.total_errors,
+            "endpoints": {
+                # 0.1us resolution keeps report diffs readable
+                e.name: {
+                    key: round(value, 7) if isinstance(value, float) else value
+                    for key, value in e.to_dict().items()
+                    if key != "name"
+                }
+                for e in self.endpoints
+            },
+        }
+
+
+def save_report(path: Union[str, Path], report: LoadReport) -> Dict[str, Any]:
+    """Write a load test report as JSON; returns the document."""
+    document = report.to_dict()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2, ensure_ascii=False) + "\n")
+    return document
+
+
+def format_report(report: LoadReport) -> List[str]:
+    """Render a report as a table, one line per request name."""
+    rows = [("request", "count", "req/s", "errors", "p50", "p95", "p99", "max")]
+    rows.extend(
+        (
+            e.name,
+            str(e.requests),
+            f"{e.rps:.1f}",
+            f"{e.error_rate:.1%}",
+            _format_time(e.p50),
+            _format_time(e.p95),
+            _format_time(e.p99),
+            _format_time(e.max),
+        )
+        for e in report.endpoints
+    )
+    lines = _table(rows)
+    lines.append(
+        f"{report.total_requests} requests, {report.total_errors} errors in "
+        f"{report.duration:.1f}s (profile {report.profile}, peak {report.peak_users} users)"
+    )
+    for e in report.endpoints:
+        for kind, count in sorted(e.error_kinds.items()):
+            lines.append(f"  {e.name}: {count} x {kind}")
+    return lines
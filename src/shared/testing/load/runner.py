@@ -0,0 +1,325 @@
+"""
+LoadTestRunner - drives weighted scenarios with a ramping set of virtual users.
+
+Each virtual user loops: pick a scenario by weight, run it, wait a think
+time. Scenarios issue requests through ``VirtualUser.request``, which
+routes the path to its service (the same prefixes as the nginx gateway)
+and records the latency. Periodic jobs, like the alert scan, run next to
+the users and are recorded the same way.
+
+Services are either ``create_app()`` instances served in-process (their
+lifespans run, so background schedulers and pools behave as deployed) or
+running services reached over HTTP.
+"""
+
+import asyncio
+import random
+import re
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import httpx
+
+from src.shared.wine_fermentator_logging import get_logger
+
+from .profile import RampProfile
+from .report import JOB, SCENARIO, LatencyRecorder, LoadReport
+
+logger = get_logger(__name__)
+
+_ID_SEGMENT = re.compile(r"/(\d+|[0-9a-f]{8}-[0-9a-f-]{27})(?=/|$)")
+
+
+def request_name(method: str, path: str) -> str:
+    """Report name of a request: ids in the path become ``{id}``."""
+    return f"{method.upper()} {_ID_SEGMENT.sub('/{id}', path.split('?', 1)[0])}"
+
+
+class Gateway:
+    """
+    Routes request paths to the client of the service serving them.
+
+    Routes are regular expressions tried in order, like the nginx gateway's
+    locations; unmatched paths go to ``default``.
+    """
+
+    def __init__(
+        self,
+        routes: Sequence[Tuple[str, httpx.AsyncClient]] = (),
+        default: Optional[httpx.AsyncClient] = None,
+    ):
+        self._routes = [(re.compile(pattern), client) for pattern, client in routes]
+        self._default = default
+
+    def client_for(self, path: str) -> httpx.AsyncClient:
+        for pattern, client in self._routes:
+            if pattern.match(path):
+                return client
+        if self._default is None:
+            raise LookupError(f"No service routes {path}")
+        return self._default
+
+
+@asynccontextmanager
+async def http_gateway(base_url: str, timeout: float = 30.0) -> AsyncIterator[Gateway]:
+    """Gateway sending every request to running services behind ``base_url``."""
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout) as client:
+        yield Gateway(default=client)
+
+
+@asynccontextmanager
+async def asgi_gateway(
+    routes: Sequence[Tuple[str, Any]], timeout: float = 30.0
+) -> AsyncIterator[Gateway]:
+    """
+    Gateway serving requests from ASGI apps in-process.
+
+    Every app's lifespan runs for the duration of the context (startup in
+    route order, shutdown in reverse). An app may serve several routes.
+    """
+    async with AsyncExitStack() as stack:
+        clients: Dict[int, httpx.AsyncClient] = {}
+        client_routes = []
+        for pattern, app in routes:
+            if id(app) not in clients:
+                await stack.enter_async_context(app.router.lifespan_context(app))
+                clients[id(app)] = await stack.enter_async_context(
+                    httpx.AsyncClient(
+                        transport=httpx.ASGITransport(app=app),
+                        base_url="http://loadtest",
+                        timeout=timeout,
+                    )
+                )
+            client_routes.append((pattern, clients[id(app)]))
+        yield Gateway(client_routes)
+
+
+class VirtualUser:
+    """One simulated client; scenarios receive it to issue requests."""
+
+    def __init__(
+        self,
+        index: int,
+        gateway: Gateway,
+        recorder: LatencyRecorder,
+        rng: random.Random,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.index = index
+        self.random = rng
+        # Scratch space kept across a user's scenario iterations
+        self.state: Dict[str, Any] = {}
+        self._gateway = gateway
+        self._recorder = recorder
+        self._clock = clock
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        name: Optional[str] = None,
+        expect: Optional[Collection[int]] = None,
+        **kwargs: Any,
+    ) -> Optional[httpx.Response]:
+        """
+        Send a request and record its latency.
+
+        Args:
+            method: HTTP method
+            path: Request path (routed by the gateway)
+            name: Report name (default: method and path with ids as ``{id}``)
+            expect: Status codes counted as success (default: any 2xx)
+            **kwargs: Passed to ``httpx.AsyncClient.request`` (json, params, headers)
+
+        Returns:
+            The response, or None when the request failed in transport
+        """
+        name = name or request_name(method, path)
+        client = self._gateway.client_for(path)
+        started = self._clock()
+        try:
+            response = await client.request(method, path, **kwargs)
+        except httpx.HTTPError as exc:
+            self._recorder.record(name, self._clock() - started, error=type(exc).__name__)
+            return None
+        elapsed = self._clock() - started
+
+        ok = response.status_code in expect if expect else response.is_success
+        self._recorder.record(
+            name, elapsed, error=None if ok else f"HTTP {response.status_code}"
+        )
+        return response
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A user journey; virtual users pick scenarios in proportion to ``weight``."""
+
+    name: str
+    run: Callable[[VirtualUser], Awaitable[None]]
+    weight: int = 1
+
+
+@dataclass(frozen=True)
+class PeriodicJob:
+    """Background work run every ``interval`` seconds while the test runs."""
+
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    interval: float
+
+
+class LoadTestRunner:
+    """
+    Runs scenarios under a ramp profile and reports latency percentiles.
+
+    Usage:
+        async with asgi_gateway([(r"/api/v1/", create_app())]) as gateway:
+            runner = LoadTestRunner(scenarios, RampProfile.parse("30s:20,1m:20"), gateway)
+            report = await runner.run()
+    """
+
+    def __init__(
+        self,
+        scenarios: Sequence[Scenario],
+        profile: RampProfile,
+        gateway: Gateway,
+        jobs: Sequence[PeriodicJob] = (),
+        think_time: Tuple[float, float] = (0.5, 2.0),
+        seed: int = 0,
+        tick: float = 0.25,
+        drain_timeout: float = 30.0,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        if not scenarios:
+            raise ValueError("A load test needs at least one scenario")
+        self.scenarios = list(scenarios)
+        self.profile = profile
+        self.gateway = gateway
+        self.jobs = list(jobs)
+        self.think_time = think_time
+        self.seed = seed
+        self.tick = tick
+        self.drain_timeout = drain_timeout
+        self.recorder = LatencyRecorder()
+        self._clock = clock
+        self._weights = [scenario.weight for scenario in self.scenarios]
+
+    async def run(self) -> LoadReport:
+        """Run the whole profile; returns once every virtual user stopped."""
+        users: List[Tuple[asyncio.Task, asyncio.Event]] = []
+        retired: List[asyncio.Task] = []
+        stopping = asyncio.Event()
+        job_tasks = [asyncio.create_task(self._job_loop(job, stopping)) for job in self.jobs]
+        logger.info(
+            "load_test_started",
+            profile=repr(self.profile),
+            scenarios=[s.name for s in self.scenarios],
+        )
+
+        started = self._clock()
+        try:
+            while True:
+                elapsed = self._clock() - started
+                if elapsed >= self.profile.duration:
+                    break
+                target = self.profile.users_at(elapsed)
+                while len(users) < target:
+                    stop = asyncio.Event()
+                    user = self._new_user(len(users))
+                    users.append((asyncio.create_task(self._user_loop(user, stop)), stop))
+                while len(users) > target:
+                    # Newest first; it finishes its running scenario, then exits
+                    task, stop = users.pop()
+                    stop.set()
+                    retired.append(task)
+                await asyncio.sleep(self.tick)
+        finally:
+            stopping.set()
+            for _, stop in users:
+                stop.set()
+            await self._drain([task for task, _ in users] + retired + job_tasks)
+
+        elapsed = self._clock() - started
+        report = LoadReport(
+            profile=repr(self.profile),
+            duration=elapsed,
+            peak_users=self.profile.peak_users,
+            endpoints=self.recorder.summarize(elapsed),
+        )
+        logger.info(
+            "load_test_completed",
+            requests=report.total_requests,
+            errors=report.total_errors,
+            duration_seconds=round(elapsed, 1),
+        )
+        return report
+
+    def _new_user(self, index: int) -> VirtualUser:
+        rng = random.Random(f"{self.seed}:{index}")
+        return VirtualUser(index, self.gateway, self.recorder, rng, clock=self._clock)
+
+    async def _user_loop(self, user: VirtualUser, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            scenario = user.random.choices(self.scenarios, weights=self._weights)[0]
+            started = self._clock()
+            error = None
+            try:
+                await scenario.run(user)
+            except Exception as exc:
+                error = type(exc).__name__
+                logger.warning(
+                    "load_test_scenario_failed", scenario=scenario.name, error=str(exc)
+                )
+            # The whole journey, as the user experienced it
+            self.recorder.record(
+                f"scenario: {scenario.name}",
+                self._clock() - started,
+                error=error,
+                kind=SCENARIO,
+            )
+            await self._wait(stop, user.random.uniform(*self.think_time))
+
+    async def _job_loop(self, job: PeriodicJob, stopping: asyncio.Event) -> None:
+        while not await self._wait(stopping, job.interval):
+            started = self._clock()
+            error = None
+            try:
+                await job.run()
+            except Exception as exc:
+                error = type(exc).__name__
+                logger.warning("load_test_job_failed", job=job.name, error=str(exc))
+            self.recorder.record(
+                f"job: {job.name}", self._clock() - started, error=error, kind=JOB
+            )
+
+    @staticmethod
+    async def _wait(event: asyncio.Event, timeout: float) -> bool:
+        """Sleep up to ``timeout`` seconds; True when ``event`` was set meanwhile."""
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def _drain(self, tasks: List[asyncio.Task]) -> None:
+        if not tasks:
+            return
+        _, pending = await asyncio.wait(tasks, timeout=self.drain_timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
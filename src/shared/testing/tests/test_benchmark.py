@@ -0,0 +1,153 @@
+"""
+Tests for the benchmark runner and JSON baselines.
+
+A fake clock makes every round take a known time.
+"""
+
+import json
+
+import pytest
+from testing.benchmark import (
+    BenchmarkRunner,
+    BenchmarkStats,
+    compare_results,
+    format_comparison,
+    load_results,
+    save_results,
+)
+
+
+class FakeClock:
+    """Advances by ``step`` seconds on every reading."""
+
+    def __init__(self, step=0.5):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+def _stats(name, median, group="repo"):
+    return BenchmarkStats(
+        name=name, group=group, rounds=3, min=median, max=median,
+        mean=median, median=median, stddev=0.0,
+    )
+
+
+class TestBenchmarkRunner:
+    """Test suite for BenchmarkRunner."""
+
+    @pytest.mark.asyncio
+    async def test_times_async_callables(self):
+        calls = []
+
+        async def target(value):
+            calls.append(value)
+            return value * 2
+
+        runner = BenchmarkRunner("test_double", clock=FakeClock(), warmup_rounds=1)
+
+        result = await runner(target, 21, rounds=3)
+
+        assert result == 42
+        assert calls == [21] * 4  # warmup + 3 timed rounds
+        assert runner.stats.rounds == 3
+        assert runner.stats.median == pytest.approx(0.5)
+
+    @pytest.mark.asyncio
+    async def test_times_sync_callables(self):
+        runner = BenchmarkRunner("test_sum", clock=FakeClock(), warmup_rounds=0)
+
+        result = await runner(sum, [1, 2, 3], rounds=2)
+
+        assert result == 6
+        assert runner.stats.rounds == 2
+
+    @pytest.mark.asyncio
+    async def test_time_boxed_rounds(self):
+        runner = BenchmarkRunner(
+            "test_noop", clock=FakeClock(step=0.1), min_rounds=2, max_time=1.0,
+            warmup_rounds=0,
+        )
+
+        await runner(lambda: None)
+
+        assert 2 <= runner.stats.rounds < 10
+
+    @pytest.mark.asyncio
+    async def test_setup_arguments_are_passed_to_each_round(self):
+        rounds = iter(range(10))
+        seen = []
+
+        async def setup():
+            return {"value": next(rounds)}
+
+        def target(value):
+            seen.append(value)
+
+        runner = BenchmarkRunner("test_setup", clock=FakeClock(), warmup_rounds=1)
+
+        await runner(target, setup=setup, rounds=2)
+
+        assert seen == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_runs_only_once(self):
+        runner = BenchmarkRunner("test_once", clock=FakeClock(), warmup_rounds=0)
+        await runner(lambda: None, rounds=1)
+
+        with pytest.raises(RuntimeError):
+            await runner(lambda: None, rounds=1)
+
+
+class TestBaselines:
+    """Test suite for baseline files and comparisons."""
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        path = tmp_path / "baseline.json"
+
+        save_results(path, [_stats("test_b", 0.2), _stats("test_a", 0.1)])
+
+        document = json.loads(path.read_text())
+        assert list(document["benchmarks"]) == ["repo::test_a", "repo::test_b"]
+        assert "python" in document["machine"]
+        assert load_results(path)["repo::test_a"]["median"] == 0.1
+
+    def test_saving_a_partial_run_keeps_other_benchmarks(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        save_results(path, [_stats("test_a", 0.1), _stats("test_b", 0.2)])
+
+        save_results(path, [_stats("test_b", 0.3)], previous=load_results(path))
+
+        results = load_results(path)
+        assert results["repo::test_a"]["median"] == 0.1
+        assert results["repo::test_b"]["median"] == 0.3
+
+    def test_compare_flags_regressions_beyond_the_threshold(self):
+        baseline = {"a": {"median": 1.0}, "b": {"median": 1.0}, "c": {"median": 1.0}}
+        current = {"a": {"median": 1.3}, "b": {"median": 1.1}, "d": {"median": 1.0}}
+
+        comparisons = {
+            c.key: c for c in compare_results(baseline, current, threshold=0.25)
+        }
+
+        assert comparisons["a"].status == "regressed"
+        assert comparisons["a"].change == pytest.approx(0.3)
+        assert comparisons["b"].status == "unchanged"
+        assert comparisons["c"].status == "missing"
+        assert comparisons["d"].status == "new"
+
+    def test_compare_reports_improvements(self):
+        comparisons = compare_results({"a": {"median": 1.0}}, {"a": {"median": 0.5}})
+
+        assert comparisons[0].status == "improved"
+
+    def test_format_comparison_is_one_line_per_benchmark(self):
+        lines = format_comparison(
+            compare_results({"a": {"median": 0.002}}, {"a": {"median": 0.003}})
+        )
+
+        assert lines[0].split() == ["benchmark", "baseline", "current", "change", "status"]
+        assert lines[1].split() == ["a", "2.00ms", "3.00ms", "+50.0%", "regressed"]
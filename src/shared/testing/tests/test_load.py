@@ -0,0 +1,160 @@
+"""
+Tests for the load test harness: ramp profiles, percentiles and the runner.
+
+The runner tests drive a small FastAPI app in-process for half a second.
+"""
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from testing.load import (
+    LatencyRecorder,
+    LoadTestRunner,
+    PeriodicJob,
+    RampProfile,
+    Scenario,
+    Stage,
+    asgi_gateway,
+    format_report,
+    parse_duration,
+    percentile,
+    request_name,
+)
+
+
+class TestRampProfile:
+    """Test suite for RampProfile."""
+
+    def test_parse_stages(self):
+        profile = RampProfile.parse("30s:10,2m:10,500ms:0")
+
+        assert profile.stages == [Stage(30, 10), Stage(120, 10), Stage(0.5, 0)]
+        assert profile.duration == pytest.approx(150.5)
+        assert profile.peak_users == 10
+
+    def test_ramps_linearly_between_stages(self):
+        profile = RampProfile.parse("10s:10,10s:10,10s:0")
+
+        assert [profile.users_at(t) for t in (0, 5, 10, 15, 25, 30)] == [0, 5, 10, 10, 5, 0]
+
+    def test_constant_profile(self):
+        profile = RampProfile.constant(users=4, duration=60)
+
+        assert profile.users_at(0) == profile.users_at(59) == 4
+
+    @pytest.mark.parametrize("text", ["10", "10s", "ten:5", "10x:5"])
+    def test_rejects_malformed_stages(self, text):
+        with pytest.raises(ValueError):
+            RampProfile.parse(text)
+
+    def test_parse_duration_units(self):
+        assert parse_duration("250ms") == pytest.approx(0.25)
+        assert parse_duration("2m") == 120
+        assert parse_duration("1.5h") == 5400
+        assert parse_duration("45") == 45
+
+
+class TestLatencyRecorder:
+    """Test suite for percentiles and per-request statistics."""
+
+    def test_nearest_rank_percentiles(self):
+        values = [float(v) for v in range(1, 101)]
+
+        assert percentile(values, 0.50) == 50
+        assert percentile(values, 0.95) == 95
+        assert percentile(values, 0.99) == 99
+        assert percentile([7.0], 0.99) == 7
+
+    def test_summarize_per_request_name(self):
+        recorder = LatencyRecorder()
+        for ms in range(1, 11):
+            recorder.record("GET /a", ms / 1000)
+        recorder.record("GET /a", 0.5, error="HTTP 500")
+        recorder.record("POST /b", 0.2)
+
+        stats = {s.name: s for s in recorder.summarize(elapsed=2.0)}
+
+        assert stats["GET /a"].requests == 11
+        assert stats["GET /a"].errors == 1
+        assert stats["GET /a"].error_kinds == {"HTTP 500": 1}
+        assert stats["GET /a"].p50 == pytest.approx(0.006)
+        assert stats["GET /a"].max == pytest.approx(0.5)
+        assert stats["POST /b"].rps == pytest.approx(0.5)
+
+    def test_request_name_hides_ids(self):
+        assert request_name("get", "/api/v1/fermentations/42/samples/7?limit=5") == (
+            "GET /api/v1/fermentations/{id}/samples/{id}"
+        )
+        assert request_name(
+            "GET", "/api/v1/analyses/fermentation/00000000-0000-0000-0000-00000000002a"
+        ) == "GET /api/v1/analyses/fermentation/{id}"
+
+
+def _app():
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        if item_id == 0:
+            raise HTTPException(status_code=404)
+        return {"id": item_id}
+
+    return app
+
+
+class TestLoadTestRunner:
+    """Test suite for LoadTestRunner."""
+
+    @pytest.mark.asyncio
+    async def test_runs_weighted_scenarios_and_reports_percentiles(self):
+        async def browse(user):
+            await user.request("GET", f"/items/{user.index + 1}")
+
+        async def missing(user):
+            await user.request("GET", "/items/0")
+
+        jobs_run = []
+
+        async def job():
+            jobs_run.append(1)
+
+        async with asgi_gateway([(r"/items/", _app())]) as gateway:
+            runner = LoadTestRunner(
+                [Scenario("browse", browse, weight=3), Scenario("missing", missing)],
+                RampProfile.parse("200ms:3,300ms:3"),
+                gateway,
+                jobs=[PeriodicJob("tick", job, interval=0.1)],
+                think_time=(0.01, 0.02),
+                tick=0.02,
+            )
+            report = await runner.run()
+
+        items = report.endpoint("GET /items/{id}")
+        assert items.requests > 10
+        assert 0 < items.errors < items.requests
+        assert items.error_kinds.keys() == {"HTTP 404"}
+        assert items.p50 <= items.p95 <= items.p99 <= items.max
+        assert report.endpoint("scenario: browse").kind == "scenario"
+        assert report.endpoint("job: tick").requests == len(jobs_run) > 0
+        # Totals count HTTP requests, not scenario or job runs
+        assert report.total_requests == items.requests
+        assert report.peak_users == 3
+        assert any(line.startswith("GET /items/{id}") for line in format_report(report))
+
+    @pytest.mark.asyncio
+    async def test_failing_scenarios_are_recorded_not_raised(self):
+        async def broken(user):
+            raise RuntimeError("boom")
+
+        async with asgi_gateway([(r"/", _app())]) as gateway:
+            runner = LoadTestRunner(
+                [Scenario("broken", broken)],
+                RampProfile.constant(users=1, duration=0.1),
+                gateway,
+                think_time=(0.01, 0.01),
+                tick=0.02,
+            )
+            report = await runner.run()
+
+        broken_stats = report.endpoint("scenario: broken")
+        assert broken_stats.errors == broken_stats.requests > 0
+        assert broken_stats.error_kinds.keys() == {"RuntimeError"}
@@ -7,6 +7,10 @@ Provides centralized, structured logging with:
 - Automatic correlation ID tracking across requests
 - Context propagation (winery_id, user_id, etc.)
 - Performance timing utilities
+- Per-event sampling, rate limiting and batch summaries for hot paths
+- Optional queue-backed sink (render/write off the event loop)
+- In-process metrics registry (latency histograms, SQL per request, pool)
+- Event loop lag sampler and blocked-loop detector (stack of the offender)
 
 Usage:
     from src.shared.wine_fermentator_logging import get_logger, LogTimer, configure_logging
@@ -21,6 +25,13 @@ Usage:
     # Time operations
     with LogTimer(logger, "operation_name"):
         result = expensive_function()
+    
+    # Collapse per-row logs of a bulk operation into one summary event
+    with log_batch(logger, "etl_import", winery_id=winery_id):
+        import_rows()
+    
+    # Drain the async sink on shutdown
+    shutdown_logging()
 
 Related ADRs:
 - ADR-027: Structured Logging & Observability Infrastructure
@@ -32,6 +43,22 @@ from .logger import (
     LogTimer,
     sanitize_log_data,
 )
+from .metrics import (
+    MetricsMiddleware,
+    get_metrics_registry,
+    instrument_engine,
+    track_queries,
+)
+from .loop_monitor import EventLoopMonitor
+from .sampling import (
+    LogSampler,
+    log_batch,
+)
+from .sink import (
+    QueueLogSink,
+    get_log_sink,
+    shutdown_logging,
+)
 
 # Conditional import of middleware (requires FastAPI)
 try:
@@ -54,6 +81,16 @@ __all__ = [
     "get_logger",
     "LogTimer",
     "sanitize_log_data",
+    "LogSampler",
+    "log_batch",
+    "QueueLogSink",
+    "get_log_sink",
+    "shutdown_logging",
+    "MetricsMiddleware",
+    "get_metrics_registry",
+    "instrument_engine",
+    "track_queries",
+    "EventLoopMonitor",
 ]
 
 # Add middleware to exports only if available
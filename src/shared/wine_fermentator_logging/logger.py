@@ -13,17 +13,26 @@ Key Features:
 - Context variables (winery_id, user_id) automatically included
 - Configurable log levels by environment
 - Thread-safe and async-compatible
+- Per-event sampling / rate limiting and batch summaries for hot paths
+  (see sampling.py)
+- Optional queue-backed sink: rendering and stdout writes happen on a
+  background thread instead of the event loop (see sink.py)
 
 Related ADR: ADR-027 (Structured Logging & Observability)
 """
 
 import structlog
 import logging
+import os
 import sys
 import time
-from typing import Optional
+from typing import Optional, TextIO
 from contextvars import ContextVar
 
+from .metrics import get_metrics_registry
+from .sampling import LogSampler, collect_batch_events, parse_event_config
+from .sink import QueueLogSink, QueueLoggerFactory, install_sink
+
 
 # Context variable for storing additional logging context
 # This allows automatic propagation of winery_id, user_id, etc.
@@ -34,6 +43,12 @@ def configure_logging(
     environment: str = "development",
     log_level: str = "INFO",
     json_logs: bool = None,
+    async_sink: bool = None,
+    sink_queue_size: int = None,
+    sink_overflow_policy: str = None,
+    sample_rates: Optional[dict] = None,
+    rate_limits: Optional[dict] = None,
+    stream: Optional[TextIO] = None,
 ) -> None:
     """
     Configure structlog for the entire application.
@@ -53,6 +68,22 @@ def configure_logging(
             - None: Auto-detect (JSON in production, console in dev)
             - True: Force JSON output
             - False: Force console output
+        async_sink: Write logs through a background QueueLogSink
+            - None: Auto-detect (LOG_ASYNC_SINK env var, else on in production)
+            - True: Render/write on a background thread (non-blocking)
+            - False: Render/write synchronously on the calling thread
+        sink_queue_size: Max pending records for the async sink
+            (default: LOG_SINK_QUEUE_SIZE env var or 10000)
+        sink_overflow_policy: "drop" or "block" when the sink queue is full
+            (default: LOG_SINK_OVERFLOW_POLICY env var or "drop").
+            Warnings and errors always wait briefly before being dropped.
+        sample_rates: Fraction of each event name to keep, e.g.
+            {"sample_created": 0.01} (default: LOG_SAMPLE_RATES env var).
+            Warnings and errors are never sampled.
+        rate_limits: Max events per second per event name, e.g.
+            {"request_started": 200} (default: LOG_RATE_LIMITS env var)
+        stream: Where log lines are written (default: sys.stdout at the
+            time of the call)
     
     Example:
         # In main.py or app startup
@@ -67,12 +98,38 @@ def configure_logging(
     Environment Variables:
         LOG_LEVEL: Override log level (DEBUG, INFO, WARNING, ERROR)
         LOG_FORMAT: Override format (json, console)
+        LOG_ASYNC_SINK: "true"/"false" to force the async sink on/off
+        LOG_SINK_QUEUE_SIZE: Async sink buffer size
+        LOG_SINK_OVERFLOW_POLICY: Async sink overflow policy (drop, block)
+        LOG_SAMPLE_RATES: "event=rate,..." (e.g. "sample_created=0.01")
+        LOG_RATE_LIMITS: "event=per_second,..." (e.g. "request_started=200")
     """
     
     # Auto-detect JSON output if not specified
     if json_logs is None:
         json_logs = environment == "production"
     
+    # Auto-detect async sink if not specified
+    if async_sink is None:
+        env_async = os.getenv("LOG_ASYNC_SINK")
+        if env_async is not None:
+            async_sink = env_async.lower() == "true"
+        else:
+            async_sink = environment == "production"
+    
+    renderer = (
+        structlog.processors.JSONRenderer() if json_logs
+        else structlog.dev.ConsoleRenderer(colors=True, pad_event_to=30)
+    )
+    
+    if sample_rates is None:
+        sample_rates = parse_event_config(os.getenv("LOG_SAMPLE_RATES"))
+    if rate_limits is None:
+        rate_limits = parse_event_config(os.getenv("LOG_RATE_LIMITS"))
+    sampler = LogSampler(sample_rates=sample_rates, rate_limits=rate_limits)
+    if stream is None:
+        stream = sys.stdout
+    
     # Build processor pipeline
     processors = [
         # Merge context variables (correlation_id, winery_id, etc.)
@@ -81,20 +138,47 @@ def configure_logging(
         # Add log level to output
         structlog.stdlib.add_log_level,
         
+        # Volume control — runs before timestamping/rendering so dropped
+        # events cost as little as possible:
+        # count per-row events inside log_batch() blocks ...
+        collect_batch_events,
+    ]
+    
+    # ... and sample / rate-limit configured event names
+    if sampler.enabled:
+        processors.append(sampler)
+    
+    processors += [
         # Add timestamp in ISO 8601 format
         structlog.processors.TimeStamper(fmt="iso"),
         
         # Format stack info on exceptions
         structlog.processors.StackInfoRenderer(),
         
-        # Format exception info (traceback)
+        # Format exception info (traceback) — must run on the calling
+        # thread, while the exception is still being handled
         structlog.processors.format_exc_info,
-        
-        # Render as JSON (production) or colored console (development)
-        structlog.processors.JSONRenderer() if json_logs
-        else structlog.dev.ConsoleRenderer(colors=True, pad_event_to=30)
     ]
     
+    if async_sink:
+        # Renderer runs on the sink's writer thread; the pipeline ends with
+        # the event dict, which structlog passes to QueueLogger as kwargs.
+        sink = QueueLogSink(
+            renderer=renderer,
+            stream=stream,
+            max_queue_size=sink_queue_size
+            or int(os.getenv("LOG_SINK_QUEUE_SIZE", "10000")),
+            overflow_policy=sink_overflow_policy
+            or os.getenv("LOG_SINK_OVERFLOW_POLICY", "drop"),
+        )
+        install_sink(sink)
+        logger_factory = QueueLoggerFactory(sink)
+    else:
+        # Render as JSON (production) or colored console (development)
+        install_sink(None)
+        processors.append(renderer)
+        logger_factory = structlog.PrintLoggerFactory(file=stream)
+    
     # Configure structlog
     structlog.configure(
         processors=processors,
@@ -102,14 +186,14 @@ def configure_logging(
             logging.getLevelName(log_level.upper())
         ),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(file=sys.stdout),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
     
     # Also configure stdlib logging (for libraries that use it)
     logging.basicConfig(
         format="%(message)s",
-        stream=sys.stdout,
+        stream=stream,
         level=logging.getLevelName(log_level.upper()),
     )
 
@@ -164,7 +248,9 @@ class LogTimer:
     Context manager for logging operation execution time.
     
     Automatically logs when operation starts and completes (or fails),
-    including the duration in milliseconds.
+    including the duration in milliseconds. The duration is also recorded
+    in the ``operation_duration_seconds{operation,status}`` histogram of the
+    metrics registry (exposed on /metrics).
     
     Usage:
         from src.shared.wine_fermentator_logging import get_logger, LogTimer
@@ -197,6 +283,10 @@ class LogTimer:
         logger: The logger to use for timing logs
         operation: Name of the operation being timed
         log_start: Whether to log when operation starts (default: False)
+        level: Level of the completion event (default: "info"). Hot read
+            paths pass "debug": the duration still goes to the histogram,
+            and a disabled level costs no log event. Failures are always
+            logged as errors.
     """
     
     def __init__(
@@ -204,6 +294,7 @@ class LogTimer:
         logger: structlog.BoundLogger,
         operation: str,
         log_start: bool = False,
+        level: str = "info",
     ):
         """
         Initialize LogTimer.
@@ -212,11 +303,16 @@ class LogTimer:
             logger: Logger instance to use for timing logs
             operation: Name of the operation (e.g., "db_query", "validation")
             log_start: If True, log when operation starts (default: False)
+            level: Level of the completion event (default: "info")
         """
         self.logger = logger
         self.operation = operation
         self.log_start = log_start
+        self.level = level
         self.start_time: Optional[float] = None
+        self._histogram = get_metrics_registry().histogram(
+            "operation_duration_seconds", "LogTimer operation durations"
+        )
     
     def __enter__(self):
         """Start timing and optionally log operation start."""
@@ -236,11 +332,17 @@ class LogTimer:
             return
         
         # Calculate elapsed time in milliseconds
-        elapsed_ms = (time.perf_counter() - self.start_time) * 1000
+        elapsed = time.perf_counter() - self.start_time
+        elapsed_ms = elapsed * 1000
+        self._histogram.observe(
+            elapsed,
+            operation=self.operation,
+            status="success" if exc_type is None else "error",
+        )
         
         if exc_type is None:
             # Success: log completion
-            self.logger.info(
+            getattr(self.logger, self.level)(
                 f"{self.operation}_completed",
                 operation=self.operation,
                 duration_ms=round(elapsed_ms, 2),
@@ -0,0 +1,238 @@
+"""
+Event loop lag sampler and slow-callback detector for Wine Fermentation System.
+
+CPU-bound work run directly on the event loop (pandas parsing, bcrypt,
+Python-side aggregation) stalls every other request of the process. This
+module makes those stalls visible:
+
+- A sampler task sleeps for a fixed interval and records how late it wakes
+  up (``event_loop_lag_seconds`` histogram; p50/p95/p99 in ``/metrics``)
+- A watchdog thread notices when the sampler has not run for longer than
+  the slow-callback threshold and logs ``event_loop_blocked`` with the
+  stack of the code holding the loop and the task it belongs to
+- When the loop catches up, ``event_loop_recovered`` reports how long the
+  stall lasted
+
+The stack is read from the loop thread while it is still blocked, so it
+points at the offending call rather than at whatever runs afterwards.
+Code that holds the GIL in a C extension delays the watchdog until the
+GIL is released; the stack is then captured as soon as possible.
+
+Usage:
+    from src.shared.wine_fermentator_logging.loop_monitor import EventLoopMonitor
+
+    # In the FastAPI lifespan
+    loop_monitor = EventLoopMonitor.from_env()
+    loop_monitor.start()
+    yield
+    await loop_monitor.stop()
+
+Environment Variables:
+    EVENT_LOOP_MONITOR_ENABLED: "false" disables the monitor (default: true)
+    EVENT_LOOP_LAG_INTERVAL_MS: Sampling interval in milliseconds (default: 100)
+    EVENT_LOOP_SLOW_CALLBACK_MS: Blocking threshold in milliseconds (default: 250)
+
+Related ADR: ADR-027 (Structured Logging & Observability)
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+import structlog
+
+from .metrics import MetricsRegistry, get_metrics_registry
+
+# structlog.get_logger directly, like metrics.py (logger.py imports metrics)
+logger = structlog.get_logger(__name__)
+
+# Lag is usually sub-millisecond; the upper buckets catch real stalls
+LAG_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+# Innermost frames kept in the ``event_loop_blocked`` stack
+STACK_LIMIT = 30
+
+
+class EventLoopMonitor:
+    """
+    Samples event loop lag and reports callbacks that block the loop.
+
+    Attributes:
+        interval_seconds: Sampler sleep interval
+        slow_callback_seconds: Stall length reported as ``event_loop_blocked``
+        enabled: False makes start/stop no-ops
+        blocked_count: Stalls reported since start
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = 0.1,
+        slow_callback_seconds: float = 0.25,
+        registry: Optional[MetricsRegistry] = None,
+        enabled: bool = True,
+    ):
+        """
+        Args:
+            interval_seconds: Sampler sleep interval (must be > 0)
+            slow_callback_seconds: Blocking threshold (must be > 0)
+            registry: Registry to record into (default: process-wide)
+            enabled: False disables the monitor
+
+        Raises:
+            ValueError: If interval_seconds or slow_callback_seconds is not positive
+        """
+        if interval_seconds <= 0:
+            raise ValueError(f"interval_seconds must be positive, got {interval_seconds}")
+        if slow_callback_seconds <= 0:
+            raise ValueError(
+                f"slow_callback_seconds must be positive, got {slow_callback_seconds}"
+            )
+        self.interval_seconds = interval_seconds
+        self.slow_callback_seconds = slow_callback_seconds
+        self.enabled = enabled
+        self.blocked_count = 0
+
+        registry = registry or get_metrics_registry()
+        self._lag = registry.histogram(
+            "event_loop_lag_seconds",
+            "Delay between when the loop lag sampler should and did wake up",
+            LAG_BUCKETS,
+        )
+        self._blocked = registry.counter(
+            "event_loop_blocked_total",
+            "Stalls where a callback held the event loop past the slow callback threshold",
+        )
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._sampler: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        # Written by the sampler, read by the watchdog (float stores are atomic)
+        self._heartbeat = 0.0
+        self._reported_heartbeat = -1.0
+
+    @classmethod
+    def from_env(cls, registry: Optional[MetricsRegistry] = None) -> "EventLoopMonitor":
+        """Build a monitor configured from EVENT_LOOP_* environment variables."""
+        return cls(
+            interval_seconds=float(os.getenv("EVENT_LOOP_LAG_INTERVAL_MS", "100")) / 1000.0,
+            slow_callback_seconds=float(os.getenv("EVENT_LOOP_SLOW_CALLBACK_MS", "250"))
+            / 1000.0,
+            registry=registry,
+            enabled=os.getenv("EVENT_LOOP_MONITOR_ENABLED", "true").lower() != "false",
+        )
+
+    @property
+    def running(self) -> bool:
+        return self._sampler is not None and not self._sampler.done()
+
+    def lag_percentile(self, q: float) -> Optional[float]:
+        """Estimated q-th percentile (0-100) of loop lag in seconds, or None."""
+        return self._lag.percentile(q)
+
+    def start(self) -> None:
+        """
+        Start sampling the running loop. Must be called from the loop thread.
+
+        Idempotent: starting a running monitor is a no-op.
+        """
+        if not self.enabled or self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stopping.clear()
+        self._heartbeat = time.monotonic()
+        self._sampler = self._loop.create_task(
+            self._sample(), name="event_loop_lag_sampler"
+        )
+        self._watchdog = threading.Thread(
+            target=self._watch, name="event-loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+        logger.info(
+            "event_loop_monitor_started",
+            interval_ms=round(self.interval_seconds * 1000, 2),
+            slow_callback_ms=round(self.slow_callback_seconds * 1000, 2),
+        )
+
+    async def stop(self) -> None:
+        """Stop the sampler and the watchdog thread."""
+        if self._sampler is None:
+            return
+        self._stopping.set()
+        self._sampler.cancel()
+        try:
+            await self._sampler
+        except asyncio.CancelledError:
+            pass
+        self._sampler = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=self.interval_seconds + 1.0)
+            self._watchdog = None
+        p50, p99 = self.lag_percentile(50), self.lag_percentile(99)
+        logger.info(
+            "event_loop_monitor_stopped",
+            lag_p50_ms=round(p50 * 1000, 3) if p50 is not None else None,
+            lag_p99_ms=round(p99 * 1000, 3) if p99 is not None else None,
+            blocked_count=self.blocked_count,
+        )
+
+    # ─── Sampler (loop thread) ──────────────────────────────────────────────
+
+    async def _sample(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval_seconds
+            await asyncio.sleep(self.interval_seconds)
+            lag = max(0.0, loop.time() - expected)
+            self._lag.observe(lag)
+            stalled = self._reported_heartbeat == self._heartbeat
+            self._heartbeat = time.monotonic()
+            if stalled:
+                logger.warning(
+                    "event_loop_recovered",
+                    lag_ms=round(lag * 1000, 2),
+                    threshold_ms=round(self.slow_callback_seconds * 1000, 2),
+                )
+
+    # ─── Watchdog (background thread) ───────────────────────────────────────
+
+    def _watch(self) -> None:
+        # The sampler is due every interval; anything beyond that is lag
+        deadline = self.interval_seconds + self.slow_callback_seconds
+        check_every = min(self.interval_seconds, self.slow_callback_seconds / 2)
+        while not self._stopping.wait(check_every):
+            heartbeat = self._heartbeat
+            if heartbeat == self._reported_heartbeat:
+                continue  # this stall was already reported
+            blocked_for = time.monotonic() - heartbeat
+            if blocked_for >= deadline:
+                self._reported_heartbeat = heartbeat
+                self._report_blocked(blocked_for - self.interval_seconds)
+
+    def _report_blocked(self, blocked_seconds: float) -> None:
+        self.blocked_count += 1
+        self._blocked.inc()
+        task = asyncio.current_task(self._loop) if self._loop is not None else None
+        coro = task.get_coro() if task is not None else None
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = (
+            "".join(traceback.format_list(traceback.extract_stack(frame, limit=STACK_LIMIT)))
+            if frame is not None
+            else None
+        )
+        logger.warning(
+            "event_loop_blocked",
+            blocked_ms=round(blocked_seconds * 1000, 2),
+            threshold_ms=round(self.slow_callback_seconds * 1000, 2),
+            task=task.get_name() if task is not None else None,
+            coroutine=getattr(coro, "__qualname__", None),
+            stack=stack,
+        )
@@ -0,0 +1,512 @@
+"""
+In-process metrics registry for Wine Fermentation System.
+
+Aggregates what LogTimer and LoggingMiddleware only log line by line:
+- Per-route HTTP latency histograms (MetricsMiddleware)
+- Per-request SQL statement count and DB time (SQLAlchemy engine events)
+- Slow query counter + ``slow_query`` warning log
+- Connection pool utilization gauges
+- LogTimer operation durations (operation_duration_seconds)
+
+Exposed in Prometheus text format (or JSON) by ``GET /metrics``
+(see ``src.shared.api.metrics_router``). No external dependency: each
+service process keeps its own registry.
+
+Usage:
+    from src.shared.wine_fermentator_logging.metrics import (
+        MetricsMiddleware,
+        instrument_engine,
+    )
+
+    instrument_engine(engine)             # once per engine
+    app.add_middleware(MetricsMiddleware) # per-route latency + SQL per request
+
+Environment Variables:
+    DB_SLOW_QUERY_MS: Slow query threshold in milliseconds (default: 200)
+
+Related ADR: ADR-027 (Structured Logging & Observability)
+"""
+
+import bisect
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import structlog
+
+# structlog.get_logger directly (same as logger.get_logger): logger.py imports
+# this module for LogTimer, so importing it back would be circular.
+logger = structlog.get_logger(__name__)
+
+
+# Default bucket boundaries
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+COUNT_BUCKETS: Tuple[float, ...] = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    items = list(key) + ([extra] if extra else [])
+    if not items:
+        return ""
+    body = ",".join(
+        '{}="{}"'.format(k, v.replace("\\", "\\\\").replace('"', '\\"'))
+        for k, v in items
+    )
+    return "{" + body + "}"
+
+
+class _HistogramSeries:
+    """Bucket counts for one label combination."""
+
+    __slots__ = ("bucket_counts", "count", "sum")
+
+    def __init__(self, n_buckets: int):
+        self.bucket_counts = [0] * (n_buckets + 1)  # last = +Inf
+        self.count = 0
+        self.sum = 0.0
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram family (one series per label combination).
+
+    Percentiles are estimated from bucket counts by linear interpolation.
+    """
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float]):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelKey, _HistogramSeries] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        """Record one observation."""
+        key = _label_key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _HistogramSeries(len(self.buckets))
+            series.bucket_counts[index] += 1
+            series.count += 1
+            series.sum += value
+
+    def percentile(self, q: float, **labels) -> Optional[float]:
+        """
+        Estimate the q-th percentile (0-100) for one label combination.
+
+        Returns:
+            Estimated value, or None if nothing was observed
+        """
+        with self._lock:
+            series = self._series.get(_label_key(labels))
+            if series is None or series.count == 0:
+                return None
+            counts = list(series.bucket_counts)
+            total = series.count
+        return self._estimate(counts, total, q)
+
+    def _estimate(self, counts: List[int], total: int, q: float) -> float:
+        rank = total * q / 100.0
+        cumulative = 0
+        for i, bucket_count in enumerate(counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else lower
+                fraction = (rank - cumulative) / bucket_count
+                return lower + (upper - lower) * fraction
+            cumulative += bucket_count
+        return self.buckets[-1]
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = [
+                (key, list(s.bucket_counts), s.count, s.sum)
+                for key, s in self._series.items()
+            ]
+        for key, counts, count, total in sorted(items):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(key, ('le', le))} {cumulative}"
+                )
+            lines.append(f"{self.name}_count{_format_labels(key)} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {total}")
+        return lines
+
+    def snapshot(self) -> List[dict]:
+        with self._lock:
+            items = [
+                (key, list(s.bucket_counts), s.count, s.sum)
+                for key, s in self._series.items()
+            ]
+        result = []
+        for key, counts, count, total in sorted(items):
+            result.append(
+                {
+                    "labels": dict(key),
+                    "count": count,
+                    "sum": round(total, 6),
+                    "p50": self._estimate(counts, count, 50),
+                    "p95": self._estimate(counts, count, 95),
+                    "p99": self._estimate(counts, count, 99),
+                }
+            )
+        return result
+
+
+class Counter:
+    """Monotonic counter family."""
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(_label_key(labels), 0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        lines += [f"{self.name}{_format_labels(k)} {v}" for k, v in items]
+        return lines
+
+    def snapshot(self) -> List[dict]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [{"labels": dict(k), "value": v} for k, v in items]
+
+
+GaugeCollector = Callable[[], Dict[LabelKey, float]]
+
+
+class Gauge:
+    """Gauge family whose values are read from a collector at render time."""
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._collectors: List[GaugeCollector] = []
+
+    def add_collector(self, collector: GaugeCollector) -> None:
+        self._collectors.append(collector)
+
+    def _collect(self) -> Dict[LabelKey, float]:
+        values: Dict[LabelKey, float] = {}
+        for collector in list(self._collectors):
+            try:
+                values.update(collector())
+            except Exception:
+                continue
+        return values
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge"]
+        lines += [
+            f"{self.name}{_format_labels(k)} {v}"
+            for k, v in sorted(self._collect().items())
+        ]
+        return lines
+
+    def snapshot(self) -> List[dict]:
+        return [
+            {"labels": dict(k), "value": v} for k, v in sorted(self._collect().items())
+        ]
+
+
+class MetricsRegistry:
+    """Named collection of histograms, counters and gauges."""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, name: str, factory: Callable[[], object]):
+        # Lock-free hit: metrics are looked up on every LogTimer
+        metric = self._metrics.get(name)
+        if metric is not None:
+            return metric
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = factory()
+            return metric
+
+    def histogram(
+        self, name: str, help_text: str = "", buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._get_or_create(name, lambda: Histogram(name, help_text, buckets))
+
+    def counter(self, name: str, help_text: str = "") -> Counter:
+        return self._get_or_create(name, lambda: Counter(name, help_text))
+
+    def gauge(self, name: str, help_text: str = "") -> Gauge:
+        return self._get_or_create(name, lambda: Gauge(name, help_text))
+
+    def get(self, name: str):
+        """Return a metric by name, or None."""
+        return self._metrics.get(name)
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in Prometheus text exposition format."""
+        lines: List[str] = []
+        for name in sorted(self._metrics):
+            lines += self._metrics[name].render()
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, List[dict]]:
+        """Return all metrics as plain dicts (histograms include p50/p95/p99)."""
+        return {name: self._metrics[name].snapshot() for name in sorted(self._metrics)}
+
+    def reset(self) -> None:
+        """Drop all metrics (tests)."""
+        with self._lock:
+            self._metrics.clear()
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Return the process-wide metrics registry."""
+    return _registry
+
+
+# =============================================================================
+# Per-request query statistics
+# =============================================================================
+
+@dataclass
+class QueryStats:
+    """SQL statements executed within one request/operation."""
+
+    statements: int = 0
+    duration_seconds: float = 0.0
+
+
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Count SQL statements executed by instrumented engines inside the block.
+
+    Works across awaits (context variables propagate into SQLAlchemy's
+    async engine events).
+
+    Yields:
+        QueryStats updated live as statements run
+    """
+    stats = QueryStats()
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+# =============================================================================
+# SQLAlchemy engine instrumentation
+# =============================================================================
+
+_instrumented_engines: "weakref.WeakSet" = weakref.WeakSet()
+
+
+def _slow_query_threshold_seconds() -> float:
+    return float(os.getenv("DB_SLOW_QUERY_MS", "200")) / 1000.0
+
+
+def instrument_engine(
+    engine,
+    name: str = "default",
+    registry: Optional[MetricsRegistry] = None,
+    slow_query_seconds: Optional[float] = None,
+) -> None:
+    """
+    Attach query timing and pool metrics to a SQLAlchemy (async) engine.
+
+    Idempotent: instrumenting the same engine twice is a no-op.
+
+    Records:
+        db_query_duration_seconds{engine}  histogram
+        db_slow_queries_total{engine}      counter (+ ``slow_query`` warning log)
+        db_pool_connections{engine,state}  gauge (size/checked_out/overflow/idle)
+
+    Args:
+        engine: AsyncEngine or Engine
+        name: Label value identifying the engine/pool
+        registry: Registry to record into (default: process-wide)
+        slow_query_seconds: Slow query threshold (default: DB_SLOW_QUERY_MS)
+    """
+    from sqlalchemy import event
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if sync_engine in _instrumented_engines:
+        return
+    _instrumented_engines.add(sync_engine)
+
+    registry = registry or _registry
+    threshold = (
+        slow_query_seconds
+        if slow_query_seconds is not None
+        else _slow_query_threshold_seconds()
+    )
+    query_duration = registry.histogram(
+        "db_query_duration_seconds", "SQL statement execution time"
+    )
+    slow_queries = registry.counter(
+        "db_slow_queries_total", "SQL statements slower than the slow query threshold"
+    )
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("_query_start")
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        query_duration.observe(elapsed, engine=name)
+
+        stats = _query_stats.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.duration_seconds += elapsed
+
+        if elapsed >= threshold:
+            slow_queries.inc(engine=name)
+            logger.warning(
+                "slow_query",
+                engine=name,
+                duration_ms=round(elapsed * 1000, 2),
+                statement=statement[:500],
+            )
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _on_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None:
+            starts = conn.info.get("_query_start")
+            if starts:
+                starts.pop()
+
+    pool_ref = weakref.ref(sync_engine.pool)
+
+    def _collect_pool() -> Dict[LabelKey, float]:
+        pool = pool_ref()
+        if pool is None:
+            return {}
+        values: Dict[LabelKey, float] = {}
+        for state, attr in (
+            ("size", "size"),
+            ("checked_out", "checkedout"),
+            ("overflow", "overflow"),
+            ("idle", "checkedin"),
+        ):
+            method = getattr(pool, attr, None)
+            if callable(method):
+                values[_label_key({"engine": name, "state": state})] = method()
+        return values
+
+    registry.gauge(
+        "db_pool_connections", "Connection pool utilization by state"
+    ).add_collector(_collect_pool)
+
+
+# =============================================================================
+# ASGI middleware
+# =============================================================================
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording per-route latency and SQL per request.
+
+    The route label is the matched route template (``/fermentations/{id}``),
+    not the raw path, so cardinality stays bounded. Unmatched requests are
+    grouped under ``"unmatched"``.
+
+    Records:
+        http_request_duration_seconds{method,route,status}
+        db_statements_per_request{route}
+        db_time_per_request_seconds{route}
+    """
+
+    def __init__(
+        self,
+        app,
+        registry: Optional[MetricsRegistry] = None,
+        exclude_paths: Optional[List[str]] = None,
+    ):
+        self.app = app
+        self.registry = registry or _registry
+        self.exclude_paths = frozenset(
+            exclude_paths or ["/metrics", "/health", "/healthz", "/docs", "/redoc", "/openapi.json"]
+        )
+        self._latency = self.registry.histogram(
+            "http_request_duration_seconds", "HTTP request latency by route"
+        )
+        self._statements = self.registry.histogram(
+            "db_statements_per_request", "SQL statements per HTTP request", COUNT_BUCKETS
+        )
+        self._db_time = self.registry.histogram(
+            "db_time_per_request_seconds", "Time spent in SQL per HTTP request"
+        )
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        with track_queries() as stats:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                elapsed = time.perf_counter() - start
+                route = scope.get("route")
+                route_path = getattr(route, "path", None) or "unmatched"
+                self._latency.observe(
+                    elapsed,
+                    method=scope["method"],
+                    route=route_path,
+                    status=status_code,
+                )
+                self._statements.observe(stats.statements, route=route_path)
+                self._db_time.observe(stats.duration_seconds, route=route_path)
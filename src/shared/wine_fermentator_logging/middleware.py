@@ -12,17 +12,18 @@ Features:
 - Adds X-Correlation-ID header to responses for debugging
 - Binds request metadata to context (method, path, client_host)
 
+Both middlewares are pure ASGI callables rather than BaseHTTPMiddleware
+subclasses, which avoids the per-request task and body stream overhead.
+
 Related ADR: ADR-027 (Structured Logging & Observability)
 """
 
 import os
 import uuid
 import time
-from typing import Callable
 import jwt
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers, MutableHeaders, QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import structlog
 
 from .logger import get_logger
@@ -30,10 +31,14 @@ from .logger import get_logger
 logger = get_logger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """
     Middleware to add correlation IDs and log all HTTP requests.
     
+    Implemented as a pure ASGI middleware (not ``BaseHTTPMiddleware``): it
+    wraps ``send`` to observe the response status and inject the header, so
+    there is no extra task, stream or response re-wrapping per request.
+    
     This middleware should be added to the FastAPI app during initialization.
     It provides:
     - Automatic correlation ID generation per request
@@ -57,7 +62,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
     
     What gets logged:
         - request_started: When request begins processing
-        - request_completed: When request finishes successfully
+        - request_completed: When the response has been sent
         - request_failed: When request errors (with exception info)
     
     What gets bound to context (available in ALL logs during request):
@@ -92,40 +97,39 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         Initialize logging middleware.
         
         Args:
-            app: The FastAPI application instance
+            app: The ASGI application to wrap
             exclude_paths: List of paths to exclude from logging
                           (e.g., ["/health", "/metrics"])
-                          Default: ["/health", "/docs", "/redoc", "/openapi.json"]
+                          Default: ["/health", "/metrics", "/docs", "/redoc", "/openapi.json"]
         """
-        super().__init__(app)
+        self.app = app
         
         # Default paths to exclude from logging (health checks, docs)
-        self.exclude_paths = exclude_paths or [
+        self.exclude_paths = frozenset(exclude_paths or [
             "/health",
             "/healthz",
+            "/metrics",
             "/docs",
             "/redoc",
             "/openapi.json",
-        ]
+        ])
     
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable,
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request with logging and correlation ID.
         
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in the chain
-        
-        Returns:
-            HTTP response with X-Correlation-ID header
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel (wrapped to add X-Correlation-ID)
         """
-        # Skip logging for excluded paths (health checks, docs)
-        if request.url.path in self.exclude_paths:
-            return await call_next(request)
+        # Only HTTP requests are logged; skip excluded paths (health, docs)
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        
+        path = scope["path"]
+        method = scope["method"]
         
         # Generate unique correlation ID for this request
         correlation_id = str(uuid.uuid4())
@@ -135,46 +139,39 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         structlog.contextvars.clear_contextvars()
         structlog.contextvars.bind_contextvars(
             correlation_id=correlation_id,
-            path=request.url.path,
-            method=request.method,
+            path=path,
+            method=method,
         )
         
         # Extract client information
-        client_host = None
-        if request.client:
-            client_host = request.client.host
+        client = scope.get("client")
+        client_host = client[0] if client else None
+        query_string = scope.get("query_string", b"")
         
         # Log request start
         start_time = time.perf_counter()
         logger.info(
             "request_started",
-            path=request.url.path,
-            method=request.method,
+            path=path,
+            method=method,
             client_host=client_host,
-            query_params=dict(request.query_params) if request.query_params else None,
+            query_params=dict(QueryParams(query_string)) if query_string else None,
         )
         
+        status_code = None
+        
+        async def send_with_correlation_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add correlation ID to response headers (useful for debugging)
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Correlation-ID", correlation_id)
+            await send(message)
+        
         # Process request
         try:
-            response = await call_next(request)
-            
-            # Calculate duration
-            duration_ms = (time.perf_counter() - start_time) * 1000
-            
-            # Log successful request completion
-            logger.info(
-                "request_completed",
-                path=request.url.path,
-                method=request.method,
-                status_code=response.status_code,
-                duration_ms=round(duration_ms, 2),
-            )
-            
-            # Add correlation ID to response headers (useful for debugging)
-            response.headers["X-Correlation-ID"] = correlation_id
-            
-            return response
-            
+            await self.app(scope, receive, send_with_correlation_id)
         except Exception as e:
             # Calculate duration even on error
             duration_ms = (time.perf_counter() - start_time) * 1000
@@ -182,8 +179,8 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             # Log failed request
             logger.error(
                 "request_failed",
-                path=request.url.path,
-                method=request.method,
+                path=path,
+                method=method,
                 error=str(e),
                 error_type=type(e).__name__,
                 duration_ms=round(duration_ms, 2),
@@ -192,9 +189,21 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             
             # Re-raise to let error handlers deal with it
             raise
+        
+        # Calculate duration
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        
+        # Log successful request completion
+        logger.info(
+            "request_completed",
+            path=path,
+            method=method,
+            status_code=status_code,
+            duration_ms=round(duration_ms, 2),
+        )
 
 
-class UserContextMiddleware(BaseHTTPMiddleware):
+class UserContextMiddleware:
     """
     Middleware to bind authenticated user context to structlog contextvars.
 
@@ -204,6 +213,9 @@ class UserContextMiddleware(BaseHTTPMiddleware):
     malformed token) is silently swallowed and the request continues
     unaffected.
 
+    Implemented as a pure ASGI middleware: it only reads the request
+    headers from the scope and never touches the response.
+
     This middleware must be registered *before* ``LoggingMiddleware`` with
     ``app.add_middleware`` so that Starlette's LIFO wrapping makes
     ``LoggingMiddleware`` the outermost layer (runs first, clears context,
@@ -226,11 +238,16 @@ class UserContextMiddleware(BaseHTTPMiddleware):
          "user_id": "42", "winery_id": "7", "user_role": "winemaker", ...}
     """
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable,
-    ) -> Response:
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize user context middleware.
+
+        Args:
+            app: The ASGI application to wrap
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Decode JWT from Authorization header and bind user context to logs.
 
@@ -238,31 +255,39 @@ class UserContextMiddleware(BaseHTTPMiddleware):
         malformed, expired, or signed with a different key.  Security
         enforcement is handled by the ``get_current_user`` dependency.
         """
-        auth_header = request.headers.get("Authorization", "")
-        if auth_header.startswith("Bearer "):
-            token = auth_header[len("Bearer "):]
-            try:
-                secret = os.environ.get("JWT_SECRET_KEY")
-                if not secret:
-                    # JWT_SECRET_KEY not configured — skip user-context binding.
-                    # Security enforcement is handled by the get_current_user dependency.
-                    return await call_next(request)
-                payload = jwt.decode(
-                    token,
-                    secret,
-                    algorithms=["HS256"],
-                )
-                structlog.contextvars.bind_contextvars(
-                    user_id=str(payload.get("sub", "")),
-                    winery_id=str(payload.get("winery_id", "")),
-                    user_role=payload.get("role", ""),
-                )
-            except Exception:
-                # Invalid, expired, or malformed token — skip silently.
-                # The auth dependency will reject the request if needed.
-                pass
+        if scope["type"] == "http":
+            self._bind_user_context(Headers(scope=scope).get("authorization", ""))
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _bind_user_context(auth_header: str) -> None:
+        """Bind user_id / winery_id / user_role from a Bearer token, if valid."""
+        if not auth_header.startswith("Bearer "):
+            return
 
-        return await call_next(request)
+        secret = os.environ.get("JWT_SECRET_KEY")
+        if not secret:
+            # JWT_SECRET_KEY not configured — skip user-context binding.
+            # Security enforcement is handled by the get_current_user dependency.
+            return
+
+        token = auth_header[len("Bearer "):]
+        try:
+            payload = jwt.decode(
+                token,
+                secret,
+                algorithms=["HS256"],
+            )
+            structlog.contextvars.bind_contextvars(
+                user_id=str(payload.get("sub", "")),
+                winery_id=str(payload.get("winery_id", "")),
+                user_role=payload.get("role", ""),
+            )
+        except Exception:
+            # Invalid, expired, or malformed token — skip silently.
+            # The auth dependency will reject the request if needed.
+            pass
 
 
 # Helper function for manual correlation ID management
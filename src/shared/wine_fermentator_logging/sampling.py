@@ -0,0 +1,247 @@
+"""
+Log volume control for hot paths: per-event sampling, rate limiting and
+batch summaries.
+
+Provides two structlog processors that ``configure_logging`` installs:
+
+- ``LogSampler``: keeps a configurable fraction of an event
+  (e.g. 1% of ``sample_created``) and/or caps it at N events per second.
+  Warnings and errors are never sampled.
+- ``collect_batch_events``: while a ``log_batch`` block is active, routine
+  (debug/info) events are counted instead of emitted, and a single summary
+  event is logged when the block exits.
+
+Usage:
+    from src.shared.wine_fermentator_logging import get_logger, log_batch
+
+    logger = get_logger(__name__)
+
+    with log_batch(logger, "etl_import", winery_id=7):
+        for row in rows:
+            await sample_repo.create(sample)   # per-row logs are counted
+
+    # Logs once:
+    # {"event": "etl_import_batch_summary", "winery_id": 7,
+    #  "event_counts": {"sample_created": 3000, ...}, "duration_ms": 812.4}
+
+Environment Variables:
+    LOG_SAMPLE_RATES: "event=rate,..." e.g. "sample_created=0.01,creating_sample=0"
+    LOG_RATE_LIMITS: "event=per_second,..." e.g. "request_started=200"
+
+Related ADR: ADR-027 (Structured Logging & Observability)
+"""
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+import structlog
+
+
+# Levels that always pass through sampling and batching
+_ALWAYS_KEEP_LEVELS = frozenset({"warning", "error", "critical", "exception"})
+
+
+def parse_event_config(raw: Optional[str]) -> Dict[str, float]:
+    """
+    Parse an "event=value,event=value" string into a dict.
+
+    Malformed entries are ignored so a bad env var never breaks startup.
+
+    Args:
+        raw: Config string (e.g. from an environment variable)
+
+    Returns:
+        Mapping of event name to numeric value
+    """
+    config: Dict[str, float] = {}
+    if not raw:
+        return config
+    for item in raw.split(","):
+        name, sep, value = item.partition("=")
+        if not sep:
+            continue
+        try:
+            config[name.strip()] = float(value)
+        except ValueError:
+            continue
+    return config
+
+
+class _TokenBucket:
+    """Per-event token bucket (capacity = one second's worth of events)."""
+
+    __slots__ = ("rate", "tokens", "updated_at")
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated_at = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class LogSampler:
+    """
+    structlog processor that samples and rate-limits events by name.
+
+    Must run after ``add_log_level`` (it reads ``event_dict["level"]``).
+    Kept events that were subject to sampling get a ``sample_rate`` field so
+    log aggregators can re-weight counts.
+
+    Attributes:
+        sample_rates: event name → fraction kept (0.0 - 1.0)
+        rate_limits: event name → max events per second
+        dropped: event name → number of events dropped so far
+    """
+
+    def __init__(
+        self,
+        sample_rates: Optional[Dict[str, float]] = None,
+        rate_limits: Optional[Dict[str, float]] = None,
+        default_sample_rate: float = 1.0,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Initialize sampler.
+
+        Args:
+            sample_rates: Fraction of each event to keep (missing → default)
+            rate_limits: Max events per second for each event (missing → unlimited)
+            default_sample_rate: Fraction kept for events not in sample_rates
+            rng: Random source (injectable for deterministic tests)
+        """
+        self.sample_rates = dict(sample_rates or {})
+        self.rate_limits = dict(rate_limits or {})
+        self.default_sample_rate = default_sample_rate
+        self.dropped: Dict[str, int] = {}
+        self._random = (rng or random.Random()).random
+        self._buckets = {
+            name: _TokenBucket(rate) for name, rate in self.rate_limits.items()
+        }
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """True if any sampling or rate limiting is configured."""
+        return bool(
+            self.sample_rates or self.rate_limits or self.default_sample_rate < 1.0
+        )
+
+    def __call__(self, logger, method_name: str, event_dict: dict) -> dict:
+        """Drop the event (raise DropEvent) if it is sampled out or over its limit."""
+        if event_dict.get("level", method_name) in _ALWAYS_KEEP_LEVELS:
+            return event_dict
+
+        event = event_dict.get("event")
+        rate = self.sample_rates.get(event, self.default_sample_rate)
+        if rate < 1.0:
+            if rate <= 0.0 or self._random() >= rate:
+                self._count_drop(event)
+                raise structlog.DropEvent
+            event_dict["sample_rate"] = rate
+
+        bucket = self._buckets.get(event)
+        if bucket is not None:
+            with self._lock:
+                allowed = bucket.take()
+            if not allowed:
+                self._count_drop(event)
+                raise structlog.DropEvent
+
+        return event_dict
+
+    def _count_drop(self, event: str) -> None:
+        with self._lock:
+            self.dropped[event] = self.dropped.get(event, 0) + 1
+
+
+class _Batch:
+    """Counters for one active log_batch block."""
+
+    __slots__ = ("event_counts",)
+
+    def __init__(self):
+        self.event_counts: Dict[str, int] = {}
+
+
+_active_batch: ContextVar[Optional[_Batch]] = ContextVar("log_batch", default=None)
+
+
+def collect_batch_events(logger, method_name: str, event_dict: dict) -> dict:
+    """
+    structlog processor: count routine events inside an active log_batch.
+
+    Must run after ``add_log_level``. Warnings and errors are always emitted.
+    """
+    batch = _active_batch.get()
+    if batch is None or event_dict.get("level", method_name) in _ALWAYS_KEEP_LEVELS:
+        return event_dict
+
+    event = event_dict.get("event")
+    batch.event_counts[event] = batch.event_counts.get(event, 0) + 1
+    raise structlog.DropEvent
+
+
+@contextmanager
+def log_batch(logger, operation: str, **context) -> Iterator[Dict[str, int]]:
+    """
+    Collapse routine per-item logs of a bulk operation into one summary event.
+
+    Inside the block, debug/info events from any logger running in the same
+    context (including awaited coroutines) are counted by event name instead
+    of being emitted. On exit a single ``{operation}_batch_summary`` event
+    is logged (``{operation}_batch_failed`` at error level on exception).
+    Nested blocks roll their counts up into the outer block.
+
+    Args:
+        logger: Logger used to emit the summary
+        operation: Name of the bulk operation (e.g. "etl_import")
+        **context: Extra fields for the summary event
+
+    Yields:
+        Live dict of event name → count (useful for tests/diagnostics)
+    """
+    outer = _active_batch.get()
+    batch = _Batch()
+    token = _active_batch.set(batch)
+    start = time.perf_counter()
+    failed = None
+    try:
+        yield batch.event_counts
+    except BaseException as e:
+        failed = e
+        raise
+    finally:
+        _active_batch.reset(token)
+        duration_ms = round((time.perf_counter() - start) * 1000, 2)
+        if outer is not None:
+            for event, count in batch.event_counts.items():
+                outer.event_counts[event] = outer.event_counts.get(event, 0) + count
+        if failed is None:
+            logger.info(
+                f"{operation}_batch_summary",
+                operation=operation,
+                event_counts=dict(batch.event_counts),
+                duration_ms=duration_ms,
+                **context,
+            )
+        else:
+            logger.error(
+                f"{operation}_batch_failed",
+                operation=operation,
+                event_counts=dict(batch.event_counts),
+                duration_ms=duration_ms,
+                error_type=type(failed).__name__,
+                **context,
+            )
@@ -0,0 +1,350 @@
+"""
+Queue-backed log sink for Wine Fermentation System.
+
+Moves log serialization and stdout writes off the event loop:
+- Request handlers only enqueue the already-processed event dict
+- A single background thread renders (JSON/console) and writes in batches
+- Bounded buffering with an explicit overflow policy (drop or block)
+- Dropped records are counted and reported as a summary event
+
+The sink plugs into structlog as a logger factory. The pipeline built by
+``configure_logging`` omits the renderer when the sink is enabled, so the
+last processor returns the event dict and structlog passes it as keyword
+arguments to ``QueueLogger``. The renderer is applied on the writer thread.
+
+Related ADR: ADR-027 (Structured Logging & Observability)
+"""
+
+import atexit
+import queue
+import sys
+import threading
+import time
+from typing import Any, Callable, List, Optional, TextIO
+
+
+# Overflow policies
+DROP = "drop"
+BLOCK = "block"
+
+# Levels that are never dropped silently: the producer blocks (up to
+# block_timeout) instead, because losing errors defeats the purpose of logs.
+_PRIORITY_LEVELS = frozenset({"warning", "error", "critical", "exception"})
+
+_STOP = object()
+
+Renderer = Callable[[Any, str, dict], Any]
+
+
+class QueueLogSink:
+    """
+    Bounded in-memory queue drained by a background writer thread.
+
+    Attributes:
+        max_queue_size: Maximum number of pending records
+        overflow_policy: ``"drop"`` (discard when full) or ``"block"``
+            (wait up to ``block_timeout`` seconds, then discard)
+        block_timeout: Seconds a producer may wait when the queue is full
+        batch_size: Maximum records written per stream write/flush
+        dropped_count: Records discarded because the queue was full
+    """
+
+    def __init__(
+        self,
+        renderer: Renderer,
+        stream: Optional[TextIO] = None,
+        max_queue_size: int = 10000,
+        overflow_policy: str = DROP,
+        block_timeout: float = 0.1,
+        batch_size: int = 256,
+    ):
+        """
+        Initialize and start the sink.
+
+        Args:
+            renderer: structlog renderer (e.g. ``JSONRenderer()``) used on the
+                writer thread to turn event dicts into lines
+            stream: Output stream (default: ``sys.stdout``)
+            max_queue_size: Bound on pending records (must be > 0)
+            overflow_policy: ``"drop"`` or ``"block"``
+            block_timeout: Max seconds to wait for space when blocking
+            batch_size: Max records per write
+
+        Raises:
+            ValueError: If max_queue_size or overflow_policy is invalid
+        """
+        if max_queue_size <= 0:
+            raise ValueError(f"max_queue_size must be positive, got {max_queue_size}")
+        if overflow_policy not in (DROP, BLOCK):
+            raise ValueError(
+                f"overflow_policy must be '{DROP}' or '{BLOCK}', got {overflow_policy!r}"
+            )
+
+        self.renderer = renderer
+        self.stream = stream if stream is not None else sys.stdout
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+        self.batch_size = batch_size
+        self.dropped_count = 0
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._dropped_since_report = 0
+        self._drop_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run,
+            name="log-sink-writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # Producer side (called from the event loop / request threads)
+    # ------------------------------------------------------------------
+
+    def submit(self, method_name: str, event_dict: dict) -> bool:
+        """
+        Enqueue a processed event dict for rendering and writing.
+
+        Never raises and never blocks longer than ``block_timeout``.
+
+        Args:
+            method_name: structlog method name (info, error, ...)
+            event_dict: Fully processed event dict (renderer not applied)
+
+        Returns:
+            True if the record was accepted, False if it was dropped
+        """
+        if self._closed:
+            # After shutdown, write synchronously so late records are not lost.
+            self._write([self._render(method_name, event_dict)])
+            return True
+
+        item = (method_name, event_dict)
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            pass
+
+        if self.overflow_policy == BLOCK or method_name in _PRIORITY_LEVELS:
+            try:
+                self._queue.put(item, timeout=self.block_timeout)
+                return True
+            except queue.Full:
+                pass
+
+        with self._drop_lock:
+            self.dropped_count += 1
+            self._dropped_since_report += 1
+        return False
+
+    @property
+    def pending(self) -> int:
+        """Approximate number of records waiting to be written."""
+        return self._queue.qsize()
+
+    # ------------------------------------------------------------------
+    # Writer side (background thread)
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        """Drain the queue in batches until the stop sentinel arrives."""
+        while True:
+            item = self._queue.get()
+            batch: List[Any] = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            lines: List[str] = []
+            for entry in batch:
+                if entry is _STOP:
+                    stop = True
+                    continue
+                line = self._render(*entry)
+                if line is not None:
+                    lines.append(line)
+
+            dropped_line = self._render_drop_report()
+            if dropped_line is not None:
+                lines.append(dropped_line)
+
+            self._write(lines)
+
+            for _ in batch:
+                self._queue.task_done()
+
+            if stop:
+                return
+
+    def _render(self, method_name: str, event_dict: dict) -> Optional[str]:
+        """Render one record; rendering errors must not kill the writer."""
+        try:
+            rendered = self.renderer(None, method_name, event_dict)
+        except Exception as e:
+            rendered = (
+                f'{{"event": "log_render_failed", "level": "error", '
+                f'"error_type": "{type(e).__name__}"}}'
+            )
+        if isinstance(rendered, bytes):
+            rendered = rendered.decode("utf-8", errors="replace")
+        return rendered
+
+    def _render_drop_report(self) -> Optional[str]:
+        """Emit a summary line for records dropped since the last report."""
+        with self._drop_lock:
+            dropped = self._dropped_since_report
+            self._dropped_since_report = 0
+        if not dropped:
+            return None
+        return self._render(
+            "warning",
+            {
+                "event": "log_records_dropped",
+                "level": "warning",
+                "dropped": dropped,
+                "dropped_total": self.dropped_count,
+                "max_queue_size": self.max_queue_size,
+            },
+        )
+
+    def _write(self, lines: List[str]) -> None:
+        """Write a batch of lines with a single write/flush."""
+        if not lines:
+            return
+        try:
+            self.stream.write("\n".join(lines) + "\n")
+            self.stream.flush()
+        except Exception:
+            # Stream closed (interpreter shutdown) — nothing sensible to do.
+            pass
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until all records enqueued so far have been written.
+
+        Args:
+            timeout: Max seconds to wait
+
+        Returns:
+            True if the queue drained within the timeout
+        """
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.005)
+        return not self._queue.unfinished_tasks
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Stop accepting records, drain the queue and stop the writer thread.
+
+        Safe to call more than once. Records submitted afterwards are
+        written synchronously.
+
+        Args:
+            timeout: Max seconds to wait for the writer to finish
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout=timeout)
+
+
+def _sink_method(method_name: str) -> Callable[..., None]:
+    """Build a QueueLogger level method that submits to the sink."""
+
+    def method(self: "QueueLogger", **event_dict: Any) -> None:
+        self._sink.submit(method_name, event_dict)
+
+    method.__name__ = method_name
+    return method
+
+
+class QueueLogger:
+    """
+    structlog-compatible logger that forwards event dicts to a QueueLogSink.
+
+    Every level method accepts the processed event dict as keyword
+    arguments (the return value of the last processor).
+    """
+
+    def __init__(self, sink: QueueLogSink):
+        self._sink = sink
+
+    msg = _sink_method("info")
+    log = _sink_method("info")
+    debug = _sink_method("debug")
+    info = _sink_method("info")
+    warn = _sink_method("warning")
+    warning = _sink_method("warning")
+    error = _sink_method("error")
+    err = _sink_method("error")
+    exception = _sink_method("exception")
+    critical = _sink_method("critical")
+    fatal = _sink_method("critical")
+    failure = _sink_method("error")
+
+
+class QueueLoggerFactory:
+    """structlog logger factory producing QueueLoggers bound to one sink."""
+
+    def __init__(self, sink: QueueLogSink):
+        self.sink = sink
+
+    def __call__(self, *args: Any) -> QueueLogger:
+        return QueueLogger(self.sink)
+
+
+# Process-wide active sink (set by configure_logging)
+_active_sink: Optional[QueueLogSink] = None
+
+
+def install_sink(sink: Optional[QueueLogSink]) -> None:
+    """
+    Make ``sink`` the process-wide active sink, closing the previous one.
+
+    Args:
+        sink: New sink, or None to disable
+    """
+    global _active_sink
+    previous = _active_sink
+    _active_sink = sink
+    if previous is not None and previous is not sink:
+        previous.close()
+
+
+def get_log_sink() -> Optional[QueueLogSink]:
+    """Return the active QueueLogSink, or None when logging is synchronous."""
+    return _active_sink
+
+
+def shutdown_logging(timeout: float = 5.0) -> None:
+    """
+    Drain and stop the active log sink (no-op when logging is synchronous).
+
+    Call from the application's shutdown hook so buffered records are not lost.
+
+    Args:
+        timeout: Max seconds to wait for pending records to be written
+    """
+    global _active_sink
+    sink = _active_sink
+    _active_sink = None
+    if sink is not None:
+        sink.close(timeout=timeout)
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,286 @@
+"""
+Benchmark suite configuration.
+
+Benchmarks are marked ``benchmark`` and skipped unless ``--benchmark`` is
+given, so the regular test run stays fast:
+
+    python -m pytest tests/benchmarks --benchmark
+    python -m pytest tests/benchmarks --benchmark --benchmark-compare
+    python -m pytest tests/benchmarks --benchmark --benchmark-save
+
+``--benchmark-compare`` checks every median against the committed
+baseline (tests/benchmarks/baseline.json) and fails the run when one grew
+by more than ``--benchmark-threshold``; ``--benchmark-save`` rewrites the
+baseline, to be committed together with the change that moved it.
+
+Database benchmarks run the real repositories against a SQLite copy of a
+synthetic dataset (scripts/generate_synthetic_data.py, fixed seed), so
+every run times the same rows. The options are only registered when this
+directory is passed to pytest explicitly.
+"""
+
+import asyncio
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from scripts.generate_synthetic_data import GeneratorConfig, generate
+from src.modules.fermentation.src.domain.entities.fermentation import Fermentation
+from src.modules.fermentation.src.domain.entities.protocol_execution import (
+    ProtocolExecution,
+)
+from src.modules.fermentation.src.domain.enums.step_type import ProtocolExecutionStatus
+from src.modules.winery.src.domain.entities.winery import Winery
+from src.shared.auth.domain.entities.user import User
+from src.shared.infra.orm.base_entity import Base
+from src.shared.testing.benchmark import (
+    DEFAULT_REGRESSION_THRESHOLD,
+    REGRESSED,
+    BenchmarkRunner,
+    benchmark_key,
+    compare_results,
+    format_comparison,
+    format_results,
+    load_results,
+    save_results,
+)
+from src.shared.testing.integration import TestSessionManager
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+# Fixed dataset every benchmark run is timed against
+SYNTHETIC_DATASET = GeneratorConfig(seed=42, wineries=1, fermentations=120, vintages=2)
+
+_results_key = pytest.StashKey[list]()
+_comparisons_key = pytest.StashKey[list]()
+
+
+# =============================================================================
+# Options and reporting
+# =============================================================================
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark", "repository and service benchmarks")
+    group.addoption(
+        "--benchmark", action="store_true", default=False, help="Run benchmark tests"
+    )
+    group.addoption(
+        "--benchmark-save",
+        nargs="?",
+        const=str(BASELINE_PATH),
+        default=None,
+        metavar="PATH",
+        help="Write results as a JSON baseline (default: tests/benchmarks/baseline.json)",
+    )
+    group.addoption(
+        "--benchmark-compare",
+        nargs="?",
+        const=str(BASELINE_PATH),
+        default=None,
+        metavar="PATH",
+        help="Compare results with a JSON baseline and fail on regressions",
+    )
+    group.addoption(
+        "--benchmark-threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        metavar="FRACTION",
+        help="Median slowdown counted as a regression (default: 0.25)",
+    )
+
+
+def pytest_configure(config):
+    config.stash[_results_key] = []
+    config.stash[_comparisons_key] = []
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmark", default=False):
+        return
+    skip = pytest.mark.skip(reason="benchmark: run with --benchmark")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    results = config.stash.get(_results_key, [])
+    if not results:
+        return
+
+    save_path = config.getoption("--benchmark-save", default=None)
+    compare_path = config.getoption("--benchmark-compare", default=None)
+
+    if compare_path and Path(compare_path).exists():
+        current = {
+            benchmark_key(stats): stats.to_dict() for stats in results
+        }
+        comparisons = compare_results(
+            load_results(compare_path),
+            current,
+            threshold=config.getoption("--benchmark-threshold"),
+        )
+        config.stash[_comparisons_key] = comparisons
+        if any(c.status == REGRESSED for c in comparisons):
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    if save_path:
+        previous = load_results(save_path) if Path(save_path).exists() else None
+        save_results(save_path, results, previous=previous)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config.stash.get(_results_key, [])
+    if not results:
+        return
+    terminalreporter.write_sep("-", "benchmark results")
+    for line in format_results(results):
+        terminalreporter.write_line(line)
+
+    comparisons = config.stash.get(_comparisons_key, [])
+    if comparisons:
+        terminalreporter.write_sep("-", "benchmark comparison")
+        for line in format_comparison(comparisons):
+            terminalreporter.write_line(line)
+        regressed = [c.key for c in comparisons if c.status == REGRESSED]
+        if regressed:
+            terminalreporter.write_line(
+                f"{len(regressed)} benchmark(s) regressed: {', '.join(regressed)}",
+                red=True,
+            )
+    elif config.getoption("--benchmark-compare", default=None):
+        terminalreporter.write_line("No baseline found to compare with")
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture
+def bench(request):
+    """
+    Times a sync or async callable and records it in the run's results.
+
+        result = await bench(repository.get_samples_by_fermentation_id, 7)
+    """
+    group = request.node.module.__name__.rsplit(".", 1)[-1]
+    if group.startswith("test_"):
+        group = group[len("test_"):]
+    if group.endswith("_benchmarks"):
+        group = group[: -len("_benchmarks")]
+    runner = BenchmarkRunner(request.node.name, group=group)
+    yield runner
+    if runner.stats is not None:
+        request.config.stash.setdefault(_results_key, []).append(runner.stats)
+
+
+@dataclass(frozen=True)
+class SyntheticDataset:
+    """Location and key ids of the seeded benchmark database."""
+
+    path: Path
+    winery_id: int
+    user_id: int
+    fermentation_ids: List[int]
+    active_execution_ids: List[int]
+    execution_ids: List[int]
+
+
+def _create_schema(connection):
+    # recommendation templates use PostgreSQL ARRAY columns; they are not seeded
+    tables = [
+        table
+        for table in Base.metadata.sorted_tables
+        if not table.name.startswith("recommendation")
+    ]
+    Base.metadata.create_all(connection, tables=tables)
+
+
+async def _seed(path: Path) -> SyntheticDataset:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(_create_schema)
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with factory() as session:
+            await generate(TestSessionManager(session), SYNTHETIC_DATASET, "not-a-hash")
+            winery_id = (
+                await session.execute(
+                    select(Winery.id).where(Winery.code == SYNTHETIC_DATASET.code(1))
+                )
+            ).scalar_one()
+            user_id = (
+                await session.execute(
+                    select(User.id).where(User.winery_id == winery_id).order_by(User.id)
+                )
+            ).scalars().first()
+            fermentation_ids = list(
+                (
+                    await session.execute(
+                        select(Fermentation.id)
+                        .where(Fermentation.winery_id == winery_id)
+                        .order_by(Fermentation.id)
+                    )
+                ).scalars()
+            )
+            executions = (
+                await session.execute(
+                    select(ProtocolExecution.id, ProtocolExecution.status).order_by(
+                        ProtocolExecution.id
+                    )
+                )
+            ).all()
+    finally:
+        await engine.dispose()
+
+    return SyntheticDataset(
+        path=path,
+        winery_id=winery_id,
+        user_id=user_id,
+        fermentation_ids=fermentation_ids,
+        active_execution_ids=[
+            id_ for id_, status in executions if status == ProtocolExecutionStatus.ACTIVE.value
+        ],
+        execution_ids=[id_ for id_, _ in executions],
+    )
+
+
+@pytest.fixture(scope="session")
+def synthetic_dataset(tmp_path_factory) -> SyntheticDataset:
+    """Seeds the synthetic dataset once per run."""
+    path = tmp_path_factory.mktemp("benchmark") / "synthetic.db"
+    return asyncio.run(_seed(path))
+
+
+@pytest.fixture
+def database_url(synthetic_dataset, tmp_path) -> str:
+    """URL of a private copy of the seeded database, so writes never leak."""
+    path = tmp_path / "benchmark.db"
+    shutil.copyfile(synthetic_dataset.path, path)
+    return f"sqlite+aiosqlite:///{path}"
+
+
+@pytest_asyncio.fixture
+async def db_session(database_url):
+    """Session on the benchmark database, rolled back after the test."""
+    engine = create_async_engine(database_url)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with factory() as session:
+            async with session.begin():
+                yield session
+                await session.rollback()
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture
+def session_manager(db_session) -> TestSessionManager:
+    return TestSessionManager(db_session)
@@ -0,0 +1,160 @@
+"""
+Benchmarks for pattern extraction and the analysis pipeline.
+
+PatternAnalysisService runs on the real fermentation and sample
+repositories. The analysis engine relies on PostgreSQL-only columns, so
+AnalysisOrchestratorService gets a session answering its queries from
+synthetic rows: the benchmark times the pipeline itself, not a database.
+"""
+
+from datetime import timedelta
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+
+from scripts.generate_synthetic_data import VARIETALS, GeneratorConfig, plan_fermentation
+from src.modules.analysis_engine.src.domain.entities.analysis import Analysis
+from src.modules.analysis_engine.src.domain.entities.recommendation_template import (
+    RecommendationTemplate,
+)
+from src.modules.analysis_engine.src.domain.enums.recommendation_category import (
+    RecommendationCategory,
+)
+from src.modules.analysis_engine.src.service_component.services.analysis_orchestrator_service import (
+    AnalysisOrchestratorService,
+)
+from src.modules.analysis_engine.src.service_component.services.threshold_config_service import (
+    ThresholdConfigService,
+)
+from src.modules.fermentation.src.repository_component.repositories.fermentation_repository import (
+    FermentationRepository,
+)
+from src.modules.fermentation.src.repository_component.repositories.sample_repository import (
+    SampleRepository,
+)
+from src.modules.fermentation.src.service_component.services.pattern_analysis_service import (
+    PatternAnalysisService,
+)
+from src.shared.infra.events import EventBus
+
+pytestmark = pytest.mark.benchmark
+
+HISTORICAL_FERMENTATIONS = 200
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+    def first(self):
+        return self._rows[0] if self._rows else None
+
+    def one(self):
+        (row,) = self._rows
+        return row
+
+
+class _SyntheticSession:
+    """Answers the analysis engine's queries from in-memory rows."""
+
+    def __init__(self, fermentations, templates):
+        self._fermentations = fermentations
+        self._templates = templates
+
+    async def execute(self, statement):
+        column = statement.column_descriptions[0]
+        if column["entity"] is RecommendationTemplate:
+            if column["name"] == "count":
+                # Template version: (count, latest updated_at)
+                return _Result([(len(self._templates), None)])
+            return _Result(self._templates)
+        if column["entity"] is Analysis:
+            # No earlier analysis, so every round runs the full pipeline
+            return _Result([])
+        if column["name"] == "id":
+            return _Result([f.id for f in self._fermentations])
+        return _Result(self._fermentations)
+
+    def add(self, instance):
+        pass
+
+
+def _historical_fermentations():
+    config = GeneratorConfig(fermentations=HISTORICAL_FERMENTATIONS, vintages=1)
+    return [
+        SimpleNamespace(id=i + 1, initial_sugar_brix=plan.initial_brix)
+        for i, plan in enumerate(
+            plan_fermentation(config, 1, i) for i in range(config.fermentations)
+        )
+    ]
+
+
+def _templates():
+    return [
+        RecommendationTemplate(
+            id=UUID(int=index + 1),
+            code=category.value,
+            recommendation_text=f"Review {category.value.lower()}",
+            category=category.value,
+            effectiveness_score=60 + index,
+        )
+        for index, category in enumerate(RecommendationCategory)
+    ]
+
+
+def _stuck_plan():
+    config = GeneratorConfig(fermentations=200, vintages=1)
+    return next(
+        plan
+        for plan in (plan_fermentation(config, 1, i) for i in range(config.fermentations))
+        if plan.profile == "stuck" and plan.end_date is not None
+    )
+
+
+async def test_extract_patterns(bench, session_manager, synthetic_dataset):
+    service = PatternAnalysisService(
+        fermentation_repo=FermentationRepository(session_manager),
+        sample_repo=SampleRepository(session_manager),
+    )
+
+    pattern = await bench(service.extract_patterns, synthetic_dataset.winery_id)
+
+    assert pattern["total_fermentations"] == len(synthetic_dataset.fermentation_ids)
+    assert pattern["avg_duration_days"] is not None
+
+
+async def test_execute_analysis(bench):
+    plan = _stuck_plan()
+    readings = [
+        (plan.start_date + timedelta(hours=point.hours), point.density)
+        for point in plan.curve
+    ]
+    fermentations = _historical_fermentations()
+    service = AnalysisOrchestratorService(
+        _SyntheticSession(fermentations, _templates()),
+        ThresholdConfigService(),
+        event_bus=EventBus(),
+    )
+
+    analysis = await bench(
+        service.execute_analysis,
+        winery_id=UUID(int=1),
+        fermentation_id=UUID(int=2),
+        current_density=plan.curve[-1].density,
+        temperature_celsius=plan.curve[-1].temperature,
+        variety=VARIETALS[plan.varietal_index][1],
+        starting_brix=plan.initial_brix,
+        days_fermenting=plan.curve[-1].hours / 24,
+        previous_densities=readings,
+        protocol_compliance_score=82.5,
+    )
+
+    assert analysis.status == "COMPLETED"
+    assert analysis.historical_samples_count > 0
@@ -0,0 +1,144 @@
+"""
+Benchmarks for the ETL import pipeline.
+
+The workbook is built from completed fermentations of the synthetic
+generator, one reading per day, so all three validation layers pass and
+the import creates every fermentation. Each import round runs for a new
+winery, which keeps fermentation and harvest lot codes unique.
+"""
+
+from datetime import timedelta
+from itertools import count
+
+import pandas as pd
+import pytest
+
+from scripts.generate_synthetic_data import VARIETALS, GeneratorConfig, plan_fermentation
+from src.modules.fermentation.src.service_component.etl.etl_service import ETLService
+from src.modules.fermentation.src.service_component.etl.etl_validator import ETLValidator
+from src.modules.fruit_origin.src.repository_component.repositories.harvest_lot_repository import (
+    HarvestLotRepository,
+)
+from src.modules.fruit_origin.src.repository_component.repositories.vineyard_block_repository import (
+    VineyardBlockRepository,
+)
+from src.modules.fruit_origin.src.repository_component.repositories.vineyard_repository import (
+    VineyardRepository,
+)
+from src.modules.fruit_origin.src.service_component.services.fruit_origin_service import (
+    FruitOriginService,
+)
+from src.modules.winery.src.domain.entities.winery import Winery
+from src.shared.auth.domain.entities.user import User
+
+pytestmark = pytest.mark.benchmark
+
+VALIDATION_FERMENTATIONS = 40
+IMPORT_FERMENTATIONS = 15
+
+# Readings are every 6 hours; the workbook keeps one per day
+_READINGS_PER_DAY = 4
+
+
+def _workbook_rows(fermentations):
+    config = GeneratorConfig(seed=7, fermentations=fermentations * 3, vintages=1)
+    plans = [plan_fermentation(config, 1, i) for i in range(config.fermentations)]
+    completed = [p for p in plans if p.end_date is not None][:fermentations]
+
+    rows = []
+    for plan in completed:
+        brix = density = float("inf")
+        for point in plan.curve[::_READINGS_PER_DAY]:
+            # Trend rules reject any rise, so smooth out the sensor noise
+            brix = min(brix, max(point.brix, 0.0))
+            density = min(density, round(point.density / 1000, 4))
+            rows.append(
+                {
+                    "fermentation_code": f"BENCH-{plan.index:04d}",
+                    "fermentation_start_date": plan.start_date.strftime("%Y-%m-%d"),
+                    "fermentation_end_date": plan.end_date.strftime("%Y-%m-%d"),
+                    "harvest_date": (plan.start_date - timedelta(days=2)).strftime("%Y-%m-%d"),
+                    "harvest_mass_kg": sum(kg for _, kg in plan.lots),
+                    "vineyard_name": f"VIÑA-{VARIETALS[plan.varietal_index][0]}",
+                    "grape_variety": VARIETALS[plan.varietal_index][1],
+                    "sample_date": (
+                        plan.start_date + timedelta(hours=point.hours)
+                    ).strftime("%Y-%m-%d"),
+                    "density": density,
+                    "temperature_celsius": round(point.temperature, 1),
+                    "sugar_brix": round(brix, 2),
+                }
+            )
+    return rows
+
+
+def _write_workbook(path, fermentations):
+    pd.DataFrame(_workbook_rows(fermentations)).to_excel(
+        path, index=False, engine="openpyxl", sheet_name="Fermentations"
+    )
+    return path
+
+
+@pytest.fixture(scope="module")
+def validation_workbook(tmp_path_factory):
+    path = tmp_path_factory.mktemp("etl") / "validation.xlsx"
+    return _write_workbook(path, VALIDATION_FERMENTATIONS)
+
+
+@pytest.fixture(scope="module")
+def import_workbook(tmp_path_factory):
+    path = tmp_path_factory.mktemp("etl") / "import.xlsx"
+    return _write_workbook(path, IMPORT_FERMENTATIONS)
+
+
+class TestETLValidator:
+    async def test_pre_validate(self, bench, validation_workbook):
+        result = await bench(ETLValidator().pre_validate, validation_workbook)
+
+        assert result.is_valid
+
+    async def test_validate_rows(self, bench, validation_workbook):
+        result = await bench(ETLValidator().validate_rows, validation_workbook)
+
+        assert result.invalid_row_count == 0
+
+    async def test_post_validate(self, bench, validation_workbook):
+        result = await bench(ETLValidator().post_validate, validation_workbook)
+
+        assert result.invalid_row_count == 0
+
+
+class TestETLImport:
+    async def test_import_file(self, bench, session_manager, db_session, import_workbook):
+        service = ETLService(
+            session_manager=session_manager,
+            fruit_origin_service=FruitOriginService(
+                vineyard_repo=VineyardRepository(session_manager),
+                harvest_lot_repo=HarvestLotRepository(session_manager),
+                vineyard_block_repo=VineyardBlockRepository(session_manager),
+            ),
+        )
+        wineries = count(1)
+
+        async def _new_winery():
+            n = next(wineries)
+            winery = Winery(code=f"ETL-BENCH-{n}", name=f"ETL Bench {n}", location="Bench")
+            db_session.add(winery)
+            await db_session.flush()
+            user = User(
+                username=f"etl-bench-{n}",
+                email=f"etl-bench-{n}@example.com",
+                full_name="ETL Bench",
+                password_hash="not-a-hash",
+                winery_id=winery.id,
+            )
+            db_session.add(user)
+            await db_session.flush()
+            return {"winery_id": winery.id, "user_id": user.id}
+
+        result = await bench(
+            service.import_file, import_workbook, setup=_new_winery, rounds=3
+        )
+
+        assert result.success, result.errors or result.row_errors
+        assert result.fermentations_created == IMPORT_FERMENTATIONS
@@ -0,0 +1,72 @@
+"""
+Benchmarks for protocol compliance scoring and the alert scheduler.
+
+The alert scheduler runs AlertSchedulerService.run_pending against the
+benchmark database on the background pool. Its warmup round loads every
+ACTIVE execution's deadlines and raises the alerts of every overdue step;
+the timed rounds measure the steady state, where only the changed-execution
+lookup runs and no deadline is due.
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+
+from src.modules.fermentation.src.domain.entities.protocol_alert import ProtocolAlert
+from src.modules.fermentation.src.domain.entities.step_completion import StepCompletion
+from src.modules.fermentation.src.repository_component import (
+    FermentationProtocolRepository,
+    ProtocolExecutionRepository,
+    ProtocolStepRepository,
+    StepCompletionRepository,
+)
+from src.modules.fermentation.src.service_component.services.alert_scheduler_service import (
+    AlertSchedulerService,
+)
+from src.modules.fermentation.src.service_component.services.protocol_compliance_service import (
+    ProtocolComplianceService,
+)
+from src.shared.infra.database.engine_registry import POOL_BACKGROUND, get_engine_registry
+from src.shared.infra.events import EventBus
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest_asyncio.fixture
+async def most_completed_execution(db_session):
+    """Execution with the most step completions."""
+    result = await db_session.execute(
+        select(StepCompletion.execution_id)
+        .group_by(StepCompletion.execution_id)
+        .order_by(func.count().desc(), StepCompletion.execution_id)
+        .limit(1)
+    )
+    return result.scalar_one()
+
+
+async def test_calculate_compliance_score(bench, db_session, most_completed_execution):
+    service = ProtocolComplianceService(
+        protocol_repository=FermentationProtocolRepository(db_session),
+        execution_repository=ProtocolExecutionRepository(db_session),
+        completion_repository=StepCompletionRepository(db_session),
+        step_repository=ProtocolStepRepository(db_session),
+    )
+
+    result = await bench(service.calculate_compliance_score, most_completed_execution)
+
+    assert 0 <= result.compliance_score <= 100
+    assert result.breakdown["completion"].completed_count > 0
+
+
+async def test_alert_scan(bench, database_url, db_session, synthetic_dataset):
+    assert synthetic_dataset.active_execution_ids
+    scheduler = AlertSchedulerService(database_url=database_url, event_bus=EventBus())
+    try:
+        await bench(scheduler.run_pending)
+    finally:
+        await get_engine_registry().dispose(POOL_BACKGROUND)
+
+    raised = await db_session.execute(
+        select(func.count()).select_from(ProtocolAlert).where(ProtocolAlert.status == "PENDING")
+    )
+    assert raised.scalar_one() > 0
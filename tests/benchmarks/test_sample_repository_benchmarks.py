@@ -0,0 +1,141 @@
+"""
+Benchmarks for SampleRepository reads and writes.
+
+Reads are timed on the busiest fermentation of the synthetic dataset;
+writes add fresh samples every round inside the test's rolled-back
+transaction.
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+
+from src.modules.fermentation.src.domain.entities.samples.base_sample import BaseSample
+from src.modules.fermentation.src.domain.entities.samples.sugar_sample import SugarSample
+from src.modules.fermentation.src.domain.enums.sample_type import SampleType
+from src.modules.fermentation.src.repository_component.repositories.sample_repository import (
+    SampleRepository,
+)
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture
+def sample_repository(session_manager):
+    return SampleRepository(session_manager)
+
+
+@pytest_asyncio.fixture
+async def busiest_fermentation(db_session):
+    """(fermentation_id, sample count) of the fermentation with most samples."""
+    result = await db_session.execute(
+        select(BaseSample.fermentation_id, func.count().label("samples"))
+        .group_by(BaseSample.fermentation_id)
+        .order_by(func.count().desc(), BaseSample.fermentation_id)
+        .limit(1)
+    )
+    return result.one()
+
+
+def _new_samples(fermentation_id, user_id, count, start):
+    return [
+        SugarSample(
+            fermentation_id=fermentation_id,
+            recorded_by_user_id=user_id,
+            sample_type=SampleType.SUGAR,
+            value=Decimal("12.5"),
+            units="brix",
+            recorded_at=start + timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+
+
+class TestSampleReads:
+    async def test_get_samples_by_fermentation_id(
+        self, bench, sample_repository, busiest_fermentation
+    ):
+        fermentation_id, count = busiest_fermentation
+
+        samples = await bench(
+            sample_repository.get_samples_by_fermentation_id, fermentation_id
+        )
+
+        assert len(samples) == count
+
+    async def test_get_samples_in_timerange(
+        self, bench, sample_repository, busiest_fermentation
+    ):
+        fermentation_id, _ = busiest_fermentation
+        start = await sample_repository.get_fermentation_start_date(fermentation_id)
+
+        samples = await bench(
+            sample_repository.get_samples_in_timerange,
+            fermentation_id,
+            start,
+            start + timedelta(days=3),
+        )
+
+        assert samples
+
+    async def test_get_latest_sample_by_type(
+        self, bench, sample_repository, busiest_fermentation
+    ):
+        fermentation_id, _ = busiest_fermentation
+
+        sample = await bench(
+            sample_repository.get_latest_sample_by_type,
+            fermentation_id,
+            SampleType.DENSITY,
+        )
+
+        assert sample is not None
+
+    async def test_get_latest_samples_by_fermentation_ids(
+        self, bench, sample_repository, synthetic_dataset
+    ):
+        latest = await bench(
+            sample_repository.get_latest_samples_by_fermentation_ids,
+            synthetic_dataset.fermentation_ids,
+        )
+
+        assert len(latest) == len(synthetic_dataset.fermentation_ids)
+
+
+class TestSampleWrites:
+    async def test_create(
+        self, bench, sample_repository, busiest_fermentation, synthetic_dataset
+    ):
+        fermentation_id, _ = busiest_fermentation
+        samples = iter(
+            _new_samples(
+                fermentation_id, synthetic_dataset.user_id, 1000, datetime(2030, 1, 1)
+            )
+        )
+
+        created = await bench(
+            sample_repository.create, setup=lambda: {"sample": next(samples)}
+        )
+
+        assert created.id is not None
+
+    async def test_bulk_upsert_samples(
+        self, bench, sample_repository, busiest_fermentation, synthetic_dataset
+    ):
+        fermentation_id, _ = busiest_fermentation
+        rounds = iter(range(1000))
+
+        def _batch():
+            start = datetime(2030, 1, 1) + timedelta(days=next(rounds))
+            return {
+                "samples": _new_samples(
+                    fermentation_id, synthetic_dataset.user_id, 100, start
+                )
+            }
+
+        upserted = await bench(sample_repository.bulk_upsert_samples, setup=_batch)
+
+        assert len(upserted) == 100
@@ -1,7 +1,7 @@
 """
 Integration tests for protocol migration tables (ADR-035, ADR-040).
 
-Verifies that migrations 001 and 002 created the correct schema and that
+Verifies that migrations 001, 002 and 013 created the correct schema and that
 repositories can perform CRUD operations against the live DB.
 
 Tables tested:
@@ -34,18 +34,24 @@ from src.modules.fermentation.src.repository_component.protocol_alert_repository
 
 # ─── Helpers ────────────────────────────────────────────────────────────────
 
+def _protocol_values(winery_id: int = 1, varietal_code: str = "PN", version: str = "1.0"):
+    return {
+        "winery_id": winery_id,
+        "varietal_code": varietal_code,
+        "varietal_name": "Pinot Noir",
+        "color": "RED",
+        "version": version,
+        "protocol_name": f"Test Protocol {varietal_code} {version}",
+        "expected_duration_days": 28,
+        "is_active": False,
+        "created_by_user_id": 1,
+    }
+
+
 def _make_protocol(winery_id: int = 1, varietal_code: str = "PN", version: str = "1.0"):
     return FermentationProtocol(
-        winery_id=winery_id,
-        varietal_code=varietal_code,
-        varietal_name="Pinot Noir",
-        color="RED",
-        version=version,
-        protocol_name=f"Test Protocol {varietal_code} {version}",
+        **_protocol_values(winery_id, varietal_code, version),
         description="Integration test protocol",
-        expected_duration_days=28,
-        is_active=False,
-        created_by_user_id=1,
         created_at=datetime.utcnow(),
         updated_at=datetime.utcnow(),
     )
@@ -140,6 +146,24 @@ class TestFermentationProtocolsTable:
         assert created.id is not None
         assert created.winery_id == 99999
 
+    async def test_instances_share_their_template_version(self, db_session):
+        """Migration 013: uniqueness covers templates only."""
+        repo = FermentationProtocolRepository(db_session)
+        template = await repo.create(_make_protocol(winery_id=3, varietal_code="SY", version="1.0"))
+
+        instances = await repo.bulk_create(
+            [
+                {**_protocol_values(winery_id=3, varietal_code="SY", version="1.0"),
+                 "protocol_name": f"Tank {n}", "is_template": False, "template_id": template.id}
+                for n in (1, 2)
+            ]
+        )
+
+        assert [i.protocol_name for i in instances] == ["Tank 1", "Tank 2"]
+        assert all(i.id is not None for i in instances)
+        found = await repo.get_by_winery_varietal_version(3, "SY", "1.0")
+        assert found.id == template.id
+
 
 # ─── protocol_steps table ────────────────────────────────────────────────────
 
@@ -183,6 +207,29 @@ class TestProtocolStepsTable:
         with pytest.raises(IntegrityError):
             await step_repo.create(_make_step(protocol.id, 1))  # duplicate step_order
 
+    async def test_bulk_create_and_set_dependencies(self, db_session):
+        proto_repo = FermentationProtocolRepository(db_session)
+        step_repo = ProtocolStepRepository(db_session)
+
+        protocol = await proto_repo.create(_make_protocol(varietal_code="TE", version="1.0"))
+        first, second = await step_repo.bulk_create(
+            [
+                {"protocol_id": protocol.id, "step_order": 1, "step_type": "MONITORING",
+                 "description": "First", "expected_day": 0, "tolerance_hours": 12,
+                 "duration_minutes": 30, "criticality_score": 1.0},
+                {"protocol_id": protocol.id, "step_order": 2, "step_type": "MONITORING",
+                 "description": "Second", "expected_day": 1, "tolerance_hours": 12,
+                 "duration_minutes": 30, "criticality_score": 1.0},
+            ]
+        )
+        await step_repo.bulk_set_dependencies({second.id: first.id})
+        db_session.expire_all()
+
+        steps = await step_repo.get_by_protocol(protocol.id)
+
+        assert [s.description for s in steps] == ["First", "Second"]
+        assert steps[1].depends_on_step_id == first.id
+
 
 # ─── protocol_executions table ───────────────────────────────────────────────
 
@@ -297,3 +344,6 @@ class TestProtocolAlertsTable:
         )
         created = await alert_repo.create(alert)
         assert created.winery_id == 55555
+        # The inbox counters carry the same unconstrained winery_id
+        counts = await alert_repo.get_winery_counts(55555)
+        assert counts.count("PENDING", "CRITICAL") == 1
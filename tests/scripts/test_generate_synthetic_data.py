@@ -0,0 +1,226 @@
+"""
+Unit tests for generate_synthetic_data.py script.
+
+Plans and rows are pure functions of the seed, so they are tested without
+a database; the bulk writer is tested against a mocked session.
+"""
+import sys
+from pathlib import Path
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.generate_synthetic_data import (  # noqa: E402
+    BulkWriter,
+    GeneratorConfig,
+    WineryIds,
+    alert_rows,
+    density_from_brix,
+    estimate,
+    execution_row,
+    plan_fermentation,
+    protocol_steps,
+    sample_rows,
+    step_completion_rows,
+)
+from src.modules.fermentation.src.domain.entities.samples.base_sample import (  # noqa: E402
+    BaseSample,
+)
+from src.modules.fermentation.src.domain.enums.fermentation_status import (  # noqa: E402
+    FermentationStatus,
+)
+
+
+def _ids():
+    return WineryIds(
+        winery_id=7,
+        admin_id=1,
+        winemaker_ids=[2, 3, 4],
+        lot_ids={year: list(range(100, 106)) for year in range(2021, 2026)},
+        protocol_ids=[10, 11, 12, 13, 14],
+        step_ids=[list(range(v * 100, v * 100 + 9)) for v in range(5)],
+    )
+
+
+# =============================================================================
+# Test: determinism
+# =============================================================================
+
+def test_same_seed_produces_the_same_plans():
+    config = GeneratorConfig(seed=7, fermentations=20)
+
+    first = [plan_fermentation(config, 1, i) for i in range(20)]
+    second = [plan_fermentation(config, 1, i) for i in range(20)]
+
+    assert first == second
+
+
+def test_plans_do_not_depend_on_the_dataset_size():
+    small = GeneratorConfig(seed=7, fermentations=20, vintages=1)
+    large = GeneratorConfig(seed=7, fermentations=2000, vintages=1)
+
+    assert plan_fermentation(small, 1, 3) == plan_fermentation(large, 1, 3)
+
+
+def test_other_seed_produces_other_plans():
+    a = plan_fermentation(GeneratorConfig(seed=1), 1, 0)
+    b = plan_fermentation(GeneratorConfig(seed=2), 1, 0)
+
+    assert a.curve != b.curve
+
+
+# =============================================================================
+# Test: fermentation curves
+# =============================================================================
+
+def test_completed_fermentation_ferments_dry():
+    config = GeneratorConfig(fermentations=200)
+    plans = [plan_fermentation(config, 1, i) for i in range(200)]
+    completed = [
+        p for p in plans if p.status == FermentationStatus.COMPLETED and p.profile == "normal"
+    ]
+
+    assert completed
+    for plan in completed:
+        assert plan.curve[0].brix > 18
+        assert plan.curve[-1].brix < 0
+        assert plan.curve[-1].density < plan.curve[0].density
+        assert max(p.temperature for p in plan.curve) > plan.curve[0].temperature
+
+
+def test_stuck_fermentations_stall_above_dryness():
+    config = GeneratorConfig(fermentations=400)
+    stuck = [
+        p for p in (plan_fermentation(config, 1, i) for i in range(400)) if p.profile == "stuck"
+    ]
+
+    assert stuck
+    assert all(p.curve[-1].brix > 2 for p in stuck if p.end_date is not None)
+
+
+def test_running_fermentations_stop_at_the_snapshot():
+    config = GeneratorConfig(fermentations=200)
+    running = [
+        p for p in (plan_fermentation(config, 1, i) for i in range(200)) if p.end_date is None
+    ]
+
+    assert running
+    for plan in running:
+        assert plan.last_update <= config.as_of
+
+
+def test_vessel_codes_are_unique_per_winery():
+    config = GeneratorConfig(fermentations=200)
+
+    codes = [plan_fermentation(config, 1, i).vessel_code for i in range(200)]
+
+    assert len(set(codes)) == len(codes)
+
+
+def test_density_follows_brix():
+    assert density_from_brix(0) == pytest.approx(1000.0)
+    assert 1095 < density_from_brix(24) < 1105
+
+
+# =============================================================================
+# Test: rows
+# =============================================================================
+
+def test_sample_rows_have_one_reading_per_type_and_time():
+    plan = plan_fermentation(GeneratorConfig(), 1, 0)
+
+    rows = sample_rows(plan, fermentation_id=55, recorded_by_user_id=2)
+
+    assert len(rows) == 3 * len(plan.curve)
+    assert {r["sample_type"] for r in rows} == {"sugar", "density", "temperature"}
+    assert rows[0]["recorded_at"] == plan.start_date
+    assert all(r["fermentation_id"] == 55 for r in rows)
+
+
+def test_execution_compliance_counts_on_time_steps():
+    plan = plan_fermentation(GeneratorConfig(), 1, 0)
+
+    row = execution_row(plan, fermentation_id=55, ids=_ids())
+    completions = step_completion_rows(plan, execution_id=9, ids=_ids())
+
+    on_time = sum(1 for c in completions if c["is_on_schedule"])
+    assert row["compliance_score"] == round(100.0 * on_time / len(plan.steps), 1)
+    assert row["completed_steps"] == sum(1 for c in completions if not c["was_skipped"])
+    assert all(
+        c["skip_reason"] is not None for c in completions if c["was_skipped"]
+    )
+    assert {c["step_id"] for c in completions} <= set(_ids().step_ids[plan.varietal_index])
+
+
+def test_alerts_are_raised_for_late_steps():
+    config = GeneratorConfig(fermentations=50)
+    plan = next(
+        p
+        for p in (plan_fermentation(config, 1, i) for i in range(50))
+        if any(s.days_late for s in p.steps)
+    )
+
+    alerts = alert_rows(plan, execution_id=9, ids=_ids())
+
+    late = [s for s in plan.steps if s.days_late]
+    overdue = [a for a in alerts if a["alert_type"] == "STEP_OVERDUE"]
+    assert len(overdue) == len(late)
+    steps = protocol_steps(plan.varietal_index)
+    assert {a["step_name"] for a in overdue} == {steps[s.step_index][1] for s in late}
+
+
+def test_estimate_counts_rows_without_a_database():
+    rows = estimate(GeneratorConfig(wineries=2, fermentations=10))
+
+    assert rows["fermentations"] == 20
+    assert rows["samples"] > 20 * 3 * 10
+
+
+# =============================================================================
+# Test: BulkWriter
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_copy_uses_asyncpg_copy_records():
+    raw = MagicMock()
+    raw.driver_connection.copy_records_to_table = AsyncMock()
+    connection = MagicMock()
+    connection.dialect.driver = "asyncpg"
+    connection.get_raw_connection = AsyncMock(return_value=raw)
+    session = AsyncMock()
+    session.connection.return_value = connection
+    writer = BulkWriter(session)
+    rows = [
+        {"fermentation_id": 1, "value": 22.5, "recorded_at": datetime(2024, 9, 2)},
+        {"fermentation_id": 1, "value": 22.0, "recorded_at": datetime(2024, 9, 3)},
+    ]
+
+    await writer.copy(BaseSample.__table__, rows)
+
+    raw.driver_connection.copy_records_to_table.assert_awaited_once_with(
+        "samples",
+        records=[(1, 22.5, datetime(2024, 9, 2)), (1, 22.0, datetime(2024, 9, 3))],
+        columns=["fermentation_id", "value", "recorded_at"],
+    )
+    assert writer.rows["samples"] == 2
+    session.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_copy_falls_back_to_executemany_insert():
+    connection = MagicMock()
+    connection.dialect.driver = "aiosqlite"
+    session = AsyncMock()
+    session.connection.return_value = connection
+    writer = BulkWriter(session)
+
+    await writer.copy(BaseSample.__table__, [{"fermentation_id": 1}])
+
+    session.execute.assert_awaited_once()
+    assert session.execute.await_args.args[1] == [{"fermentation_id": 1}]
+    assert writer.rows["samples"] == 1
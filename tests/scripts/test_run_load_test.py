@@ -0,0 +1,149 @@
+"""
+Unit tests for run_load_test.py script.
+
+Scenarios are tested against stub services served in-process; routing
+and the analysis payload are pure functions.
+"""
+import random
+import re
+import sys
+from pathlib import Path
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+from fastapi import FastAPI, Request
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.run_load_test import (  # noqa: E402
+    SERVICE_ROUTES,
+    RunningFermentation,
+    Workload,
+    analysis_payload,
+    build_scenarios,
+)
+from src.shared.auth.domain.dtos import UserContext  # noqa: E402
+from src.shared.auth.domain.enums.user_role import UserRole  # noqa: E402
+from src.shared.auth.infra.services.jwt_service import JwtService  # noqa: E402
+from src.shared.testing.load import (  # noqa: E402
+    LatencyRecorder,
+    VirtualUser,
+    asgi_gateway,
+)
+
+SECRET = "load-test-secret-of-at-least-32-characters"
+
+FERMENTATION = RunningFermentation(
+    id=42,
+    variety="Merlot",
+    initial_sugar_brix=24.5,
+    start_date=datetime(2024, 9, 1, 8, 0),
+)
+
+
+def _workload():
+    return Workload(
+        winery_id=3,
+        users=[UserContext(user_id=9, winery_id=3, email="w@x.com", role=UserRole.WINEMAKER)],
+        fermentations=[FERMENTATION],
+        tokens=JwtService(secret_key=SECRET),
+    )
+
+
+def _stub_service(name, seen):
+    app = FastAPI()
+
+    @app.api_route("/{path:path}", methods=["GET", "POST"])
+    async def handle(path: str, request: Request):
+        seen.append((name, request.method, f"/{path}", request.headers.get("authorization")))
+        if path.endswith("/samples") and request.method == "GET":
+            return [
+                {"sample_type": "density", "value": 1080.0, "recorded_at": "2024-09-02T08:00:00"},
+                {"sample_type": "temperature", "value": 24.0, "recorded_at": "2024-09-02T08:00:00"},
+                {"sample_type": "density", "value": 1050.0, "recorded_at": "2024-09-04T08:00:00"},
+            ]
+        return {}
+
+    return app
+
+
+# =============================================================================
+# Test: routing
+# =============================================================================
+
+@pytest.mark.parametrize(
+    "path, service",
+    [
+        ("/api/v1/fermentations/42/samples", "fermentation"),
+        ("/api/v1/fermentations", "fermentation"),
+        ("/api/v1/fermentations/42/advisories", "analysis_engine"),
+        ("/api/v1/analyses", "analysis_engine"),
+        ("/api/v1/harvest-lots/", "fruit_origin"),
+        ("/api/v1/admin/wineries/3", "winery"),
+    ],
+)
+def test_paths_route_to_the_service_behind_the_gateway(path, service):
+    routed = next(s for pattern, s in SERVICE_ROUTES if re.match(pattern, path))
+
+    assert routed == service
+
+
+# =============================================================================
+# Test: analysis payload
+# =============================================================================
+
+def test_analysis_payload_uses_the_latest_density_readings():
+    samples = [
+        {"sample_type": "density", "value": 1080.0, "recorded_at": "2024-09-02T08:00:00"},
+        {"sample_type": "temperature", "value": 24.0, "recorded_at": "2024-09-02T08:00:00"},
+        {"sample_type": "density", "value": 1050.0, "recorded_at": "2024-09-04T08:00:00"},
+    ]
+
+    payload = analysis_payload(FERMENTATION, samples)
+
+    assert UUID(payload["fermentation_id"]) == UUID(int=42)
+    assert payload["current_density"] == 1050.0
+    assert payload["temperature_celsius"] == 24.0
+    assert payload["days_fermenting"] == pytest.approx(3.0)
+    assert [r["density"] for r in payload["previous_densities"]] == [1080.0, 1050.0]
+
+
+def test_analysis_payload_without_readings_starts_from_day_zero():
+    payload = analysis_payload(FERMENTATION, [])
+
+    assert payload["days_fermenting"] == 0.0
+    assert payload["previous_densities"] == []
+
+
+# =============================================================================
+# Test: scenarios
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_scenarios_call_their_services_with_a_valid_token():
+    seen = []
+    apps = {
+        name: _stub_service(name, seen)
+        for name in ("fermentation", "winery", "fruit_origin", "analysis_engine")
+    }
+    workload = _workload()
+
+    async with asgi_gateway([(p, apps[s]) for p, s in SERVICE_ROUTES]) as gateway:
+        recorder = LatencyRecorder()
+        user = VirtualUser(0, gateway, recorder, random.Random(1))
+        for scenario in build_scenarios(workload):
+            await scenario.run(user)
+
+    services = {(service, method, path) for service, method, path, _ in seen}
+    assert ("fermentation", "POST", "/api/v1/fermentations/42/samples") in services
+    assert ("fruit_origin", "GET", "/api/v1/harvest-lots/") in services
+    assert ("winery", "GET", "/api/v1/admin/wineries/3") in services
+    assert ("analysis_engine", "POST", "/api/v1/analyses") in services
+
+    token = seen[0][3].split()[1]
+    context = JwtService(secret_key=SECRET).extract_user_context(token)
+    assert (context.user_id, context.winery_id) == (9, 3)
+    assert all(s.errors == 0 for s in recorder.summarize(elapsed=1.0))
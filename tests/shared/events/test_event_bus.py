@@ -0,0 +1,237 @@
+"""
+Unit tests for the in-process event bus and the SSE stream endpoint.
+
+Covers per-winery fan-out, connection limits, slow-consumer handling,
+Last-Event-ID replay, and the frames/heartbeats the endpoint writes.
+"""
+
+import asyncio
+import json
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.shared.api.error_handlers import register_error_handlers
+from src.shared.api.event_stream_router import _event_frames
+from src.shared.api.event_stream_router import router as event_stream_router
+from src.shared.auth.domain.dtos import UserContext
+from src.shared.auth.domain.enums.user_role import UserRole
+from src.shared.auth.infra.api.dependencies import get_current_user
+from src.shared.domain.errors import EventStreamLimitReached
+from src.shared.infra.events import LAGGED_EVENT_TYPE, EventBus, get_event_bus
+
+
+# ---------------------------------------------------------------------------
+# Test helpers
+# ---------------------------------------------------------------------------
+
+def _data(event) -> dict:
+    return json.loads(event.frame.split("data: ", 1)[1])
+
+
+async def _drain(subscription) -> list:
+    events = []
+    while True:
+        event = await subscription.next_event(timeout=0.01)
+        if event is None:
+            return events
+        events.append(event)
+
+
+class _FakeRequest:
+    def __init__(self, disconnect_after: int = 0) -> None:
+        self.checks = 0
+        self.disconnect_after = disconnect_after
+
+    async def is_disconnected(self) -> bool:
+        self.checks += 1
+        return self.checks > self.disconnect_after
+
+
+# ---------------------------------------------------------------------------
+# EventBus
+# ---------------------------------------------------------------------------
+
+class TestPublish:
+    async def test_event_reaches_only_subscribers_of_the_winery(self):
+        bus = EventBus()
+        mine = bus.subscribe(1)
+        other = bus.subscribe(2)
+
+        bus.publish(1, "sample.created", {"id": 5})
+
+        events = await _drain(mine)
+        assert [(e.type, _data(e)) for e in events] == [("sample.created", {"id": 5})]
+        assert await _drain(other) == []
+
+    async def test_winery_ids_are_normalised(self):
+        bus = EventBus()
+        subscription = bus.subscribe("7")
+
+        bus.publish(7, "alert.created", {"id": 1})
+
+        assert len(await _drain(subscription)) == 1
+
+    async def test_uuid_form_of_integer_winery_id_shares_its_key(self):
+        bus = EventBus()
+        subscription = bus.subscribe(7)
+        other = bus.subscribe(uuid4())
+
+        bus.publish(UUID(int=7), "analysis.completed", {"id": 1})
+
+        assert len(await _drain(subscription)) == 1
+        assert await _drain(other) == []
+
+    def test_frame_is_encoded_once_for_all_subscribers(self):
+        bus = EventBus()
+        first, second = bus.subscribe(1), bus.subscribe(1)
+
+        event = bus.publish(1, "alert.created", {"id": 1})
+
+        assert first._queue[0] is second._queue[0] is event
+        assert event.frame == (
+            f"id: {event.id}\nevent: alert.created\ndata: {{\"id\":1}}\n\n"
+        )
+
+    async def test_waiting_subscriber_is_woken(self):
+        bus = EventBus()
+        subscription = bus.subscribe(1)
+
+        pending = asyncio.ensure_future(subscription.next_event(timeout=1))
+        await asyncio.sleep(0)
+        bus.publish(1, "sample.created", {"id": 1})
+
+        assert (await pending).type == "sample.created"
+
+    async def test_slow_consumer_drops_oldest_and_is_told(self):
+        bus = EventBus(queue_size=2)
+        subscription = bus.subscribe(1)
+
+        for i in range(4):
+            bus.publish(1, "sample.created", {"id": i})
+
+        events = await _drain(subscription)
+        assert events[0].type == LAGGED_EVENT_TYPE
+        assert _data(events[0]) == {"dropped": 2}
+        assert [_data(e)["id"] for e in events[1:]] == [2, 3]
+
+    async def test_lagged_frame_does_not_move_last_event_id(self):
+        bus = EventBus(queue_size=2)
+        subscription = bus.subscribe(1)
+        for i in range(4):
+            bus.publish(1, "sample.created", {"id": i})
+
+        lagged, *delivered = await _drain(subscription)
+
+        assert lagged.id is None
+        assert "id:" not in lagged.frame
+        # Reconnecting from the last frame with an id replays nothing twice
+        reconnected = bus.subscribe(1, last_event_id=delivered[0].id)
+        assert [_data(e)["id"] for e in await _drain(reconnected)] == [3]
+
+
+class TestSubscribe:
+    def test_per_winery_limit(self):
+        bus = EventBus(max_per_winery=1)
+        bus.subscribe(1)
+
+        with pytest.raises(EventStreamLimitReached):
+            bus.subscribe(1)
+        bus.subscribe(2)
+
+    def test_process_limit(self):
+        bus = EventBus(max_connections=2)
+        bus.subscribe(1)
+        bus.subscribe(2)
+
+        with pytest.raises(EventStreamLimitReached):
+            bus.subscribe(3)
+
+    async def test_close_frees_the_slot(self):
+        bus = EventBus(max_per_winery=1)
+
+        async with bus.subscribe(1):
+            assert bus.connections == 1
+        bus.subscribe(1)
+
+        assert bus.connections == 1
+
+    async def test_last_event_id_replays_missed_events(self):
+        bus = EventBus()
+        seen = bus.publish(1, "sample.created", {"id": 1})
+        bus.publish(2, "sample.created", {"id": 2})
+        bus.publish(1, "sample.created", {"id": 3})
+
+        subscription = bus.subscribe(1, last_event_id=seen.id)
+
+        assert [_data(e)["id"] for e in await _drain(subscription)] == [3]
+
+    async def test_last_event_id_outside_replay_window_is_lagged(self):
+        bus = EventBus(replay_size=2)
+        first = bus.publish(1, "sample.created", {"id": 1})
+        for i in range(2, 5):
+            bus.publish(1, "sample.created", {"id": i})
+
+        subscription = bus.subscribe(1, last_event_id=first.id)
+
+        events = await _drain(subscription)
+        assert [e.type for e in events] == [LAGGED_EVENT_TYPE]
+
+    async def test_unknown_last_event_id_is_lagged(self):
+        bus = EventBus()
+
+        subscription = bus.subscribe(1, last_event_id=999)
+
+        assert [e.type for e in await _drain(subscription)] == [LAGGED_EVENT_TYPE]
+
+
+# ---------------------------------------------------------------------------
+# SSE endpoint
+# ---------------------------------------------------------------------------
+
+class TestEventFrames:
+    async def test_retry_then_events_then_heartbeat(self):
+        bus = EventBus()
+        subscription = bus.subscribe(1)
+        bus.publish(1, "alert.created", {"id": 1})
+        frames = _event_frames(
+            _FakeRequest(disconnect_after=1), subscription, None, heartbeat_seconds=0.01
+        )
+
+        collected = [frame async for frame in frames]
+
+        assert collected[0].startswith("retry: ")
+        assert collected[1].startswith("id: ") and "event: alert.created" in collected[1]
+        assert collected[2:] == [": keep-alive\n\n"]
+        assert bus.connections == 0
+
+    async def test_type_filter(self):
+        bus = EventBus()
+        subscription = bus.subscribe(1)
+        bus.publish(1, "sample.created", {"id": 1})
+        bus.publish(1, "alert.created", {"id": 2})
+        frames = _event_frames(
+            _FakeRequest(), subscription, ["alert.created"], heartbeat_seconds=0.01
+        )
+
+        collected = [frame async for frame in frames][1:]
+
+        assert len(collected) == 1 and "alert.created" in collected[0]
+
+
+class TestStreamEndpoint:
+    def test_limit_reached_returns_429(self):
+        bus = EventBus(max_per_winery=0)
+        app = FastAPI()
+        register_error_handlers(app)
+        app.include_router(event_stream_router, prefix="/api/v1")
+        app.dependency_overrides[get_current_user] = lambda: UserContext(
+            user_id=1, winery_id=1, email="w@example.com", role=UserRole.WINEMAKER
+        )
+        app.dependency_overrides[get_event_bus] = lambda: bus
+
+        response = TestClient(app).get("/api/v1/events/stream")
+
+        assert response.status_code == 429
@@ -0,0 +1,181 @@
+"""
+Unit tests for log volume control — LogSampler and log_batch.
+
+Verifies per-event sampling and rate limiting (errors always kept), and that
+routine events inside a log_batch block collapse into one summary event.
+"""
+
+import asyncio
+import io
+import json
+import random
+
+import pytest
+import structlog
+
+from src.shared.wine_fermentator_logging import (
+    LogSampler,
+    configure_logging,
+    get_logger,
+    log_batch,
+)
+from src.shared.wine_fermentator_logging.sampling import parse_event_config
+
+
+# ---------------------------------------------------------------------------
+# Test helpers
+# ---------------------------------------------------------------------------
+
+def _run(processor, event: str, level: str = "info") -> bool:
+    """Return True if the processor keeps the event."""
+    try:
+        processor(None, level, {"event": event, "level": level})
+        return True
+    except structlog.DropEvent:
+        return False
+
+
+def _events(stream: io.StringIO) -> list:
+    out = stream.getvalue()
+    return [json.loads(line) for line in out.splitlines() if line.startswith("{")]
+
+
+@pytest.fixture
+def json_logging():
+    """JSON logs into a private stream (capture fixtures swap sys.stdout per phase)."""
+    stream = io.StringIO()
+    configure_logging(
+        environment="production", json_logs=True, async_sink=False, stream=stream
+    )
+    yield stream
+    configure_logging(environment="development", async_sink=False)
+
+
+# ---------------------------------------------------------------------------
+# LogSampler
+# ---------------------------------------------------------------------------
+
+class TestLogSampler:
+    """LogSampler keeps a fraction of configured events and never drops errors."""
+
+    def test_sample_rate_keeps_expected_fraction(self):
+        sampler = LogSampler(sample_rates={"sample_created": 0.1}, rng=random.Random(42))
+
+        kept = sum(_run(sampler, "sample_created") for _ in range(10000))
+
+        assert 800 < kept < 1200
+        assert sampler.dropped["sample_created"] == 10000 - kept
+
+    def test_unconfigured_events_pass(self):
+        sampler = LogSampler(sample_rates={"sample_created": 0.0})
+
+        assert _run(sampler, "fermentation_created") is True
+
+    def test_errors_are_never_sampled(self):
+        sampler = LogSampler(sample_rates={"sample_created": 0.0})
+
+        assert _run(sampler, "sample_created", level="error") is True
+        assert _run(sampler, "sample_created", level="warning") is True
+
+    def test_kept_events_carry_sample_rate(self):
+        sampler = LogSampler(sample_rates={"e": 0.5}, rng=random.Random(0))
+        event_dict = None
+        while event_dict is None:
+            try:
+                event_dict = sampler(None, "info", {"event": "e", "level": "info"})
+            except structlog.DropEvent:
+                pass
+
+        assert event_dict["sample_rate"] == 0.5
+
+    def test_rate_limit_caps_events_per_second(self):
+        sampler = LogSampler(rate_limits={"request_started": 5})
+
+        kept = sum(_run(sampler, "request_started") for _ in range(50))
+
+        assert kept == 5
+
+    def test_parse_event_config_ignores_malformed_entries(self):
+        assert parse_event_config("a=0.5, b=bad,c,d=2") == {"a": 0.5, "d": 2.0}
+        assert parse_event_config(None) == {}
+
+    def test_configure_logging_reads_env(self, monkeypatch):
+        monkeypatch.setenv("LOG_SAMPLE_RATES", "noisy_event=0")
+        stream = io.StringIO()
+        configure_logging(
+            environment="production", json_logs=True, async_sink=False, stream=stream
+        )
+        try:
+            logger = get_logger("test")
+            logger.info("noisy_event")
+            logger.info("useful_event")
+            logger.error("noisy_event")
+        finally:
+            monkeypatch.delenv("LOG_SAMPLE_RATES")
+            configure_logging(environment="development", async_sink=False)
+
+        events = [(e["event"], e["level"]) for e in _events(stream)]
+        assert events == [("useful_event", "info"), ("noisy_event", "error")]
+
+
+# ---------------------------------------------------------------------------
+# log_batch
+# ---------------------------------------------------------------------------
+
+class TestLogBatch:
+    """log_batch collapses per-row events into one summary."""
+
+    def test_emits_single_summary_with_counts(self, json_logging):
+        logger = get_logger("test")
+
+        with log_batch(logger, "etl_import", winery_id=7):
+            for _ in range(100):
+                logger.info("sample_created")
+            logger.debug("creating_sample")
+            logger.warning("row_skipped", row=3)
+
+        events = _events(json_logging)
+        assert [e["event"] for e in events] == ["row_skipped", "etl_import_batch_summary"]
+        summary = events[-1]
+        assert summary["event_counts"] == {"sample_created": 100}
+        assert summary["winery_id"] == 7
+
+    def test_counts_events_from_awaited_coroutines(self, json_logging):
+        logger = get_logger("test")
+
+        async def create_row():
+            await asyncio.sleep(0)
+            logger.info("sample_created")
+
+        async def import_rows():
+            with log_batch(logger, "bulk"):
+                for _ in range(3):
+                    await create_row()
+
+        asyncio.run(import_rows())
+
+        events = _events(json_logging)
+        assert len(events) == 1
+        assert events[0]["event_counts"] == {"sample_created": 3}
+
+    def test_exception_emits_failed_summary(self, json_logging):
+        logger = get_logger("test")
+
+        with pytest.raises(ValueError):
+            with log_batch(logger, "bulk"):
+                logger.info("sample_created")
+                raise ValueError("bad row")
+
+        events = _events(json_logging)
+        assert events[-1]["event"] == "bulk_batch_failed"
+        assert events[-1]["level"] == "error"
+        assert events[-1]["error_type"] == "ValueError"
+
+    def test_logging_resumes_after_batch(self, json_logging):
+        logger = get_logger("test")
+
+        with log_batch(logger, "bulk"):
+            logger.info("inside")
+        logger.info("outside")
+
+        assert [e["event"] for e in _events(json_logging)] == ["bulk_batch_summary", "outside"]
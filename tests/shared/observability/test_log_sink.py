@@ -0,0 +1,150 @@
+"""
+Unit tests for QueueLogSink — queue-backed, background-thread log writer.
+
+Verifies that records are rendered and written off the calling thread,
+that the bounded queue applies its overflow policy, and that
+configure_logging wires the sink into structlog when async_sink=True.
+"""
+
+import io
+import json
+import threading
+
+import pytest
+import structlog
+
+from src.shared.wine_fermentator_logging import (
+    configure_logging,
+    get_log_sink,
+    get_logger,
+    shutdown_logging,
+)
+from src.shared.wine_fermentator_logging.sink import QueueLogSink
+
+
+# ---------------------------------------------------------------------------
+# Test helpers
+# ---------------------------------------------------------------------------
+
+class _BlockingRenderer:
+    """Renderer that waits on an event, so the queue can be filled up."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.threads = set()
+
+    def __call__(self, logger, method_name, event_dict):
+        self.threads.add(threading.current_thread().name)
+        self.release.wait(timeout=5)
+        return json.dumps(event_dict)
+
+
+def _lines(stream: io.StringIO) -> list:
+    return [json.loads(line) for line in stream.getvalue().splitlines() if line]
+
+
+@pytest.fixture(autouse=True)
+def _restore_logging():
+    yield
+    shutdown_logging()
+    configure_logging(environment="development", async_sink=False)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+class TestQueueLogSink:
+    """QueueLogSink renders and writes on its own thread."""
+
+    def test_records_are_written_in_order(self):
+        stream = io.StringIO()
+        sink = QueueLogSink(renderer=structlog.processors.JSONRenderer(), stream=stream)
+
+        for i in range(50):
+            sink.submit("info", {"event": "sample_created", "i": i})
+        sink.close()
+
+        assert [r["i"] for r in _lines(stream)] == list(range(50))
+
+    def test_rendering_happens_on_writer_thread(self):
+        stream = io.StringIO()
+        renderer = _BlockingRenderer()
+        renderer.release.set()
+        sink = QueueLogSink(renderer=renderer, stream=stream)
+
+        sink.submit("info", {"event": "x"})
+        sink.close()
+
+        assert renderer.threads == {"log-sink-writer"}
+
+    def test_drop_policy_discards_info_when_full_and_reports(self):
+        stream = io.StringIO()
+        renderer = _BlockingRenderer()
+        sink = QueueLogSink(renderer=renderer, stream=stream, max_queue_size=2)
+
+        # First record is picked up by the (blocked) writer; two more fill the queue.
+        results = [sink.submit("info", {"event": "e", "i": i}) for i in range(10)]
+        renderer.release.set()
+        sink.close()
+
+        assert results.count(False) == sink.dropped_count
+        assert sink.dropped_count > 0
+        events = [r["event"] for r in _lines(stream)]
+        assert "log_records_dropped" in events
+
+    def test_errors_wait_for_space_instead_of_dropping(self):
+        stream = io.StringIO()
+        renderer = _BlockingRenderer()
+        sink = QueueLogSink(
+            renderer=renderer, stream=stream, max_queue_size=1, block_timeout=2.0
+        )
+        sink.submit("info", {"event": "first"})
+        sink.submit("info", {"event": "second"})
+
+        threading.Timer(0.05, renderer.release.set).start()
+        accepted = sink.submit("error", {"event": "boom"})
+        sink.close()
+
+        assert accepted is True
+        assert "boom" in [r["event"] for r in _lines(stream)]
+
+    def test_submit_after_close_writes_synchronously(self):
+        stream = io.StringIO()
+        sink = QueueLogSink(renderer=structlog.processors.JSONRenderer(), stream=stream)
+        sink.close()
+
+        assert sink.submit("info", {"event": "late"}) is True
+        assert _lines(stream) == [{"event": "late"}]
+
+    def test_invalid_policy_rejected(self):
+        with pytest.raises(ValueError, match="overflow_policy"):
+            QueueLogSink(renderer=structlog.processors.JSONRenderer(), overflow_policy="x")
+
+
+class TestConfigureLoggingAsyncSink:
+    """configure_logging installs the sink and removes the renderer from the pipeline."""
+
+    def test_async_sink_enabled_installs_sink(self, capsys):
+        configure_logging(environment="production", async_sink=True)
+        sink = get_log_sink()
+        assert sink is not None
+
+        get_logger("test").info("sink_event", key="value")
+        assert sink.flush()
+
+        out = capsys.readouterr().out
+        record = json.loads(out.strip().splitlines()[-1])
+        assert record["event"] == "sink_event"
+        assert record["key"] == "value"
+        assert record["level"] == "info"
+
+    def test_async_sink_disabled_by_default_in_development(self, monkeypatch):
+        monkeypatch.delenv("LOG_ASYNC_SINK", raising=False)
+        configure_logging(environment="development")
+        assert get_log_sink() is None
+
+    def test_env_var_overrides_environment_default(self, monkeypatch):
+        monkeypatch.setenv("LOG_ASYNC_SINK", "false")
+        configure_logging(environment="production")
+        assert get_log_sink() is None
@@ -0,0 +1,108 @@
+"""
+Unit tests for LoggingMiddleware — pure ASGI correlation ID and request logging.
+
+Verifies the X-Correlation-ID header, the request_started / request_completed
+events (with the real status code), excluded paths and non-HTTP scopes.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from src.shared.wine_fermentator_logging.middleware import LoggingMiddleware
+
+
+def _make_app(**middleware_kwargs) -> FastAPI:
+    """Create a minimal FastAPI app with only LoggingMiddleware."""
+    app = FastAPI()
+    app.add_middleware(LoggingMiddleware, **middleware_kwargs)
+
+    @app.get("/test")
+    async def endpoint():
+        return {"ok": True}
+
+    @app.get("/missing")
+    async def missing():
+        raise HTTPException(status_code=404, detail="nope")
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    return app
+
+
+class TestLoggingMiddleware:
+    """LoggingMiddleware logs requests and adds correlation IDs."""
+
+    def test_adds_correlation_id_header(self):
+        client = TestClient(_make_app())
+        resp = client.get("/test")
+
+        assert resp.status_code == 200
+        assert len(resp.headers["X-Correlation-ID"]) == 36
+
+    def test_logs_started_and_completed_with_status(self):
+        with patch("src.shared.wine_fermentator_logging.middleware.logger") as mock_logger:
+            client = TestClient(_make_app())
+            resp = client.get("/missing?page=2")
+
+        assert resp.status_code == 404
+        events = [c.args[0] for c in mock_logger.info.call_args_list]
+        assert events == ["request_started", "request_completed"]
+        started = mock_logger.info.call_args_list[0].kwargs
+        completed = mock_logger.info.call_args_list[1].kwargs
+        assert started["query_params"] == {"page": "2"}
+        assert completed["status_code"] == 404
+        assert completed["path"] == "/missing"
+        assert completed["duration_ms"] >= 0
+
+    def test_binds_correlation_id_to_contextvars(self):
+        with patch("structlog.contextvars.bind_contextvars") as mock_bind:
+            client = TestClient(_make_app())
+            resp = client.get("/test")
+
+        kwargs = mock_bind.call_args.kwargs
+        assert kwargs["correlation_id"] == resp.headers["X-Correlation-ID"]
+        assert kwargs["path"] == "/test"
+        assert kwargs["method"] == "GET"
+
+    def test_excluded_paths_are_not_logged(self):
+        with patch("src.shared.wine_fermentator_logging.middleware.logger") as mock_logger:
+            client = TestClient(_make_app())
+            resp = client.get("/health")
+
+        assert resp.status_code == 200
+        assert "X-Correlation-ID" not in resp.headers
+        mock_logger.info.assert_not_called()
+
+    def test_unhandled_exception_logs_request_failed(self):
+        app = FastAPI()
+        app.add_middleware(LoggingMiddleware)
+
+        @app.get("/boom")
+        async def boom():
+            raise RuntimeError("kaboom")
+
+        with patch("src.shared.wine_fermentator_logging.middleware.logger") as mock_logger:
+            client = TestClient(app, raise_server_exceptions=False)
+            resp = client.get("/boom")
+
+        assert resp.status_code == 500
+        mock_logger.error.assert_called_once()
+        assert mock_logger.error.call_args.args[0] == "request_failed"
+        assert mock_logger.error.call_args.kwargs["error_type"] == "RuntimeError"
+
+    @pytest.mark.asyncio
+    async def test_non_http_scope_passes_through(self):
+        calls = []
+
+        async def inner(scope, receive, send):
+            calls.append(scope["type"])
+
+        middleware = LoggingMiddleware(inner)
+        await middleware({"type": "lifespan"}, None, None)
+
+        assert calls == ["lifespan"]
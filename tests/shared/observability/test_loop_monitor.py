@@ -0,0 +1,120 @@
+"""
+Unit tests for the event loop monitor.
+
+Runs a real loop for a fraction of a second: lag is sampled into the
+registry, and a coroutine blocking the loop is reported with its stack.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.shared.wine_fermentator_logging import loop_monitor
+from src.shared.wine_fermentator_logging.loop_monitor import EventLoopMonitor
+from src.shared.wine_fermentator_logging.metrics import MetricsRegistry
+
+
+class _RecordingLogger:
+    def __init__(self):
+        self.events = []
+
+    def _record(self, level):
+        def log(event, **fields):
+            self.events.append((level, event, fields))
+        return log
+
+    def __getattr__(self, level):
+        return self._record(level)
+
+    def named(self, event):
+        return [fields for _, name, fields in self.events if name == event]
+
+
+@pytest.fixture
+def logs(monkeypatch):
+    recorder = _RecordingLogger()
+    monkeypatch.setattr(loop_monitor, "logger", recorder)
+    return recorder
+
+
+def _crunch_on_the_loop(seconds):
+    time.sleep(seconds)
+
+
+class TestEventLoopMonitor:
+    """Lag sampling and blocked-loop reporting."""
+
+    def test_samples_lag_into_histogram(self, logs):
+        registry = MetricsRegistry()
+
+        async def run():
+            monitor = EventLoopMonitor(0.01, 0.5, registry=registry)
+            monitor.start()
+            await asyncio.sleep(0.1)
+            await monitor.stop()
+            return monitor
+
+        monitor = asyncio.run(run())
+
+        snapshot = registry.snapshot()["event_loop_lag_seconds"][0]
+        assert snapshot["count"] >= 3
+        assert monitor.lag_percentile(50) < 0.5
+        assert monitor.blocked_count == 0
+        assert logs.named("event_loop_blocked") == []
+        assert logs.named("event_loop_monitor_stopped")[0]["lag_p99_ms"] is not None
+
+    def test_reports_blocking_coroutine_with_stack(self, logs):
+        registry = MetricsRegistry()
+
+        async def parse_upload():
+            _crunch_on_the_loop(0.3)
+
+        async def run():
+            monitor = EventLoopMonitor(0.01, 0.05, registry=registry)
+            monitor.start()
+            await asyncio.sleep(0.03)
+            await asyncio.get_running_loop().create_task(parse_upload(), name="upload")
+            await asyncio.sleep(0.05)
+            await monitor.stop()
+            return monitor
+
+        monitor = asyncio.run(run())
+
+        assert monitor.blocked_count == 1
+        assert registry.counter("event_loop_blocked_total").value() == 1
+        (blocked,) = logs.named("event_loop_blocked")
+        assert blocked["task"] == "upload"
+        assert blocked["coroutine"].endswith("parse_upload")
+        assert "_crunch_on_the_loop" in blocked["stack"]
+        assert blocked["blocked_ms"] >= 50
+        (recovered,) = logs.named("event_loop_recovered")
+        assert recovered["lag_ms"] >= 250
+        assert registry.get("event_loop_lag_seconds").percentile(100) >= 0.25
+
+    def test_disabled_monitor_does_nothing(self, logs):
+        async def run():
+            monitor = EventLoopMonitor(enabled=False, registry=MetricsRegistry())
+            monitor.start()
+            assert not monitor.running
+            await monitor.stop()
+
+        asyncio.run(run())
+
+        assert logs.events == []
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("EVENT_LOOP_LAG_INTERVAL_MS", "50")
+        monkeypatch.setenv("EVENT_LOOP_SLOW_CALLBACK_MS", "500")
+        monkeypatch.setenv("EVENT_LOOP_MONITOR_ENABLED", "false")
+
+        monitor = EventLoopMonitor.from_env(registry=MetricsRegistry())
+
+        assert monitor.interval_seconds == pytest.approx(0.05)
+        assert monitor.slow_callback_seconds == pytest.approx(0.5)
+        assert monitor.enabled is False
+
+    @pytest.mark.parametrize("kwargs", [{"interval_seconds": 0}, {"slow_callback_seconds": -1}])
+    def test_rejects_non_positive_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            EventLoopMonitor(registry=MetricsRegistry(), **kwargs)
@@ -0,0 +1,197 @@
+"""
+Unit tests for the in-process metrics registry.
+
+Verifies histogram bucketing/percentiles, Prometheus rendering, per-request
+SQL counting via engine events, the route label recorded by
+MetricsMiddleware and the /metrics endpoint.
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.shared.api.metrics_router import router as metrics_router
+from src.shared.wine_fermentator_logging import LogTimer, get_logger
+from src.shared.wine_fermentator_logging.metrics import (
+    MetricsMiddleware,
+    MetricsRegistry,
+    get_metrics_registry,
+    instrument_engine,
+    track_queries,
+)
+
+
+# ---------------------------------------------------------------------------
+# Registry primitives
+# ---------------------------------------------------------------------------
+
+class TestHistogram:
+    """Histogram buckets observations and estimates percentiles."""
+
+    def test_percentiles_follow_distribution(self):
+        registry = MetricsRegistry()
+        hist = registry.histogram("latency", buckets=(0.01, 0.1, 1.0))
+
+        for _ in range(90):
+            hist.observe(0.005, route="/a")
+        for _ in range(10):
+            hist.observe(0.5, route="/a")
+
+        assert hist.percentile(50, route="/a") <= 0.01
+        assert 0.1 < hist.percentile(99, route="/a") <= 1.0
+        assert hist.percentile(50, route="/other") is None
+
+    def test_render_prometheus_cumulative_buckets(self):
+        registry = MetricsRegistry()
+        hist = registry.histogram("latency", "Request latency", buckets=(0.1, 1.0))
+        hist.observe(0.05, route="/a")
+        hist.observe(0.5, route="/a")
+        registry.counter("errors_total").inc(route="/a")
+
+        output = registry.render_prometheus()
+
+        assert "# TYPE latency histogram" in output
+        assert 'latency_bucket{route="/a",le="0.1"} 1' in output
+        assert 'latency_bucket{route="/a",le="1.0"} 2' in output
+        assert 'latency_bucket{route="/a",le="+Inf"} 2' in output
+        assert 'latency_count{route="/a"} 2' in output
+        assert 'errors_total{route="/a"} 1' in output
+
+    def test_registry_returns_same_metric_by_name(self):
+        registry = MetricsRegistry()
+
+        assert registry.histogram("h") is registry.histogram("h")
+        assert registry.get("missing") is None
+
+    def test_logtimer_records_operation_duration(self):
+        hist = get_metrics_registry().histogram("operation_duration_seconds")
+
+        with LogTimer(get_logger("test"), "metrics_test_operation"):
+            pass
+
+        series = [
+            s for s in hist.snapshot()
+            if s["labels"] == {"operation": "metrics_test_operation", "status": "success"}
+        ]
+        assert series and series[0]["count"] >= 1
+
+    def test_logtimer_completion_level(self):
+        logger = Mock()
+
+        with LogTimer(logger, "quiet_operation", level="debug"):
+            pass
+
+        logger.debug.assert_called_once()
+        assert logger.debug.call_args.args == ("quiet_operation_completed",)
+        logger.info.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Engine instrumentation
+# ---------------------------------------------------------------------------
+
+class TestInstrumentEngine:
+    """Engine events feed per-request query stats and pool gauges."""
+
+    def test_track_queries_counts_statements(self):
+        registry = MetricsRegistry()
+
+        async def run():
+            engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+            instrument_engine(engine, name="test", registry=registry)
+            try:
+                with track_queries() as stats:
+                    async with engine.connect() as conn:
+                        for _ in range(3):
+                            await conn.execute(text("SELECT 1"))
+                async with engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+            finally:
+                await engine.dispose()
+            return stats
+
+        stats = asyncio.run(run())
+
+        assert stats.statements == 3
+        assert stats.duration_seconds > 0
+        snapshot = registry.snapshot()["db_query_duration_seconds"]
+        assert snapshot[0]["labels"] == {"engine": "test"}
+        assert snapshot[0]["count"] == 4
+        assert "db_pool_connections" in registry.render_prometheus()
+
+    def test_slow_queries_are_counted(self):
+        registry = MetricsRegistry()
+
+        async def run():
+            engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+            instrument_engine(engine, name="slow", registry=registry, slow_query_seconds=0)
+            try:
+                async with engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+            finally:
+                await engine.dispose()
+
+        asyncio.run(run())
+
+        assert registry.counter("db_slow_queries_total").value(engine="slow") == 1
+
+
+# ---------------------------------------------------------------------------
+# Middleware and endpoint
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def app():
+    registry = get_metrics_registry()
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    yield app
+    registry.reset()
+
+
+class TestMetricsMiddleware:
+    """MetricsMiddleware labels by route template and exposes /metrics."""
+
+    def test_route_label_uses_template(self, app):
+        client = TestClient(app)
+        client.get("/items/1")
+        client.get("/items/2")
+        client.get("/nope")
+
+        latency = get_metrics_registry().histogram("http_request_duration_seconds")
+        labels = [s["labels"] for s in latency.snapshot()]
+        assert {"method": "GET", "route": "/items/{item_id}", "status": "200"} in labels
+        assert {"method": "GET", "route": "unmatched", "status": "404"} in labels
+        assert latency.snapshot()[0]["count"] >= 1
+
+    def test_metrics_endpoint_prometheus_and_json(self, app):
+        client = TestClient(app)
+        client.get("/items/1")
+
+        text_response = client.get("/metrics")
+        json_response = client.get("/metrics", params={"format": "json"})
+
+        assert text_response.status_code == 200
+        assert text_response.headers["content-type"].startswith("text/plain")
+        assert 'route="/items/{item_id}"' in text_response.text
+        assert "db_statements_per_request" in text_response.text
+        series = json_response.json()["http_request_duration_seconds"]
+        assert {"p50", "p95", "p99"} <= set(series[0])
+
+    def test_metrics_endpoint_not_recorded(self, app):
+        client = TestClient(app)
+        client.get("/metrics")
+
+        latency = get_metrics_registry().histogram("http_request_duration_seconds")
+        assert latency.snapshot() == []
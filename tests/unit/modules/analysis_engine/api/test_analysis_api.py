@@ -109,6 +109,7 @@ def make_mock_analysis(
     status: str = "COMPLETE",
     anomalies=None,
     recommendations=None,
+    max_severity=None,
 ):
     """Build a mock Analysis ORM entity."""
     mock = MagicMock()
@@ -122,6 +123,10 @@ def make_mock_analysis(
     mock.historical_samples_count = 3
     mock.anomalies = anomalies or []
     mock.recommendations = recommendations or []
+    # Summary aggregates, as list queries populate them
+    mock.anomaly_count = len(mock.anomalies)
+    mock.recommendation_count = len(mock.recommendations)
+    mock.max_severity = max_severity
     return mock
 
 
@@ -217,6 +222,28 @@ class TestTriggerAnalysis:
         assert call_kwargs["winery_id"] == WINERY_ID
         assert call_kwargs["fermentation_id"] == FERMENTATION_ID
 
+    @pytest.mark.asyncio
+    async def test_trigger_analysis_refresh_bypasses_memo(
+        self, winemaker_user, analysis_create_request, mock_orchestrator
+    ):
+        """refresh=true should force the pipeline to re-run; the default reuses results."""
+        mock_orchestrator.execute_analysis.return_value = make_mock_analysis()
+
+        await trigger_analysis(
+            request=analysis_create_request,
+            current_user=winemaker_user,
+            orchestrator=mock_orchestrator,
+        )
+        assert mock_orchestrator.execute_analysis.call_args.kwargs["force_refresh"] is False
+
+        await trigger_analysis(
+            request=analysis_create_request,
+            current_user=winemaker_user,
+            orchestrator=mock_orchestrator,
+            refresh=True,
+        )
+        assert mock_orchestrator.execute_analysis.call_args.kwargs["force_refresh"] is True
+
     @pytest.mark.asyncio
     async def test_trigger_analysis_converts_density_readings(
         self, winemaker_user, analysis_create_request, mock_orchestrator
@@ -495,6 +522,26 @@ class TestListFermentationAnalyses:
         assert result[0].anomaly_count == 2
         assert result[0].recommendation_count == 1
 
+    @pytest.mark.asyncio
+    async def test_list_analyses_summary_uses_aggregates_not_children(
+        self, winemaker_user, mock_orchestrator
+    ):
+        """Counts and max severity come from the summary aggregates."""
+        mock_analysis = make_mock_analysis(max_severity="CRITICAL")
+        mock_analysis.anomaly_count = 4
+        mock_analysis.recommendation_count = 2
+        mock_orchestrator.get_fermentation_analyses.return_value = [mock_analysis]
+
+        result = await list_fermentation_analyses(
+            fermentation_id=FERMENTATION_ID,
+            current_user=winemaker_user,
+            orchestrator=mock_orchestrator,
+            limit=10,
+        )
+
+        assert (result[0].anomaly_count, result[0].recommendation_count) == (4, 2)
+        assert result[0].max_severity == "CRITICAL"
+
 
 # ==============================================================================
 # Tests: GET /api/v1/recommendations/{id}  (get_recommendation)
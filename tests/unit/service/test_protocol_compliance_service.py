@@ -588,6 +588,31 @@ async def test_no_completed_steps_zero_score(
     assert result.compliance_score <= 30
 
 
+@pytest.mark.asyncio
+async def test_step_types_loaded_as_strings_are_scored(
+    compliance_service,
+    sample_protocol_execution,
+    sample_fermentation_protocol,
+):
+    """
+    Steps read from the database hold step_type as its string value.
+
+    Expected: The breakdown reports the same step types as for enum steps
+    """
+    for step in sample_fermentation_protocol.steps:
+        step.step_type = step.step_type.value
+    compliance_service.execution_repo.get_by_id = AsyncMock(
+        return_value=sample_protocol_execution
+    )
+    compliance_service.completion_repo.get_by_execution = AsyncMock(return_value=[])
+
+    result = await compliance_service.calculate_compliance_score(1)
+
+    assert [b.step_type for b in result.breakdown["completion"].step_breakdown] == [
+        step.step_type for step in sample_fermentation_protocol.steps
+    ]
+
+
 # ============================================================================
 # Test: Deviation Detection - Missing Critical Step
 # ============================================================================